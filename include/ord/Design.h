@@ -11,6 +11,7 @@
 
 namespace odb {
 class dbBlock;
+class dbChipRegion;
 class dbDatabase;
 class dbMaster;
 class dbMTerm;
@@ -39,6 +40,10 @@ namespace grt {
 class GlobalRouter;
 }
 
+namespace gui {
+struct HeatMapGrid;
+}
+
 namespace gpl {
 class Replace;
 }
@@ -47,6 +52,10 @@ namespace dpl {
 class Opendp;
 }
 
+namespace est {
+class EstimateParasitics;
+}
+
 namespace exa {
 class Example;
 }
@@ -139,6 +148,19 @@ class Design
   void writeDb(const std::string& file_name);
   void writeDef(const std::string& file_name);
 
+  void read3Dbv(const std::string& file_name);
+  void read3Dbx(const std::string& file_name);
+  void read3DBloxBMap(const std::string& file_name);
+  // Bulk bump creation for a chip region from columnar bump data
+  // (e.g. a py3dblox bump map).  Coordinates are in microns.
+  void create3DBloxBumps(odb::dbChipRegion* chip_region,
+                         const std::vector<std::string>& inst_names,
+                         const std::vector<std::string>& cell_types,
+                         const std::vector<double>& xs,
+                         const std::vector<double>& ys,
+                         const std::vector<std::string>& port_names,
+                         const std::vector<std::string>& net_names);
+
   odb::dbBlock* getBlock();
   utl::Logger* getLogger();
 
@@ -158,6 +180,13 @@ class Design
   bool isInClock(odb::dbITerm* iterm);
   std::uint64_t getNetRoutedLength(odb::dbNet* net);
 
+  // Compute a heat map (e.g. "Placement", "Pin", "Routing" or "IRDrop")
+  // without the layout viewer.  bin_size is in microns, zero keeps the
+  // current grid of the map.
+  void getHeatMap(const std::string& name,
+                  double bin_size,
+                  gui::HeatMapGrid& grid);
+
   // Services
   ant::AntennaChecker* getAntennaChecker();
   cgt::ClockGating* getClockGating();
@@ -166,6 +195,7 @@ class Design
   dpl::Opendp* getOpendp();
   exa::Example* getExample();
   drt::TritonRoute* getTritonRoute();
+  est::EstimateParasitics* getEstimateParasitics();
   fin::Finale* getFinale();
   gpl::Replace* getReplace();
   grt::GlobalRouter* getGlobalRouter();
@@ -60,6 +60,13 @@ from .objects import (
 # Import exceptions
 from .base_parser import ParserError
 
+# Import analysis
+from .alignment import (
+    AlignmentReport,
+    ConnectionAlignment,
+    check_bump_alignment,
+)
+
 # Optional: Import viewer (requires matplotlib)
 try:
     from .viewer import ThreeDBloxViewer
@@ -98,6 +105,10 @@ __all__ = [
     "BumpMapEntry",
     # Exceptions
     "ParserError",
+    # Analysis
+    "AlignmentReport",
+    "ConnectionAlignment",
+    "check_bump_alignment",
     # Viewer (optional)
     "ThreeDBloxViewer",
 ]
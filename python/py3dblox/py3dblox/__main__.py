@@ -110,6 +110,9 @@ Examples:
 
   # Validate a file without output
   python -m py3dblox validate example.3dbv
+
+  # Check bump alignment of all connections within 0.5um
+  python -m py3dblox align example.3dbx --tolerance 0.5
         """
     )
 
@@ -153,6 +156,30 @@ Examples:
         help='Enable verbose logging'
     )
 
+    # Align command
+    align_parser = subparsers.add_parser(
+        'align', help='Check bump alignment of the connections in a .3dbx file'
+    )
+    align_parser.add_argument('file', type=str, help='.3dbx file to check')
+    align_parser.add_argument(
+        '-t', '--tolerance',
+        type=float,
+        default=0.0,
+        help='Maximum offset of aligned bumps in microns (default: 0.0)'
+    )
+    align_parser.add_argument(
+        '-r', '--search-radius',
+        type=float,
+        default=None,
+        help='Maximum offset reported as misaligned instead of unmatched '
+             '(default: tolerance)'
+    )
+    align_parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Enable verbose logging'
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -214,6 +241,40 @@ Examples:
                 print("Format: Bump Map (.bmap)")
                 print(f"Bump entries: {len(data.entries)}")
 
+        elif args.command == 'align':
+            from .alignment import check_bump_alignment
+            from .objects import DbxData
+
+            data = parse(args.file, logger=logger)
+            if not isinstance(data, DbxData):
+                raise ValueError(f"{args.file} is not a .3dbx file")
+
+            report = check_bump_alignment(
+                data,
+                tolerance=args.tolerance,
+                search_radius=args.search_radius,
+                logger=logger,
+            )
+            for name, reason in report.skipped.items():
+                print(f"Skipped {name}: {reason}")
+            for result in report.connections.values():
+                print(result.summary())
+                for pair in result.misaligned:
+                    print(f"  misaligned {pair.top.bump_inst_name} "
+                          f"{pair.bot.bump_inst_name} offset {pair.distance:.4f}")
+                for pair in result.net_mismatches:
+                    print(f"  net mismatch {pair.top.bump_inst_name} "
+                          f"({pair.top.net_name}) {pair.bot.bump_inst_name} "
+                          f"({pair.bot.net_name})")
+                for bump in result.unmatched_top:
+                    print(f"  unmatched top {bump.bump_inst_name} "
+                          f"({bump.x:.4f}, {bump.y:.4f})")
+                for bump in result.unmatched_bot:
+                    print(f"  unmatched bot {bump.bump_inst_name} "
+                          f"({bump.x:.4f}, {bump.y:.4f})")
+            if not report.is_aligned:
+                sys.exit(2)
+
     except Exception as e:
         logger.error(f"Error: {e}")
         if hasattr(args, 'verbose') and args.verbose:
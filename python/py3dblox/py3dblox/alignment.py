@@ -0,0 +1,443 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2019-2025, The OpenROAD Authors
+
+"""Bump alignment checking across stacked chiplets.
+
+For every ``Connection`` in a .3dbx assembly the bump maps of the top and
+bottom regions are transformed into global coordinates using the chiplet
+instance ``loc`` and ``orient`` and matched against each other with numpy,
+searching the bottom bumps sorted by column and y.  Matching is
+O((N + M) log M), which keeps million-bump interfaces in the range of
+seconds.
+
+Usage:
+    >>> from py3dblox import parse_dbx
+    >>> from py3dblox.alignment import check_bump_alignment
+    >>>
+    >>> report = check_bump_alignment(parse_dbx("design.3dbx"), tolerance=0.5)
+    >>> for result in report.connections.values():
+    ...     print(result.summary())
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from .bmap_parser import BmapParser
+from .dbv_parser import DbvParser
+from .objects import BumpMapData, ChipletDef, ChipletInst, DbxData
+
+# 2D orientation matrices (a, b, c, d) mapping (x, y) to
+# (a * x + b * y, c * x + d * y).  These follow odb::dbTransform.
+_ORIENT_MATRICES = {
+    "R0": (1, 0, 0, 1),
+    "R90": (0, -1, 1, 0),
+    "R180": (-1, 0, 0, -1),
+    "R270": (0, 1, -1, 0),
+    "MY": (-1, 0, 0, 1),
+    "MY_R90": (0, -1, -1, 0),
+    "MX": (1, 0, 0, -1),
+    "MX_R90": (0, 1, 1, 0),
+}
+
+# Equivalent spellings, as accepted by the C++ 3DBX reader.
+_ORIENT_ALIASES = {
+    "MXR90": "MX_R90",
+    "MYR90": "MY_R90",
+    "MY_R180": "MX",
+    "MY_R270": "MX_R90",
+    "MX_R180": "MY",
+    "MX_R270": "MY_R90",
+}
+
+_NO_NET = "-"
+
+
+def orient_matrix(orient: str) -> tuple[int, int, int, int]:
+    """Return the 2D transformation matrix for a 3D orientation string.
+
+    The z mirror (``MZ``) does not change x/y coordinates and is ignored,
+    matching ``odb::dbChipInst::getTransform``.
+
+    Args:
+        orient: Orientation string, e.g. ``R0``, ``MZ_R90`` or ``MX_R180``.
+
+    Returns:
+        Tuple (a, b, c, d) of the 2x2 transformation matrix.
+
+    Raises:
+        ValueError: If the orientation is not recognized.
+    """
+    orient_2d = orient.strip() if orient else "R0"
+    if orient_2d == "MZ":
+        orient_2d = "R0"
+    elif orient_2d.startswith("MZ_"):
+        orient_2d = orient_2d[3:]
+    orient_2d = _ORIENT_ALIASES.get(orient_2d, orient_2d)
+    if orient_2d not in _ORIENT_MATRICES:
+        raise ValueError(f"Invalid orient {orient}")
+    return _ORIENT_MATRICES[orient_2d]
+
+
+@dataclass
+class GlobalBump:
+    """A bump placed in global (assembly) coordinates."""
+    inst_name: str
+    region_name: str
+    bump_inst_name: str
+    net_name: str
+    x: float
+    y: float
+
+
+@dataclass
+class BumpPair:
+    """A top bump paired with its nearest bottom bump."""
+    top: GlobalBump
+    bot: GlobalBump
+    distance: float
+
+
+@dataclass
+class ConnectionAlignment:
+    """Alignment result for a single connection."""
+    connection: str
+    tolerance: float
+    matched: list[BumpPair] = field(default_factory=list)
+    misaligned: list[BumpPair] = field(default_factory=list)
+    unmatched_top: list[GlobalBump] = field(default_factory=list)
+    unmatched_bot: list[GlobalBump] = field(default_factory=list)
+    net_mismatches: list[BumpPair] = field(default_factory=list)
+
+    @property
+    def is_aligned(self) -> bool:
+        """True if every bump is matched within tolerance with equal nets."""
+        return not (self.misaligned or self.unmatched_top
+                    or self.unmatched_bot or self.net_mismatches)
+
+    def summary(self) -> str:
+        """Return a one-line summary of the result."""
+        return (
+            f"{self.connection}: matched {len(self.matched)}, "
+            f"misaligned {len(self.misaligned)}, "
+            f"unmatched top {len(self.unmatched_top)}, "
+            f"unmatched bot {len(self.unmatched_bot)}, "
+            f"net mismatches {len(self.net_mismatches)}"
+        )
+
+
+@dataclass
+class AlignmentReport:
+    """Alignment results for all checked connections."""
+    connections: dict[str, ConnectionAlignment] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_aligned(self) -> bool:
+        """True if every checked connection is aligned."""
+        return all(result.is_aligned for result in self.connections.values())
+
+
+def transform_bumps(
+    bump_map: BumpMapData, inst: ChipletInst, region_name: str = ""
+) -> list[GlobalBump]:
+    """Transform a bump map into global coordinates.
+
+    Args:
+        bump_map: Bump map in chiplet coordinates (microns).
+        inst: Chiplet instance providing ``loc`` and ``orient``.
+        region_name: Region name recorded on the returned bumps.
+
+    Returns:
+        List of GlobalBump objects in bump map order.
+    """
+    a, b, c, d = orient_matrix(inst.orient)
+    dx = inst.loc.x
+    dy = inst.loc.y
+    return [
+        GlobalBump(
+            inst_name=inst.name,
+            region_name=region_name,
+            bump_inst_name=entry.bump_inst_name,
+            net_name=entry.net_name,
+            x=a * entry.x + b * entry.y + dx,
+            y=c * entry.x + d * entry.y + dy,
+        )
+        for entry in bump_map.entries
+    ]
+
+
+def match_bumps(
+    top_bumps: list[GlobalBump],
+    bot_bumps: list[GlobalBump],
+    tolerance: float,
+    search_radius: float | None = None,
+    connection: str = "",
+) -> ConnectionAlignment:
+    """Match two sets of global bumps through sorted columns of bumps.
+
+    Each top bump is paired with the nearest unpaired bottom bump within
+    ``search_radius``, the lower bottom bump index winning ties.  Pairs
+    closer than ``tolerance`` are matched; the others are reported as
+    misaligned.  Top bumps are processed in order, so the result is
+    deterministic.
+
+    Args:
+        top_bumps: Bumps of the top region.
+        bot_bumps: Bumps of the bottom region.
+        tolerance: Maximum distance (microns) for an aligned pair.
+        search_radius: Maximum distance (microns) to pair bumps at all.
+            Defaults to ``tolerance``, i.e. no misaligned pairs are reported.
+        connection: Connection name recorded on the result.
+
+    Returns:
+        ConnectionAlignment object.
+
+    Raises:
+        ValueError: If tolerance or search_radius is invalid.
+    """
+    if tolerance < 0:
+        raise ValueError(f"Tolerance must be non-negative, got {tolerance}")
+    if search_radius is None:
+        search_radius = tolerance
+    if search_radius < tolerance:
+        raise ValueError(
+            f"Search radius {search_radius} is smaller than tolerance {tolerance}"
+        )
+
+    result = ConnectionAlignment(connection=connection, tolerance=tolerance)
+    top_cand, bot_cand, dist_sq = _find_candidates(
+        top_bumps, bot_bumps, search_radius
+    )
+
+    # Candidates are sorted by top bump, distance and bottom bump, so the
+    # first candidate of a top bump is its nearest bottom bump.  Top bumps
+    # whose candidates are not candidates of any other top bump simply take
+    # it; the others compete in top bump order.
+    best = np.full(len(top_bumps), -1, dtype=np.int64)
+    best_sq = np.zeros(len(top_bumps))
+    if len(top_cand) > 0:
+        starts = np.flatnonzero(np.r_[True, top_cand[1:] != top_cand[:-1]])
+        shared = np.bincount(bot_cand, minlength=len(bot_bumps))[bot_cand] > 1
+        contested = np.logical_or.reduceat(shared, starts)
+        alone = starts[~contested]
+        best[top_cand[alone]] = bot_cand[alone]
+        best_sq[top_cand[alone]] = dist_sq[alone]
+
+        used = np.zeros(len(bot_bumps), dtype=bool)
+        used[bot_cand[alone]] = True
+        ends = np.r_[starts[1:], len(top_cand)]
+        for first, last in zip(starts[contested].tolist(),
+                               ends[contested].tolist()):
+            for k in range(first, last):
+                index = bot_cand[k]
+                if not used[index]:
+                    used[index] = True
+                    best[top_cand[k]] = index
+                    best_sq[top_cand[k]] = dist_sq[k]
+                    break
+
+    tolerance_sq = tolerance * tolerance
+    used = np.zeros(len(bot_bumps), dtype=bool)
+    for top, index, pair_sq in zip(top_bumps, best.tolist(), best_sq.tolist()):
+        if index < 0:
+            result.unmatched_top.append(top)
+            continue
+
+        used[index] = True
+        pair = BumpPair(top=top, bot=bot_bumps[index], distance=math.sqrt(pair_sq))
+        if pair_sq <= tolerance_sq:
+            result.matched.append(pair)
+            if (top.net_name != _NO_NET and pair.bot.net_name != _NO_NET
+                    and top.net_name != pair.bot.net_name):
+                result.net_mismatches.append(pair)
+        else:
+            result.misaligned.append(pair)
+
+    result.unmatched_bot = [bot_bumps[index]
+                            for index in np.flatnonzero(~used).tolist()]
+    return result
+
+
+def _find_candidates(
+    top_bumps: list[GlobalBump],
+    bot_bumps: list[GlobalBump],
+    search_radius: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the bottom bumps within ``search_radius`` of each top bump.
+
+    The bottom bumps are sorted by columns twice the search radius wide and
+    by y within a column, so the search window of a top bump is at most two
+    ranges of the sorted bumps, found with ``searchsorted``.
+
+    Returns:
+        Arrays of top bump indices, bottom bump indices and squared
+        distances of the candidate pairs, sorted by top bump, distance and
+        bottom bump.
+    """
+    top_x = np.fromiter((bump.x for bump in top_bumps), float, len(top_bumps))
+    top_y = np.fromiter((bump.y for bump in top_bumps), float, len(top_bumps))
+    bot_x = np.fromiter((bump.x for bump in bot_bumps), float, len(bot_bumps))
+    bot_y = np.fromiter((bump.y for bump in bot_bumps), float, len(bot_bumps))
+    if len(top_x) == 0 or len(bot_x) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0)
+
+    # The columns and y ranks give exact integer keys sorted like (x, y).
+    cell = 2.0 * search_radius if search_radius > 0 else 1.0
+    bot_col = np.floor(bot_x / cell).astype(np.int64)
+    columns, bot_col = np.unique(bot_col, return_inverse=True)
+    y_values, bot_rank = np.unique(bot_y, return_inverse=True)
+    stride = len(y_values) + 1
+    bot_key = bot_col.reshape(-1) * stride + bot_rank.reshape(-1)
+    order = np.argsort(bot_key, kind="stable")
+    sorted_key = bot_key[order]
+
+    rank_lo = np.searchsorted(y_values, top_y - search_radius, side="left")
+    rank_hi = np.searchsorted(y_values, top_y + search_radius, side="right")
+    lo_col = np.floor((top_x - search_radius) / cell).astype(np.int64)
+    hi_col = np.floor((top_x + search_radius) / cell).astype(np.int64)
+    query_top = []
+    query_start = []
+    query_count = []
+    for col, valid in ((lo_col, True), (hi_col, hi_col != lo_col)):
+        index = np.minimum(np.searchsorted(columns, col), len(columns) - 1)
+        found = (columns[index] == col) & valid
+        start = np.searchsorted(sorted_key, index * stride + rank_lo)
+        end = np.searchsorted(sorted_key, index * stride + rank_hi)
+        query_top.append(np.flatnonzero(found))
+        query_start.append(start[found])
+        query_count.append((end - start)[found])
+    query_top = np.concatenate(query_top)
+    query_start = np.concatenate(query_start)
+    query_count = np.concatenate(query_count)
+
+    # Expand the ranges into candidate pairs.
+    total = int(query_count.sum())
+    top_cand = np.repeat(query_top, query_count)
+    offsets = np.arange(total) - np.repeat(
+        np.cumsum(query_count) - query_count, query_count
+    )
+    bot_cand = order[np.repeat(query_start, query_count) + offsets]
+
+    dx = bot_x[bot_cand] - top_x[top_cand]
+    dy = bot_y[bot_cand] - top_y[top_cand]
+    dist_sq = dx * dx + dy * dy
+    keep = dist_sq <= search_radius * search_radius
+    top_cand = top_cand[keep]
+    bot_cand = bot_cand[keep]
+    dist_sq = dist_sq[keep]
+    order = np.lexsort((bot_cand, dist_sq, top_cand))
+    return top_cand[order], bot_cand[order], dist_sq[order]
+
+
+def load_chiplet_defs(
+    dbx: DbxData, logger: logging.Logger | None = None
+) -> dict[str, ChipletDef]:
+    """Load the chiplet definitions of the .3dbv files included by a .3dbx.
+
+    Args:
+        dbx: Parsed .3dbx data.
+        logger: Optional logger instance.
+
+    Returns:
+        Dictionary mapping chiplet names to ChipletDef objects.
+    """
+    chiplet_defs: dict[str, ChipletDef] = {}
+    for include in dbx.header.includes:
+        if Path(include).suffix.lower() == '.3dbv':
+            data = DbvParser(logger=logger).parse_file(include)
+            chiplet_defs.update(data.chiplet_defs)
+    return chiplet_defs
+
+
+def _split_region_path(path: str) -> tuple[str, str] | None:
+    """Split ``inst.regions.name`` into instance and region names."""
+    last_part = path.split('/')[-1]
+    inst_name, sep, region_name = last_part.partition('.regions.')
+    if not sep or not inst_name or not region_name:
+        return None
+    return inst_name, region_name
+
+
+def check_bump_alignment(
+    dbx: DbxData,
+    chiplet_defs: dict[str, ChipletDef] | None = None,
+    tolerance: float = 0.0,
+    search_radius: float | None = None,
+    bump_maps: dict[str, BumpMapData] | None = None,
+    logger: logging.Logger | None = None,
+) -> AlignmentReport:
+    """Check bump alignment of all connections in a .3dbx assembly.
+
+    Connections with a virtual end (``~``), unknown instances or regions,
+    or regions without a bump map are skipped and listed in the report.
+
+    Args:
+        dbx: Parsed .3dbx data.
+        chiplet_defs: Chiplet definitions.  Defaults to the .3dbv files
+            included by ``dbx``.
+        tolerance: Maximum distance (microns) for an aligned pair.
+        search_radius: Maximum distance (microns) to report a bump pair as
+            misaligned instead of unmatched.  Defaults to ``tolerance``.
+        bump_maps: Optional pre-parsed bump maps keyed by .bmap path, used
+            instead of reading the files referenced by the regions.
+        logger: Optional logger instance.
+
+    Returns:
+        AlignmentReport object.
+    """
+    logger = logger or logging.getLogger(__name__)
+    if chiplet_defs is None:
+        chiplet_defs = load_chiplet_defs(dbx, logger)
+    bump_maps = dict(bump_maps) if bump_maps else {}
+
+    def region_bumps(path: str) -> list[GlobalBump] | str:
+        names = _split_region_path(path)
+        if names is None:
+            return f"invalid region path {path}"
+        inst_name, region_name = names
+        inst = dbx.chiplet_instances.get(inst_name)
+        if inst is None:
+            return f"chiplet instance {inst_name} not found"
+        chiplet = chiplet_defs.get(inst.reference)
+        if chiplet is None:
+            return f"chiplet definition {inst.reference} not found"
+        region = chiplet.regions.get(region_name)
+        if region is None:
+            return f"region {region_name} not found in {inst.reference}"
+        if not region.bmap:
+            return f"region {region_name} of {inst.reference} has no bump map"
+        if region.bmap not in bump_maps:
+            bump_maps[region.bmap] = BmapParser(logger=logger).parse_file(
+                region.bmap
+            )
+        return transform_bumps(bump_maps[region.bmap], inst, region_name)
+
+    report = AlignmentReport()
+    for name, conn in dbx.connections.items():
+        if not conn.top or not conn.bot or conn.top == '~' or conn.bot == '~':
+            report.skipped[name] = "virtual connection"
+            continue
+        top_bumps = region_bumps(conn.top)
+        bot_bumps = region_bumps(conn.bot)
+        reason = next(
+            (bumps for bumps in (top_bumps, bot_bumps) if isinstance(bumps, str)),
+            None,
+        )
+        if reason is not None:
+            logger.debug(f"Skipping connection {name}: {reason}")
+            report.skipped[name] = reason
+            continue
+        result = match_bumps(
+            top_bumps, bot_bumps, tolerance, search_radius, connection=name
+        )
+        logger.info(result.summary())
+        report.connections[name] = result
+
+    return report
@@ -16,11 +16,13 @@ matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 import numpy as np
 
+from .alignment import orient_matrix
+from .bmap_parser import BmapParser
 from .parser import parse, parse_dbv, parse_dbx
-from .objects import DbxData, DbvData, ChipletInst, ChipletDef
+from .objects import BumpMapData, DbxData, DbvData, ChipletInst, ChipletDef
 
 
 class ThreeDBloxViewer:
@@ -36,22 +38,36 @@ class ThreeDBloxViewer:
         self.root.title("3D Blox Stack Viewer")
         self.root.geometry("1400x900")
 
+        self._init_state()
+
+        # Setup UI
+        self._setup_ui()
+
+    def _init_state(self):
+        """Initialize the data and scene state, independent of the UI."""
         # Data storage
         self.data: Optional[DbxData | DbvData] = None
         self.current_file: Optional[Path] = None
         self.chiplet_defs: dict[str, ChipletDef] = {}  # Chiplet definitions (from .3dbv or included files)
-        self.chiplet_artists = {}  # Maps chiplet name to artist objects
         self.chiplet_visibility = {}  # Maps chiplet name to visibility state
         self.selected_chiplet: Optional[str] = None
         self.measurement_points = []  # For distance measurement
         self.measurement_mode = False
 
+        # Scene graph: artists are built once per file and updated in place
+        self.scene: dict[str, dict] = {}  # Maps chiplet name to its artists and geometry
+        self.connection_artists = {}  # Maps connection name to its line
+        self.bump_artist = None  # Single scatter collection for bump density
+        self.measurement_artist = None
+        self.show_connections = True
+        self.show_bumps = False
+        self.bump_bins = 64  # Density bins along the longest side of the view
+        self.lod_fraction = 0.05  # Hide labels/regions of chiplets smaller than this fraction of the view
+        self.bump_maps: dict[str, BumpMapData] = {}  # Cache of parsed bump maps
+
         # Logger
         self.logger = logging.getLogger('py3dblox.viewer')
 
-        # Setup UI
-        self._setup_ui()
-
     def _setup_ui(self):
         """Setup the user interface."""
         # Menu bar
@@ -100,6 +116,7 @@ class ThreeDBloxViewer:
         ttk.Button(control_frame, text="Reset View", command=self._reset_view).pack(side=tk.LEFT, padx=2)
         ttk.Button(control_frame, text="Toggle Grid", command=self._toggle_grid).pack(side=tk.LEFT, padx=2)
         ttk.Button(control_frame, text="Toggle Connections", command=self._toggle_connections).pack(side=tk.LEFT, padx=2)
+        ttk.Button(control_frame, text="Toggle Bumps", command=self._toggle_bumps).pack(side=tk.LEFT, padx=2)
 
         self.measure_btn = ttk.Button(control_frame, text="Measure Distance", command=self._toggle_measurement)
         self.measure_btn.pack(side=tk.LEFT, padx=2)
@@ -151,6 +168,10 @@ class ThreeDBloxViewer:
         # Bind click event for selection
         self.canvas.mpl_connect('button_press_event', self._on_click)
 
+        # Re-evaluate the level of detail after zooming or panning
+        self.canvas.mpl_connect('button_release_event', self._on_view_change)
+        self.canvas.mpl_connect('scroll_event', self._on_view_change)
+
         # Show initial state
         self._update_file_info()
 
@@ -167,17 +188,7 @@ class ThreeDBloxViewer:
             return
 
         try:
-            self.current_file = Path(filename)
-            self.data = parse(filename)
-            self.logger.info(f"Loaded file: {filename}")
-
-            # Load chiplet definitions
-            self._load_chiplet_defs()
-
-            # Reset state
-            self.selected_chiplet = None
-            self.measurement_points = []
-            self.measurement_mode = False
+            self._load_file(filename)
             self.measure_label.config(text="")
 
             # Update UI
@@ -189,6 +200,25 @@ class ThreeDBloxViewer:
             messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
             self.logger.error(f"Failed to load file: {e}", exc_info=True)
 
+    def _load_file(self, filename):
+        """Parse a 3dblox file and reset the per-file state.
+
+        Args:
+            filename: Path to a .3dbx or .3dbv file.
+        """
+        self.current_file = Path(filename)
+        self.data = parse(filename)
+        self.logger.info(f"Loaded file: {filename}")
+
+        # Load chiplet definitions
+        self._load_chiplet_defs()
+
+        # Reset state
+        self.selected_chiplet = None
+        self.measurement_points = []
+        self.measurement_mode = False
+        self.bump_maps.clear()
+
     def _update_file_info(self):
         """Update the file information display."""
         self.file_info_text.config(state=tk.NORMAL)
@@ -281,7 +311,7 @@ class ThreeDBloxViewer:
 
     def _on_visibility_change(self):
         """Handle visibility checkbox changes."""
-        self._render_3d_view()
+        self._update_scene()
 
     def _select_chiplet(self, name: str):
         """Select a chiplet and show its details.
@@ -291,7 +321,7 @@ class ThreeDBloxViewer:
         """
         self.selected_chiplet = name
         self._update_details()
-        self._render_3d_view()
+        self._update_scene()
 
     def _update_details(self):
         """Update the details panel with selected chiplet information."""
@@ -363,42 +393,46 @@ class ThreeDBloxViewer:
         self.details_text.config(state=tk.DISABLED)
 
     def _render_3d_view(self):
-        """Render the 3D view of the stack."""
+        """Build the scene graph of the 3D view.
+
+        This is only done when a file is loaded.  Visibility, selection and
+        level-of-detail changes update the existing artists in place through
+        _update_scene.
+        """
         self.ax.clear()
         self.ax.set_xlabel('X (μm)')
         self.ax.set_ylabel('Y (μm)')
         self.ax.set_zlabel('Z (μm)')
         self.ax.set_title('3D Stack View')
 
+        self.scene.clear()
+        self.connection_artists.clear()
+        self.bump_artist = None
+        self.measurement_artist = None
+
         if not self.data:
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
-        self.chiplet_artists.clear()
-
         if isinstance(self.data, DbxData):
-            self._render_dbx_data()
+            self._build_dbx_scene()
         elif isinstance(self.data, DbvData):
-            self._render_dbv_data()
+            self._build_dbv_scene()
 
         # Set equal aspect ratio
         self._set_axes_equal()
-        self.canvas.draw()
+        self._update_scene()
 
-    def _render_dbx_data(self):
-        """Render .3dbx data (chiplet instances in a stack)."""
+    def _build_dbx_scene(self):
+        """Build artists for .3dbx data (chiplet instances in a stack)."""
         for name, inst in self.data.chiplet_instances.items():
-            # Check visibility
-            if name in self.chiplet_visibility and not self.chiplet_visibility[name].get():
-                continue
-
             # Get dimensions from referenced chiplet definition
             width = 1000.0  # Default width
             height = 1000.0  # Default height
             thickness = 100.0  # Default thickness
 
-            if inst.reference in self.chiplet_defs:
-                chiplet_def = self.chiplet_defs[inst.reference]
+            chiplet_def = self.chiplet_defs.get(inst.reference)
+            if chiplet_def:
                 if chiplet_def.design_width > 0:
                     width = chiplet_def.design_width
                 if chiplet_def.design_height > 0:
@@ -406,81 +440,98 @@ class ThreeDBloxViewer:
                 if chiplet_def.thickness > 0:
                     thickness = chiplet_def.thickness
 
-            x = inst.loc.x
-            y = inst.loc.y
-            z = inst.z
-
-            # Create cuboid for chiplet
-            color = self._get_chiplet_color(name)
-            alpha = 0.9 if name == self.selected_chiplet else 0.6
-
-            vertices, faces = self._create_cuboid(x, y, z, width, height, thickness)
-
-            poly = Poly3DCollection(faces, alpha=alpha, facecolor=color, edgecolor='black', linewidth=1.5 if name == self.selected_chiplet else 0.5)
-            self.ax.add_collection3d(poly)
-
-            # Add label
-            cx = x + width / 2
-            cy = y + height / 2
-            cz = z + thickness / 2
-            self.ax.text(cx, cy, cz, name, fontsize=9, ha='center', va='center', weight='bold' if name == self.selected_chiplet else 'normal')
+            transform = self._inst_transform(inst)
+            corners = transform(np.array([[0.0, 0.0], [width, height]]))
+            x0, y0 = corners.min(axis=0)
+            x1, y1 = corners.max(axis=0)
 
-            self.chiplet_artists[name] = (poly, width, height, thickness)  # Store dimensions for later use
+            self._add_chiplet(name, x0, y0, x1, y1, inst.z, thickness)
+            if chiplet_def:
+                self._add_regions(name, chiplet_def, transform, inst.z, thickness)
 
-        # Render connections
-        self._render_connections()
+        self._build_connections()
 
-    def _render_dbv_data(self):
-        """Render .3dbv data (chiplet definitions)."""
+    def _build_dbv_scene(self):
+        """Build artists for .3dbv data (chiplet definitions)."""
         z_offset = 0
         spacing = 50  # Spacing between chiplets in vertical display
 
         for name, chiplet in self.data.chiplet_defs.items():
-            # Check visibility
-            if name in self.chiplet_visibility and not self.chiplet_visibility[name].get():
-                continue
-
             x = chiplet.offset.x
             y = chiplet.offset.y
-            z = z_offset
             width = chiplet.design_width if chiplet.design_width > 0 else 1000.0
             height = chiplet.design_height if chiplet.design_height > 0 else 1000.0
             thickness = chiplet.thickness if chiplet.thickness > 0 else 100.0
 
-            # Create cuboid for chiplet
-            color = self._get_chiplet_color(name)
-            alpha = 0.9 if name == self.selected_chiplet else 0.6
-
-            vertices, faces = self._create_cuboid(x, y, z, width, height, thickness)
+            self._add_chiplet(name, x, y, x + width, y + height, z_offset, thickness)
+            self._add_regions(name, chiplet, lambda xy: np.asarray(xy, dtype=float),
+                              z_offset, thickness)
 
-            poly = Poly3DCollection(faces, alpha=alpha, facecolor=color, edgecolor='black', linewidth=1.5 if name == self.selected_chiplet else 0.5)
-            self.ax.add_collection3d(poly)
+            z_offset += thickness + spacing
 
-            # Add label
-            cx = x + width / 2
-            cy = y + height / 2
-            cz = z + thickness / 2
-            self.ax.text(cx, cy, cz, name, fontsize=9, ha='center', va='center', weight='bold' if name == self.selected_chiplet else 'normal')
+    @staticmethod
+    def _inst_transform(inst: ChipletInst):
+        """Return a function mapping chiplet coordinates to global coordinates.
 
-            self.chiplet_artists[name] = (poly, width, height, thickness)  # Store dimensions for later use
+        Args:
+            inst: The chiplet instance.
 
-            # Render regions
-            self._render_regions(chiplet, z, thickness)
+        Returns:
+            Function taking and returning an (N, 2) array.
+        """
+        try:
+            a, b, c, d = orient_matrix(inst.orient)
+        except ValueError:
+            a, b, c, d = orient_matrix("R0")
+        matrix = np.array([[a, c], [b, d]], dtype=float)
+        offset = np.array([inst.loc.x, inst.loc.y])
+        return lambda xy: np.asarray(xy, dtype=float) @ matrix + offset
 
-            z_offset += thickness + spacing
+    def _add_chiplet(self, name: str, x0: float, y0: float, x1: float, y1: float,
+                     z: float, thickness: float):
+        """Create the body and label artists of a chiplet.
 
-    def _render_regions(self, chiplet: ChipletDef, z_base: float, thickness: float):
-        """Render chiplet regions as colored outlines.
+        Args:
+            name: The chiplet name.
+            x0, y0, x1, y1: Footprint in global coordinates.
+            z: Bottom z-coordinate.
+            thickness: Size in z direction.
+        """
+        _, faces = self._create_cuboid(x0, y0, z, x1 - x0, y1 - y0, thickness)
+        body = Poly3DCollection(faces, alpha=0.6, facecolor=self._get_chiplet_color(name),
+                                edgecolor='black', linewidth=0.5)
+        self.ax.add_collection3d(body)
+
+        label = self.ax.text((x0 + x1) / 2, (y0 + y1) / 2, z + thickness / 2, name,
+                             fontsize=9, ha='center', va='center')
+
+        self.scene[name] = {
+            'body': body,
+            'label': label,
+            'regions': None,
+            'bumps': None,
+            'footprint': (x0, y0, x1, y1),
+            'z': z,
+            'thickness': thickness,
+        }
+
+    def _add_regions(self, name: str, chiplet: ChipletDef, transform,
+                     z_base: float, thickness: float):
+        """Create one line collection with all region outlines of a chiplet.
+
+        Bump maps of the regions are loaded here as well so the bump density
+        layer can be drawn without reparsing.
 
         Args:
+            name: The chiplet name.
             chiplet: The chiplet definition.
+            transform: Function mapping chiplet to global coordinates.
             z_base: The base z-coordinate of the chiplet.
             thickness: The thickness of the chiplet.
         """
-        for region_name, region in chiplet.regions.items():
-            if not region.coords:
-                continue
-
+        outlines = []
+        bumps = []
+        for region in chiplet.regions.values():
             # Determine z position based on side
             if region.side == 'front':
                 z = z_base
@@ -489,64 +540,161 @@ class ThreeDBloxViewer:
             else:
                 z = z_base + thickness / 2
 
-            # Draw region boundary
-            xs = [coord.x for coord in region.coords] + [region.coords[0].x]
-            ys = [coord.y for coord in region.coords] + [region.coords[0].y]
-            zs = [z] * len(xs)
+            if region.coords:
+                xy = transform([[coord.x, coord.y] for coord in region.coords])
+                xy = np.vstack([xy, xy[:1]])
+                outlines.append(np.column_stack([xy, np.full(len(xy), z)]))
 
-            self.ax.plot(xs, ys, zs, color='red', linewidth=2, alpha=0.8, label=f"{region_name}")
+            bump_map = self._load_bump_map(region.bmap)
+            if bump_map and bump_map.entries:
+                xy = transform([[entry.x, entry.y] for entry in bump_map.entries])
+                bumps.append(np.column_stack([xy, np.full(len(xy), z)]))
 
-    def _render_connections(self):
-        """Render connections between chiplets."""
-        if not isinstance(self.data, DbxData):
-            return
+        entry = self.scene[name]
+        if outlines:
+            regions = Line3DCollection(outlines, colors='red', linewidths=2, alpha=0.8)
+            self.ax.add_collection3d(regions)
+            entry['regions'] = regions
+        if bumps:
+            entry['bumps'] = np.vstack(bumps)
+
+    def _load_bump_map(self, bmap: str) -> Optional[BumpMapData]:
+        """Parse a bump map file once and cache it.
+
+        Args:
+            bmap: Path to the .bmap file, may be empty.
 
+        Returns:
+            BumpMapData object, or None if there is no readable bump map.
+        """
+        if not bmap:
+            return None
+        if bmap not in self.bump_maps:
+            try:
+                self.bump_maps[bmap] = BmapParser(logger=self.logger).parse_file(bmap)
+            except (IOError, ValueError) as e:
+                self.logger.warning(f"Failed to load bump map {bmap}: {e}")
+                self.bump_maps[bmap] = None
+        return self.bump_maps[bmap]
+
+    def _build_connections(self):
+        """Create the lines of connections between chiplets."""
         for name, conn in self.data.connections.items():
+            # Handle virtual connections (indicated by ~)
+            if not conn.top or not conn.bot or conn.top == '~' or conn.bot == '~':
+                continue
+
             # Parse connection endpoints (format: "inst.regions.name")
-            try:
-                top_parts = conn.top.split('.')
-                bot_parts = conn.bot.split('.')
+            top = self.scene.get(conn.top.split('.')[0])
+            bot = self.scene.get(conn.bot.split('.')[0])
+            if not top or not bot:
+                self.logger.warning(f"Failed to render connection {name}")
+                continue
 
-                # Handle virtual connections (indicated by ~)
-                if conn.top == '~' or conn.bot == '~':
-                    continue
+            # Draw connection line from top of bottom chiplet to bottom of top chiplet
+            bx0, by0, bx1, by1 = bot['footprint']
+            tx0, ty0, tx1, ty1 = top['footprint']
+            line, = self.ax.plot([(bx0 + bx1) / 2, (tx0 + tx1) / 2],
+                                 [(by0 + by1) / 2, (ty0 + ty1) / 2],
+                                 [bot['z'] + bot['thickness'], top['z']],
+                                 color='blue', linewidth=2, linestyle='--', alpha=0.7, label=name)
+            self.connection_artists[name] = (line, conn.top.split('.')[0], conn.bot.split('.')[0])
 
-                if len(top_parts) >= 1 and len(bot_parts) >= 1:
-                    top_inst_name = top_parts[0]
-                    bot_inst_name = bot_parts[0]
+    def _is_visible(self, name: str) -> bool:
+        """Return whether a chiplet is checked as visible.
 
-                    top_inst = self.data.chiplet_instances.get(top_inst_name)
-                    bot_inst = self.data.chiplet_instances.get(bot_inst_name)
+        Args:
+            name: The chiplet name.
+        """
+        var = self.chiplet_visibility.get(name)
+        return var is None or var.get()
+
+    def _update_scene(self):
+        """Update visibility and selection of existing artists and redraw."""
+        for name, entry in self.scene.items():
+            visible = self._is_visible(name)
+            selected = name == self.selected_chiplet
+
+            entry['body'].set_visible(visible)
+            entry['body'].set_alpha(0.9 if selected else 0.6)
+            entry['body'].set_linewidth(1.5 if selected else 0.5)
+            entry['label'].set_fontweight('bold' if selected else 'normal')
+
+        for line, top_name, bot_name in self.connection_artists.values():
+            line.set_visible(self.show_connections
+                             and self._is_visible(top_name)
+                             and self._is_visible(bot_name))
+
+        self._update_bump_layer()
+        self._apply_lod()
+        self.canvas.draw_idle()
+
+    def _update_bump_layer(self):
+        """Draw the bumps of all visible chiplets as one density scatter.
+
+        Bumps are binned on a grid so the number of points drawn is bounded
+        by the number of bins rather than the number of bumps.
+        """
+        if self.bump_artist is not None:
+            self.bump_artist.remove()
+            self.bump_artist = None
 
-                    if top_inst and bot_inst:
-                        # Get chiplet dimensions
-                        top_dims = self.chiplet_artists.get(top_inst_name)
-                        bot_dims = self.chiplet_artists.get(bot_inst_name)
+        if not self.show_bumps:
+            return
 
-                        # Use center of chiplets, with proper dimensions
-                        if top_dims and len(top_dims) == 4:
-                            _, top_w, top_h, top_t = top_dims
-                        else:
-                            top_w, top_h, top_t = 1000.0, 1000.0, 100.0
+        points = [entry['bumps'] for name, entry in self.scene.items()
+                  if entry['bumps'] is not None and self._is_visible(name)]
+        if not points:
+            return
+        points = np.vstack(points)
+
+        x_min, y_min = points[:, 0].min(), points[:, 1].min()
+        span = max(points[:, 0].max() - x_min, points[:, 1].max() - y_min)
+        bin_size = span / self.bump_bins if span > 0 else 1.0
+        keys = np.column_stack([
+            np.floor((points[:, 0] - x_min) / bin_size),
+            np.floor((points[:, 1] - y_min) / bin_size),
+            points[:, 2],
+        ])
+        bins, counts = np.unique(keys, axis=0, return_counts=True)
 
-                        if bot_dims and len(bot_dims) == 4:
-                            _, bot_w, bot_h, bot_t = bot_dims
-                        else:
-                            bot_w, bot_h, bot_t = 1000.0, 1000.0, 100.0
+        self.bump_artist = self.ax.scatter(
+            x_min + (bins[:, 0] + 0.5) * bin_size,
+            y_min + (bins[:, 1] + 0.5) * bin_size,
+            bins[:, 2],
+            c=counts, cmap='viridis', s=4, depthshade=False,
+        )
 
-                        # Draw connection line from top of bottom chiplet to bottom of top chiplet
-                        x1 = bot_inst.loc.x + bot_w / 2
-                        y1 = bot_inst.loc.y + bot_h / 2
-                        z1 = bot_inst.z + bot_t  # Top surface of bottom chiplet
+    def _apply_lod(self) -> bool:
+        """Hide labels and regions of chiplets that are small in the view.
 
-                        x2 = top_inst.loc.x + top_w / 2
-                        y2 = top_inst.loc.y + top_h / 2
-                        z2 = top_inst.z  # Bottom surface of top chiplet
+        Returns:
+            True if the visibility of any artist changed.
+        """
+        x_lo, x_hi = self.ax.get_xlim()
+        y_lo, y_hi = self.ax.get_ylim()
+        span = max(x_hi - x_lo, y_hi - y_lo)
+
+        changed = False
+        for name, entry in self.scene.items():
+            x0, y0, x1, y1 = entry['footprint']
+            detailed = (self._is_visible(name)
+                        and max(x1 - x0, y1 - y0) >= self.lod_fraction * span)
+            for key in ('label', 'regions'):
+                artist = entry[key]
+                if artist is not None and artist.get_visible() != detailed:
+                    artist.set_visible(detailed)
+                    changed = True
+        return changed
+
+    def _on_view_change(self, event):
+        """Re-evaluate the level of detail after the view changed.
 
-                        self.ax.plot([x1, x2], [y1, y2], [z1, z2],
-                                   color='blue', linewidth=2, linestyle='--', alpha=0.7, label=name)
-            except Exception as e:
-                self.logger.warning(f"Failed to render connection {name}: {e}")
+        Args:
+            event: The matplotlib mouse event.
+        """
+        if self.scene and self._apply_lod():
+            self.canvas.draw_idle()
 
     def _create_cuboid(self, x: float, y: float, z: float, width: float, height: float, depth: float):
         """Create vertices and faces for a cuboid.
@@ -608,45 +756,32 @@ class ThreeDBloxViewer:
 
     def _set_axes_equal(self):
         """Set equal aspect ratio for 3D plot."""
-        if not self.data:
+        if not self.scene:
             return
 
-        # Get all vertices from rendered objects
+        # Get the extents of all chiplets in the scene
         all_coords = []
-
-        if isinstance(self.data, DbxData):
-            for inst in self.data.chiplet_instances.values():
-                all_coords.extend([
-                    [inst.loc.x, inst.loc.y, inst.z],
-                    [inst.loc.x + 1000, inst.loc.y + 1000, inst.z + 100]
-                ])
-        elif isinstance(self.data, DbvData):
-            z = 0
-            for chiplet in self.data.chiplet_defs.values():
-                w = chiplet.design_width if chiplet.design_width > 0 else 1000.0
-                h = chiplet.design_height if chiplet.design_height > 0 else 1000.0
-                t = chiplet.thickness if chiplet.thickness > 0 else 100.0
-                all_coords.extend([
-                    [chiplet.offset.x, chiplet.offset.y, z],
-                    [chiplet.offset.x + w, chiplet.offset.y + h, z + t]
-                ])
-                z += t + 50
-
-        if all_coords:
-            all_coords = np.array(all_coords)
-            max_range = np.array([
-                all_coords[:, 0].max() - all_coords[:, 0].min(),
-                all_coords[:, 1].max() - all_coords[:, 1].min(),
-                all_coords[:, 2].max() - all_coords[:, 2].min()
-            ]).max() / 2.0
-
-            mid_x = (all_coords[:, 0].max() + all_coords[:, 0].min()) * 0.5
-            mid_y = (all_coords[:, 1].max() + all_coords[:, 1].min()) * 0.5
-            mid_z = (all_coords[:, 2].max() + all_coords[:, 2].min()) * 0.5
-
-            self.ax.set_xlim(mid_x - max_range, mid_x + max_range)
-            self.ax.set_ylim(mid_y - max_range, mid_y + max_range)
-            self.ax.set_zlim(mid_z - max_range, mid_z + max_range)
+        for entry in self.scene.values():
+            x0, y0, x1, y1 = entry['footprint']
+            all_coords.extend([
+                [x0, y0, entry['z']],
+                [x1, y1, entry['z'] + entry['thickness']]
+            ])
+
+        all_coords = np.array(all_coords)
+        max_range = np.array([
+            all_coords[:, 0].max() - all_coords[:, 0].min(),
+            all_coords[:, 1].max() - all_coords[:, 1].min(),
+            all_coords[:, 2].max() - all_coords[:, 2].min()
+        ]).max() / 2.0
+
+        mid_x = (all_coords[:, 0].max() + all_coords[:, 0].min()) * 0.5
+        mid_y = (all_coords[:, 1].max() + all_coords[:, 1].min()) * 0.5
+        mid_z = (all_coords[:, 2].max() + all_coords[:, 2].min()) * 0.5
+
+        self.ax.set_xlim(mid_x - max_range, mid_x + max_range)
+        self.ax.set_ylim(mid_y - max_range, mid_y + max_range)
+        self.ax.set_zlim(mid_z - max_range, mid_z + max_range)
 
     def _reset_view(self):
         """Reset the 3D view to default angle."""
@@ -660,8 +795,13 @@ class ThreeDBloxViewer:
 
     def _toggle_connections(self):
         """Toggle connection visibility."""
-        # Re-render to toggle connections
-        self._render_3d_view()
+        self.show_connections = not self.show_connections
+        self._update_scene()
+
+    def _toggle_bumps(self):
+        """Toggle the bump density layer."""
+        self.show_bumps = not self.show_bumps
+        self._update_scene()
 
     def _toggle_measurement(self):
         """Toggle distance measurement mode."""
@@ -675,7 +815,14 @@ class ThreeDBloxViewer:
             self.measure_btn.config(text="Measure Distance")
             self.measure_label.config(text="")
             self.measurement_points = []
-            self._render_3d_view()
+            self._clear_measurement()
+
+    def _clear_measurement(self):
+        """Remove the measurement line from the view."""
+        if self.measurement_artist is not None:
+            self.measurement_artist.remove()
+            self.measurement_artist = None
+            self.canvas.draw_idle()
 
     def _on_click(self, event):
         """Handle click events on the 3D canvas.
@@ -702,9 +849,11 @@ class ThreeDBloxViewer:
                     self.measure_label.config(text=f"Distance: {dist:.2f} μm")
 
                     # Draw measurement line
-                    self.ax.plot([p1[0], p2[0]], [p1[1], p2[1]], [p1[2], p2[2]],
-                               color='green', linewidth=2, marker='o')
-                    self.canvas.draw()
+                    self._clear_measurement()
+                    self.measurement_artist, = self.ax.plot(
+                        [p1[0], p2[0]], [p1[1], p2[1]], [p1[2], p2[2]],
+                        color='green', linewidth=2, marker='o')
+                    self.canvas.draw_idle()
 
                     # Reset measurement mode
                     self.measurement_mode = False
@@ -41,6 +41,7 @@ setup(
     python_requires=">=3.10",
     install_requires=[
         "PyYAML>=6.0",
+        "numpy>=1.20.0",
     ],
     extras_require={
         "dev": [
@@ -51,7 +52,6 @@ setup(
         ],
         "viewer": [
             "matplotlib>=3.5.0",
-            "numpy>=1.20.0",
         ],
     },
     entry_points={
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test script for the bump alignment checker.
+
+Builds a small two-chiplet stack with bump maps in a temporary directory
+and checks matched, misaligned, unmatched and net-mismatched bumps.
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir.parent))
+
+from py3dblox import check_bump_alignment, parse_dbx
+from py3dblox.alignment import GlobalBump, match_bumps, orient_matrix
+
+DBV = """
+Header:
+  version: "1.0"
+  unit: "micron"
+  precision: 1000
+
+ChipletDef:
+  Base:
+    type: die
+    design_area: [100, 100]
+    thickness: 50
+    regions:
+      top_side:
+        side: front
+        bmap: base.bmap
+        coords: [[0, 0], [100, 0], [100, 100], [0, 100]]
+  Die:
+    type: die
+    design_area: [20, 20]
+    thickness: 50
+    regions:
+      bumps:
+        side: back
+        bmap: die.bmap
+        coords: [[0, 0], [20, 0], [20, 20], [0, 20]]
+"""
+
+DBX = """
+Header:
+  version: "1.0"
+  unit: "micron"
+  precision: 1000
+  include:
+    - chiplets.3dbv
+
+Design:
+  name: "AlignTest"
+
+ChipletInst:
+  base:
+    reference: Base
+  die:
+    reference: Die
+
+Stack:
+  base:
+    loc: [0.0, 0.0]
+    z: 0.0
+    orient: R0
+  die:
+    loc: [50.0, 40.0]
+    z: 50.0
+    orient: MZ_R90
+
+Connection:
+  die_to_base:
+    top: die.regions.bumps
+    bot: base.regions.top_side
+  die_to_void:
+    top: die.regions.bumps
+    bot: ~
+"""
+
+# Die bumps (x, y) map to (50 - y, 40 + x) under R90 at loc (50, 40).
+DIE_BMAP = """
+d0 BUMP 0.0 0.0 - n0
+d1 BUMP 10.0 0.0 - n1
+d2 BUMP 0.0 10.0 - n2
+d3 BUMP 10.0 10.0 - n3
+"""
+
+BASE_BMAP = """
+b0 BUMP 50.0 40.0 - n0
+b1 BUMP 50.0 50.05 - n1
+b2 BUMP 40.0 40.0 - nX
+b3 BUMP 70.0 70.0 - n3
+"""
+
+
+def _write_stack(directory: Path) -> Path:
+    (directory / "chiplets.3dbv").write_text(DBV)
+    (directory / "die.bmap").write_text(DIE_BMAP)
+    (directory / "base.bmap").write_text(BASE_BMAP)
+    dbx_file = directory / "stack.3dbx"
+    dbx_file.write_text(DBX)
+    return dbx_file
+
+
+def test_orient_matrix():
+    """Test orientation aliases resolve like the C++ reader."""
+    assert orient_matrix("R0") == orient_matrix("MZ")
+    assert orient_matrix("MY_R180") == orient_matrix("MX")
+    assert orient_matrix("MZ_MX_R270") == orient_matrix("MY_R90")
+    try:
+        orient_matrix("R45")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid orient was accepted")
+
+
+def test_match_bumps():
+    """Test matching on bumps straddling column boundaries."""
+    top = [GlobalBump("t", "r", f"t{i}", "n", i * 2.0, -1e-3) for i in range(100)]
+    bot = [GlobalBump("b", "r", f"b{i}", "n", i * 2.0 + 1e-3, 0.0) for i in range(100)]
+    result = match_bumps(top, bot, tolerance=0.01)
+    assert len(result.matched) == 100
+    assert all(p.top.bump_inst_name[1:] == p.bot.bump_inst_name[1:]
+               for p in result.matched)
+    assert result.is_aligned
+
+
+def test_match_bumps_contested():
+    """Test nearby bumps competing for the same bottom bump in order."""
+    rng = random.Random(3)
+    top = [GlobalBump("t", "r", f"t{i}", "n", rng.uniform(0, 20),
+                      rng.uniform(0, 20)) for i in range(300)]
+    bot = [GlobalBump("b", "r", f"b{i}", "n", rng.uniform(0, 20),
+                      rng.uniform(0, 20)) for i in range(300)]
+    result = match_bumps(top, bot, tolerance=0.5, search_radius=1.5)
+
+    # Greedy reference: nearest unused bottom bump, lowest index on ties.
+    used = set()
+    expected = {}
+    for t in top:
+        candidates = [((b.x - t.x) ** 2 + (b.y - t.y) ** 2, i)
+                      for i, b in enumerate(bot) if i not in used]
+        candidates = [c for c in candidates if c[0] <= 1.5 ** 2]
+        if candidates:
+            _, index = min(candidates)
+            used.add(index)
+            expected[t.bump_inst_name] = bot[index].bump_inst_name
+    pairs = {p.top.bump_inst_name: p.bot.bump_inst_name
+             for p in result.matched + result.misaligned}
+    assert pairs == expected
+    assert len(result.unmatched_top) == len(top) - len(expected)
+    assert len(result.unmatched_bot) == len(bot) - len(expected)
+    assert all(p.distance <= 0.5 for p in result.matched)
+    assert all(0.5 < p.distance <= 1.5 for p in result.misaligned)
+
+
+def test_check_bump_alignment():
+    """Test a full stack with every kind of violation."""
+    with tempfile.TemporaryDirectory() as tmp:
+        dbx = parse_dbx(_write_stack(Path(tmp)))
+        report = check_bump_alignment(dbx, tolerance=0.01, search_radius=1.0)
+
+    assert set(report.skipped) == {"die_to_void"}
+    result = report.connections["die_to_base"]
+    matched = {(p.top.bump_inst_name, p.bot.bump_inst_name)
+               for p in result.matched}
+    assert matched == {("d0", "b0"), ("d2", "b2")}
+    assert [(p.top.bump_inst_name, p.bot.bump_inst_name)
+            for p in result.net_mismatches] == [("d2", "b2")]
+    assert [(p.top.bump_inst_name, p.bot.bump_inst_name)
+            for p in result.misaligned] == [("d1", "b1")]
+    assert [b.bump_inst_name for b in result.unmatched_top] == ["d3"]
+    assert [b.bump_inst_name for b in result.unmatched_bot] == ["b3"]
+    assert not report.is_aligned
+
+
+def main():
+    """Run all tests."""
+    test_orient_matrix()
+    test_match_bumps()
+    test_match_bumps_contested()
+    test_check_bump_alignment()
+    print("✓ All alignment tests passed")
+
+
+if __name__ == '__main__':
+    main()
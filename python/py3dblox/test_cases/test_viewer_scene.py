@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the 3D Blox viewer scene graph.
+
+Loads the test stacks into a viewer without a window, draws the scene on
+an Agg canvas and checks the artists built for each chiplet.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir.parent))
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from py3dblox.viewer import ThreeDBloxViewer
+
+
+def _make_viewer():
+    """Return a viewer drawing on an Agg canvas instead of a Tk window."""
+    viewer = ThreeDBloxViewer.__new__(ThreeDBloxViewer)
+    viewer._init_state()
+    figure = Figure()
+    viewer.canvas = FigureCanvasAgg(figure)
+    viewer.ax = figure.add_subplot(111, projection='3d')
+    return viewer
+
+
+def _load(filename):
+    """Load a test file, build its scene and draw it."""
+    viewer = _make_viewer()
+    viewer._load_file(test_dir / filename)
+    viewer._render_3d_view()
+    viewer.canvas.draw()
+    return viewer
+
+
+def test_dbx_scene():
+    """Test the scene of a stack of chiplet instances."""
+    viewer = _load("complex_stack.3dbx")
+    assert set(viewer.scene) == set(viewer.data.chiplet_instances)
+    for name, inst in viewer.data.chiplet_instances.items():
+        entry = viewer.scene[name]
+        assert entry['body'] in viewer.ax.collections
+        assert entry['z'] == inst.z
+        x0, y0, x1, y1 = entry['footprint']
+        assert x0 < x1 and y0 < y1
+    assert viewer.connection_artists
+
+
+def test_dbv_scene():
+    """Test the scene of chiplet definitions and their regions."""
+    viewer = _load("single_chiplet.3dbv")
+    assert set(viewer.scene) == set(viewer.data.chiplet_defs)
+    for entry in viewer.scene.values():
+        assert entry['regions'] is not None
+
+
+def test_update_scene():
+    """Test that selection updates the existing artists in place."""
+    viewer = _load("simple_stack.3dbx")
+    name = next(iter(viewer.scene))
+    body = viewer.scene[name]['body']
+    viewer.selected_chiplet = name
+    viewer._update_scene()
+    viewer.canvas.draw()
+    assert viewer.scene[name]['body'] is body
+    assert body.get_linewidth()[0] == 1.5
+
+
+def main():
+    """Run all tests."""
+    test_dbx_scene()
+    test_dbv_scene()
+    test_update_scene()
+    print("✓ All viewer scene tests passed")
+
+
+if __name__ == '__main__':
+    main()
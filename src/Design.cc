@@ -9,12 +9,16 @@
 #include <mutex>
 #include <ostream>
 #include <string>
+#include <vector>
 
 #include "ant/AntennaChecker.hh"
 #include "db_sta/dbNetwork.hh"
 #include "db_sta/dbSta.hh"
 #include "grt/GlobalRouter.h"
+#include "gui/gui.h"
+#include "gui/heatMap.h"
 #include "ifp/InitFloorplan.hh"
+#include "odb/3dblox.h"
 #include "odb/db.h"
 #include "ord/OpenRoad.hh"
 #include "ord/Tech.h"
@@ -103,6 +107,34 @@ void Design::writeDef(const std::string& file_name)
   getOpenRoad()->writeDef(file_name.c_str(), "5.8");
 }
 
+void Design::read3Dbv(const std::string& file_name)
+{
+  getOpenRoad()->read3Dbv(file_name);
+}
+
+void Design::read3Dbx(const std::string& file_name)
+{
+  getOpenRoad()->read3Dbx(file_name);
+}
+
+void Design::read3DBloxBMap(const std::string& file_name)
+{
+  getOpenRoad()->read3DBloxBMap(file_name);
+}
+
+void Design::create3DBloxBumps(odb::dbChipRegion* chip_region,
+                               const std::vector<std::string>& inst_names,
+                               const std::vector<std::string>& cell_types,
+                               const std::vector<double>& xs,
+                               const std::vector<double>& ys,
+                               const std::vector<std::string>& port_names,
+                               const std::vector<std::string>& net_names)
+{
+  odb::ThreeDBlox parser(getLogger(), getDb(), getSta());
+  parser.createBumps(
+      chip_region, inst_names, cell_types, xs, ys, port_names, net_names);
+}
+
 ifp::InitFloorplan Design::getFloorplan()
 {
   auto block = getBlock();
@@ -139,6 +171,19 @@ std::string Design::evalTclString(const std::string& cmd)
   return std::string(Tcl_GetStringResult(tcl_interp));
 }
 
+void Design::getHeatMap(const std::string& name,
+                        const double bin_size,
+                        gui::HeatMapGrid& grid)
+{
+  if (!OpenRoad::getGUICompileOption()) {
+    getLogger()->error(utl::ORD,
+                       105,
+                       "Heat maps are not available as OpenROAD was not "
+                       "compiled with the GUI.");
+  }
+  grid = gui::Gui::get()->getHeatMapGrid(name, bin_size);
+}
+
 Tech* Design::getTech()
 {
   return tech_;
@@ -312,6 +357,11 @@ stt::SteinerTreeBuilder* Design::getSteinerTreeBuilder()
   return getOpenRoad()->getSteinerTreeBuilder();
 }
 
+est::EstimateParasitics* Design::getEstimateParasitics()
+{
+  return getOpenRoad()->getEstimateParasitics();
+}
+
 psm::PDNSim* Design::getPDNSim()
 {
   return getOpenRoad()->getPDNSim();
@@ -72,6 +72,8 @@ using std::string;
   X(stt)                                 \
   X(psm)                                 \
   X(pdn)                                 \
+  X(est)                                 \
+  X(rsz)                                 \
   X(odb)                                 \
   X(ord)
 
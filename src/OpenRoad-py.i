@@ -7,11 +7,14 @@
 
 %{
 
+#include <algorithm>
+
 #include "odb/db.h"
 #include "ord/Tech.h"
 #include "ord/Design.h"
 #include "ord/Timing.h"
 #include "ifp/InitFloorplan.hh"
+#include "gui/heatMap.h"
 
 using odb::dbDatabase;
 using odb::dbBlock;
@@ -50,8 +53,49 @@ get_db_block();
 %template(Corners) std::vector<sta::Corner*>;
 %template(MTerms) std::vector<odb::dbMTerm*>;
 %template(Masters) std::vector<odb::dbMaster*>;
+%template(Doubles) std::vector<double>;
 
 %include "Exception-py.i"
+
+// For Design::getHeatMap, returned as (values, x_grid, y_grid) where values
+// is a rows x cols memoryview of doubles, i.e. numpy.asarray(values)[y, x],
+// and the grids are the bin edges in DBU.
+%typemap(in, numinputs=0) gui::HeatMapGrid& (gui::HeatMapGrid temp) {
+  $1 = &temp;
+}
+
+%typemap(argout) gui::HeatMapGrid& {
+  const int cols = std::max<int>($1->x_grid.size() - 1, 0);
+  const int rows = std::max<int>($1->y_grid.size() - 1, 0);
+  PyObject* buffer = PyByteArray_FromStringAndSize(
+      reinterpret_cast<const char*>($1->values.data()),
+      $1->values.size() * sizeof(double));
+  if (buffer == nullptr) {
+    SWIG_fail;
+  }
+  PyObject* bytes_view = PyMemoryView_FromObject(buffer);
+  Py_DECREF(buffer);
+  if (bytes_view == nullptr) {
+    SWIG_fail;
+  }
+  PyObject* values
+      = PyObject_CallMethod(bytes_view, "cast", "s(ii)", "d", rows, cols);
+  Py_DECREF(bytes_view);
+  if (values == nullptr) {
+    SWIG_fail;
+  }
+  PyObject* x_grid = PyList_New($1->x_grid.size());
+  for (std::size_t i = 0; i < $1->x_grid.size(); i++) {
+    PyList_SetItem(x_grid, i, PyLong_FromLong($1->x_grid[i]));
+  }
+  PyObject* y_grid = PyList_New($1->y_grid.size());
+  for (std::size_t i = 0; i < $1->y_grid.size(); i++) {
+    PyList_SetItem(y_grid, i, PyLong_FromLong($1->y_grid[i]));
+  }
+  PyObject* map = Py_BuildValue("(NNN)", values, x_grid, y_grid);
+  $result = SWIG_Python_AppendOutput($result, map);
+}
+
 %include "ord/Tech.h"
 %include "ord/Design.h"
 %include "ord/Timing.h"
@@ -70,7 +114,9 @@ get_db_block();
 %include "src/pdn/src/PdnGen-py.i"
 %include "src/ppl/src/IOPlacer-py.i"
 %include "src/psm/src/pdnsim-py.i"
+%include "src/est/src/EstimateParasitics-py.i"
 %include "src/rcx/src/ext-py.i"
+%include "src/rsz/src/Resizer-py.i"
 %include "src/stt/src/SteinerTreeBuilder-py.i"
 %include "src/tap/src/tapcell-py.i"
 %import "src/odb/src/swig/common/odb.i"
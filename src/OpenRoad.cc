@@ -355,6 +355,7 @@ void OpenRoad::readDef(const char* filename,
   if (continue_on_errors) {
     def_reader.continueOnErrors();
   }
+  def_reader.setThreadCount(threads_);
   def_reader.readChip(search_libs, filename, chip);
 }
 
@@ -105,6 +105,10 @@ class CtsOptions : public odb::dbBlockCallBackObj
   {
     return charWirelengthIterations_;
   }
+  void setNumThreads(int threads) { numThreads_ = threads; }
+  int getNumThreads() const { return numThreads_; }
+  void setCharCacheDir(const std::string& dir) { charCacheDir_ = dir; }
+  const std::string& getCharCacheDir() const { return charCacheDir_; }
   void setCapSteps(int steps) { capSteps_ = steps; }
   int getCapSteps() const { return capSteps_; }
   void setSlewSteps(int steps) { slewSteps_ = steps; }
@@ -380,6 +384,8 @@ class CtsOptions : public odb::dbBlockCallBackObj
   int capSteps_ = 20;
   int slewSteps_ = 7;
   unsigned charWirelengthIterations_ = 4;
+  std::string charCacheDir_;
+  int numThreads_ = 1;
   unsigned clockTreeMaxDepth_ = 100;
   bool enableFakeLutEntries_ = true;
   bool forceBuffersOnLeafLevel_ = true;
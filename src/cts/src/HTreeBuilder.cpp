@@ -1168,7 +1168,7 @@ void HTreeBuilder::legalize()
   }
 }
 
-void HTreeBuilder::run()
+void HTreeBuilder::initSinks()
 {
   double clusterDiameter = (type_ == TreeType::MacroTree)
                                ? options_->getMacroMaxDiameter()
@@ -1207,7 +1207,29 @@ void HTreeBuilder::run()
   minLengthSinkRegion_ = techChar_->getMinSegmentLength() * 2;
 
   initSinkRegion();
+}
 
+bool HTreeBuilder::needsFakeLutEntries() const
+{
+  if (!options_->isFakeLutEntriesEnabled()) {
+    return false;
+  }
+  // same stop criteria as run
+  for (int level = 1; level <= clockTreeMaxDepth_; ++level) {
+    double regionWidth, regionHeight;
+    computeSubRegionSize(level, regionWidth, regionHeight);
+    if (isSubRegionTooSmall(regionWidth, regionHeight)) {
+      return true;
+    }
+    if (isNumberOfSinksTooSmall(computeNumberOfSinksPerSubRegion(level))) {
+      return false;
+    }
+  }
+  return false;
+}
+
+void HTreeBuilder::run()
+{
   for (int level = 1; level <= clockTreeMaxDepth_; ++level) {
     const unsigned numSinksPerSubRegion
         = computeNumberOfSinksPerSubRegion(level);
@@ -154,7 +154,9 @@ class HTreeBuilder : public TreeBuilder
   {
   }
 
+  void initSinks() override;
   void run() override;
+  bool needsFakeLutEntries() const override;
   void findLegalLocations(const Point<double>& parentPoint,
                           const Point<double>& branchPoint,
                           double x1,
@@ -14,6 +14,7 @@
 
 #include "stt/SteinerTreeBuilder.h"
 #include "utl/Logger.h"
+#include "utl/timer.h"
 
 namespace cts {
 
@@ -85,10 +86,14 @@ void SinkClustering::normalizePoints(float maxDiameter)
 void SinkClustering::computeAllThetas()
 {
   if (firstRun_) {
-    for (unsigned idx = 0; idx < points_.size(); ++idx) {
+    const int numPoints = points_.size();
+    thetaIndexVector_.resize(numPoints);
+    const int numThreads = options_->getNumThreads();
+#pragma omp parallel for num_threads(numThreads) if (numPoints > 10000)
+    for (int idx = 0; idx < numPoints; ++idx) {
       const Point<double>& p = points_[idx];
       const double theta = computeTheta(p.getX(), p.getY());
-      thetaIndexVector_.emplace_back(theta, idx);
+      thetaIndexVector_[idx] = {theta, idx};
     }
     // clang-format off
     debugPrint(logger_, CTS, "clustering", 1, "SinkClustering::computeAllThetas:"
@@ -164,6 +169,15 @@ void SinkClustering::run(const unsigned groupSize,
                          float& bestDiameter)
 {
   scaleFactor_ = scaleFactor;
+  const utl::DebugScopedTimer timer(
+      logger_,
+      CTS,
+      "runtime",
+      2,
+      fmt::format("Clustered {} sinks in groups of {} with {} threads in {{}}.",
+                  points_.size(),
+                  groupSize,
+                  options_->getNumThreads()));
 
   // clang-format off
   debugPrint(logger_, CTS, "clustering", 1, "SinkClustering::run points_ "
@@ -192,19 +206,6 @@ void SinkClustering::run(const unsigned groupSize,
 
 bool SinkClustering::findBestMatching(const unsigned groupSize)
 {
-  // Counts how many clusters are in each solution.
-  vector<unsigned> clusters(groupSize, 0);
-  // Keeps track of the total cost of each solution.
-  vector<double> costs(groupSize, 0);
-  vector<double> previousCosts(groupSize, 0);
-  // Has the points for each cluster of each solution.
-  vector<vector<vector<Point<double>>>> solutionPoints;
-  // Has the points index for each cluster of each solution.
-  // example: solutionsPointsIdx[solutionId][clusterIdx][pointIdx]
-  vector<vector<vector<unsigned>>> solutionPointsIdx;
-  // Has the sink indexes for each cluster of each solution.
-  vector<vector<vector<unsigned>>> solutions;
-
   if (useMaxCapLimit_) {
     debugPrint(logger_,
                CTS,
@@ -213,159 +214,28 @@ bool SinkClustering::findBestMatching(const unsigned groupSize)
                "Clustering with max cap limit of {:.3e}",
                options_->getSinkBufferInputCap() * max_cap__factor_);
   }
-  // Iterates over the theta vector.
-  for (unsigned i = 0; i < thetaIndexVector_.size(); ++i) {
-    // The - groupSize is because each solution will start on a different index.
-    // There is groupSize solutions.
-    for (unsigned j = 0; j < groupSize; ++j) {
-      if ((i + j) < thetaIndexVector_.size()) {
-        // Add vectors in case they are no allocated yet.
-        if (solutions.size() < (j + 1)) {
-          solutions.emplace_back();
-          solutionPoints.emplace_back();
-          solutionPointsIdx.emplace_back();
-        }
-        if (solutions[j].size() < (clusters[j] + 1)) {
-          solutions[j].emplace_back();
-          solutionPoints[j].emplace_back();
-          solutionPointsIdx[j].emplace_back();
-        }
-        // Get the current point
-        const unsigned idx = thetaIndexVector_[i + j].second;
-        const Point<double>& p = points_[idx];
-        double distanceCost = 0;
-        double capCost = pointsCap_[idx];
-        unsigned pointIdx = 0;
-        // Check the distance from the current point to others in the cluster,
-        // if there are any.
-        for (Point<double> comparisonPoint : solutionPoints[j][clusters[j]]) {
-          const double cost = HTree_->computeDist(p, comparisonPoint);
-          if (useMaxCapLimit_) {
-            capCost
-                += cost * capPerUnit_
-                   + pointsCap_[solutionPointsIdx[j][clusters[j]][pointIdx]];
-          }
-          pointIdx++;
-          if (cost > distanceCost) {
-            distanceCost = cost;
-          }
-        }
-        // If the cluster size is higher than groupSize,
-        // or the distance is higher than maxInternalDiameter_
-        //-> start another cluster and save the cost of the current one.
-        if (isLimitExceeded(solutionPoints[j][clusters[j]].size(),
-                            distanceCost,
-                            capCost,
-                            groupSize)) {
-          debugPrint(logger_,
-                     CTS,
-                     "Stree",
-                     4,
-                     "Created cluster of size {}, dia {:.3}, cap {:.3e}",
-                     solutionPoints[j][clusters[j]].size(),
-                     distanceCost,
-                     capCost);
-          // The cost is computed as the highest cost found on the current
-          // cluster
-          if (previousCosts[j] == 0) {
-            previousCosts[j] = maxInternalDiameter_;
-          }
-          costs[j] += previousCosts[j];
-          // A new cluster is defined
-          clusters[j] = clusters[j] + 1;
-          // The cost was already saved, so the same structure can be used for
-          // the next cluster.
-          previousCosts[j] = 0;
-        } else {
-          // Node will be a part of the current cluster, thus, save the highest
-          // cost.
-          if (distanceCost > previousCosts[j]) {
-            previousCosts[j] = distanceCost;
-          }
-        }
-        // Add vectors in case they are no allocated yet. (Depends if a new
-        // cluster was defined above)
-        if (solutions[j].size() < (clusters[j] + 1)) {
-          solutions[j].emplace_back();
-          solutionPoints[j].emplace_back();
-          solutionPointsIdx[j].emplace_back();
-        }
-        // Save the current Point in it's respective cluster. (Depends if a new
-        // cluster was defined above)
-        solutionPoints[j][clusters[j]].push_back(p);
-        solutionPointsIdx[j][clusters[j]].push_back(idx);
-        solutions[j][clusters[j]].push_back(idx);
-      }
-    }
-  }
-
-  // Same computation as above, however, only for the first groupSize Points.
-  for (unsigned i = 0; i < groupSize; ++i) {
-    // This is because every solution after the first one skips a Point (starts
-    // one late).
-    for (unsigned j = (i + 1); j < groupSize; ++j) {
-      if (solutions[j].size() < (clusters[j] + 1)) {
-        solutions[j].emplace_back();
-        solutionPoints[j].emplace_back();
-        solutionPointsIdx[j].emplace_back();
-      }
-      // Thus here we will assign the Points missing from those solutions.
-      const unsigned idx = thetaIndexVector_[i].second;
-      const Point<double>& p = points_[idx];
-      unsigned pointIdx = 0;
-      double distanceCost = 0;
-      double capCost = pointsCap_[idx];
-      for (Point<double> comparisonPoint : solutionPoints[j][clusters[j]]) {
-        const double cost = HTree_->computeDist(p, comparisonPoint);
-        if (useMaxCapLimit_) {
-          capCost += cost * capPerUnit_
-                     + pointsCap_[solutionPointsIdx[j][clusters[j]][pointIdx]];
-        }
-        pointIdx++;
-        if (cost > distanceCost) {
-          distanceCost = cost;
-        }
-      }
-
-      if (isLimitExceeded(solutionPoints[j][clusters[j]].size(),
-                          distanceCost,
-                          capCost,
-                          groupSize)) {
-        debugPrint(logger_,
-                   CTS,
-                   "Stree",
-                   4,
-                   "Created cluster of size {}, dia {:.3}, cap {:.3e}",
-                   solutionPoints[j][clusters[j]].size(),
-                   distanceCost,
-                   capCost);
-        if (previousCosts[j] == 0) {
-          previousCosts[j] = maxInternalDiameter_;
-        }
-        costs[j] += previousCosts[j];
-        clusters[j] = clusters[j] + 1;
-        previousCosts[j] = 0;
-      } else {
-        if (distanceCost > previousCosts[j]) {
-          previousCosts[j] = distanceCost;
-        }
-      }
-      if (solutions[j].size() < (clusters[j] + 1)) {
-        solutions[j].emplace_back();
-        solutionPoints[j].emplace_back();
-        solutionPointsIdx[j].emplace_back();
-      }
-      solutionPoints[j][clusters[j]].push_back(p);
-      solutionPointsIdx[j][clusters[j]].push_back(idx);
-      solutions[j][clusters[j]].push_back(idx);
-    }
+  // There are groupSize solutions, each one starts on a different index of
+  // the theta vector. They are independent, so they are computed in
+  // parallel, and the best one is picked below in order so the result does
+  // not depend on the number of threads.
+  const int numSolutions
+      = std::min<size_t>(groupSize, thetaIndexVector_.size());
+  // Has the sink indexes for each cluster of each solution.
+  vector<vector<vector<unsigned>>> solutions(numSolutions);
+  // Keeps track of the total cost of each solution.
+  vector<double> costs(groupSize, 0);
+  const int numThreads = options_->getNumThreads();
+#pragma omp parallel for num_threads(numThreads) \
+    schedule(dynamic) if (thetaIndexVector_.size() > 10000)
+  for (int j = 0; j < numSolutions; ++j) {
+    costs[j] = clusterFromOffset(j, groupSize, solutions[j]);
   }
 
   unsigned bestSolution = 0;
   bool bestSolutionFound = false;
 
   // Find the solution with minimum cost.
-  for (unsigned j = 1; j < groupSize; ++j) {
+  for (int j = 1; j < numSolutions; ++j) {
     if (logger_->debugCheck(CTS, "clustering", 1)) {
       // clang-format off
       logger_->report("Solution from group has {:0.3f} cost and {}"
@@ -409,10 +279,71 @@ bool SinkClustering::findBestMatching(const unsigned groupSize)
   return bestSolutionFound;
 }
 
+// Iterates over the theta vector starting at index offset and wrapping
+// around, and starts another cluster whenever the current one would exceed
+// the size, diameter or cap limit. Returns the cost of the solution, the
+// sum of the highest cost found on each cluster but the last one.
+double SinkClustering::clusterFromOffset(
+    const unsigned offset,
+    const unsigned groupSize,
+    vector<vector<unsigned>>& clusters) const
+{
+  const size_t numPoints = thetaIndexVector_.size();
+  double cost = 0;
+  double previousCost = 0;
+  clusters.emplace_back();
+  for (size_t i = 0; i < numPoints; ++i) {
+    // Get the current point
+    const unsigned idx = thetaIndexVector_[(offset + i) % numPoints].second;
+    const Point<double>& p = points_[idx];
+    double distanceCost = 0;
+    double capCost = pointsCap_[idx];
+    // Check the distance from the current point to others in the cluster,
+    // if there are any.
+    for (const unsigned clusterIdx : clusters.back()) {
+      const double dist = HTree_->computeDist(p, points_[clusterIdx]);
+      if (useMaxCapLimit_) {
+        capCost += dist * capPerUnit_ + pointsCap_[clusterIdx];
+      }
+      if (dist > distanceCost) {
+        distanceCost = dist;
+      }
+    }
+    // If the cluster size is higher than groupSize,
+    // or the distance is higher than maxInternalDiameter_
+    //-> start another cluster and save the cost of the current one.
+    if (isLimitExceeded(
+            clusters.back().size(), distanceCost, capCost, groupSize)) {
+      debugPrint(logger_,
+                 CTS,
+                 "Stree",
+                 4,
+                 "Created cluster of size {}, dia {:.3}, cap {:.3e}",
+                 clusters.back().size(),
+                 distanceCost,
+                 capCost);
+      // The cost is computed as the highest cost found on the current
+      // cluster
+      if (previousCost == 0) {
+        previousCost = maxInternalDiameter_;
+      }
+      cost += previousCost;
+      clusters.emplace_back();
+      previousCost = 0;
+    } else if (distanceCost > previousCost) {
+      // Node will be a part of the current cluster, thus, save the highest
+      // cost.
+      previousCost = distanceCost;
+    }
+    clusters.back().push_back(idx);
+  }
+  return cost;
+}
+
 bool SinkClustering::isLimitExceeded(const unsigned size,
                                      const double cost,
                                      const double capCost,
-                                     const unsigned sizeLimit)
+                                     const unsigned sizeLimit) const
 {
   if (useMaxCapLimit_) {
     return (capCost > options_->getSinkBufferInputCap() * max_cap__factor_);
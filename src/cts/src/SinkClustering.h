@@ -67,6 +67,9 @@ class SinkClustering
   void sortPoints();
   void writePlotFile();
   bool findBestMatching(unsigned groupSize);
+  double clusterFromOffset(unsigned offset,
+                           unsigned groupSize,
+                           std::vector<std::vector<unsigned>>& clusters) const;
   void writePlotFile(unsigned groupSize);
 
   double computeTheta(double x, double y) const;
@@ -75,7 +78,7 @@ class SinkClustering
   bool isLimitExceeded(unsigned size,
                        double cost,
                        double capCost,
-                       unsigned sizeLimit);
+                       unsigned sizeLimit) const;
   static bool isOne(double pos);
   static bool isZero(double pos);
 
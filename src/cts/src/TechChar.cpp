@@ -3,15 +3,21 @@
 
 #include "TechChar.h"
 
+#include <unistd.h>
+
 #include <algorithm>
 #include <bitset>
 #include <cmath>
 #include <cstddef>
 #include <cstdint>
 #include <deque>
+#include <filesystem>
+#include <fstream>
 #include <functional>
+#include <iomanip>
 #include <iterator>
 #include <limits>
+#include <map>
 #include <ostream>
 #include <sstream>
 #include <string>
@@ -41,6 +47,44 @@ namespace cts {
 
 using utl::CTS;
 
+namespace {
+
+// First line of the characterization cache files; bump it whenever the
+// characterization or the file layout changes.
+constexpr const char* kCacheVersion = "OpenROAD CTS characterization 1";
+
+// A topology has at most 5 nodes (see createPatterns), so its description
+// alternates at most 5 buffers with 6 wire segments.
+constexpr size_t kMaxTopologySize = 11;
+
+uint64_t fnv1a(const char* data,
+               size_t length,
+               uint64_t hash = 0xcbf29ce484222325)
+{
+  for (size_t i = 0; i < length; ++i) {
+    hash ^= static_cast<uint8_t>(data[i]);
+    hash *= 0x00000100000001b3;
+  }
+  return hash;
+}
+
+// Hash of the contents of file, or of its name if it can't be read.
+uint64_t fileHash(const std::string& file)
+{
+  std::ifstream in(file, std::ios::binary);
+  if (!in) {
+    return fnv1a(file.data(), file.size());
+  }
+  uint64_t hash = fnv1a(nullptr, 0);
+  std::vector<char> buffer(1 << 20);
+  while (in.read(buffer.data(), buffer.size()) || in.gcount() > 0) {
+    hash = fnv1a(buffer.data(), in.gcount(), hash);
+  }
+  return hash;
+}
+
+}  // namespace
+
 TechChar::TechChar(CtsOptions* options,
                    odb::dbDatabase* db,
                    sta::dbSta* sta,
@@ -53,7 +97,6 @@ TechChar::TechChar(CtsOptions* options,
       resizer_(resizer),
       estimate_parasitics_(estimate_parasitics),
       openSta_(sta),
-      openStaChar_(nullptr),
       db_network_(db_network),
       logger_(logger),
       resPerDBU_(0.0),
@@ -368,6 +411,12 @@ void TechChar::createFakeEntries(unsigned length, unsigned fakeLength)
   if (length == fakeLength) {
     return;
   }
+  // Every tree builder asks for the same entries, which only need to be
+  // created once.
+  if (fakeEntries_.contains({length, fakeLength})) {
+    return;
+  }
+  fakeEntries_.emplace(length, fakeLength);
 
   if (logger_->debugCheck(utl::CTS, "tech char", 1)) {
     logger_->warn(CTS, 45, "Creating fake entries in the LUT.");
@@ -527,14 +576,6 @@ void TechChar::initCharacterization()
     logger_->error(
         CTS, 541, "Could not find buffer output port for {}.", bufMasterName);
   }
-  // Creates the new characterization block. (Wiresegments are created here
-  // instead of the main block)
-  const char* characterizationBlockName = "CharacterizationBlock";
-  if (auto char_block = block->findChild(characterizationBlockName)) {
-    odb::dbBlock::destroy(char_block);
-  }
-  charBlock_ = odb::dbBlock::create(block, characterizationBlockName);
-
   // Defines the different wirelengths to test and the characterization unit.
   const unsigned wirelengthIterations = options_->getCharWirelengthIterations();
   unsigned maxWirelength = (charBuf_->getHeight() * 10)
@@ -936,6 +977,7 @@ std::vector<float>::iterator TechChar::largestDiffIter(
 }
 
 std::vector<TechChar::SolutionData> TechChar::createPatterns(
+    odb::dbBlock* block,
     unsigned setupWirelength)
 {
   // Sets the number of nodes (wirelength/characterization unit) that a buffer
@@ -963,7 +1005,7 @@ std::vector<TechChar::SolutionData> TechChar::createPatterns(
                                             setupWirelength,
                                             solutionCounter.to_string(),
                                             wireCounter);
-    net = odb::dbNet::create(charBlock_, netName.c_str());
+    net = odb::dbNet::create(block, netName.c_str());
     odb::dbWire::create(net);
     net->setSigType(odb::dbSigType::SIGNAL);
     // Creates the input port.
@@ -999,7 +1041,7 @@ std::vector<TechChar::SolutionData> TechChar::createPatterns(
                    "topo:{}", bufName, nodeIndex, solutionCounterInt);
         // clang-format on
         odb::dbInst* bufInstance
-            = odb::dbInst::create(charBlock_, charBuf_, bufName.c_str());
+            = odb::dbInst::create(block, charBuf_, bufName.c_str());
         odb::dbITerm* bufInstanceInPin = bufInstance->getITerm(charBufIn_);
         odb::dbITerm* bufInstanceOutPin = bufInstance->getITerm(charBufOut_);
         bufInstanceInPin->connect(net);
@@ -1013,7 +1055,7 @@ std::vector<TechChar::SolutionData> TechChar::createPatterns(
                                                 setupWirelength,
                                                 solutionCounter.to_string(),
                                                 wireCounter);
-        net = odb::dbNet::create(charBlock_, netName.c_str());
+        net = odb::dbNet::create(block, netName.c_str());
         odb::dbWire::create(net);
         bufInstanceOutPin->connect(net);
         net->setSigType(odb::dbSigType::SIGNAL);
@@ -1058,26 +1100,24 @@ std::vector<TechChar::SolutionData> TechChar::createPatterns(
   return topologiesVector;
 }
 
-void TechChar::createStaInstance()
+void TechChar::createStaInstance(CharContext& context)
 {
   // Creates a new OpenSTA instance that is used only for the
   // characterization. Creates the new instance based on the charcterization
   // block.
-  openStaChar_ = openSta_->makeBlockSta(charBlock_);
+  context.sta = openSta_->makeBlockSta(context.block);
   // Gets the corner and other analysis attributes from the new instance.
-  charCorner_ = openStaChar_->cmdCorner();
+  context.corner = context.sta->cmdCorner();
   sta::PathAPIndex path_ap_index
-      = charCorner_->findPathAnalysisPt(sta::MinMax::max())->index();
-  sta::Corners* corners = openStaChar_->search()->corners();
-  charPathAnalysis_ = corners->findPathAnalysisPt(path_ap_index);
+      = context.corner->findPathAnalysisPt(sta::MinMax::max())->index();
+  sta::Corners* corners = context.sta->search()->corners();
+  context.pathAnalysis = corners->findPathAnalysisPt(path_ap_index);
 }
 
-void TechChar::setParasitics(
-    const std::vector<TechChar::SolutionData>& topologiesVector,
-    unsigned setupWirelength)
+void TechChar::setParasitics(const CharContext& context)
 {
   // For each topology...
-  for (const SolutionData& solution : topologiesVector) {
+  for (const SolutionData& solution : context.topologies) {
     // For each net in the topolgy -> set the parasitics.
     for (unsigned netIndex = 0; netIndex < solution.netVector.size();
          ++netIndex) {
@@ -1130,28 +1170,29 @@ void TechChar::setParasitics(
       const unsigned charUnit = options_->getWireSegmentUnit();
       const double wire_cap = nodesWithoutBuf * charUnit * capPerDBU_;
       const double wire_res = nodesWithoutBuf * charUnit * resPerDBU_;
-      openStaChar_->makePiElmore(firstPin,
-                                 sta::RiseFall::rise(),
-                                 sta::MinMaxAll::all(),
-                                 wire_cap / 2,
-                                 wire_res,
-                                 wire_cap / 2);
-      openStaChar_->setElmore(firstPin,
-                              lastPin,
-                              sta::RiseFall::rise(),
-                              sta::MinMaxAll::all(),
-                              wire_res * wire_cap);
+      context.sta->makePiElmore(firstPin,
+                                sta::RiseFall::rise(),
+                                sta::MinMaxAll::all(),
+                                wire_cap / 2,
+                                wire_res,
+                                wire_cap / 2);
+      context.sta->setElmore(firstPin,
+                             lastPin,
+                             sta::RiseFall::rise(),
+                             sta::MinMaxAll::all(),
+                             wire_res * wire_cap);
     }
   }
 }
 
 TechChar::ResultData TechChar::computeTopologyResults(
+    const CharContext& context,
     const TechChar::SolutionData& solution,
     sta::Vertex* outPinVert,
     float load,
-    float inSlew,
-    unsigned setupWirelength)
+    float inSlew)
 {
+  const unsigned setupWirelength = context.wirelength;
   ResultData results;
   results.wirelength = setupWirelength;
   results.topology = solution.topologyDescriptor;
@@ -1166,7 +1207,7 @@ TechChar::ResultData TechChar::computeTopologyResults(
     for (odb::dbInst* bufferInst : solution.instVector) {
       sta::Instance* bufferInstSta = db_network_->dbToSta(bufferInst);
       sta::PowerResult instResults
-          = openStaChar_->power(bufferInstSta, charCorner_);
+          = context.sta->power(bufferInstSta, context.corner);
       totalPower = totalPower + instResults.total();
     }
   }
@@ -1191,13 +1232,13 @@ TechChar::ResultData TechChar::computeTopologyResults(
       = std::round(incap / charCapStepSize_) * charCapStepSize_;
   results.totalcap = totalcap;
   // Computations for delay.
-  const float pinArrival = openStaChar_->vertexArrival(
-      outPinVert, sta::RiseFall::fall(), charPathAnalysis_);
+  const float pinArrival = context.sta->vertexArrival(
+      outPinVert, sta::RiseFall::fall(), context.pathAnalysis);
   results.pinArrival = pinArrival;
   // Computations for output slew.
-  const float pinRise = openStaChar_->vertexSlew(
+  const float pinRise = context.sta->vertexSlew(
       outPinVert, sta::RiseFall::rise(), sta::MinMax::max());
-  const float pinFall = openStaChar_->vertexSlew(
+  const float pinFall = context.sta->vertexSlew(
       outPinVert, sta::RiseFall::fall(), sta::MinMax::max());
   const float pinSlew = std::round((pinRise + pinFall) / 2 / charSlewStepSize_)
                         * charSlewStepSize_;
@@ -1541,6 +1582,135 @@ unsigned TechChar::normalizeCharResults(float value,
   return normVal;
 }
 
+// Returns a description of every input the characterization results depend
+// on: the buffers with their LEF size and liberty file contents, the clock
+// wire RC, the characterization options and the tested points.
+std::string TechChar::cacheKey() const
+{
+  std::ostringstream key;
+  key << std::setprecision(std::numeric_limits<double>::max_digits10);
+  std::map<std::string, uint64_t> libraryHashes;
+  key << "buffers";
+  for (const std::string& name : masterNames_) {
+    odb::dbMaster* master = db_->findMaster(name.c_str());
+    sta::LibertyCell* libertyCell
+        = db_network_->libertyCell(db_network_->dbToSta(master));
+    const std::string libraryFile = libertyCell->libertyLibrary()->filename();
+    auto it = libraryHashes.find(libraryFile);
+    if (it == libraryHashes.end()) {
+      it = libraryHashes.emplace(libraryFile, fileHash(libraryFile)).first;
+    }
+    key << ' ' << name << ' ' << master->getWidth() << ' '
+        << master->getHeight() << ' ' << std::hex << it->second << std::dec;
+  }
+  key << " char_buf " << charBuf_->getName();
+  key << " corner " << openSta_->cmdCorner()->name();
+  key << " dbu " << db_->getChip()->getBlock()->getDbUnitsPerMicron();
+  key << " rc " << resPerDBU_ << ' ' << capPerDBU_;
+  key << " wire_unit " << options_->getWireSegmentUnit();
+  key << " length_unit " << lengthUnit_;
+  key << " max_slew " << options_->getMaxCharSlew();
+  key << " max_cap " << options_->getMaxCharCap();
+  key << " steps " << charSlewStepSize_ << ' ' << charCapStepSize_;
+  key << " wirelengths";
+  for (float wirelength : wirelengthsToTest_) {
+    key << ' ' << wirelength;
+  }
+  key << " loads";
+  for (float load : loadsToTest_) {
+    key << ' ' << load;
+  }
+  key << " slews";
+  for (float slew : slewsToTest_) {
+    key << ' ' << slew;
+  }
+  return key.str();
+}
+
+// Reads the post-processed results and their bounds from a cache file
+// written by writeCache() for the same key.
+bool TechChar::readCache(const std::string& file,
+                         const std::string& key,
+                         std::vector<ResultData>& solutions)
+{
+  std::ifstream in(file);
+  std::string line;
+  if (!std::getline(in, line) || line != kCacheVersion
+      || !std::getline(in, line) || line != key) {
+    return false;
+  }
+
+  unsigned minSlew, maxSlew, minCapacitance, maxCapacitance;
+  unsigned minSegmentLength, maxSegmentLength;
+  size_t numSolutions = 0;
+  in >> minSlew >> maxSlew >> minCapacitance >> maxCapacitance
+      >> minSegmentLength >> maxSegmentLength >> numSolutions;
+  for (size_t i = 0; in && i < numSolutions; ++i) {
+    ResultData solution;
+    size_t topologySize = 0;
+    in >> solution.load >> solution.inSlew >> solution.wirelength
+        >> solution.pinSlew >> solution.pinArrival >> solution.totalcap
+        >> solution.totalPower >> solution.isPureWire >> topologySize;
+    if (topologySize > kMaxTopologySize) {
+      in.setstate(std::ios::failbit);
+    }
+    solution.topology.resize(in ? topologySize : 0);
+    for (std::string& node : solution.topology) {
+      in >> node;
+    }
+    solutions.push_back(std::move(solution));
+  }
+  if (!in) {
+    logger_->warn(
+        CTS, 232, "Ignoring unreadable characterization cache {}.", file);
+    solutions.clear();
+    return false;
+  }
+
+  minSlew_ = minSlew;
+  maxSlew_ = maxSlew;
+  minCapacitance_ = minCapacitance;
+  maxCapacitance_ = maxCapacitance;
+  minSegmentLength_ = minSegmentLength;
+  maxSegmentLength_ = maxSegmentLength;
+  return true;
+}
+
+void TechChar::writeCache(const std::string& file,
+                          const std::string& key,
+                          const std::vector<ResultData>& solutions) const
+{
+  // Write to a private file and rename it so concurrent runs never read a
+  // partial cache file.
+  const std::string tmpFile = fmt::format("{}.{}", file, getpid());
+  std::error_code error;
+  std::filesystem::create_directories(options_->getCharCacheDir(), error);
+  std::ofstream out(tmpFile);
+  out << std::setprecision(std::numeric_limits<float>::max_digits10);
+  out << kCacheVersion << '\n' << key << '\n';
+  out << minSlew_ << ' ' << maxSlew_ << ' ' << minCapacitance_ << ' '
+      << maxCapacitance_ << ' ' << minSegmentLength_ << ' ' << maxSegmentLength_
+      << ' ' << solutions.size() << '\n';
+  for (const ResultData& solution : solutions) {
+    out << solution.load << ' ' << solution.inSlew << ' ' << solution.wirelength
+        << ' ' << solution.pinSlew << ' ' << solution.pinArrival << ' '
+        << solution.totalcap << ' ' << solution.totalPower << ' '
+        << solution.isPureWire << ' ' << solution.topology.size();
+    for (const std::string& node : solution.topology) {
+      out << ' ' << node;
+    }
+    out << '\n';
+  }
+  out.close();
+  if (out) {
+    std::filesystem::rename(tmpFile, file, error);
+  }
+  if (!out || error) {
+    logger_->warn(CTS, 233, "Could not write characterization cache {}.", file);
+    std::filesystem::remove(tmpFile, error);
+  }
+}
+
 void TechChar::create()
 {
   //
@@ -1558,158 +1728,206 @@ void TechChar::create()
   }
   // Setup of the attributes required to run the characterization.
   initCharacterization();
-  int64_t topologiesCreated = 0;
-  for (unsigned setupWirelength : wirelengthsToTest_) {
-    // Creates the topologies for the current wirelength.
-    std::vector<SolutionData> topologiesVector
-        = createPatterns(setupWirelength);
-    // Creates an OpenSTA instance.
-    createStaInstance();
-    // Setup of the parasitics for each net.
-    setParasitics(topologiesVector, setupWirelength);
-    // For each topology...
-    sta::Graph* graph = openStaChar_->ensureGraph();
-    int topoIndex = 0;
-    for (SolutionData solution : topologiesVector) {
-      // clang-format off
-      debugPrint(logger_, CTS, "tech char", 1, "create WL:{} of {}, "
-                 "topo:{} of {}", setupWirelength, wirelengthsToTest_.size(),
-                 topoIndex, topologiesVector.size());
-      // clang-format on
-      topoIndex++;
-      // Gets the input and output port (as terms, pins and vertices).
-      odb::dbBTerm* inBTerm = solution.inPort->getBTerm();
-      odb::dbBTerm* outBTerm = solution.outPort->getBTerm();
-      odb::dbNet* lastNet = solution.netVector.back();
-      sta::Pin* inPin = db_network_->dbToSta(inBTerm);
-      sta::Pin* outPin = db_network_->dbToSta(outBTerm);
-      sta::Vertex* outPinVert = graph->pinLoadVertex(outPin);
-      sta::Vertex* inPinVert = graph->pinDrvrVertex(inPin);
-
-      // Gets the first pin of the last net. Needed to set a new parasitic
-      // (load) value.
-      sta::Pin* firstPinLastNet = nullptr;
-      if (lastNet->getBTerms().size() > 1) {
-        // Parasitics for purewire segment.
-        // First and last pin are already available.
-        firstPinLastNet = inPin;
-      } else {
-        // Parasitics for the end/start of a net. One Port and one
-        // instance pin.
-        odb::dbITerm* netITerm = lastNet->get1stITerm();
-        firstPinLastNet = db_network_->dbToSta(netITerm);
-      }
-
-      float c1, c2, r1;
-      bool piExists = false;
-      // Gets the parasitics that are currently used for the last net.
-      openStaChar_->findPiElmore(firstPinLastNet,
-                                 sta::RiseFall::rise(),
-                                 sta::MinMax::max(),
-                                 c2,
-                                 r1,
-                                 c1,
-                                 piExists);
-      // For each possible buffer combination (different sizes).
-      unsigned buffersUpdate
-          = getBufferingCombo(masterNames_.size(), solution.instVector.size());
-      // clang-format off
-      debugPrint(logger_, CTS, "tech char", 1, "create #bufs={} "
-                 "#soln.instVector.size={}, #bufUpdate={}, #topo={}",
-                 masterNames_.size(), solution.instVector.size(),
-                 buffersUpdate, topologiesCreated);
-      // clang-format on
-
-      if (buffersUpdate == 0) {
-        continue;
-      }
 
-      do {
-        // For each possible load.
-        for (float load : loadsToTest_) {
-          // Sets the new parasitic of the last net (load added to last pin).
-          openStaChar_->makePiElmore(firstPinLastNet,
-                                     sta::RiseFall::rise(),
-                                     sta::MinMaxAll::all(),
-                                     c2,
-                                     r1,
-                                     c1 + load);
-          openStaChar_->setElmore(firstPinLastNet,
-                                  outPin,
-                                  sta::RiseFall::rise(),
-                                  sta::MinMaxAll::all(),
-                                  r1 * (c1 + c2 + load));
-          // For each possible input slew.
-          for (float inputslew : slewsToTest_) {
-            // Sets the slew on the input vertex.
-            // Here the new pattern is created (combination of load, buffers
-            // and slew values).
-            openStaChar_->setAnnotatedSlew(inPinVert,
-                                           charCorner_,
-                                           sta::MinMaxAll::all(),
-                                           sta::RiseFallBoth::riseFall(),
-                                           inputslew);
-            // Updates timing for the new pattern.
-            openStaChar_->updateTiming(true);
-
-            // Gets the results (delay, slew, power...) for the pattern.
-            ResultData results = computeTopologyResults(
-                solution, outPinVert, load, inputslew, setupWirelength);
-
-            // Appends the results to a map, grouping each result by
-            // wirelength, load, output slew and input cap.
-            CharKey solutionKey;
-            solutionKey.wirelength = results.wirelength;
-            solutionKey.pinSlew = results.pinSlew;
-            solutionKey.load = results.load;
-            solutionKey.totalcap = results.totalcap;
-            if (solutionMap_.find(solutionKey) != solutionMap_.end()) {
-              solutionMap_[solutionKey].push_back(results);
-            } else {
-              std::vector<ResultData> resultGroup;
-              resultGroup.push_back(results);
-              solutionMap_[solutionKey] = std::move(resultGroup);
-            }
-            topologiesCreated++;
-            if (logger_->debugCheck(utl::CTS, "tech char", 1)
-                && topologiesCreated % 50000 == 0) {
-              debugPrint(logger_,
-                         CTS,
-                         "tech char",
-                         1,
-                         "Number of created patterns = {}.",
-                         topologiesCreated);
-            }
-          }
-        }
-        // If the solution is not a pure-wire, update the buffer topologies.
-        if (!solution.isPureWire) {
-          updateBufferTopologies(solution);
-        }
-        // For pure-wire solution buffersUpdate == 1, so it only runs once.
-        buffersUpdate--;
-      } while (buffersUpdate != 0);
+  // The compiled LUT only depends on the inputs hashed by cacheKey(), so it
+  // is reused from the cache directory when one is set.
+  std::string cacheFile;
+  std::string key;
+  std::vector<ResultData> convertedSolutions;
+  bool cacheHit = false;
+  if (!options_->getCharCacheDir().empty()) {
+    key = cacheKey();
+    cacheFile = fmt::format("{}/{:016x}.lut",
+                            options_->getCharCacheDir(),
+                            fnv1a(key.data(), key.size()));
+    cacheHit = readCache(cacheFile, key, convertedSolutions);
+    if (cacheHit) {
+      logger_->info(
+          CTS, 230, "Characterization cache hit, loaded {}.", cacheFile);
+    } else {
+      logger_->info(CTS, 231, "Characterization cache miss for {}.", cacheFile);
     }
-    openStaChar_.reset(nullptr);
   }
-  if (logger_->debugCheck(utl::CTS, "tech char", 1)) {
-    logger_->info(
-        CTS, 39, "Number of created patterns = {}.", topologiesCreated);
+  if (!cacheHit) {
+    characterize();
+    // Post-processing of the results.
+    convertedSolutions = characterizationPostProcess();
+    if (!cacheFile.empty()) {
+      writeCache(cacheFile, key, convertedSolutions);
+    }
   }
-  // Post-processing of the results.
-  const std::vector<ResultData> convertedSolutions
-      = characterizationPostProcess();
   compileLut(convertedSolutions);
   if (logger_->debugCheck(CTS, "characterization", 3)) {
     printCharacterization();
     printSolution();
   }
-  odb::dbBlock::destroy(charBlock_);
   if (is_hierarchical) {
     db_network_->setHierarchy();
   }
 }
 
+void TechChar::characterize()
+{
+  // Every wirelength is characterized in its own block with its own OpenSTA
+  // instance.  The sweep is serial, as the OpenSTA instances share the
+  // network and liberty of the design.
+  odb::dbBlock* block = db_->getChip()->getBlock();
+  int64_t topologiesCreated = 0;
+  for (const unsigned wirelength : wirelengthsToTest_) {
+    CharContext context;
+    context.wirelength = wirelength;
+    // Creates the characterization block. (Wiresegments are created here
+    // instead of the main block)
+    const std::string blockName
+        = fmt::format("CharacterizationBlock_{}", context.wirelength);
+    if (auto char_block = block->findChild(blockName.c_str())) {
+      odb::dbBlock::destroy(char_block);
+    }
+    context.block = odb::dbBlock::create(block, blockName.c_str());
+    // Creates the topologies for the current wirelength.
+    context.topologies = createPatterns(context.block, context.wirelength);
+    // Creates an OpenSTA instance.
+    createStaInstance(context);
+    // Setup of the parasitics for each net.
+    setParasitics(context);
+    characterizeWirelength(context);
+
+    // Appends the results to a map, grouping each result by wirelength,
+    // load, output slew and input cap.
+    for (ResultData& results : context.results) {
+      CharKey solutionKey;
+      solutionKey.wirelength = results.wirelength;
+      solutionKey.pinSlew = results.pinSlew;
+      solutionKey.load = results.load;
+      solutionKey.totalcap = results.totalcap;
+      solutionMap_[solutionKey].push_back(std::move(results));
+    }
+    topologiesCreated += context.patterns;
+    context.sta.reset(nullptr);
+    odb::dbBlock::destroy(context.block);
+  }
+  if (logger_->debugCheck(utl::CTS, "tech char", 1)) {
+    logger_->info(
+        CTS, 39, "Number of created patterns = {}.", topologiesCreated);
+  }
+}
+
+// Runs the timing sweep of all the topologies of a wirelength and collects
+// the results in the context.
+void TechChar::characterizeWirelength(CharContext& context)
+{
+  sta::dbSta* charSta = context.sta.get();
+  sta::Graph* graph = charSta->ensureGraph();
+  int topoIndex = 0;
+  // For each topology...
+  for (SolutionData solution : context.topologies) {
+    // clang-format off
+    debugPrint(logger_, CTS, "tech char", 1, "create WL:{} of {}, "
+               "topo:{} of {}", context.wirelength, wirelengthsToTest_.size(),
+               topoIndex, context.topologies.size());
+    // clang-format on
+    topoIndex++;
+    // Gets the input and output port (as terms, pins and vertices).
+    odb::dbBTerm* inBTerm = solution.inPort->getBTerm();
+    odb::dbBTerm* outBTerm = solution.outPort->getBTerm();
+    odb::dbNet* lastNet = solution.netVector.back();
+    sta::Pin* inPin = db_network_->dbToSta(inBTerm);
+    sta::Pin* outPin = db_network_->dbToSta(outBTerm);
+    sta::Vertex* outPinVert = graph->pinLoadVertex(outPin);
+    sta::Vertex* inPinVert = graph->pinDrvrVertex(inPin);
+
+    // Gets the first pin of the last net. Needed to set a new parasitic
+    // (load) value.
+    sta::Pin* firstPinLastNet = nullptr;
+    if (lastNet->getBTerms().size() > 1) {
+      // Parasitics for purewire segment.
+      // First and last pin are already available.
+      firstPinLastNet = inPin;
+    } else {
+      // Parasitics for the end/start of a net. One Port and one
+      // instance pin.
+      odb::dbITerm* netITerm = lastNet->get1stITerm();
+      firstPinLastNet = db_network_->dbToSta(netITerm);
+    }
+
+    float c1, c2, r1;
+    bool piExists = false;
+    // Gets the parasitics that are currently used for the last net.
+    charSta->findPiElmore(firstPinLastNet,
+                          sta::RiseFall::rise(),
+                          sta::MinMax::max(),
+                          c2,
+                          r1,
+                          c1,
+                          piExists);
+    // For each possible buffer combination (different sizes).
+    unsigned buffersUpdate
+        = getBufferingCombo(masterNames_.size(), solution.instVector.size());
+    // clang-format off
+    debugPrint(logger_, CTS, "tech char", 1, "create #bufs={} "
+               "#soln.instVector.size={}, #bufUpdate={}, #topo={}",
+               masterNames_.size(), solution.instVector.size(),
+               buffersUpdate, context.patterns);
+    // clang-format on
+
+    if (buffersUpdate == 0) {
+      continue;
+    }
+
+    do {
+      // For each possible load.
+      for (float load : loadsToTest_) {
+        // Sets the new parasitic of the last net (load added to last pin).
+        charSta->makePiElmore(firstPinLastNet,
+                              sta::RiseFall::rise(),
+                              sta::MinMaxAll::all(),
+                              c2,
+                              r1,
+                              c1 + load);
+        charSta->setElmore(firstPinLastNet,
+                           outPin,
+                           sta::RiseFall::rise(),
+                           sta::MinMaxAll::all(),
+                           r1 * (c1 + c2 + load));
+        // For each possible input slew.
+        for (float inputslew : slewsToTest_) {
+          // Sets the slew on the input vertex.
+          // Here the new pattern is created (combination of load, buffers
+          // and slew values).
+          charSta->setAnnotatedSlew(inPinVert,
+                                    context.corner,
+                                    sta::MinMaxAll::all(),
+                                    sta::RiseFallBoth::riseFall(),
+                                    inputslew);
+          // Updates timing for the new pattern.
+          charSta->updateTiming(true);
+
+          // Gets the results (delay, slew, power...) for the pattern.
+          context.results.push_back(computeTopologyResults(
+              context, solution, outPinVert, load, inputslew));
+
+          context.patterns++;
+          if (logger_->debugCheck(utl::CTS, "tech char", 1)
+              && context.patterns % 50000 == 0) {
+            debugPrint(logger_,
+                       CTS,
+                       "tech char",
+                       1,
+                       "Number of created patterns = {}.",
+                       context.patterns);
+          }
+        }
+      }
+      // If the solution is not a pure-wire, update the buffer topologies.
+      if (!solution.isPureWire) {
+        updateBufferTopologies(solution);
+      }
+      // For pure-wire solution buffersUpdate == 1, so it only runs once.
+      buffersUpdate--;
+    } while (buffersUpdate != 0);
+  }
+}
+
 // Compute possible buffering solution combinations given #buffers and
 // #nodes.  This is much less than #buffers ^ #nodes because we assume
 // buffers drive buffers of equal or higher drive strength. If #buffers is 4 and
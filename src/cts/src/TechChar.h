@@ -200,6 +200,20 @@ class TechChar
     std::vector<std::string> topology;
   };
 
+  // CharContext holds the characterization of one wirelength in its own
+  // block and OpenSTA instance.
+  struct CharContext
+  {
+    unsigned wirelength = 0;
+    odb::dbBlock* block = nullptr;
+    std::unique_ptr<sta::dbSta> sta;
+    sta::Corner* corner = nullptr;
+    sta::PathAnalysisPt* pathAnalysis = nullptr;
+    std::vector<SolutionData> topologies;
+    std::vector<ResultData> results;
+    int64_t patterns = 0;
+  };
+
   // ResultData represents the resulting metrics for a specific characterization
   // segment. The topology object helps on reconstructing that segment.
   struct CharKey
@@ -261,15 +275,15 @@ class TechChar
   void reduceOrExpand(std::vector<float>& values, unsigned limit);
   std::vector<float>::iterator smallestDiffIter(std::vector<float>& values);
   std::vector<float>::iterator largestDiffIter(std::vector<float>& values);
-  std::vector<SolutionData> createPatterns(unsigned setupWirelength);
-  void createStaInstance();
-  void setParasitics(const std::vector<SolutionData>& topologiesVector,
-                     unsigned setupWirelength);
-  ResultData computeTopologyResults(const SolutionData& solution,
+  std::vector<SolutionData> createPatterns(odb::dbBlock* block,
+                                           unsigned setupWirelength);
+  void createStaInstance(CharContext& context);
+  void setParasitics(const CharContext& context);
+  ResultData computeTopologyResults(const CharContext& context,
+                                    const SolutionData& solution,
                                     sta::Vertex* outPinVert,
                                     float load,
-                                    float inSlew,
-                                    unsigned setupWirelength);
+                                    float inSlew);
   void updateBufferTopologies(SolutionData& solution);
   void updateBufferTopologiesOld(TechChar::SolutionData& solution);
   size_t cellNameToID(const std::string& masterName);
@@ -280,7 +294,16 @@ class TechChar
   void swapTopologyBuffer(SolutionData& solution,
                           unsigned nodeIndex,
                           const std::string& newMasterName);
+  void characterize();
+  void characterizeWirelength(CharContext& context);
   std::vector<ResultData> characterizationPostProcess();
+  std::string cacheKey() const;
+  bool readCache(const std::string& file,
+                 const std::string& key,
+                 std::vector<ResultData>& solutions);
+  void writeCache(const std::string& file,
+                  const std::string& key,
+                  const std::vector<ResultData>& solutions) const;
   unsigned normalizeCharResults(float value,
                                 float iter,
                                 unsigned* min,
@@ -312,12 +335,8 @@ class TechChar
   rsz::Resizer* resizer_;
   est::EstimateParasitics* estimate_parasitics_;
   sta::dbSta* openSta_;
-  std::unique_ptr<sta::dbSta> openStaChar_;
   sta::dbNetwork* db_network_;
   Logger* logger_;
-  sta::PathAnalysisPt* charPathAnalysis_ = nullptr;
-  sta::Corner* charCorner_ = nullptr;
-  odb::dbBlock* charBlock_ = nullptr;
   odb::dbMaster* charBuf_ = nullptr;
   odb::dbMTerm* charBufIn_ = nullptr;
   odb::dbMTerm* charBufOut_ = nullptr;
@@ -330,6 +349,8 @@ class TechChar
   std::vector<float> loadsToTest_;
   std::vector<float> slewsToTest_;
 
+  // (length, fakeLength) of the fake entries created so far
+  std::set<std::pair<unsigned, unsigned>> fakeEntries_;
   std::map<CharKey, std::vector<ResultData>> solutionMap_;
   // keep track of acceptable buffering combinations in topology
   boost::unordered_map<std::pair<size_t, size_t>, unsigned, PairHash, PairEqual>
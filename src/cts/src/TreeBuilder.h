@@ -74,7 +74,11 @@ class TreeBuilder
   }
   virtual ~TreeBuilder() = default;
 
+  // Clusters the sinks of the tree before run builds it
+  virtual void initSinks() = 0;
   virtual void run() = 0;
+  // Whether run adds the fake entries for small sink regions to the LUT
+  virtual bool needsFakeLutEntries() const = 0;
   void mergeBlockages();
   void initBlockages();
   void setTechChar(TechChar& techChar) { techChar_ = &techChar; }
@@ -51,6 +51,9 @@
 #include "sta/Sdc.hh"
 #include "sta/Vector.hh"
 #include "utl/Logger.h"
+#include "utl/exception.h"
+#include "utl/stage_metrics.h"
+#include "utl/timer.h"
 
 namespace cts {
 
@@ -81,6 +84,7 @@ TritonCTS::~TritonCTS()
 
 void TritonCTS::runTritonCts()
 {
+  utl::ScopedStageMetrics metrics(logger_, "clock_tree_synthesis");
   odb::dbChip* chip = db_->getChip();
   odb::dbBlock* block = chip->getBlock();
   options_->addOwner(block);
@@ -101,6 +105,9 @@ void TritonCTS::runTritonCts()
     balanceMacroRegisterLatencies();
   }
 
+  metrics.setQuality("clocks", numberOfClocks_);
+  metrics.setQuality("clock_nets", numClkNets_);
+
   // reset
   techChar_.reset();
   builders_.clear();
@@ -274,12 +281,64 @@ void TritonCTS::findClockRoots()
 
 void TritonCTS::buildClockTrees()
 {
+  // The trees of different clock nets are independent, so they are built
+  // concurrently unless the solution is being plotted or observed.
+  const int numThreads = options_->getNumThreads();
+  const bool parallel = numThreads > 1 && builders_.size() > 1
+                        && !options_->getPlotSolution()
+                        && !options_->getObserver();
+  const utl::DebugScopedTimer timer(
+      logger_,
+      CTS,
+      "runtime",
+      1,
+      fmt::format("Built {} clock trees with {} threads in {{}}.",
+                  builders_.size(),
+                  parallel ? numThreads : 1));
   for (auto& builder : builders_) {
     builder->setTechChar(*techChar_);
     builder->setDb(db_);
     builder->setLogger(logger_);
     builder->initBlockages();
-    builder->run();
+  }
+  if (!parallel) {
+    for (auto& builder : builders_) {
+      builder->initSinks();
+      builder->run();
+    }
+    return;
+  }
+
+  auto forEachBuilder = [&](const int begin,
+                            const int end,
+                            const std::function<void(TreeBuilder*)>& func) {
+    utl::ThreadException exception;
+#pragma omp parallel for num_threads(numThreads) schedule(dynamic)
+    for (int i = begin; i < end; ++i) {
+      try {
+        func(builders_[i].get());
+      } catch (...) {
+        exception.capture();
+      }
+    }
+    exception.rethrow();
+  };
+  const int numBuilders = builders_.size();
+  forEachBuilder(
+      0, numBuilders, [](TreeBuilder* builder) { builder->initSinks(); });
+  // The LUT is shared by the builders, and the first tree that needs the fake
+  // entries adds them while it is built.  The trees before it are built
+  // without them and the trees after it with them, as with one thread.
+  int fakeBuilder = 0;
+  while (fakeBuilder < numBuilders
+         && !builders_[fakeBuilder]->needsFakeLutEntries()) {
+    fakeBuilder++;
+  }
+  auto build = [](TreeBuilder* builder) { builder->run(); };
+  forEachBuilder(0, fakeBuilder, build);
+  if (fakeBuilder < numBuilders) {
+    builders_[fakeBuilder]->run();
+    forEachBuilder(fakeBuilder + 1, numBuilders, build);
   }
 }
 
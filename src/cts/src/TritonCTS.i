@@ -88,6 +88,12 @@ set_max_char_slew(double slew)
   getTritonCts()->getParms()->setMaxCharSlew(slew);
 }
 
+void
+set_char_cache_dir(const char* dir)
+{
+  getTritonCts()->getParms()->setCharCacheDir(dir);
+}
+
 void
 set_wire_segment_distance_unit(unsigned unit)
 {
@@ -279,6 +285,8 @@ set_repair_clock_nets(bool value)
 void
 run_triton_cts()
 {
+  const int num_threads = ord::OpenRoad::openRoad()->getThreadCount();
+  getTritonCts()->getParms()->setNumThreads(num_threads);
   getTritonCts()->runTritonCts();
 }
 
@@ -5,11 +5,12 @@ sta::define_cmd_args "configure_cts_characterization" {[-max_cap cap] \
                                                        [-max_slew slew] \
                                                        [-slew_steps slew_steps] \
                                                        [-cap_steps cap_steps] \
+                                                       [-cache_dir dir] \
                                                       }
 
 proc configure_cts_characterization { args } {
   sta::parse_key_args "configure_cts_characterization" args \
-    keys {-max_cap -max_slew -slew_steps -cap_steps} flags {}
+    keys {-max_cap -max_slew -slew_steps -cap_steps -cache_dir} flags {}
 
   sta::check_argc_eq0 "configure_cts_characterization" $args
 
@@ -34,6 +35,10 @@ proc configure_cts_characterization { args } {
     sta::check_cardinal "-cap_steps" $steps
     cts::set_cap_steps $cap
   }
+
+  if { [info exists keys(-cache_dir)] } {
+    cts::set_char_cache_dir $keys(-cache_dir)
+  }
 }
 
 sta::define_cmd_args "set_cts_config" {[-apply_ndr strategy] \
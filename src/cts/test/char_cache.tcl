@@ -0,0 +1,67 @@
+# simple_test.tcl run twice with a characterization cache. The first run
+# misses and writes the cache, the second one loads it and builds the same
+# tree.
+source "helpers.tcl"
+read_lef Nangate45/Nangate45.lef
+read_liberty Nangate45/Nangate45_typ.lib
+read_def "16sinks.def"
+
+create_clock -period 5 clk
+
+set_wire_rc -clock -layer metal3
+
+set cache_dir [make_result_file char_cache]
+file delete -force $cache_dir
+
+# Reconnects the sinks to clk and removes the clock tree.
+proc remove_clock_tree { } {
+  set block [ord::get_db_block]
+  set clk [$block findNet "clk"]
+  foreach net [$block getNets] {
+    if { [string match "clknet_*" [$net getName]] } {
+      foreach iterm [$net getITerms] {
+        if { ![string match "clkbuf_*" [[$iterm getInst] getName]] } {
+          $iterm disconnect
+          $iterm connect $clk
+        }
+      }
+    }
+  }
+  foreach inst [$block getInsts] {
+    if { [string match "clkbuf_*" [$inst getName]] } {
+      odb::dbInst_destroy $inst
+    }
+  }
+  foreach net [$block getNets] {
+    if { [string match "clknet_*" [$net getName]] } {
+      odb::dbNet_destroy $net
+    }
+  }
+}
+
+proc run_cts { cache_dir def_file } {
+  set_cts_config -wire_unit 20 \
+    -apply_ndr root_only \
+    -root_buf CLKBUF_X3 \
+    -buf_list CLKBUF_X3
+  configure_cts_characterization -cache_dir $cache_dir
+
+  # The cache file name is a hash of the characterization inputs
+  tee -quiet -variable log { clock_tree_synthesis }
+  foreach id { 230 231 } {
+    if { [regexp "CTS-0$id" $log] } {
+      puts "Found CTS-0$id"
+    }
+  }
+  write_def $def_file
+}
+
+set def_file1 [make_result_file char_cache1.def]
+run_cts $cache_dir $def_file1
+diff_files simple_test_out.defok $def_file1
+
+remove_clock_tree
+
+set def_file2 [make_result_file char_cache2.def]
+run_cts $cache_dir $def_file2
+diff_files $def_file1 $def_file2
@@ -0,0 +1,62 @@
+# Two clock trees built with 1 and 4 threads are the same
+source "helpers.tcl"
+read_lef Nangate45/Nangate45.lef
+read_liberty Nangate45/Nangate45_typ.lib
+read_def "multi_clock.def"
+
+create_clock -name clk1 -period 5 [get_ports clk1]
+create_clock -name clk2 -period 7 [get_ports clk2]
+
+set_wire_rc -clock -layer metal3
+
+# The clock nets of the sinks before CTS
+set sink_nets {}
+foreach inst [[ord::get_db_block] getInsts] {
+  set iterm [$inst findITerm "CK"]
+  lappend sink_nets $iterm [$iterm getNet]
+}
+
+proc remove_clock_trees { sink_nets } {
+  foreach { iterm net } $sink_nets {
+    $iterm disconnect
+    $iterm connect $net
+  }
+  set block [ord::get_db_block]
+  foreach inst [$block getInsts] {
+    if { [string match "clkbuf_*" [$inst getName]] } {
+      odb::dbInst_destroy $inst
+    }
+  }
+  foreach net [$block getNets] {
+    if { [string match "clknet_*" [$net getName]] } {
+      odb::dbNet_destroy $net
+    }
+  }
+}
+
+# Returns the sorted CTS messages, as the messages of different clock nets
+# interleave with multiple threads.
+proc run_cts { threads def_file } {
+  set_thread_count $threads
+  set_cts_config -wire_unit 20 \
+    -root_buf CLKBUF_X3 \
+    -buf_list CLKBUF_X3
+  tee -quiet -variable log { clock_tree_synthesis }
+  write_def $def_file
+  return [lsort [split $log "\n"]]
+}
+
+set serial_def [make_result_file multi_clock_threads1.def]
+set serial_log [run_cts 1 $serial_def]
+
+remove_clock_trees $sink_nets
+
+set parallel_def [make_result_file multi_clock_threads4.def]
+set parallel_log [run_cts 4 $parallel_def]
+
+if { $serial_log == $parallel_log } {
+  puts "Same CTS messages."
+} else {
+  puts "Different CTS messages."
+}
+diff_files $serial_def $parallel_def
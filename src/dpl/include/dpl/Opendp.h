@@ -8,6 +8,7 @@
 #include <map>
 #include <memory>
 #include <numeric>  // accumulate
+#include <optional>
 #include <set>
 #include <string>
 #include <unordered_map>
@@ -107,7 +108,12 @@ class Opendp
   int padLeft(odb::dbInst* inst) const;
   int padRight(odb::dbInst* inst) const;
 
-  void checkPlacement(bool verbose, const std::string& report_file_name = "");
+  // Incremental checks only report violations of the instances that moved
+  // since the previous check of the block.
+  void checkPlacement(bool verbose,
+                      const std::string& report_file_name = "",
+                      bool incremental = false,
+                      int num_threads = 1);
   void fillerPlacement(const dbMasterSeq& filler_masters,
                        const char* prefix,
                        bool verbose);
@@ -228,6 +234,10 @@ class Opendp
   void groupInitPixels2();
 
   // checkPlacement
+  std::vector<char> findMovedCells(bool incremental);
+  void checkCellsInRowBands(const std::vector<char>& moved,
+                            std::vector<uint16_t>& failures,
+                            int num_threads);
   static bool isPlaced(const Node* cell);
   bool checkInRows(const Node& cell) const;
   const Node* checkOverlap(Node& cell) const;
@@ -322,6 +332,21 @@ class Opendp
   bool disallow_one_site_gaps_ = false;
   std::vector<Node*> placement_failures_;
 
+  // Instance placement at the last checkPlacement, for incremental checks.
+  // Blocks and instances are keyed by their database ids, as their pointers
+  // may be reused by new objects once they are destroyed.
+  struct CheckedPlacement
+  {
+    bool operator==(const CheckedPlacement& other) const;
+
+    odb::dbMaster* master;
+    odb::Point location;
+    odb::dbOrientType::Value orient;
+    odb::dbPlacementStatus::Value status;
+  };
+  std::optional<uint> checked_block_id_;
+  std::unordered_map<uint, CheckedPlacement> checked_placements_;
+
   // 2D pixel grid
   std::unique_ptr<Grid> grid_;
   RtreeBox regions_rtree_;
@@ -350,6 +375,8 @@ class Opendp
   static constexpr double group_refine_percent_ = .05;
   static constexpr double refine_percent_ = .02;
   static constexpr int rand_seed_ = 777;
+  // Fewest grid rows in a checkPlacement row band.
+  static constexpr int min_check_band_rows_ = 16;
 };
 
 int divRound(int dividend, int divisor);
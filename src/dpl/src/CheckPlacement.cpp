@@ -1,9 +1,13 @@
 // SPDX-License-Identifier: BSD-3-Clause
 // Copyright (c) 2020-2025, The OpenROAD Authors
 
+#include <algorithm>
 #include <cmath>
+#include <cstddef>
+#include <cstdint>
 #include <functional>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "PlacementDRC.h"
@@ -15,6 +19,7 @@
 #include "odb/db.h"
 #include "odb/isotropy.h"
 #include "utl/Logger.h"
+#include "utl/exception.h"
 namespace dpl {
 
 using odb::Direction2D;
@@ -24,8 +29,34 @@ using utl::DPL;
 
 using utl::format_as;
 
+namespace {
+
+// Checks failed by a cell
+enum CheckFailure : uint16_t
+{
+  kPlaced = 1 << 0,
+  kInRows = 1 << 1,
+  kOverlap = 1 << 2,
+  kPadding = 1 << 3,
+  kOneSiteGap = 1 << 4,
+  kSiteAlign = 1 << 5,
+  kRegionPlacement = 1 << 6,
+  kEdgeSpacing = 1 << 7,
+  kBlockedLayers = 1 << 8
+};
+
+}  // namespace
+
+bool Opendp::CheckedPlacement::operator==(const CheckedPlacement& other) const
+{
+  return master == other.master && location == other.location
+         && orient == other.orient && status == other.status;
+}
+
 void Opendp::checkPlacement(const bool verbose,
-                            const std::string& report_file_name)
+                            const std::string& report_file_name,
+                            const bool incremental,
+                            const int num_threads)
 {
   importDb();
   adjustNodesOrient();
@@ -42,60 +73,109 @@ void Opendp::checkPlacement(const bool verbose,
 
   initGrid();
   groupAssignCellRegions();
+  const auto& nodes = network_->getNodes();
+  const int node_count = nodes.size();
+  const std::vector<char> moved = findMovedCells(incremental);
+  std::vector<uint16_t> failures(node_count, 0);
+
+  // The checks that only look at the cell itself.
   const auto& row_coords = grid_->getRowCoordinates();
-  for (auto& cell : network_->getNodes()) {
-    if (cell->getType() != Node::CELL) {
-      continue;
-    }
+  auto check_cell = [&](Node* cell) -> uint16_t {
+    uint16_t failed = 0;
     if (cell->isStdCell()) {
       // Site alignment check
       if (cell->getLeft() % grid_->getSiteWidth() != 0
           || row_coords.find(cell->getBottom().v) == row_coords.end()) {
-        site_align_failures.push_back(cell.get());
-        continue;
+        return kSiteAlign;
       }
 
       if (!checkInRows(*cell)) {
-        in_rows_failures.push_back(cell.get());
+        failed |= kInRows;
       }
-      if (!checkRegionPlacement(cell.get())) {
-        region_placement_failures.push_back(cell.get());
+      if (!checkRegionPlacement(cell)) {
+        failed |= kRegionPlacement;
       }
     }
     // Placed check
-    if (!isPlaced(cell.get())) {
-      placed_failures.push_back(cell.get());
-    }
-    // Overlap check
-    if (checkOverlap(*cell)) {
-      overlap_failures.push_back(cell.get());
+    if (!isPlaced(cell)) {
+      failed |= kPlaced;
     }
-    // Padding check
-    if (!drc_engine_->checkPadding(cell.get())) {
-      padding_failures.emplace_back(cell.get());
+    if (!drc_engine_->checkBlockedLayers(cell)) {
+      failed |= kBlockedLayers;
     }
-    grid_->paintCellPadding(cell.get());
-    // EdgeSpacing check
-    if (!drc_engine_->checkEdgeSpacing(cell.get())) {
-      edge_spacing_failures.emplace_back(cell.get());
+    return failed;
+  };
+
+  utl::ThreadException exception;
+#pragma omp parallel for num_threads(num_threads) schedule(dynamic, 1024)
+  for (int i = 0; i < node_count; i++) {
+    Node* cell = nodes[i].get();
+    if (cell->getType() != Node::CELL || !moved[i]) {
+      continue;
     }
-    if (!drc_engine_->checkBlockedLayers(cell.get())) {
-      blocked_layers_failures.emplace_back(cell.get());
+    try {
+      failures[i] = check_cell(cell);
+    } catch (...) {
+      exception.capture();
     }
   }
+  exception.rethrow();
+
+  // Overlap, padding and edge spacing checks
+  checkCellsInRowBands(moved, failures, num_threads);
+
   // This loop is separate because it needs to be done after the overlap check
   // The overlap check assigns the overlap cell to its pixel
   // Thus, the one site gap check needs to be done after the overlap check
   // Otherwise, this check will miss the pixels that could have resulted in
   // one-site gap violations as null
   if (disallow_one_site_gaps_) {
-    for (auto& cell : network_->getNodes()) {
+#pragma omp parallel for num_threads(num_threads) schedule(dynamic, 1024)
+    for (int i = 0; i < node_count; i++) {
+      Node* cell = nodes[i].get();
       // One site gap check
-      if (cell->getType() == Node::CELL && checkOneSiteGaps(*cell)) {
-        one_site_gap_failures.push_back(cell.get());
+      if (cell->getType() == Node::CELL && moved[i]
+          && checkOneSiteGaps(*cell)) {
+        failures[i] |= kOneSiteGap;
       }
     }
   }
+
+  for (int i = 0; i < node_count; i++) {
+    const uint16_t failed = failures[i];
+    if (failed == 0) {
+      continue;
+    }
+    Node* cell = nodes[i].get();
+    if (failed & kPlaced) {
+      placed_failures.push_back(cell);
+    }
+    if (failed & kInRows) {
+      in_rows_failures.push_back(cell);
+    }
+    if (failed & kOverlap) {
+      overlap_failures.push_back(cell);
+    }
+    if (failed & kPadding) {
+      padding_failures.push_back(cell);
+    }
+    if (failed & kOneSiteGap) {
+      one_site_gap_failures.push_back(cell);
+    }
+    if (failed & kSiteAlign) {
+      site_align_failures.push_back(cell);
+    }
+    if (failed & kRegionPlacement) {
+      region_placement_failures.push_back(cell);
+    }
+    if (failed & kEdgeSpacing) {
+      edge_spacing_failures.push_back(cell);
+    }
+    if (failed & kBlockedLayers) {
+      blocked_layers_failures.push_back(cell);
+    }
+  }
+
   saveFailures(placed_failures,
                in_rows_failures,
                overlap_failures,
@@ -122,10 +202,12 @@ void Opendp::checkPlacement(const bool verbose,
   reportFailures(
       edge_spacing_failures, 9, "LEF58_CELLEDGESPACINGTABLE", verbose);
   reportFailures(blocked_layers_failures, 10, "Blocked layers", verbose);
-  logger_->metric("design__violations",
-                  placed_failures.size() + in_rows_failures.size()
-                      + overlap_failures.size() + padding_failures.size()
-                      + site_align_failures.size());
+  if (!incremental) {
+    logger_->metric("design__violations",
+                    placed_failures.size() + in_rows_failures.size()
+                        + overlap_failures.size() + padding_failures.size()
+                        + site_align_failures.size());
+  }
 
   if (placed_failures.size() + in_rows_failures.size() + overlap_failures.size()
           + padding_failures.size() + site_align_failures.size()
@@ -137,6 +219,147 @@ void Opendp::checkPlacement(const bool verbose,
   }
 }
 
+// Return the cells whose instance moved since the last check of the block,
+// or all of them.  Saves the current placement for the next check.
+std::vector<char> Opendp::findMovedCells(const bool incremental)
+{
+  auto placement_of = [](odb::dbInst* inst) {
+    return CheckedPlacement{inst->getMaster(),
+                            inst->getLocation(),
+                            inst->getOrient().getValue(),
+                            inst->getPlacementStatus().getValue()};
+  };
+  const auto& nodes = network_->getNodes();
+  std::vector<char> moved(nodes.size(), true);
+  if (incremental && checked_block_id_ == block_->getId()) {
+    int moved_count = 0;
+    int cell_count = 0;
+    for (size_t i = 0; i < nodes.size(); i++) {
+      const Node* cell = nodes[i].get();
+      if (cell->getType() != Node::CELL) {
+        continue;
+      }
+      odb::dbInst* inst = cell->getDbInst();
+      auto it = checked_placements_.find(inst->getId());
+      moved[i] = it == checked_placements_.end()
+                 || !(it->second == placement_of(inst));
+      moved_count += moved[i];
+      cell_count++;
+    }
+    logger_->info(DPL,
+                  403,
+                  "Checking {} of {} instances moved since the last check.",
+                  moved_count,
+                  cell_count);
+  }
+
+  checked_block_id_ = block_->getId();
+  checked_placements_.clear();
+  for (odb::dbInst* inst : block_->getInsts()) {
+    checked_placements_[inst->getId()] = placement_of(inst);
+  }
+  return moved;
+}
+
+// The overlap, padding and edge spacing checks paint the grid cell by
+// cell, and a cell is only checked against the pixels painted by the cells
+// before it.  The rows are split into bands that are checked concurrently.
+// Each band visits, in the same order, every cell whose checks can touch
+// its rows, with the pixels outside the band hidden from the thread, so
+// the union of the band results is what a single pass over the grid finds.
+// Cells that did not move are painted before the moved ones so that a
+// violation between a moved and an unmoved cell is reported on the moved
+// cell.
+void Opendp::checkCellsInRowBands(const std::vector<char>& moved,
+                                  std::vector<uint16_t>& failures,
+                                  const int num_threads)
+{
+  const auto& nodes = network_->getNodes();
+  const int node_count = nodes.size();
+  const int row_count = grid_->getRowCount().v;
+  int band_count = 1;
+  if (num_threads > 1) {
+    band_count
+        = std::clamp(row_count / min_check_band_rows_, 1, num_threads * 4);
+  }
+  const int band_rows = std::max(divCeil(row_count, band_count), 1);
+  band_count = std::max(divCeil(row_count, band_rows), 1);
+
+  // Distance beyond the cell the edge spacing check looks at.
+  const DbuY halo{drc_engine_->getMaxEdgeSpacing() + 1};
+  std::vector<std::vector<int>> band_cells(band_count);
+  std::vector<char> band_has_moved(band_count, false);
+  for (const bool moved_pass : {false, true}) {
+    for (int i = 0; i < node_count; i++) {
+      Node* cell = nodes[i].get();
+      if (cell->getType() != Node::CELL || moved[i] != moved_pass
+          || (failures[i] & kSiteAlign)) {
+        continue;
+      }
+      // The checks start at the snapped or the rounded row of the cell.
+      const DbuY y_snap = grid_->gridYToDbu(grid_->gridSnapDownY(cell));
+      const DbuY y_round = grid_->gridYToDbu(grid_->gridRoundY(cell));
+      const DbuY bottom = std::min(cell->getBottom(), y_snap) - halo;
+      const DbuY top
+          = std::max(cell->getBottom(), y_round) + cell->getHeight() + halo;
+      const int row_lo = std::max(grid_->gridSnapDownY(bottom).v - 1, 0);
+      const int row_hi = std::min(grid_->gridEndY(top).v + 1, row_count);
+      if (row_lo >= row_hi) {
+        continue;
+      }
+      for (int band = row_lo / band_rows; band <= (row_hi - 1) / band_rows;
+           band++) {
+        band_cells[band].push_back(i);
+        band_has_moved[band] |= moved_pass;
+      }
+    }
+  }
+
+  // Failures of each band as (cell index, failed checks)
+  std::vector<std::vector<std::pair<int, uint16_t>>> band_failures(band_count);
+  utl::ThreadException exception;
+#pragma omp parallel for num_threads(num_threads) schedule(dynamic, 1)
+  for (int band = 0; band < band_count; band++) {
+    if (!band_has_moved[band]) {
+      continue;
+    }
+    try {
+      Grid::setThreadRows(GridY{band * band_rows},
+                          GridY{std::min((band + 1) * band_rows, row_count)});
+      for (const int i : band_cells[band]) {
+        Node* cell = nodes[i].get();
+        uint16_t failed = 0;
+        // Overlap check
+        if (checkOverlap(*cell)) {
+          failed |= kOverlap;
+        }
+        // Padding check
+        if (moved[i] && !drc_engine_->checkPadding(cell)) {
+          failed |= kPadding;
+        }
+        grid_->paintCellPadding(cell);
+        // EdgeSpacing check
+        if (moved[i] && !drc_engine_->checkEdgeSpacing(cell)) {
+          failed |= kEdgeSpacing;
+        }
+        if (moved[i] && failed != 0) {
+          band_failures[band].emplace_back(i, failed);
+        }
+      }
+    } catch (...) {
+      exception.capture();
+    }
+    Grid::clearThreadRows();
+  }
+  exception.rethrow();
+
+  for (const auto& band : band_failures) {
+    for (const auto& [i, failed] : band) {
+      failures[i] |= failed;
+    }
+  }
+}
+
 void Opendp::saveViolations(const std::vector<Node*>& failures,
                             odb::dbMarkerCategory* category,
                             const std::string& violation_type) const
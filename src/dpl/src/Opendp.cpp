@@ -27,6 +27,7 @@
 #include "odb/util.h"
 #include "util/journal.h"
 #include "utl/Logger.h"
+#include "utl/stage_metrics.h"
 
 namespace dpl {
 
@@ -94,6 +95,7 @@ void Opendp::detailedPlacement(const int max_displacement_x,
                                const int max_displacement_y,
                                const std::string& report_file_name)
 {
+  utl::ScopedStageMetrics metrics(logger_, "detailed_placement");
   importDb();
   adjustNodesOrient();
   for (const auto& node : network_->getNodes()) {
@@ -121,6 +123,9 @@ void Opendp::detailedPlacement(const int max_displacement_x,
   // Save displacement stats before updating instance DB locations.
   findDisplacementStats();
   updateDbInstLocations();
+  metrics.setQuality("displacement_max",
+                     block_->dbuToMicrons(displacement_max_));
+  metrics.setQuality("failures", placement_failures_.size());
   if (!placement_failures_.empty()) {
     logger_->info(DPL,
                   34,
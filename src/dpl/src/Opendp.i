@@ -37,10 +37,16 @@ report_legalization_stats()
 }
 
 void
-check_placement_cmd(bool verbose, const char* report_file_name)
+check_placement_cmd(bool verbose,
+                    const char* report_file_name,
+                    bool incremental)
 {
   dpl::Opendp *opendp = ord::OpenRoad::openRoad()->getOpendp();
-  opendp->checkPlacement(verbose, std::string(report_file_name));
+  const int num_threads = ord::OpenRoad::openRoad()->getThreadCount();
+  opendp->checkPlacement(verbose,
+                         std::string(report_file_name),
+                         incremental,
+                         num_threads);
 }
 
 
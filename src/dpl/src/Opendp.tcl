@@ -122,7 +122,8 @@ proc remove_fillers { args } {
 
 sta::define_cmd_args "check_placement" {[-verbose] \
                                         [-disallow_one_site_gaps] \
-                                        [-report_file_name file_name]}
+                                        [-report_file_name file_name] \
+                                        [-incremental]}
 
 proc check_placement { args } {
   if { [ord::get_db_block] == "NULL" } {
@@ -130,8 +131,10 @@ proc check_placement { args } {
   }
 
   sta::parse_key_args "check_placement" args \
-    keys {-report_file_name} flags {-verbose -disallow_one_site_gaps}
+    keys {-report_file_name} \
+    flags {-verbose -disallow_one_site_gaps -incremental}
   set verbose [info exists flags(-verbose)]
+  set incremental [info exists flags(-incremental)]
   sta::check_argc_eq0 "check_placement" $args
   set file_name ""
   if { [info exists keys(-report_file_name)] } {
@@ -140,7 +143,7 @@ proc check_placement { args } {
   if { [info exists flags(-disallow_one_site_gaps)] } {
     utl::warn DPL 4 "-disallow_one_site_gaps is deprecated"
   }
-  dpl::check_placement_cmd $verbose $file_name
+  dpl::check_placement_cmd $verbose $file_name $incremental
 }
 
 sta::define_cmd_args "optimize_mirroring" {}
@@ -412,6 +412,18 @@ int PlacementDRC::getMaxSpacing(const int edge_type_idx) const
       ->spc;
 }
 
+// Get the maximum spacing between any two edge types
+int PlacementDRC::getMaxEdgeSpacing() const
+{
+  int max_spc = 0;
+  for (const auto& spacings : edge_spacing_table_) {
+    for (const EdgeSpacingEntry& entry : spacings) {
+      max_spc = std::max(max_spc, entry.spc);
+    }
+  }
+  return max_spc;
+}
+
 // Get the index of an edge type from its name
 int PlacementDRC::getEdgeTypeIdx(const std::string& edge_type) const
 {
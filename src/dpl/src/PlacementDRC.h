@@ -65,6 +65,7 @@ class PlacementDRC
   int getEdgeTypeIdx(const std::string& edge_type) const;
   bool hasCellEdgeSpacingTable() const;
   int getMaxSpacing(int edge_type_idx) const;
+  int getMaxEdgeSpacing() const;
 
  private:
   // Member variables
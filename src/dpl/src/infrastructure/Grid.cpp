@@ -271,15 +271,29 @@ Grid::getSiteOrientation(GridX x, GridY y, odb::dbSite* site) const
   return {};
 }
 
+thread_local GridY Grid::thread_row_lo_{0};
+thread_local GridY Grid::thread_row_hi_{std::numeric_limits<int>::max()};
+
 Pixel* Grid::gridPixel(GridX grid_x, GridY grid_y) const
 {
-  if (grid_x >= 0 && grid_x < row_site_count_ && grid_y >= 0
-      && grid_y < row_count_) {
+  if (grid_x >= 0 && grid_x < row_site_count_ && grid_y >= thread_row_lo_
+      && grid_y < row_count_ && grid_y < thread_row_hi_) {
     return const_cast<Pixel*>(&pixels_[grid_y.v][grid_x.v]);
   }
   return nullptr;
 }
 
+void Grid::setThreadRows(const GridY lo, const GridY hi)
+{
+  thread_row_lo_ = lo;
+  thread_row_hi_ = hi;
+}
+
+void Grid::clearThreadRows()
+{
+  setThreadRows(GridY{0}, GridY{std::numeric_limits<int>::max()});
+}
+
 void Grid::visitCellPixels(
     Node& cell,
     bool padded,
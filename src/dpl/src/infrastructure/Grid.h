@@ -132,6 +132,10 @@ class Grid
   DbuX getSiteWidth() const { return site_width_; }
 
   Pixel* gridPixel(GridX x, GridY y) const;
+  // Limit gridPixel() on the calling thread to the rows [lo, hi), as if the
+  // grid had no other rows.  Lets threads work on disjoint row bands.
+  static void setThreadRows(GridY lo, GridY hi);
+  static void clearThreadRows();
   Pixel& pixel(GridY y, GridX x) { return pixels_[y.v][x.v]; }
   const Pixel& pixel(GridY y, GridX x) const { return pixels_[y.v][x.v]; }
 
@@ -211,6 +215,9 @@ class Grid
 
   GridY row_count_{0};
   GridX row_site_count_{0};
+
+  static thread_local GridY thread_row_lo_;
+  static thread_local GridY thread_row_hi_;
 };
 
 }  // namespace dpl
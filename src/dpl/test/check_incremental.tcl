@@ -0,0 +1,26 @@
+source "helpers.tcl"
+# check_placement -incremental after moving and replacing an instance
+read_lef Nangate45/Nangate45.lef
+read_def check3.def
+check_placement -verbose
+
+set block [ord::get_db_block]
+set inst [$block findInst "_284_"]
+$inst setLocation 31800 28000
+catch { tee -quiet -variable log { check_placement -verbose -incremental } }
+regexp {Checking [0-9]+ of [0-9]+ instances[^\n]*} $log checking
+puts $checking
+foreach id { 005 033 } {
+  if { [regexp "DPL-0$id" $log] } {
+    puts "Found DPL-0$id"
+  }
+}
+
+# The new instance may reuse the id of the destroyed one.
+set master [$inst getMaster]
+odb::dbInst_destroy $inst
+set inst [odb::dbInst_create $block $master "_286_"]
+$inst setOrient MY
+$inst setLocation 32180 28000
+$inst setPlacementStatus PLACED
+check_placement -verbose -incremental
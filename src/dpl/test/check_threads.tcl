@@ -0,0 +1,29 @@
+source "helpers.tcl"
+# check_placement on 4 threads with overlap, padding and edge spacing
+# failures in several row bands
+read_lef Nangate45/Nangate45.lef
+read_lef Nangate45/fake_macros.lef
+read_lef edge_spacing.lef
+read_def check_threads.def
+set_placement_padding -global -left 1 -right 1
+
+proc check_placement_log { threads } {
+  set_thread_count $threads
+  catch { tee -quiet -variable log { check_placement -verbose } }
+  return $log
+}
+
+set log1 [check_placement_log 1]
+set log4 [check_placement_log 4]
+if { $log1 == $log4 } {
+  puts "Same check_placement messages."
+} else {
+  puts "Different check_placement messages."
+  puts $log1
+  puts $log4
+}
+foreach id { 005 009 011 033 } {
+  if { [regexp "DPL-0$id" $log4] } {
+    puts "Found DPL-0$id"
+  }
+}
@@ -55,6 +55,7 @@
 #include "utl/CallBackHandler.h"
 #include "utl/Logger.h"
 #include "utl/ScopedTemporaryFile.h"
+#include "utl/stage_metrics.h"
 
 using odb::dbTechLayerType;
 
@@ -970,6 +971,7 @@ void TritonRoute::sendDesignUpdates(const std::string& router_cfg_path,
 
 int TritonRoute::main()
 {
+  utl::ScopedStageMetrics metrics(logger_, "detailed_route");
   // Just to verify that OMP support is compiled in correctly.
   omp_set_num_threads(2);
 #pragma omp parallel
@@ -1065,6 +1067,9 @@ int TritonRoute::main()
                [this] { sendDesignUpdates("", router_cfg_->MAX_THREADS); });
   }
   dr();
+  if (num_drvs_ >= 0) {
+    metrics.setQuality("drvs", num_drvs_);
+  }
   if (!router_cfg_->SINGLE_STEP_DR) {
     endFR();
   }
@@ -104,9 +104,17 @@ struct ParasiticsCapacitance
   double v_cap;
 };
 
+// Result of re-estimating the parasitics of the invalid nets.
+struct IncrementalUpdate
+{
+  int nets = 0;
+  double seconds = 0.0;
+};
+
 class AbstractSteinerRenderer;
 class OdbCallBack;
 class EstimateParasiticsCallBack;
+class IncrementalParasiticsGuard;
 
 class EstimateParasitics : public dbStaState
 {
@@ -218,7 +226,8 @@ class EstimateParasitics : public dbStaState
   SteinerTree* makeSteinerTree(odb::Point drvr_location,
                                const std::vector<odb::Point>& sink_locations);
   SteinerTree* makeSteinerTree(const Pin* drvr_pin);
-  void updateParasitics(bool save_guides = false);
+  // Returns the number of re-estimated nets.
+  int updateParasitics(bool save_guides = false);
   void ensureWireParasitic(const Pin* drvr_pin);
   void ensureWireParasitic(const Pin* drvr_pin, const Net* net);
   void highlightSteiner(const Pin* drvr);
@@ -238,7 +247,19 @@ class EstimateParasitics : public dbStaState
 
   Logger* getLogger() { return logger_; }
 
+  // Incremental sessions let scripts re-estimate only the nets changed by
+  // their edits.  Nets are marked dirty with markNetDirty() and, when
+  // auto_mark is set, by the odb callbacks on netlist changes and instance
+  // moves.  Ending the session re-estimates the remaining dirty nets.
+  void beginIncrementalSession(bool auto_mark = true);
+  void markNetDirty(odb::dbNet* net);
+  int dirtyNetCount() const;
+  IncrementalUpdate updateIncrementalSession();
+  IncrementalUpdate endIncrementalSession();
+  bool inIncrementalSession() const { return incremental_session_ != nullptr; }
+
  private:
+  void reportIncrementalUpdate(const IncrementalUpdate& update) const;
   void ensureParasitics();
   void estimateWireParasiticSteiner(const Pin* drvr_pin,
                                     const Net* net,
@@ -293,6 +314,7 @@ class EstimateParasitics : public dbStaState
   int dbu_ = 0;
 
   bool incremental_parasitics_enabled_ = false;
+  std::unique_ptr<IncrementalParasiticsGuard> incremental_session_;
 
   // constants
   const MinMax* min_ = MinMax::min();
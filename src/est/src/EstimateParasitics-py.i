@@ -0,0 +1,56 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+%module est_py
+
+%{
+#include "est/EstimateParasitics.h"
+#include "odb/db.h"
+#include "ord/OpenRoad.hh"
+
+using namespace est;
+%}
+
+%include "../../Exception-py.i"
+
+%import "odb.i"
+
+// Only the parts of EstimateParasitics that do not need STA types are
+// wrapped; the full header pulls in most of OpenSTA.
+namespace est {
+
+enum class ParasiticsSrc
+{
+  none,
+  placement,
+  global_routing,
+  detailed_routing
+};
+
+struct IncrementalUpdate
+{
+  int nets;
+  double seconds;
+};
+
+%nodefaultctor EstimateParasitics;
+%nodefaultdtor EstimateParasitics;
+
+class EstimateParasitics
+{
+ public:
+  void estimateParasitics(ParasiticsSrc src);
+  bool haveEstimatedParasitics() const;
+  ParasiticsSrc getParasiticsSrc();
+  void parasiticsInvalid(const odb::dbNet* net);
+  bool parasiticsValid() const;
+
+  void beginIncrementalSession(bool auto_mark = true);
+  void markNetDirty(odb::dbNet* net);
+  int dirtyNetCount() const;
+  IncrementalUpdate updateIncrementalSession();
+  IncrementalUpdate endIncrementalSession();
+  bool inIncrementalSession() const;
+};
+
+}  // namespace est
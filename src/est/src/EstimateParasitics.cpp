@@ -42,6 +42,8 @@
 #include "stt/SteinerTreeBuilder.h"
 #include "utl/CallBackHandler.h"
 #include "utl/Logger.h"
+#include "utl/stage_metrics.h"
+#include "utl/timer.h"
 
 namespace est {
 
@@ -370,6 +372,7 @@ void EstimateParasitics::estimateParasitics(
     ParasiticsSrc src,
     std::map<Corner*, std::ostream*>& spef_streams)
 {
+  utl::ScopedStageMetrics metrics(logger_, "estimate_parasitics");
   initBlock();
   std::unique_ptr<SpefWriter> spef_writer;
   if (!spef_streams.empty()) {
@@ -398,7 +401,7 @@ bool EstimateParasitics::haveEstimatedParasitics() const
   return parasitics_src_ != ParasiticsSrc::none;
 }
 
-void EstimateParasitics::updateParasitics(bool save_guides)
+int EstimateParasitics::updateParasitics(bool save_guides)
 {
   if (!incremental_parasitics_enabled_) {
     logger_->error(
@@ -413,6 +416,7 @@ void EstimateParasitics::updateParasitics(bool save_guides)
   network_->Network::clear();
   network_->setDefaultLibertyLibrary(default_lib);
 
+  int updated_nets = 0;
   switch (parasitics_src_) {
     case ParasiticsSrc::placement:
       for (const Net* net : parasitics_invalid_) {
@@ -423,6 +427,7 @@ void EstimateParasitics::updateParasitics(bool save_guides)
           continue;
         }
         estimateWireParasitic(net);
+        updated_nets++;
       }
       break;
     case ParasiticsSrc::global_routing:
@@ -431,6 +436,7 @@ void EstimateParasitics::updateParasitics(bool save_guides)
       incr_groute_->updateRoutes(save_guides);
       for (const Net* net : parasitics_invalid_) {
         estimateGlobalRouteRC(db_network_->staToDb(net));
+        updated_nets++;
       }
       break;
     }
@@ -439,6 +445,83 @@ void EstimateParasitics::updateParasitics(bool save_guides)
   }
 
   parasitics_invalid_.clear();
+  return updated_nets;
+}
+
+void EstimateParasitics::beginIncrementalSession(const bool auto_mark)
+{
+  if (incremental_session_) {
+    logger_->error(EST, 165, "An incremental session is already active.");
+  }
+  if (!haveEstimatedParasitics()) {
+    logger_->error(EST,
+                   166,
+                   "Run estimate_parasitics before starting an incremental "
+                   "session.");
+  }
+  if (incremental_parasitics_enabled_) {
+    logger_->error(EST,
+                   167,
+                   "Incremental parasitics are already enabled by another "
+                   "command.");
+  }
+
+  incremental_session_ = std::make_unique<IncrementalParasiticsGuard>(this);
+  if (!auto_mark) {
+    removeDbCbkOwner();
+  }
+}
+
+void EstimateParasitics::markNetDirty(odb::dbNet* net)
+{
+  parasiticsInvalid(net);
+}
+
+int EstimateParasitics::dirtyNetCount() const
+{
+  return parasitics_invalid_.size();
+}
+
+IncrementalUpdate EstimateParasitics::updateIncrementalSession()
+{
+  if (!incremental_session_) {
+    logger_->error(EST, 168, "No incremental session is active.");
+  }
+
+  const utl::Timer timer;
+  IncrementalUpdate update;
+  update.nets = updateParasitics();
+  update.seconds = timer.elapsed();
+
+  reportIncrementalUpdate(update);
+  return update;
+}
+
+void EstimateParasitics::reportIncrementalUpdate(
+    const IncrementalUpdate& update) const
+{
+  logger_->info(EST,
+                170,
+                "Re-estimated parasitics of {} nets in {:.3f} seconds.",
+                update.nets,
+                update.seconds);
+}
+
+IncrementalUpdate EstimateParasitics::endIncrementalSession()
+{
+  if (!incremental_session_) {
+    logger_->error(EST, 169, "No incremental session is active.");
+  }
+
+  // Destroying the guard re-estimates the dirty nets
+  const utl::Timer timer;
+  IncrementalUpdate update;
+  update.nets = dirtyNetCount();
+  incremental_session_.reset();
+  update.seconds = timer.elapsed();
+
+  reportIncrementalUpdate(update);
+  return update;
 }
 
 bool EstimateParasitics::parasiticsValid() const
@@ -142,4 +142,29 @@ void OdbCallBack::inDbInstSwapMasterAfter(odb::dbInst* inst)
   }
 }
 
+void OdbCallBack::inDbPostMoveInst(odb::dbInst* inst)
+{
+  // Only the moves of incremental sessions mark the nets, so the parasitics
+  // of the other commands are unchanged.
+  if (!estimate_parasitics_->inIncrementalSession()) {
+    return;
+  }
+  debugPrint(estimate_parasitics_->getLogger(),
+             utl::EST,
+             "odb",
+             1,
+             "inDbPostMoveInst {}",
+             inst->getName());
+  Instance* sta_inst = db_network_->dbToSta(inst);
+  std::unique_ptr<InstancePinIterator> pin_iter{
+      network_->pinIterator(sta_inst)};
+  while (pin_iter->hasNext()) {
+    Pin* pin = pin_iter->next();
+    Net* net = network_->net(pin);
+    if (net) {
+      estimate_parasitics_->parasiticsInvalid(net);
+    }
+  }
+}
+
 }  // namespace est
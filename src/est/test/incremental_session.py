@@ -0,0 +1,56 @@
+# incremental sessions re-estimate the nets marked dirty by hand and by the
+# odb callbacks
+from openroad import Tech
+import helpers
+import est
+import utl
+
+tech = Tech()
+tech.readLef("Nangate45/Nangate45.lef")
+tech.readLiberty("Nangate45/Nangate45_typ.lib")
+
+design = helpers.make_design(tech)
+design.readDef("reg3.def")
+design.evalTclString("create_clock -period 10 clk")
+design.evalTclString("source Nangate45/Nangate45.rc")
+design.evalTclString("set_wire_rc -layer metal3")
+
+block = design.getBlock()
+logger = design.getLogger()
+estimator = design.getEstimateParasitics()
+estimator.estimateParasitics(est.ParasiticsSrc_placement)
+
+
+# Returns the update and the number of update reports, whose times vary.
+def logged(call):
+    logger.redirectStringBegin()
+    update = call()
+    log = logger.redirectStringEnd()
+    return update, log.count("EST-0170")
+
+
+# nets marked by hand
+estimator.beginIncrementalSession(False)
+for name in ["r1q", "r2q", "r1q"]:
+    estimator.markNetDirty(block.findNet(name))
+utl.report(f"Dirty nets: {estimator.dirtyNetCount()}")
+u1 = block.findInst("u1")
+u1.setLocation(42000, 10000)
+utl.report(f"Dirty nets after a move: {estimator.dirtyNetCount()}")
+update, reports = logged(estimator.updateIncrementalSession)
+utl.report(f"Updated {update.nets} nets in {reports} update.")
+utl.report(f"Dirty nets: {estimator.dirtyNetCount()}")
+update, reports = logged(estimator.endIncrementalSession)
+utl.report(f"Ended with {update.nets} nets in {reports} update.")
+utl.report(f"In a session: {estimator.inIncrementalSession()}")
+
+# nets marked by the odb callbacks
+estimator.beginIncrementalSession()
+u1.setLocation(40000, 10000)
+utl.report(f"Dirty nets after a move: {estimator.dirtyNetCount()}")
+estimator.markNetDirty(block.findNet("u2z"))
+utl.report(f"Dirty nets: {estimator.dirtyNetCount()}")
+update, reports = logged(estimator.endIncrementalSession)
+utl.report(f"Ended with {update.nets} nets in {reports} update.")
+utl.report(f"Dirty nets: {estimator.dirtyNetCount()}")
+utl.report(f"In a session: {estimator.inIncrementalSession()}")
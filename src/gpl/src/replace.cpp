@@ -24,6 +24,7 @@
 #include "sta/StaMain.hh"
 #include "timingBase.h"
 #include "utl/Logger.h"
+#include "utl/stage_metrics.h"
 
 namespace gpl {
 
@@ -109,6 +110,7 @@ void Replace::addPlacementCluster(const Cluster& cluster)
 
 void Replace::doIncrementalPlace(int threads)
 {
+  utl::ScopedStageMetrics metrics(log_, "incremental_placement");
   log_->info(GPL, 6, "Execute incremental mode global placement.");
   if (pbc_ == nullptr) {
     PlacerBaseVars pbVars;
@@ -192,6 +194,7 @@ void Replace::doIncrementalPlace(int threads)
 
 void Replace::doInitialPlace(int threads)
 {
+  utl::ScopedStageMetrics metrics(log_, "initial_placement");
   log_->info(GPL, 5, "Execute conjugate gradient initial placement.");
   if (pbc_ == nullptr) {
     PlacerBaseVars pbVars;
@@ -320,6 +323,7 @@ bool Replace::initNesterovPlace(int threads)
     rbVars.rcK4 = routabilityRcK4_;
 
     rb_ = std::make_shared<RouteBase>(rbVars, db_, fr_, nbc_, nbVec_, log_);
+    fr_->setThreadCount(threads);
   }
 
   if (!tb_) {
@@ -369,6 +373,7 @@ bool Replace::initNesterovPlace(int threads)
 
 int Replace::doNesterovPlace(int threads, int start_iter)
 {
+  utl::ScopedStageMetrics metrics(log_, "global_placement");
   if (!initNesterovPlace(threads)) {
     return 0;
   }
@@ -397,6 +402,7 @@ int Replace::doNesterovPlace(int threads, int start_iter)
     fr_->setCriticalNetsPercentage(0);
     fr_->globalRoute();
   }
+  metrics.setQuality("hpwl", nbc_->getHpwl());
   return return_do_nesterov;
 }
 
@@ -0,0 +1,103 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <functional>
+#include <vector>
+
+#include "odb/geom.h"
+#include "utl/exception.h"
+
+namespace grt {
+
+// Calls route_net, then commit_net when given, for the nets in the order
+// of nets on a x_size by y_size routing grid.  With more than one thread
+// the nets are routed in batches of nets whose regions don't overlap each
+// other nor the regions of the earlier nets left for a later batch, and
+// commit_net is called after each batch in the order of nets.  A net whose
+// routing only uses the grid cells in its region gets the same route as in
+// the serial order, and the batches don't depend on the number of threads.
+inline void routeInBatches(const std::vector<int>& nets,
+                           const int x_size,
+                           const int y_size,
+                           const int num_threads,
+                           const std::function<odb::Rect(int)>& net_region,
+                           const std::function<void(int)>& route_net,
+                           const std::function<void(int)>& commit_net = nullptr)
+{
+  if (num_threads == 1) {
+    for (const int net : nets) {
+      route_net(net);
+      if (commit_net) {
+        commit_net(net);
+      }
+    }
+    return;
+  }
+
+  // regions are marked on a coarse grid of tiles to find the overlaps
+  constexpr int max_tiles = 64;
+  const int tile_size
+      = std::max((std::max(x_size, y_size) + max_tiles - 1) / max_tiles, 1);
+  const int x_tiles = (x_size + tile_size - 1) / tile_size;
+  const int y_tiles = (y_size + tile_size - 1) / tile_size;
+  std::vector<int> tile_batch(x_tiles * y_tiles, -1);
+
+  // only look that far ahead for the nets of a batch
+  constexpr int window = 4096;
+  std::vector<int> pending = nets;
+  std::vector<int> batch;
+  std::vector<int> waiting;
+  size_t first = 0;
+  for (int batch_id = 0; first < pending.size(); batch_id++) {
+    batch.clear();
+    waiting.clear();
+    const size_t last = std::min(first + window, pending.size());
+    for (size_t k = first; k < last; k++) {
+      const int net = pending[k];
+      const odb::Rect region = net_region(net);
+      bool free = true;
+      for (int x = region.xMin() / tile_size; x <= region.xMax() / tile_size;
+           x++) {
+        for (int y = region.yMin() / tile_size; y <= region.yMax() / tile_size;
+             y++) {
+          int& tile = tile_batch[x * y_tiles + y];
+          free &= tile != batch_id;
+          tile = batch_id;
+        }
+      }
+      if (free) {
+        batch.push_back(net);
+      } else {
+        waiting.push_back(net);
+      }
+    }
+    // the waiting nets keep their order in front of the unscanned ones
+    first = last - waiting.size();
+    std::copy(waiting.begin(), waiting.end(), pending.begin() + first);
+
+    const int batch_size = batch.size();
+    utl::ThreadException exception;
+#pragma omp parallel for num_threads(num_threads) \
+    schedule(dynamic) if (batch_size > 1)
+    for (int k = 0; k < batch_size; k++) {
+      try {
+        route_net(batch[k]);
+      } catch (...) {
+        exception.capture();
+      }
+    }
+    exception.rethrow();
+
+    if (commit_net) {
+      for (const int net : batch) {
+        commit_net(net);
+      }
+    }
+  }
+}
+
+}  // namespace grt
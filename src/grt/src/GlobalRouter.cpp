@@ -55,6 +55,7 @@
 #include "utl/CallBackHandler.h"
 #include "utl/Logger.h"
 #include "utl/algorithms.h"
+#include "utl/stage_metrics.h"
 
 namespace grt {
 
@@ -303,6 +304,7 @@ void GlobalRouter::globalRoute(bool save_guides,
                                bool start_incremental,
                                bool end_incremental)
 {
+  utl::ScopedStageMetrics metrics(logger_, "global_route");
   bool has_routable_nets = false;
   is_incremental = (start_incremental || end_incremental);
 
@@ -350,6 +352,7 @@ void GlobalRouter::globalRoute(bool save_guides,
         if (use_cugr_) {
           int min_layer, max_layer;
           getMinMaxLayer(min_layer, max_layer);
+          cugr_->setThreadCount(num_threads_);
           cugr_->init(min_layer, max_layer);
           cugr_->route();
           routes_ = cugr_->getRoutes();
@@ -377,6 +380,10 @@ void GlobalRouter::globalRoute(bool save_guides,
     if (verbose_) {
       logger_->info(GRT, 14, "Routed nets: {}", routes_.size());
     }
+    metrics.setQuality("routed_nets", routes_.size());
+    if (!use_cugr_) {
+      metrics.setQuality("overflow", fastroute_->totalOverflow());
+    }
     if (save_guides) {
       std::vector<odb::dbNet*> nets;
       nets.reserve(block_->getNets().size());
@@ -2085,6 +2092,11 @@ void GlobalRouter::setVerbose(const bool v)
   verbose_ = v;
 }
 
+void GlobalRouter::setThreadCount(const int threads)
+{
+  num_threads_ = threads;
+}
+
 void GlobalRouter::setCongestionIterations(int iterations)
 {
   congestion_iterations_ = iterations;
@@ -2217,6 +2229,7 @@ void GlobalRouter::configFastRoute()
   fastroute_->setOverflowIterations(congestion_iterations_);
   fastroute_->setCongestionReportIterStep(congestion_report_iter_step_);
   fastroute_->setResistanceAware(resistance_aware_);
+  fastroute_->setThreadCount(num_threads_);
 
   if (congestion_file_name_ != nullptr) {
     fastroute_->setCongestionReportFile(congestion_file_name_);
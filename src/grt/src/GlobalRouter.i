@@ -155,6 +155,7 @@ set_skip_large_fanout(int skip_large_fanout)
 void
 global_route(bool start_incremental, bool end_incremental)
 {
+  getGlobalRouter()->setThreadCount(ord::OpenRoad::openRoad()->getThreadCount());
   getGlobalRouter()->globalRoute(true, start_incremental, end_incremental);
 }
 
@@ -1,6 +1,7 @@
 #pragma once
 
 #include <csignal>
+#include <functional>
 #include <memory>
 #include <string>
 #include <utility>
@@ -65,6 +66,7 @@ class CUGR
   void write(const std::string& guide_file);
   NetRouteMap getRoutes();
   void updateDbCongestion();
+  void setThreadCount(int threads);
 
  private:
   void updateOverflowNets(std::vector<int>& netIndices);
@@ -72,6 +74,11 @@ class CUGR
   void patternRouteWithDetours(std::vector<int>& netIndices);
   void mazeRoute(std::vector<int>& netIndices);
   void sortNetIndices(std::vector<int>& netIndices) const;
+  BoxT getNetRegion(const GRNet* net, int margin) const;
+  void routeInBatches(const std::vector<int>& netIndices,
+                      const std::function<BoxT(int)>& net_region,
+                      const std::function<void(int)>& route_net,
+                      const std::function<void(int)>& commit_net = nullptr);
   void getGuides(const GRNet* net,
                  std::vector<std::pair<int, grt::BoxT>>& guides);
   void printStatistics() const;
@@ -88,6 +95,8 @@ class CUGR
 
   int area_of_pin_patches_ = 0;
   int area_of_wire_patches_ = 0;
+
+  int num_threads_ = 1;
 };
 
 }  // namespace grt
@@ -5,6 +5,7 @@
 #include <cmath>
 #include <cstdint>
 #include <fstream>
+#include <functional>
 #include <iostream>
 #include <limits>
 #include <memory>
@@ -22,7 +23,9 @@
 #include "PatternRoute.h"
 #include "geo.h"
 #include "grt/GRoute.h"
+#include "grt/RouteInBatches.h"
 #include "odb/db.h"
+#include "odb/geom.h"
 #include "stt/SteinerTreeBuilder.h"
 #include "utl/Logger.h"
 
@@ -50,6 +53,11 @@ void CUGR::init(const int min_routing_layer, const int max_routing_layer)
   }
 }
 
+void CUGR::setThreadCount(const int threads)
+{
+  num_threads_ = std::max(threads, 1);
+}
+
 void CUGR::updateOverflowNets(std::vector<int>& netIndices)
 {
   netIndices.clear();
@@ -66,17 +74,22 @@ void CUGR::patternRoute(std::vector<int>& netIndices)
 {
   logger_->report("stage 1: pattern routing");
   sortNetIndices(netIndices);
-  for (const int netIndex : netIndices) {
-    PatternRoute patternRoute(gr_nets_[netIndex].get(),
-                              grid_graph_.get(),
-                              stt_builder_,
-                              constants_,
-                              logger_);
-    patternRoute.constructSteinerTree();
-    patternRoute.constructRoutingDAG();
-    patternRoute.run();
-    grid_graph_->commitTree(gr_nets_[netIndex]->getRoutingTree());
-  }
+  routeInBatches(
+      netIndices,
+      [&](const int netIndex) {
+        return getNetRegion(gr_nets_[netIndex].get(), 0);
+      },
+      [&](const int netIndex) {
+        PatternRoute patternRoute(gr_nets_[netIndex].get(),
+                                  grid_graph_.get(),
+                                  stt_builder_,
+                                  constants_,
+                                  logger_);
+        patternRoute.constructSteinerTree();
+        patternRoute.constructRoutingDAG();
+        patternRoute.run();
+        grid_graph_->commitTree(gr_nets_[netIndex]->getRoutingTree());
+      });
 
   updateOverflowNets(netIndices);
 }
@@ -91,7 +104,17 @@ void CUGR::patternRouteWithDetours(std::vector<int>& netIndices)
   GridGraphView<bool> congestionView;
   grid_graph_->extractCongestionView(congestionView);
   sortNetIndices(netIndices);
-  for (const int netIndex : netIndices) {
+  // A detour moves a trunk at most max_detour_ratio of its length, plus
+  // the two cells of slack of the search in constructDetours, away from
+  // the pins
+  auto detourRegion = [&](const int netIndex) {
+    const GRNet* net = gr_nets_[netIndex].get();
+    const BoxT& box = net->getBoundingBox();
+    const int detour = std::ceil(constants_.max_detour_ratio
+                                 * std::max(box.width(), box.height()));
+    return getNetRegion(net, detour + 2);
+  };
+  routeInBatches(netIndices, detourRegion, [&](const int netIndex) {
     GRNet* net = gr_nets_[netIndex].get();
     grid_graph_->commitTree(net->getRoutingTree(), /*ripup*/ true);
     PatternRoute patternRoute(
@@ -102,7 +125,7 @@ void CUGR::patternRouteWithDetours(std::vector<int>& netIndices)
     patternRoute.constructDetours(congestionView);
     patternRoute.run();
     grid_graph_->commitTree(net->getRoutingTree());
-  }
+  });
 
   updateOverflowNets(netIndices);
 }
@@ -120,25 +143,43 @@ void CUGR::mazeRoute(std::vector<int>& netIndices)
   GridGraphView<CostT> wireCostView;
   grid_graph_->extractWireCostView(wireCostView);
   sortNetIndices(netIndices);
-  SparseGrid grid(10, 10, 0, 0);
-  for (const int netIndex : netIndices) {
-    GRNet* net = gr_nets_[netIndex].get();
-    MazeRoute mazeRoute(net, grid_graph_.get(), logger_);
-    mazeRoute.constructSparsifiedGraph(wireCostView, grid);
-    mazeRoute.run();
-    std::shared_ptr<SteinerTreeNode> tree = mazeRoute.getSteinerTree();
-    assert(tree != nullptr);
-
-    PatternRoute patternRoute(
-        net, grid_graph_.get(), stt_builder_, constants_, logger_);
-    patternRoute.setSteinerTree(tree);
-    patternRoute.constructRoutingDAG();
-    patternRoute.run();
-
-    grid_graph_->commitTree(net->getRoutingTree());
-    grid_graph_->updateWireCostView(wireCostView, net->getRoutingTree());
-    grid.step();
+  // The sparse grid shifts by one cell for each net in the sorted order
+  const SparseGrid start_grid(10, 10, 0, 0);
+  std::vector<int> net_position(gr_nets_.size());
+  for (int i = 0; i < netIndices.size(); i++) {
+    net_position[netIndices[i]] = i;
   }
+  // Maze routes are not bounded by a region, so with multiple threads the
+  // nets of a batch see the costs left by the earlier batches and their
+  // routes are committed after the batch, in the sorted order.
+  routeInBatches(
+      netIndices,
+      [&](const int netIndex) {
+        return getNetRegion(gr_nets_[netIndex].get(), 0);
+      },
+      [&](const int netIndex) {
+        GRNet* net = gr_nets_[netIndex].get();
+        SparseGrid grid = start_grid;
+        for (int i = net_position[netIndex] % grid.interval.x(); i > 0; i--) {
+          grid.step();
+        }
+        MazeRoute mazeRoute(net, grid_graph_.get(), logger_);
+        mazeRoute.constructSparsifiedGraph(wireCostView, grid);
+        mazeRoute.run();
+        std::shared_ptr<SteinerTreeNode> tree = mazeRoute.getSteinerTree();
+        assert(tree != nullptr);
+
+        PatternRoute patternRoute(
+            net, grid_graph_.get(), stt_builder_, constants_, logger_);
+        patternRoute.setSteinerTree(tree);
+        patternRoute.constructRoutingDAG();
+        patternRoute.run();
+      },
+      [&](const int netIndex) {
+        GRNet* net = gr_nets_[netIndex].get();
+        grid_graph_->commitTree(net->getRoutingTree());
+        grid_graph_->updateWireCostView(wireCostView, net->getRoutingTree());
+      });
 
   updateOverflowNets(netIndices);
 }
@@ -260,6 +301,40 @@ void CUGR::sortNetIndices(std::vector<int>& netIndices) const
   });
 }
 
+// Returns the cells a pattern route of the net can use: the bounding box
+// of its pins enlarged by margin cells.  Vias also add demand to the edges
+// below their cell, hence the extra cell.
+BoxT CUGR::getNetRegion(const GRNet* net, const int margin) const
+{
+  const BoxT& box = net->getBoundingBox();
+  const int expand = margin + 1;
+  return BoxT(std::max(box.lx() - expand, 0),
+              std::max(box.ly() - expand, 0),
+              std::min(box.hx() + expand, grid_graph_->getXSize() - 1),
+              std::min(box.hy() + expand, grid_graph_->getYSize() - 1));
+}
+
+// Calls route_net, then commit_net when given, for the nets in netIndices,
+// in parallel batches of nets with disjoint regions when more than one
+// thread is used.
+void CUGR::routeInBatches(const std::vector<int>& netIndices,
+                          const std::function<BoxT(int)>& net_region,
+                          const std::function<void(int)>& route_net,
+                          const std::function<void(int)>& commit_net)
+{
+  grt::routeInBatches(
+      netIndices,
+      grid_graph_->getXSize(),
+      grid_graph_->getYSize(),
+      num_threads_,
+      [&](const int netIndex) {
+        const BoxT region = net_region(netIndex);
+        return odb::Rect(region.lx(), region.ly(), region.hx(), region.hy());
+      },
+      route_net,
+      commit_net);
+}
+
 void CUGR::getGuides(const GRNet* net,
                      std::vector<std::pair<int, BoxT>>& guides)
 {
@@ -1,5 +1,6 @@
 #pragma once
 #include <algorithm>
+#include <atomic>
 #include <cassert>
 #include <cstddef>
 #include <cstdint>
@@ -180,8 +181,9 @@ class GridGraph
   CostT unit_via_cost_;
   std::vector<CostT> unit_length_short_costs_;
 
-  int total_length_ = 0;
-  int total_num_vias_ = 0;
+  // Nets are committed from multiple threads
+  std::atomic<int> total_length_ = 0;
+  std::atomic<int> total_num_vias_ = 0;
   // gridEdges[l][x][y] stores the edge {(l, x, y), (l, x+1, y)} or {(l, x, y),
   // (l, x, y+1)} depending on the routing direction of the layer
   std::vector<std::vector<std::vector<GraphEdge>>> graph_edges_;
@@ -97,7 +97,10 @@ void PatternRoute::constructSteinerTree()
     ys.push_back(accessPoint.point.y());
   }
 
-  stt::Tree flutetree = stt_builder_->flute(xs, ys, flute_accuracy_);
+  stt::Tree flutetree;
+  // FLUTE is not thread safe
+#pragma omp critical(cugr_flute)
+  flutetree = stt_builder_->flute(xs, ys, flute_accuracy_);
   const int numBranches = degree + degree - 2;
   std::vector<PointT> steinerPoints;
   steinerPoints.reserve(numBranches);
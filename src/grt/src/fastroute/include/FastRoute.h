@@ -4,6 +4,7 @@
 #pragma once
 
 #include <cstdint>
+#include <functional>
 #include <memory>
 #include <set>
 #include <string>
@@ -221,6 +222,7 @@ class FastRouteCore
   void setCriticalNetsPercentage(float u);
   float getCriticalNetsPercentage() { return critical_nets_percentage_; };
   void setOverflowIterations(int iterations);
+  void setThreadCount(int threads);
   void setCongestionReportIterStep(int congestion_report_iter_step);
   void setCongestionReportFile(const char* congestion_file_name);
   void setGridMax(int x_max, int y_max);
@@ -472,6 +474,13 @@ class FastRouteCore
                       int threshold,
                       int enlarge);
 
+  // parallel routing functions
+  odb::Rect netRoutingRegion(int netID, int expand) const;
+  void routeInBatches(int num_nets,
+                      const std::function<odb::Rect(int)>& net_region,
+                      const std::function<void(int)>& route_net,
+                      const std::function<void(int)>& commit_net = nullptr);
+
   // ripup functions
   void ripupSegL(const Segment* seg);
   void newRipup(const TreeEdge* treeedge,
@@ -623,6 +632,7 @@ class FastRouteCore
   int y_corner_;
   int tile_size_;
   int enlarge_;
+  int num_threads_;
   int costheight_;
   int ahth_;
   int num_layers_;
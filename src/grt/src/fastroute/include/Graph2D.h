@@ -5,6 +5,7 @@
 
 #include <cstdint>
 #include <functional>
+#include <mutex>
 #include <set>
 #include <string>
 #include <utility>
@@ -165,6 +166,8 @@ class Graph2D
 
   std::set<std::pair<int, int>> h_used_ggrid_;
   std::set<std::pair<int, int>> v_used_ggrid_;
+  // Nets routed in parallel update disjoint edges but share the used sets
+  std::mutex used_ggrid_mutex_;
 };
 
 }  // namespace grt
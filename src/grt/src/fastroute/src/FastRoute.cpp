@@ -47,6 +47,7 @@ FastRouteCore::FastRouteCore(odb::dbDatabase* db,
       y_corner_(0),
       tile_size_(0),
       enlarge_(0),
+      num_threads_(1),
       costheight_(0),
       ahth_(0),
       num_layers_(0),
@@ -1811,6 +1812,11 @@ void FastRouteCore::setOverflowIterations(int iterations)
   overflow_iterations_ = iterations;
 }
 
+void FastRouteCore::setThreadCount(int threads)
+{
+  num_threads_ = std::max(threads, 1);
+}
+
 void FastRouteCore::setCongestionReportIterStep(int congestion_report_iter_step)
 {
   congestion_report_iter_step_ = congestion_report_iter_step;
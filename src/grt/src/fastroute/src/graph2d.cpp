@@ -8,6 +8,7 @@
 #include <cstddef>
 #include <cstdint>
 #include <functional>
+#include <mutex>
 #include <set>
 #include <string>
 #include <utility>
@@ -226,6 +227,7 @@ void Graph2D::updateEstUsageH(const int x,
       += getCostNDRAware(net, x, y, usage, EdgeDirection::Horizontal);
 
   if (usage > 0) {
+    std::lock_guard<std::mutex> lock(used_ggrid_mutex_);
     h_used_ggrid_.insert({x, y});
   }
 }
@@ -257,6 +259,7 @@ void Graph2D::updateEstUsageV(const int x,
       += getCostNDRAware(net, x, y, usage, EdgeDirection::Vertical);
 
   if (usage > 0) {
+    std::lock_guard<std::mutex> lock(used_ggrid_mutex_);
     v_used_ggrid_.insert({x, y});
   }
 }
@@ -288,6 +291,7 @@ void Graph2D::addUsageH(const int x, const int y, const int used)
 {
   h_edges_[x][y].usage += used;
   if (used > 0) {
+    std::lock_guard<std::mutex> lock(used_ggrid_mutex_);
     h_used_ggrid_.insert({x, y});
   }
 }
@@ -305,6 +309,7 @@ void Graph2D::addUsageV(const int x, const int y, const int used)
 {
   v_edges_[x][y].usage += used;
   if (used > 0) {
+    std::lock_guard<std::mutex> lock(used_ggrid_mutex_);
     v_used_ggrid_.insert({x, y});
   }
 }
@@ -349,6 +354,7 @@ void Graph2D::updateUsageH(const int x,
       += getCostNDRAware(net, x, y, usage, EdgeDirection::Horizontal);
 
   if (usage > 0) {
+    std::lock_guard<std::mutex> lock(used_ggrid_mutex_);
     h_used_ggrid_.insert({x, y});
   }
 }
@@ -374,6 +380,7 @@ void Graph2D::updateUsageV(const int x,
       += getCostNDRAware(net, x, y, usage, EdgeDirection::Vertical);
 
   if (usage > 0) {
+    std::lock_guard<std::mutex> lock(used_ggrid_mutex_);
     v_used_ggrid_.insert({x, y});
   }
 }
@@ -13,6 +13,7 @@
 #include "DataType.h"
 #include "FastRoute.h"
 #include "odb/geom.h"
+#include "omp.h"
 #include "utl/Logger.h"
 
 namespace grt {
@@ -1046,8 +1047,6 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
                                   float& slack_th)
 {
   // maze routing for multi-source, multi-destination
-  int tmpX, tmpY;
-
   const int max_usage_multiplier = 40;
 
   for (int i = 0; i < max_usage_multiplier * h_capacity_; i++) {
@@ -1070,22 +1069,30 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
     StNetOrder();
   }
 
-  std::vector<double*> src_heap;
-  std::vector<double*> dest_heap;
-  src_heap.reserve(y_grid_ * x_grid_);
-  dest_heap.reserve(y_grid_ * x_grid_);
+  // each thread routes its nets with its own heaps
+  std::vector<std::vector<double*>> src_heaps(num_threads_);
+  std::vector<std::vector<double*>> dest_heaps(num_threads_);
+  std::vector<std::vector<OrderNetEdge>> net_eos(num_threads_);
+  src_heaps[0].reserve(y_grid_ * x_grid_);
+  dest_heaps[0].reserve(y_grid_ * x_grid_);
+  for (std::vector<OrderNetEdge>& net_eo : net_eos) {
+    net_eo.reserve(2ul * max_degree_);
+  }
 
   multi_array<double, 2> d1(boost::extents[y_range_][x_range_]);
   multi_array<double, 2> d2(boost::extents[y_range_][x_range_]);
 
-  std::vector<bool> pop_heap2(y_grid_ * x_range_, false);
+  // not a vector<bool> so the flags of nets routed in parallel don't share
+  // bytes
+  std::vector<char> pop_heap2(y_grid_ * x_range_, false);
 
   /**
    * @brief Updates the cost of an adjacent grid if the new cost is lower,
    * updating the heap accordingly. Also updates parent indexes if cost was
    * updated. Throws an error if the position can't be found.
    * */
-  auto updateAdjacent = [&](const int cur_x,
+  auto updateAdjacent = [&](std::vector<double*>& src_heap,
+                            const int cur_x,
                             const int cur_y,
                             const int adj_x,
                             const int adj_y,
@@ -1133,7 +1140,8 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
    * edge usage. It optionally adds a via cost and checks for potential hyper
    * edges, updating adjacent grids accordingly.
    */
-  auto relaxAdjacent = [&](const int cur_x,
+  auto relaxAdjacent = [&](std::vector<double*>& src_heap,
+                           const int cur_x,
                            const int cur_y,
                            const int d_x,
                            const int d_y,
@@ -1175,15 +1183,40 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
       }
     }
 
-    updateAdjacent(cur_x, cur_y, cur_x + d_x, cur_y + d_y, tmp, net_id);
+    updateAdjacent(
+        src_heap, cur_x, cur_y, cur_x + d_x, cur_y + d_y, tmp, net_id);
   };
 
-  std::vector<OrderNetEdge> net_eo;
-  net_eo.reserve(2ul * max_degree_);
+  // Rebuilding a tree calls FLUTE, which is not thread safe
+  auto rebuildTree = [this](const int netID) {
+#pragma omp critical(fastroute_rebuild_tree)
+    reInitTree(netID);
+  };
 
-  for (int nidRPC = 0; nidRPC < net_ids_.size(); nidRPC++) {
-    const int netID
-        = ordering ? tree_order_cong_[nidRPC].treeIndex : net_ids_[nidRPC];
+  enum class NetRouting
+  {
+    Routed,
+    Rebuilt,
+    Deferred
+  };
+
+  /**
+   * @brief Routes the tree edges of a net in the bounding box of the edges,
+   * enlarged by at most expand cells. Returns Rebuilt when the tree had to be
+   * rebuilt and the net has to be routed again. When net_region is given, the
+   * net is Deferred, before the edge is ripped up, as soon as the window of
+   * an edge leaves the region, which Steiner nodes moved by earlier edges can
+   * cause.
+   */
+  auto routeNet = [&](const int netID,
+                      const odb::Rect* net_region,
+                      int& last_enlarge) -> NetRouting {
+    const int thread = omp_get_thread_num();
+    std::vector<double*>& src_heap = src_heaps[thread];
+    std::vector<double*>& dest_heap = dest_heaps[thread];
+    std::vector<OrderNetEdge>& net_eo = net_eos[thread];
+    int tmpX = 0;
+    int tmpY = 0;
 
     const int num_terminals = sttrees_[netID].num_terminals;
 
@@ -1213,6 +1246,22 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
         continue;
       }
 
+      const auto [ymin, ymax] = std::minmax(n1y, n2y);
+      const auto [xmin, xmax] = std::minmax(n1x, n2x);
+
+      const int enlarge
+          = std::min(origENG, (iter / 6 + 3) * treeedge->route.routelen);
+
+      // the window is the widest without the decrease of critical nets
+      if (net_region != nullptr
+          && !net_region->contains(
+              odb::Rect(std::max(xmin - enlarge, 0),
+                        std::max(ymin - enlarge, 0),
+                        std::min(xmax + enlarge, x_grid_ - 1),
+                        std::min(ymax + enlarge, y_grid_ - 1)))) {
+        return NetRouting::Deferred;
+      }
+
       const bool enter = newRipupCheck(treeedge,
                                        n1x,
                                        n1y,
@@ -1228,20 +1277,17 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
       }
 
       // ripup the routing for the edge
-      const auto [ymin, ymax] = std::minmax(n1y, n2y);
-      const auto [xmin, xmax] = std::minmax(n1x, n2x);
-
-      enlarge_ = std::min(origENG, (iter / 6 + 3) * treeedge->route.routelen);
+      last_enlarge = enlarge;
 
       int decrease = 0;
 
       if (nets_[netID]->isCritical()) {
-        decrease = std::min((iter / 7) * 5, enlarge_ / 2);
+        decrease = std::min((iter / 7) * 5, enlarge / 2);
       }
-      const int regionX1 = std::max(xmin - enlarge_ + decrease, 0);
-      const int regionX2 = std::min(xmax + enlarge_ - decrease, x_grid_ - 1);
-      const int regionY1 = std::max(ymin - enlarge_ + decrease, 0);
-      const int regionY2 = std::min(ymax + enlarge_ - decrease, y_grid_ - 1);
+      const int regionX1 = std::max(xmin - enlarge + decrease, 0);
+      const int regionX2 = std::min(xmax + enlarge - decrease, x_grid_ - 1);
+      const int regionY1 = std::max(ymin - enlarge + decrease, 0);
+      const int regionY2 = std::min(ymax + enlarge - decrease, y_grid_ - 1);
 
       // initialize d1[][] and d2[][] as BIG_INT
       for (int i = regionY1; i <= regionY2; i++) {
@@ -1292,20 +1338,44 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
         removeMin(src_heap);
 
         if (curX > regionX1) {  // left
-          relaxAdjacent(
-              curX, curY, -1, 0, preY != curY, curX < regionX2 - 1, netID);
+          relaxAdjacent(src_heap,
+                        curX,
+                        curY,
+                        -1,
+                        0,
+                        preY != curY,
+                        curX < regionX2 - 1,
+                        netID);
         }
         if (curX < regionX2) {  // right
-          relaxAdjacent(
-              curX, curY, 1, 0, preY != curY, curX > regionX1 + 1, netID);
+          relaxAdjacent(src_heap,
+                        curX,
+                        curY,
+                        1,
+                        0,
+                        preY != curY,
+                        curX > regionX1 + 1,
+                        netID);
         }
         if (curY > regionY1) {  // bottom
-          relaxAdjacent(
-              curX, curY, 0, -1, preX != curX, curY < regionY2 - 1, netID);
+          relaxAdjacent(src_heap,
+                        curX,
+                        curY,
+                        0,
+                        -1,
+                        preX != curX,
+                        curY < regionY2 - 1,
+                        netID);
         }
         if (curY < regionY2) {  // top
-          relaxAdjacent(
-              curX, curY, 0, 1, preX != curX, curY > regionY1 + 1, netID);
+          relaxAdjacent(src_heap,
+                        curX,
+                        curY,
+                        0,
+                        1,
+                        preX != curX,
+                        curY > regionY1 + 1,
+                        netID);
         }
 
         // update ind1 for next loop
@@ -1429,9 +1499,8 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
                              "Net {} has errors during updateRouteType1.",
                              nets_[netID]->getName());
             }
-            reInitTree(netID);
-            nidRPC--;
-            break;
+            rebuildTree(netID);
+            return NetRouting::Rebuilt;
           }
           // update position for n1
           treenodes[n1].x = E1x;
@@ -1464,9 +1533,8 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
                        1,
                        "Net {} has errors during updateRouteType2.",
                        nets_[netID]->getName());
-            reInitTree(netID);
-            nidRPC--;
-            break;
+            rebuildTree(netID);
+            return NetRouting::Rebuilt;
           }
           // update position for n1
           treenodes[n1].x = E1x;
@@ -1586,9 +1654,8 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
                        1,
                        "Net {} has errors during updateRouteType1.",
                        nets_[netID]->getName());
-            reInitTree(netID);
-            nidRPC--;
-            break;
+            rebuildTree(netID);
+            return NetRouting::Rebuilt;
           }
 
           // update position for n2
@@ -1622,9 +1689,8 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
                        1,
                        "Net {} has errors during updateRouteType2.",
                        nets_[netID]->getName());
-            reInitTree(netID);
-            nidRPC--;
-            break;
+            rebuildTree(netID);
+            return NetRouting::Rebuilt;
           }
           // update position for n2
           treenodes[n2].x = E2x;
@@ -1713,7 +1779,54 @@ void FastRouteCore::mazeRouteMSMD(const int iter,
         }
       }
     }  // loop edgeID
-  }  // loop netID
+    return NetRouting::Routed;
+  };
+
+  // The edges of a net are routed in the bounding box of its tree and
+  // routes enlarged by expand, so nets that don't share cells there are
+  // routed in parallel.  d1, d2 and the other grids of the router are only
+  // used in the region of the net being routed.  The regions are computed
+  // before routing, as the net moves its Steiner nodes.  A net whose window
+  // leaves its region is routed again after its batch, alone, so that with
+  // one thread the nets are routed as before.
+  const int num_nets = net_ids_.size();
+  auto netAt = [&](const int i) {
+    return ordering ? tree_order_cong_[i].treeIndex : net_ids_[i];
+  };
+  std::vector<odb::Rect> net_regions(num_nets);
+  for (int i = 0; i < num_nets; i++) {
+    net_regions[i] = netRoutingRegion(netAt(i), expand);
+  }
+  std::vector<int> net_enlarge(num_nets, -1);
+  std::vector<char> net_deferred(num_nets, false);
+  auto routeNetAt = [&](const int i, const odb::Rect* net_region) {
+    NetRouting routing;
+    do {
+      routing = routeNet(netAt(i), net_region, net_enlarge[i]);
+    } while (routing == NetRouting::Rebuilt);
+    return routing;
+  };
+  const bool in_region = num_threads_ > 1;
+  routeInBatches(
+      num_nets,
+      [&](const int i) { return net_regions[i]; },
+      [&](const int i) {
+        net_deferred[i] = routeNetAt(i, in_region ? &net_regions[i] : nullptr)
+                          == NetRouting::Deferred;
+      },
+      [&](const int i) {
+        if (net_deferred[i]) {
+          routeNetAt(i, nullptr);
+        }
+      });
+
+  // keep the enlargement of the last edge routed in net order
+  for (auto it = net_enlarge.rbegin(); it != net_enlarge.rend(); it++) {
+    if (*it >= 0) {
+      enlarge_ = *it;
+      break;
+    }
+  }
 
   h_cost_table_.clear();
   v_cost_table_.clear();
@@ -5,11 +5,15 @@
 #include <cmath>
 #include <cstddef>
 #include <cstdint>
+#include <functional>
+#include <numeric>
 #include <queue>
 #include <vector>
 
 #include "DataType.h"
 #include "FastRoute.h"
+#include "grt/RouteInBatches.h"
+#include "odb/geom.h"
 #include "utl/Logger.h"
 
 namespace grt {
@@ -173,21 +177,31 @@ void FastRouteCore::routeSegLFirstTime(Segment* seg)
 void FastRouteCore::routeLAll(const bool firstTime)
 {
   if (firstTime) {  // no previous route
+    // the segments of a net stay in the bounding box of its segments
+    auto segments_region = [this](const int i) {
+      odb::Rect region;
+      region.mergeInit();
+      for (const Segment& seg : seglist_[net_ids_[i]]) {
+        region.merge(odb::Point(seg.x1, seg.y1));
+        region.merge(odb::Point(seg.x2, seg.y2));
+      }
+      return region;
+    };
     // estimate congestion with 0.5+0.5 L
-    for (const int netID : net_ids_) {
-      for (auto& seg : seglist_[netID]) {
+    routeInBatches(net_ids_.size(), segments_region, [this](const int i) {
+      for (auto& seg : seglist_[net_ids_[i]]) {
         estimateOneSeg(&seg);
       }
-    }
+    });
     // L route
-    for (const int netID : net_ids_) {
-      for (auto& seg : seglist_[netID]) {
+    routeInBatches(net_ids_.size(), segments_region, [this](const int i) {
+      for (auto& seg : seglist_[net_ids_[i]]) {
         // no need to reroute the H or V segs
         if (seg.x1 != seg.x2 && seg.y1 != seg.y2) {
           routeSegLFirstTime(&seg);
         }
       }
-    }
+    });
   } else {  // previous is L-route
     for (const int netID : net_ids_) {
       for (auto& seg : seglist_[netID]) {
@@ -337,15 +351,12 @@ void FastRouteCore::newrouteL(const int netID,
 // first
 void FastRouteCore::newrouteLAll(const bool firstTime, const bool viaGuided)
 {
-  if (firstTime) {
-    for (const int netID : net_ids_) {
-      newrouteL(netID, RouteType::NoRoute, viaGuided);  // do L-routing
-    }
-  } else {
-    for (const int netID : net_ids_) {
-      newrouteL(netID, RouteType::LRoute, viaGuided);
-    }
-  }
+  const RouteType ripuptype
+      = firstTime ? RouteType::NoRoute : RouteType::LRoute;
+  routeInBatches(
+      net_ids_.size(),
+      [this](const int i) { return netRoutingRegion(net_ids_[i], 0); },
+      [&](const int i) { newrouteL(net_ids_[i], ripuptype, viaGuided); });
 }
 
 void FastRouteCore::newrouteZ_edge(const int netID, const int edgeID)
@@ -1342,17 +1353,18 @@ void FastRouteCore::routeMonotonicAll(const int threshold,
   multi_array<double, 2> d1(boost::extents[y_range_][x_range_]);
   multi_array<double, 2> d2(boost::extents[y_range_][x_range_]);
 
-  for (const int netID : net_ids_) {
-    const int numEdges = sttrees_[netID].num_edges();
-    for (int edgeID = 0; edgeID < numEdges; edgeID++) {
-      routeMonotonic(netID,
-                     edgeID,
-                     d1,
-                     d2,
-                     threshold,
-                     expand);  // ripup previous route and do Monotonic routing
-    }
-  }
+  // d1 and d2 are only used in the region of the net being routed
+  routeInBatches(
+      net_ids_.size(),
+      [&](const int i) { return netRoutingRegion(net_ids_[i], expand); },
+      [&](const int i) {
+        const int netID = net_ids_[i];
+        const int numEdges = sttrees_[netID].num_edges();
+        for (int edgeID = 0; edgeID < numEdges; edgeID++) {
+          // ripup previous route and do Monotonic routing
+          routeMonotonic(netID, edgeID, d1, d2, threshold, expand);
+        }
+      });
   h_cost_table_.clear();
 }
 
@@ -1432,4 +1444,48 @@ void FastRouteCore::newrouteLInMaze(const int netID)
   }  // loop i
 }
 
+// Returns the grid cells a net can use when it is rerouted: the bounding
+// box of its tree nodes and maze routes, enlarged by expand cells.
+odb::Rect FastRouteCore::netRoutingRegion(const int netID,
+                                          const int expand) const
+{
+  const StTree& tree = sttrees_[netID];
+  if (tree.num_nodes() == 0) {
+    return odb::Rect(0, 0, 0, 0);
+  }
+
+  odb::Rect region;
+  region.mergeInit();
+  for (int i = 0; i < tree.num_nodes(); i++) {
+    region.merge(odb::Point(tree.nodes[i].x, tree.nodes[i].y));
+  }
+  for (const TreeEdge& edge : tree.edges) {
+    if (edge.route.type == RouteType::MazeRoute) {
+      for (const GPoint3D& grid : edge.route.grids) {
+        region.merge(odb::Point(grid.x, grid.y));
+      }
+    }
+  }
+
+  return odb::Rect(std::max(region.xMin() - expand, 0),
+                   std::max(region.yMin() - expand, 0),
+                   std::min(region.xMax() + expand, x_grid_ - 1),
+                   std::min(region.yMax() + expand, y_grid_ - 1));
+}
+
+// Calls route_net for the nets 0..num_nets-1, in parallel batches of nets
+// with disjoint regions when more than one thread is used, and commit_net
+// when given after each batch.
+void FastRouteCore::routeInBatches(
+    const int num_nets,
+    const std::function<odb::Rect(int)>& net_region,
+    const std::function<void(int)>& route_net,
+    const std::function<void(int)>& commit_net)
+{
+  std::vector<int> nets(num_nets);
+  std::iota(nets.begin(), nets.end(), 0);
+  grt::routeInBatches(
+      nets, x_grid_, y_grid_, num_threads_, net_region, route_net, commit_net);
+}
+
 }  // namespace grt
@@ -0,0 +1,28 @@
+# route guides for a congested gcd_nangate45 are the same on 2 and 4
+# threads after the maze routing iterations
+source "helpers.tcl"
+read_lef "Nangate45/Nangate45.lef"
+read_def "gcd.def"
+
+set guide_file1 [make_result_file congestion2_parallel1.guide]
+set guide_file2 [make_result_file congestion2_parallel2.guide]
+
+set_global_routing_layer_adjustment metal2 0.9
+set_global_routing_layer_adjustment metal3 0.9
+set_global_routing_layer_adjustment metal4-metal6 0.9
+set_global_routing_layer_adjustment metal7-metal10 1.0
+
+set_routing_layers -signal metal2-metal10
+
+set_thread_count 2
+tee -quiet -variable log1 { global_route -allow_congestion }
+write_guides $guide_file1
+
+set_thread_count 4
+tee -quiet -variable log2 { global_route -allow_congestion }
+write_guides $guide_file2
+
+if { $log1 != $log2 } {
+  puts "The global_route reports differ."
+}
+diff_files $guide_file1 $guide_file2
@@ -0,0 +1,21 @@
+# route guides for gcd_nangate45 with CUGR on multiple threads are the same
+# on repeated runs
+source "helpers.tcl"
+read_lef "Nangate45/Nangate45.lef"
+read_def "gcd.def"
+
+set guide_file1 [make_result_file gcd_cugr_parallel1.guide]
+set guide_file2 [make_result_file gcd_cugr_parallel2.guide]
+
+set_thread_count 4
+
+tee -quiet -variable log1 { global_route -use_cugr }
+write_guides $guide_file1
+
+tee -quiet -variable log2 { global_route -use_cugr }
+write_guides $guide_file2
+
+if { $log1 != $log2 } {
+  puts "The global_route reports differ."
+}
+diff_files $guide_file1 $guide_file2
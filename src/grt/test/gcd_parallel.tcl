@@ -0,0 +1,14 @@
+# route guides for gcd_nangate45 with multiple threads match the single
+# thread guides
+source "helpers.tcl"
+read_lef "Nangate45/Nangate45.lef"
+read_def "gcd.def"
+
+set guide_file [make_result_file gcd_parallel.guide]
+
+set_thread_count 4
+global_route -verbose
+
+write_guides $guide_file
+
+diff_file gcd.guideok $guide_file
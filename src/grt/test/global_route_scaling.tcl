@@ -0,0 +1,55 @@
+# Runtime of global_route on the regression designs across thread counts.
+# The guides of every run are compared with the single thread guides.
+# usage: openroad global_route_scaling.tcl [max_threads]
+source "helpers.tcl"
+
+set max_threads [cpu_count]
+if { $argc > 0 } {
+  set max_threads [lindex $argv 0]
+}
+
+# design def file and lef files
+set designs {
+  { gcd.def {Nangate45/Nangate45.lef} }
+  { multiple_calls.def {Nangate45/Nangate45.lef} }
+  { gcd_sky130.def {sky130hs/sky130hs.tlef sky130hs/sky130hs_std_cell.lef} }
+}
+
+set results {}
+foreach design $designs {
+  lassign $design def_file lef_files
+  set serial_guide ""
+  for { set threads 1 } { $threads <= $max_threads } \
+    { set threads [expr $threads * 2] } {
+    clear
+    foreach lef $lef_files {
+      read_lef $lef
+    }
+    read_def $def_file
+
+    set_thread_count $threads
+    set start [clock milliseconds]
+    global_route
+    set ms [expr [clock milliseconds] - $start]
+
+    set guide_file [make_result_file \
+      [file rootname $def_file]_scaling_$threads.guide]
+    write_guides $guide_file
+    if { $threads == 1 } {
+      set serial_guide $guide_file
+      set same "-"
+    } elseif { [catch { exec cmp -s $serial_guide $guide_file }] } {
+      set same "no"
+    } else {
+      set same "yes"
+    }
+    lappend results $def_file $threads $ms $same
+  }
+}
+
+puts [format "%-24s %8s %12s %12s" "Design" "Threads" "Time (ms)" \
+  "Same guides"]
+foreach { def_file threads ms same } $results {
+  puts [format "%-24s %8d %12d %12s" $def_file $threads $ms $same]
+}
+exit
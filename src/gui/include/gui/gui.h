@@ -39,6 +39,7 @@ class Logger;
 
 namespace gui {
 class HeatMapDataSource;
+struct HeatMapGrid;
 class PinDensityDataSource;
 class PlacementDensityDataSource;
 class PowerDensityDataSource;
@@ -836,7 +837,11 @@ class Gui
                          const Renderer::Setting& value);
   Renderer::Setting getHeatMapSetting(const std::string& name,
                                       const std::string& option);
-  void dumpHeatMap(const std::string& name, const std::string& file);
+  // bin_size is in microns, zero keeps the current grid of the map.
+  void dumpHeatMap(const std::string& name,
+                   const std::string& file,
+                   double bin_size = 0.0);
+  HeatMapGrid getHeatMapGrid(const std::string& name, double bin_size = 0.0);
 
   void setMainWindowTitle(const std::string& title);
   std::string getMainWindowTitle();
@@ -34,6 +34,17 @@ namespace gui {
 class HeatMapRenderer;
 class HeatMapSetup;
 
+// Values of a heat map on its grid, for use without the layout viewer.
+struct HeatMapGrid
+{
+  // Bin edges (DBU), there are x_grid.size() - 1 columns and
+  // y_grid.size() - 1 rows.
+  std::vector<int> x_grid;
+  std::vector<int> y_grid;
+  // Row-major values (rows along y), NaN for bins without data.
+  std::vector<double> values;
+};
+
 class HeatMapDataSource
 {
  public:
@@ -84,6 +95,11 @@ class HeatMapDataSource
   utl::Logger* getLogger() const { return logger_; }
 
   void dumpToFile(const std::string& file);
+  HeatMapGrid getGrid();
+
+  // Threads used to build the map.
+  void setThreads(int threads) { threads_ = threads; }
+  int getThreads() const { return threads_; }
 
   // setup
   void showSetup();
@@ -179,6 +195,9 @@ class HeatMapDataSource
   void clearMap();
   virtual bool populateMap() = 0;
   void addToMap(const odb::Rect& region, double value);
+  // Add all regions at once, the map columns are split between threads.
+  // combineMapData must only depend on its arguments.
+  void addToMap(const std::vector<std::pair<odb::Rect, double>>& regions);
   virtual void combineMapData(bool base_has_value,
                               double& base,
                               const double new_data,
@@ -206,6 +225,8 @@ class HeatMapDataSource
   void setIssueRedraw(bool state) { issue_redraw_ = state; }
 
  private:
+  void addToMapPoint(MapColor& map_pt, const odb::Rect& region, double value);
+
   const std::string name_;
   const std::string short_name_;
   const std::string settings_group_;
@@ -218,6 +239,7 @@ class HeatMapDataSource
 
   odb::dbBlock* block_;
   utl::Logger* logger_;
+  int threads_;
   double grid_x_size_;
   double grid_y_size_;
   double display_range_min_;
@@ -36,6 +36,7 @@
 #include "displayControls.h"
 #include "drcWidget.h"
 #include "gif.h"
+#include "gui/heatMap.h"
 #include "heatMapPinDensity.h"
 #include "heatMapPlacementDensity.h"
 #include "helpWidget.h"
@@ -1080,12 +1081,47 @@ Renderer::Setting Gui::getHeatMapSetting(const std::string& name,
   return settings[option];
 }
 
-void Gui::dumpHeatMap(const std::string& name, const std::string& file)
+// Prepare a heat map to be computed on request, which also works without
+// the main window.  The map is rebuilt so it reflects the current design.
+static void prepareHeatMap(HeatMapDataSource* source,
+                           odb::dbDatabase* db,
+                           const double bin_size)
+{
+  auto* open_road = ord::OpenRoad::openRoad();
+  if (source->getBlock() == nullptr && db->getChip() != nullptr) {
+    source->setBlock(db->getChip()->getBlock());
+  }
+  source->setThreads(open_road->getThreadCount());
+  if (bin_size > 0.0) {
+    if (source->canAdjustGrid()) {
+      source->setGridSizes(bin_size, bin_size);
+    } else {
+      open_road->getLogger()->warn(
+          utl::GUI,
+          111,
+          "{} uses a fixed grid, the bin size is ignored.",
+          source->getName());
+    }
+  }
+  source->destroyMap();
+}
+
+void Gui::dumpHeatMap(const std::string& name,
+                      const std::string& file,
+                      const double bin_size)
 {
   HeatMapDataSource* source = getHeatMap(name);
+  prepareHeatMap(source, db_, bin_size);
   source->dumpToFile(file);
 }
 
+HeatMapGrid Gui::getHeatMapGrid(const std::string& name, const double bin_size)
+{
+  HeatMapDataSource* source = getHeatMap(name);
+  prepareHeatMap(source, db_, bin_size);
+  return source->getGrid();
+}
+
 void Gui::setMainWindowTitle(const std::string& title)
 {
   main_window_title_ = title;
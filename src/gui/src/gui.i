@@ -701,10 +701,10 @@ void set_heatmap(const std::string& name, const std::string& option, const std::
   gui->setHeatMapSetting(name, option, value);
 }
 
-void dump_heatmap(const std::string& name, const std::string& file)
+void dump_heatmap(const std::string& name, const std::string& file, double bin_size = 0.0)
 {
   auto gui = gui::Gui::get();
-  gui->dumpHeatMap(name, file);
+  gui->dumpHeatMap(name, file, bin_size);
 }
 
 void timing_cone(odb::dbITerm* iterm, bool fanin, bool fanout)
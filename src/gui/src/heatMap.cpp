@@ -51,6 +51,7 @@ HeatMapDataSource::HeatMapDataSource(utl::Logger* logger,
       issue_redraw_(true),
       block_(nullptr),
       logger_(logger),
+      threads_(1),
       grid_x_size_(10.0),
       grid_y_size_(10.0),
       display_range_min_(0.0),
@@ -119,6 +120,33 @@ void HeatMapDataSource::dumpToFile(const std::string& file)
   csv.close();
 }
 
+HeatMapGrid HeatMapDataSource::getGrid()
+{
+  ensureMap();
+
+  if (!isPopulated()) {
+    logger_->error(utl::GUI, 110, "\"{}\" is not populated with data.", name_);
+  }
+
+  HeatMapGrid grid;
+  grid.x_grid = map_x_grid_;
+  grid.y_grid = map_y_grid_;
+
+  const int cols = static_cast<int>(map_.shape()[0]);
+  const int rows = static_cast<int>(map_.shape()[1]);
+  grid.values.resize(static_cast<size_t>(rows) * cols);
+  for (int x = 0; x < cols; x++) {
+    for (int y = 0; y < rows; y++) {
+      const auto& map_pt = map_[x][y];
+      grid.values[static_cast<size_t>(y) * cols + x]
+          = map_pt->has_value ? convertPercentToValue(map_pt->value)
+                              : std::numeric_limits<double>::quiet_NaN();
+    }
+  }
+
+  return grid;
+}
+
 void HeatMapDataSource::redraw()
 {
   if (issue_redraw_) {
@@ -373,24 +401,79 @@ void HeatMapDataSource::addToMap(const odb::Rect& region, double value)
         continue;
       }
 
-      odb::Rect intersection;
-      map_pt->rect.intersection(region, intersection);
+      addToMapPoint(*map_pt, region, value);
 
-      const double intersect_area = intersection.area();
-      const double value_area = region.area();
-      const double region_area = map_pt->rect.area();
+      markColorsInvalid();
+    }
+  }
+}
 
-      combineMapData(map_pt->has_value,
-                     map_pt->value,
-                     value,
-                     value_area,
-                     intersect_area,
-                     region_area);
-      map_pt->has_value = true;
+void HeatMapDataSource::addToMap(
+    const std::vector<std::pair<odb::Rect, double>>& regions)
+{
+  const int cols = static_cast<int>(map_.shape()[0]);
+  const int chunks = std::max(1, std::min(threads_, cols));
+
+  // Each thread owns a range of map columns so no bin is shared.  The
+  // regions are bucketed by the ranges they overlap, in their order, before
+  // the threads start.
+  std::vector<int> chunk_x(chunks + 1);
+  for (int chunk = 0; chunk <= chunks; chunk++) {
+    chunk_x[chunk] = map_x_grid_[chunk * cols / chunks];
+  }
+  std::vector<std::vector<int>> chunk_regions(chunks);
+  for (int i = 0; i < regions.size(); i++) {
+    const odb::Rect& region = regions[i].first;
+    const int first
+        = std::lower_bound(chunk_x.begin() + 1, chunk_x.end(), region.xMin())
+          - (chunk_x.begin() + 1);
+    const int last
+        = std::upper_bound(chunk_x.begin(), chunk_x.end() - 1, region.xMax())
+          - chunk_x.begin() - 1;
+    for (int chunk = first; chunk <= last; chunk++) {
+      chunk_regions[chunk].push_back(i);
+    }
+  }
 
-      markColorsInvalid();
+#pragma omp parallel for num_threads(chunks) schedule(static, 1)
+  for (int chunk = 0; chunk < chunks; chunk++) {
+    const int x_min = chunk_x[chunk];
+    const int x_max = chunk_x[chunk + 1];
+    for (const int i : chunk_regions[chunk]) {
+      const auto& [region, value] = regions[i];
+      for (const auto& map_col : getMapView(region)) {
+        for (const auto& map_pt : map_col) {
+          if (map_pt == nullptr || map_pt->rect.xMin() < x_min
+              || map_pt->rect.xMin() >= x_max) {
+            continue;
+          }
+          addToMapPoint(*map_pt, region, value);
+        }
+      }
     }
   }
+
+  markColorsInvalid();
+}
+
+void HeatMapDataSource::addToMapPoint(MapColor& map_pt,
+                                      const odb::Rect& region,
+                                      const double value)
+{
+  odb::Rect intersection;
+  map_pt.rect.intersection(region, intersection);
+
+  const double intersect_area = intersection.area();
+  const double value_area = region.area();
+  const double region_area = map_pt.rect.area();
+
+  combineMapData(map_pt.has_value,
+                 map_pt.value,
+                 value,
+                 value_area,
+                 intersect_area,
+                 region_area);
+  map_pt.has_value = true;
 }
 
 odb::Rect HeatMapDataSource::getBounds() const
@@ -427,6 +510,7 @@ bool HeatMapDataSource::setupMap()
   map_.resize(boost::extents[x_grid_size][y_grid_size]);
 
   const Painter::Color default_color = getColor(0);
+#pragma omp parallel for num_threads(threads_)
   for (size_t x = 0; x < x_grid_size; x++) {
     const int x_min = map_x_grid_[x];
     const int x_max = map_x_grid_[x + 1];
@@ -1128,6 +1212,7 @@ bool PowerDensityDataSource::populateMap()
 
   const bool include_all
       = include_internal_ && include_leakage_ && include_switching_;
+  std::vector<std::pair<odb::Rect, double>> regions;
   for (auto* inst : getBlock()->getInsts()) {
     if (!inst->getPlacementStatus().isPlaced()) {
       continue;
@@ -1152,9 +1237,11 @@ bool PowerDensityDataSource::populateMap()
 
     odb::Rect inst_box = inst->getBBox()->getBox();
 
-    addToMap(inst_box, pwr);
+    regions.emplace_back(inst_box, pwr);
   }
 
+  addToMap(regions);
+
   return true;
 }
 
@@ -33,6 +33,7 @@ bool PinDensityDataSource::populateMap()
   // for this view.
   std::vector<std::pair<odb::dbBlock*, odb::dbTransform>> blocks
       = {{getBlock(), odb::dbTransform()}};
+  std::vector<std::pair<odb::Rect, double>> regions;
 
   while (!blocks.empty()) {
     auto [block, transform] = blocks.back();
@@ -66,11 +67,13 @@ bool PinDensityDataSource::populateMap()
         }
 
         transform.apply(bbox);
-        addToMap(bbox, 1);
+        regions.emplace_back(bbox, 1);
       }
     }
   }
 
+  addToMap(regions);
+
   return true;
 }
 
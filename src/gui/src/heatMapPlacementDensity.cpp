@@ -47,6 +47,7 @@ bool PlacementDensityDataSource::populateMap()
   // for this view.
   std::vector<std::pair<odb::dbBlock*, odb::dbTransform>> blocks
       = {{getBlock(), odb::dbTransform()}};
+  std::vector<std::pair<odb::Rect, double>> regions;
 
   while (!blocks.empty()) {
     auto [block, transform] = blocks.back();
@@ -78,10 +79,12 @@ bool PlacementDensityDataSource::populateMap()
       odb::Rect inst_box = inst->getBBox()->getBox();
       transform.apply(inst_box);
 
-      addToMap(inst_box, 100.0);
+      regions.emplace_back(inst_box, 100.0);
     }
   }
 
+  addToMap(regions);
+
   return true;
 }
 
@@ -541,8 +541,10 @@ void MainWindow::setBlock(odb::dbBlock* block)
   if (block != nullptr) {
     save_->setEnabled(true);
   }
+  const int threads = ord::OpenRoad::openRoad()->getThreadCount();
   for (auto* heat_map : Gui::get()->getHeatMaps()) {
     heat_map->setBlock(block);
+    heat_map->setThreads(threads);
   }
   hierarchy_widget_->setBlock(block);
 }
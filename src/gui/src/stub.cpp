@@ -13,6 +13,7 @@
 #include <vector>
 
 #include "gui/gui.h"
+#include "gui/heatMap.h"
 #include "odb/db.h"
 #include "odb/geom.h"
 #include "tcl.h"
@@ -267,4 +268,9 @@ void Gui::setDisplayControlsVisible(const std::string& name, bool value)
 {
 }
 
+HeatMapGrid Gui::getHeatMapGrid(const std::string& name, double bin_size)
+{
+  return {};
+}
+
 }  // namespace gui
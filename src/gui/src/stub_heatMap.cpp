@@ -3,6 +3,7 @@
 
 #include <functional>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "gui/gui.h"
@@ -24,6 +25,7 @@ HeatMapDataSource::HeatMapDataSource(utl::Logger* logger,
       issue_redraw_(true),
       block_(nullptr),
       logger_(logger),
+      threads_(1),
       grid_x_size_(10.0),
       grid_y_size_(10.0),
       display_range_min_(0.0),
@@ -74,10 +76,20 @@ void HeatMapDataSource::addMultipleChoiceSetting(
 {
 }
 
+HeatMapGrid HeatMapDataSource::getGrid()
+{
+  return {};
+}
+
 void HeatMapDataSource::addToMap(const odb::Rect& region, double value)
 {
 }
 
+void HeatMapDataSource::addToMap(
+    const std::vector<std::pair<odb::Rect, double>>& regions)
+{
+}
+
 void HeatMapDataSource::destroyMap()
 {
 }
@@ -0,0 +1,15 @@
+# gui::dump_heatmap with a bin size without the GUI, on 1 and 4 threads
+source "helpers.tcl"
+read_lef Nangate45/Nangate45.lef
+read_def heatmap.def
+
+set map_file1 [make_result_file heatmap_dump1.csv]
+set map_file4 [make_result_file heatmap_dump4.csv]
+
+# b4 straddles the bins at x = 10um
+gui::dump_heatmap Placement $map_file1 5
+diff_files heatmap_dump.csvok $map_file1
+
+set_thread_count 4
+gui::dump_heatmap Placement $map_file4 5
+diff_files heatmap_dump.csvok $map_file4
@@ -0,0 +1,31 @@
+# Design.getHeatMap with a bin size without the GUI, on 1 and 4 threads
+import math
+from openroad import Tech
+import helpers
+import utl
+
+tech = Tech()
+tech.readLef("Nangate45/Nangate45.lef")
+
+design = helpers.make_design(tech)
+design.readDef("heatmap.def")
+
+
+def format_map(values):
+    return [
+        " ".join("-" if math.isnan(value) else f"{value:.3f}" for value in row)
+        for row in values.tolist()
+    ]
+
+
+values, x_grid, y_grid = design.getHeatMap("Placement", 5.0)
+utl.report(f"x grid: {x_grid}")
+utl.report(f"y grid: {y_grid}")
+utl.report(f"Shape: {values.shape}")
+rows = format_map(values)
+for y, row in enumerate(rows):
+    utl.report(f"Row {y}: {row}")
+
+design.evalTclString("set_thread_count 4")
+values, x_grid, y_grid = design.getHeatMap("Placement", 5.0)
+utl.report(f"Same map on 4 threads: {format_map(values) == rows}")
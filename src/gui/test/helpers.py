@@ -0,0 +1 @@
+../../../test/helpers.py
\ No newline at end of file
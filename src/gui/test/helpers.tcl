@@ -0,0 +1 @@
+../../../test/helpers.tcl
\ No newline at end of file
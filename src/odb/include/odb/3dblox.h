@@ -35,6 +35,16 @@ class ThreeDBlox
   void readDbv(const std::string& dbv_file);
   void readDbx(const std::string& dbx_file);
   void readBMap(const std::string& bmap_file);
+  // Create all bumps of a chip region in one call.  The vectors are
+  // indexed by bump and must have the same size.  Coordinates are in
+  // microns; use "-" for bumps without a port or net.
+  void createBumps(dbChipRegion* chip_region,
+                   const std::vector<std::string>& inst_names,
+                   const std::vector<std::string>& cell_types,
+                   const std::vector<double>& xs,
+                   const std::vector<double>& ys,
+                   const std::vector<std::string>& port_names,
+                   const std::vector<std::string>& net_names);
 
  private:
   void createChiplet(const ChipletDef& chiplet);
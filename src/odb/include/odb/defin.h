@@ -46,6 +46,8 @@ class defin
   void skipFillWires();
   void continueOnErrors();
   void useBlockName(const char* name);
+  // Parse the COMPONENTS and NETS sections with this many threads.
+  void setThreadCount(int threads);
 
   /// Create a new chip
   void readChip(std::vector<dbLib*>& search_libs,
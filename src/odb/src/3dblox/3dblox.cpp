@@ -326,6 +326,35 @@ void ThreeDBlox::createBump(const BumpMapEntry& entry,
   }
 }
 
+void ThreeDBlox::createBumps(dbChipRegion* chip_region,
+                             const std::vector<std::string>& inst_names,
+                             const std::vector<std::string>& cell_types,
+                             const std::vector<double>& xs,
+                             const std::vector<double>& ys,
+                             const std::vector<std::string>& port_names,
+                             const std::vector<std::string>& net_names)
+{
+  const size_t size = inst_names.size();
+  if (cell_types.size() != size || xs.size() != size || ys.size() != size
+      || port_names.size() != size || net_names.size() != size) {
+    logger_->error(utl::ODB,
+                   540,
+                   "3DBV Parser Error: Bump columns for chip region {}/{} "
+                   "have different sizes",
+                   chip_region->getChip()->getName(),
+                   chip_region->getName());
+  }
+  for (size_t i = 0; i < size; i++) {
+    createBump(BumpMapEntry(inst_names[i],
+                            cell_types[i],
+                            xs[i],
+                            ys[i],
+                            port_names[i],
+                            net_names[i]),
+               chip_region);
+  }
+}
+
 dbChip* ThreeDBlox::createDesignTopChiplet(const DesignDef& design)
 {
   dbChip* chip
@@ -64,6 +64,11 @@ void defin::useBlockName(const char* name)
   _reader->useBlockName(name);
 }
 
+void defin::setThreadCount(int threads)
+{
+  _reader->setThreadCount(threads);
+}
+
 void defin::readChip(std::vector<dbLib*>& libs,
                      const char* def_file,
                      dbChip* chip,
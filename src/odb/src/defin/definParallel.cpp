@@ -0,0 +1,923 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2019-2025, The OpenROAD Authors
+
+#include "definParallel.h"
+
+#include <strings.h>
+#include <zlib.h>
+
+#include <algorithm>
+#include <array>
+#include <cctype>
+#include <cmath>
+#include <cstddef>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <filesystem>
+#include <initializer_list>
+#include <limits>
+#include <sstream>
+#include <string>
+#include <string_view>
+#include <system_error>
+#include <utility>
+#include <vector>
+
+#include "defiComponent.hpp"
+#include "utl/Logger.h"
+#include "utl/exception.h"
+#include "utl/timer.h"
+
+namespace odb {
+
+namespace {
+
+bool isBlank(const char c)
+{
+  return c == ' ' || c == '\t' || c == '\n' || c == '\r';
+}
+
+bool equal(const char* token, const char* word)
+{
+  return token != nullptr && strcmp(token, word) == 0;
+}
+
+// Same order as the orient rule of the DEF grammar
+constexpr std::array<const char*, 8> kOrients
+    = {"N", "W", "S", "E", "FN", "FW", "FS", "FE"};
+
+// Words the lexer returns as keywords inside these sections in either case,
+// even where the grammar expects a name.
+constexpr std::array<const char*, 15> kKeywords = {"NEW",
+                                                   "MASK",
+                                                   "RECT",
+                                                   "VIRTUAL",
+                                                   "TAPER",
+                                                   "TAPERRULE",
+                                                   "STYLE",
+                                                   "DO",
+                                                   "BY",
+                                                   "STEP",
+                                                   "FIXED",
+                                                   "COVER",
+                                                   "ROUTED",
+                                                   "MUSTJOIN",
+                                                   "NONDEFAULTRULE"};
+
+int orient(const char* token)
+{
+  for (size_t i = 0; i < kOrients.size(); i++) {
+    if (equal(token, kOrients[i])) {
+      return i;
+    }
+  }
+  return -1;
+}
+
+// Returns true if the lexer reads token as a name rather than as
+// punctuation or a keyword.  Names the lexer could take either way make
+// the parse fail, which is safe as the Si2 parser then reads the file.
+bool isName(const char* token)
+{
+  if (token == nullptr) {
+    return false;
+  }
+  if (token[1] == '\0' && strchr("()+;*-", token[0]) != nullptr) {
+    return false;
+  }
+  for (const char* keyword : kKeywords) {
+    if (strcasecmp(token, keyword) == 0) {
+      return false;
+    }
+  }
+  for (const char* name : kOrients) {
+    if (strcasecmp(token, name) == 0) {
+      return false;
+    }
+  }
+  return true;
+}
+
+bool isOneOf(const char* token, std::initializer_list<const char*> words)
+{
+  return std::any_of(words.begin(), words.end(), [token](const char* word) {
+    return equal(token, word);
+  });
+}
+
+// Reads a NUMBER token like the DEF lexer: strtol, then strtod, and the
+// value has to fit an int.
+bool number(const char* token, double& value)
+{
+  if (token == nullptr) {
+    return false;
+  }
+  const char c = token[0];
+  if (!isdigit(static_cast<unsigned char>(c)) && c != '.'
+      && (c != '-' || token[1] == '\0')) {
+    return false;
+  }
+  char* end;
+  value = strtol(token, &end, 10);
+  if (*end != '\0') {
+    value = strtod(token, &end);
+    if (*end != '\0') {
+      return false;
+    }
+  }
+  return value >= std::numeric_limits<int>::min()
+         && value <= std::numeric_limits<int>::max();
+}
+
+// Splits a range of a section body into tokens like the DEF lexer, in
+// place: the blank after each token is replaced by '\0'.  Quoted strings,
+// &aliases and characters the lexer rejects end the tokens with failed()
+// set.
+class Tokens
+{
+ public:
+  Tokens(char* begin, char* end) : pos_(begin), end_(end) {}
+
+  const char* next();
+  bool failed() const { return failed_; }
+  // Line of the last token, counted from 0 at the start of the range
+  int line() const { return token_line_; }
+
+ private:
+  char* pos_;
+  char* end_;
+  int line_{0};
+  int token_line_{0};
+  bool failed_{false};
+};
+
+const char* Tokens::next()
+{
+  while (pos_ < end_) {
+    if (*pos_ == '\n') {
+      line_++;
+      pos_++;
+    } else if (isBlank(*pos_)) {
+      pos_++;
+    } else if (*pos_ == '#') {
+      // Comment to the end of the line
+      pos_ = static_cast<char*>(memchr(pos_, '\n', end_ - pos_));
+      if (pos_ == nullptr) {
+        pos_ = end_;
+      }
+    } else {
+      break;
+    }
+  }
+  token_line_ = line_;
+  if (pos_ == end_) {
+    return nullptr;
+  }
+  if (*pos_ == '"' || *pos_ == '&') {
+    failed_ = true;
+    return nullptr;
+  }
+
+  char* token = pos_;
+  while (pos_ < end_ && !isBlank(*pos_)) {
+    const unsigned char c = *pos_;
+    if (c == '\0' || c > 127) {
+      failed_ = true;
+      return nullptr;
+    }
+    pos_++;
+  }
+  // The lexer drops a '\r' inside a token rather than ending it there.
+  if (pos_ == end_
+      || (*pos_ == '\r' && (pos_ + 1 == end_ || !isBlank(pos_[1])))) {
+    failed_ = true;
+    return nullptr;
+  }
+  if (*pos_ == '\n') {
+    line_++;
+  }
+  *pos_++ = '\0';
+  return token;
+}
+
+// Parses the statements of one chunk into its records, following the
+// grammar actions of def.y for the statements it handles.
+class ChunkParser
+{
+ public:
+  ChunkParser(definParallel::Chunk& chunk, double version)
+      : chunk_(chunk), tokens_(chunk.begin, chunk.end), version_(version)
+  {
+  }
+
+  void parseComponents();
+  void parseNets();
+
+ private:
+  using PathOp = definParallel::PathOp;
+
+  const char* next()
+  {
+    token_ = tokens_.next();
+    return token_;
+  }
+  void add(PathOp op,
+           const char* name = nullptr,
+           const std::array<int, 4>& values = {})
+  {
+    chunk_.paths.push_back({name, values, op});
+  }
+
+  bool component();
+  bool net();
+  bool wire(const char* type);
+  bool pathItem();
+  bool pathPoint();
+  bool rect();
+  bool coordinate(const char* token,
+                  double& saved,
+                  bool& has_saved,
+                  double& value);
+
+  definParallel::Chunk& chunk_;
+  Tokens tokens_;
+  const char* token_{nullptr};
+  double version_;
+  // The previous path point for '*'.  A '*' before the chunk's first point
+  // would need the state of the previous chunk, so it fails the parse.
+  double x_{0};
+  double y_{0};
+  bool has_x_{false};
+  bool has_y_{false};
+};
+
+void ChunkParser::parseComponents()
+{
+  next();
+  while (token_ != nullptr) {
+    if (!component()) {
+      chunk_.error_line = tokens_.line();
+      return;
+    }
+  }
+  if (tokens_.failed()) {
+    chunk_.error_line = tokens_.line();
+  }
+}
+
+void ChunkParser::parseNets()
+{
+  next();
+  while (token_ != nullptr) {
+    if (!net()) {
+      chunk_.error_line = tokens_.line();
+      return;
+    }
+  }
+  if (tokens_.failed()) {
+    chunk_.error_line = tokens_.line();
+  }
+}
+
+// - id master [net ...] [+ option ...] ;
+bool ChunkParser::component()
+{
+  definParallel::Component comp;
+  if (!equal(token_, "-")) {
+    return false;
+  }
+  comp.id = next();
+  comp.master = next();
+  if (!isName(comp.id) || !isName(comp.master)) {
+    return false;
+  }
+  // The net names are not used.
+  next();
+  while (isName(token_) || equal(token_, "*")) {
+    next();
+  }
+
+  while (equal(token_, "+")) {
+    const char* keyword = next();
+    if (isOneOf(keyword, {"PLACED", "FIXED", "COVER"})) {
+      if (equal(keyword, "PLACED")) {
+        comp.status = DEFI_COMPONENT_PLACED;
+      } else if (equal(keyword, "FIXED")) {
+        comp.status = DEFI_COMPONENT_FIXED;
+      } else {
+        comp.status = DEFI_COMPONENT_COVER;
+      }
+      double x;
+      double y;
+      if (!equal(next(), "(") || !number(next(), x) || !number(next(), y)
+          || !equal(next(), ")")) {
+        return false;
+      }
+      comp.x = std::lround(x);
+      comp.y = std::lround(y);
+      comp.orient = orient(next());
+      if (comp.orient < 0) {
+        return false;
+      }
+    } else if (equal(keyword, "UNPLACED")) {
+      comp.status = DEFI_COMPONENT_UNPLACED;
+      comp.x = -1;
+      comp.y = -1;
+      comp.orient = -1;
+    } else if (equal(keyword, "SOURCE")) {
+      comp.source = next();
+      if (!isOneOf(comp.source, {"NETLIST", "DIST", "USER", "TIMING"})) {
+        return false;
+      }
+    } else if (equal(keyword, "WEIGHT")) {
+      double weight;
+      if (!number(next(), weight)) {
+        return false;
+      }
+      comp.weight = std::lround(weight);
+    } else if (equal(keyword, "REGION")) {
+      comp.region = next();
+      if (!isName(comp.region)) {
+        return false;
+      }
+    } else if (equal(keyword, "HALO") && version_ >= 5.7) {
+      std::array<int, 4> halo;
+      for (int& edge : halo) {
+        double value;
+        if (!number(next(), value)) {
+          return false;
+        }
+        edge = static_cast<int>(value);
+      }
+      comp.halo = halo;
+    } else {
+      return false;
+    }
+    next();
+  }
+
+  if (!equal(token_, ";")) {
+    return false;
+  }
+  chunk_.components.push_back(comp);
+  next();
+  return true;
+}
+
+// - name ( inst pin ) ... [+ option ...] ;
+bool ChunkParser::net()
+{
+  definParallel::Net net;
+  if (!equal(token_, "-")) {
+    return false;
+  }
+  net.name = next();
+  if (!isName(net.name)) {
+    return false;
+  }
+  next();
+  while (equal(token_, "(")) {
+    const char* inst = next();
+    const char* pin = next();
+    if ((!isName(inst) && !equal(inst, "*")) || !isName(pin)
+        || !equal(next(), ")")) {
+      return false;
+    }
+    chunk_.connections.push_back({inst, pin});
+    next();
+  }
+
+  while (equal(token_, "+")) {
+    const char* keyword = next();
+    if (isOneOf(keyword, {"ROUTED", "FIXED", "COVER"})) {
+      if (!wire(keyword)) {
+        return false;
+      }
+      continue;
+    }
+    if (equal(keyword, "USE")) {
+      net.use = next();
+      if (!isOneOf(net.use,
+                   {"SIGNAL",
+                    "POWER",
+                    "GROUND",
+                    "CLOCK",
+                    "TIEOFF",
+                    "ANALOG",
+                    "SCAN",
+                    "RESET"})) {
+        return false;
+      }
+    } else if (equal(keyword, "SOURCE")) {
+      net.source = next();
+      if (!isOneOf(net.source, {"NETLIST", "DIST", "USER", "TIMING", "TEST"})) {
+        return false;
+      }
+    } else if (equal(keyword, "WEIGHT")) {
+      double weight;
+      if (!number(next(), weight)) {
+        return false;
+      }
+      net.weight = std::lround(weight);
+    } else if (equal(keyword, "NONDEFAULTRULE")) {
+      net.non_default_rule = next();
+      if (!isName(net.non_default_rule)) {
+        return false;
+      }
+    } else {
+      return false;
+    }
+    next();
+  }
+
+  if (!equal(token_, ";")) {
+    return false;
+  }
+  net.connections_end = chunk_.connections.size();
+  net.paths_end = chunk_.paths.size();
+  chunk_.nets.push_back(net);
+  next();
+  return true;
+}
+
+// type layer [TAPER | TAPERRULE rule] ( pt ) item ... [NEW layer ...]
+// Leaves the "+" or ";" after the wire as the token.
+bool ChunkParser::wire(const char* type)
+{
+  add(PathOp::kWire, type);
+  next();
+  for (;;) {
+    const char* layer = token_;
+    if (!isName(layer)) {
+      return false;
+    }
+    next();
+    if (equal(token_, "TAPER")) {
+      add(PathOp::kPathTaper, layer);
+      next();
+    } else if (equal(token_, "TAPERRULE")) {
+      const char* rule = next();
+      if (!isName(rule)) {
+        return false;
+      }
+      add(PathOp::kPathTaperRule, layer);
+      add(PathOp::kTaperRule, rule);
+      next();
+    } else {
+      add(PathOp::kPath, layer);
+    }
+    if (!equal(token_, "(") || !pathPoint()) {
+      return false;
+    }
+    while (token_ != nullptr && !isOneOf(token_, {"+", ";", "NEW"})) {
+      if (!pathItem()) {
+        return false;
+      }
+    }
+    add(PathOp::kPathEnd);
+    if (!equal(token_, "NEW")) {
+      break;
+    }
+    next();
+  }
+  add(PathOp::kWireEnd);
+  return token_ != nullptr;
+}
+
+// ( pt ) | RECT ( ... ) | [MASK m] ( pt ) | MASK m RECT ( ... )
+// | [MASK m] via [orient]
+bool ChunkParser::pathItem()
+{
+  if (equal(token_, "(")) {
+    return pathPoint();
+  }
+  if (equal(token_, "RECT")) {
+    return rect();
+  }
+  if (equal(token_, "MASK")) {
+    double value;
+    if (version_ < 5.8 || !number(next(), value)) {
+      return false;
+    }
+    const int mask = static_cast<int>(value);
+    next();
+    if (equal(token_, "(")) {
+      add(PathOp::kColor, nullptr, {mask});
+      return pathPoint();
+    }
+    if (equal(token_, "RECT")) {
+      add(PathOp::kColor, nullptr, {mask});
+      return rect();
+    }
+    add(PathOp::kViaColor, nullptr, {mask % 10, mask / 10 % 10, mask / 100});
+  }
+
+  const char* via = token_;
+  double value;
+  if (!isName(via) || number(via, value)) {
+    return false;
+  }
+  const int rotation = orient(next());
+  if (rotation >= 0) {
+    add(PathOp::kViaRotated, via, {rotation});
+    next();
+  } else {
+    add(PathOp::kVia, via);
+  }
+  return true;
+}
+
+// ( x y [ext] ), where x or y can be '*' for the previous point's
+bool ChunkParser::pathPoint()
+{
+  double x;
+  double y;
+  if (!coordinate(next(), x_, has_x_, x)
+      || !coordinate(next(), y_, has_y_, y)) {
+    return false;
+  }
+  next();
+  if (equal(token_, ")")) {
+    add(PathOp::kPoint,
+        nullptr,
+        {static_cast<int>(std::lround(x)), static_cast<int>(std::lround(y))});
+  } else {
+    double ext;
+    if (!number(token_, ext) || !equal(next(), ")")) {
+      return false;
+    }
+    add(PathOp::kPointExt,
+        nullptr,
+        {static_cast<int>(std::lround(x)),
+         static_cast<int>(std::lround(y)),
+         static_cast<int>(std::lround(ext))});
+  }
+  next();
+  return true;
+}
+
+// RECT ( dx1 dy1 dx2 dy2 )
+bool ChunkParser::rect()
+{
+  std::array<int, 4> values;
+  if (!equal(next(), "(")) {
+    return false;
+  }
+  for (int& value : values) {
+    double delta;
+    if (!number(next(), delta)) {
+      return false;
+    }
+    value = static_cast<int>(delta);
+  }
+  if (!equal(next(), ")")) {
+    return false;
+  }
+  add(PathOp::kRect, nullptr, values);
+  next();
+  return true;
+}
+
+bool ChunkParser::coordinate(const char* token,
+                             double& saved,
+                             bool& has_saved,
+                             double& value)
+{
+  if (equal(token, "*")) {
+    value = saved;
+    return has_saved;
+  }
+  if (!number(token, value)) {
+    return false;
+  }
+  saved = value;
+  has_saved = true;
+  return true;
+}
+
+// Returns the first line start at or after pos whose first token is "-".
+char* statementStart(char* pos, char* end)
+{
+  while (pos < end) {
+    if (pos[-1] == '\n') {
+      const char* p = pos;
+      while (p < end && (*p == ' ' || *p == '\t')) {
+        p++;
+      }
+      if (end - p >= 2 && p[0] == '-' && isBlank(p[1])) {
+        return pos;
+      }
+    }
+    pos = static_cast<char*>(memchr(pos, '\n', end - pos));
+    if (pos == nullptr) {
+      return end;
+    }
+    pos++;
+  }
+  return end;
+}
+
+}  // namespace
+
+definParallel::definParallel(utl::Logger* logger, const int threads)
+    : logger_(logger), threads_(threads)
+{
+}
+
+bool definParallel::parse(const char* file, const bool nets)
+{
+  const utl::Timer timer;
+  if (!readFile(file)) {
+    return false;
+  }
+  version_ = findVersion();
+  bool found = findSection("COMPONENTS", components_);
+  if (nets) {
+    found = findSection("NETS", nets_) || found;
+  }
+  if (!found) {
+    return false;
+  }
+
+  std::vector<std::pair<Chunk*, bool>> jobs;
+  for (Section* section : {&components_, &nets_}) {
+    splitSection(*section);
+    for (Chunk& chunk : section->chunks) {
+      jobs.emplace_back(&chunk, section == &nets_);
+    }
+  }
+
+  utl::ThreadException exception;
+  const int num_jobs = jobs.size();
+  const int num_threads = threads_;
+#pragma omp parallel for num_threads(num_threads) schedule(dynamic, 1)
+  for (int i = 0; i < num_jobs; i++) {
+    try {
+      Chunk& chunk = *jobs[i].first;
+      chunk.lines = std::count(chunk.begin, chunk.end, '\n');
+      ChunkParser parser(chunk, version_);
+      if (jobs[i].second) {
+        parser.parseNets();
+      } else {
+        parser.parseComponents();
+      }
+    } catch (...) {
+      exception.capture();
+    }
+  }
+  exception.rethrow();
+
+  if (!checkSection(file, components_) || !checkSection(file, nets_)) {
+    return false;
+  }
+  makePieces();
+
+  size_t num_components = 0;
+  for (const Chunk& chunk : components_.chunks) {
+    num_components += chunk.components.size();
+  }
+  size_t num_nets = 0;
+  for (const Chunk& chunk : nets_.chunks) {
+    num_nets += chunk.nets.size();
+  }
+  logger_->info(utl::ODB,
+                1113,
+                "Parsed {} components and {} nets of {:.1f} MB with {} "
+                "threads in {:.2f} s.",
+                num_components,
+                num_nets,
+                text_.size() / 1e6,
+                threads_,
+                timer.elapsed());
+  return true;
+}
+
+std::vector<definParallel::Chunk> definParallel::takeComponents()
+{
+  std::vector<Chunk> chunks;
+  chunks.swap(components_.chunks);
+  return chunks;
+}
+
+std::vector<definParallel::Chunk> definParallel::takeNets()
+{
+  std::vector<Chunk> chunks;
+  chunks.swap(nets_.chunks);
+  return chunks;
+}
+
+size_t definParallel::read(FILE* stream, char* buffer, const size_t size)
+{
+  definParallel* reader = reinterpret_cast<definParallel*>(stream);
+  size_t count = 0;
+  while (count < size && reader->piece_ < reader->pieces_.size()) {
+    const Piece& piece = reader->pieces_[reader->piece_];
+    const size_t n = std::min(size - count, piece.size - reader->offset_);
+    if (piece.data != nullptr) {
+      memcpy(buffer + count, piece.data + reader->offset_, n);
+    } else {
+      memset(buffer + count, '\n', n);
+    }
+    count += n;
+    reader->offset_ += n;
+    if (reader->offset_ == piece.size) {
+      reader->piece_++;
+      reader->offset_ = 0;
+    }
+  }
+  return count;
+}
+
+bool definParallel::readFile(const char* file)
+{
+  // gzread() passes plain files through unchanged.
+  gzFile stream = gzopen(file, "rb");
+  if (stream == nullptr) {
+    return false;
+  }
+  gzbuffer(stream, 1 << 20);
+  std::error_code error;
+  const auto file_size = std::filesystem::file_size(file, error);
+  if (!error) {
+    text_.reserve(file_size);
+  }
+
+  constexpr int block_size = 64 << 20;
+  size_t size = 0;
+  for (;;) {
+    text_.resize(size + block_size);
+    const int n = gzread(stream, text_.data() + size, block_size);
+    if (n < 0) {
+      gzclose(stream);
+      return false;
+    }
+    size += n;
+    if (n < block_size) {
+      break;
+    }
+  }
+  gzclose(stream);
+  text_.resize(size);
+  return true;
+}
+
+// Returns the position of the first line at or after from that starts
+// with words followed by a blank, or npos.
+size_t definParallel::findLine(const size_t from,
+                               const std::string_view words) const
+{
+  const std::string_view text(text_.data(), text_.size());
+  for (size_t pos = text.find(words, from); pos != std::string_view::npos;
+       pos = text.find(words, pos + 1)) {
+    const size_t next = pos + words.size();
+    if ((pos == 0 || text[pos - 1] == '\n') && next < text.size()
+        && isBlank(text[next])) {
+      return pos;
+    }
+  }
+  return std::string_view::npos;
+}
+
+// Finds the "name count ;" header line and the END line of a section.
+bool definParallel::findSection(const std::string_view name, Section& section)
+{
+  const std::string_view text(text_.data(), text_.size());
+  const size_t header = findLine(0, name);
+  if (header == std::string_view::npos) {
+    return false;
+  }
+  const size_t eol = text.find('\n', header);
+  if (eol == std::string_view::npos) {
+    return false;
+  }
+  std::istringstream line(std::string(text.substr(header, eol - header)));
+  std::string word;
+  std::string count;
+  std::string semicolon;
+  std::string rest;
+  line >> word >> count >> semicolon;
+  if (semicolon != ";" || (line >> rest)) {
+    return false;
+  }
+  const size_t end = findLine(eol + 1, "END " + std::string(name));
+  if (end == std::string_view::npos) {
+    return false;
+  }
+  section.begin = text_.data() + eol + 1;
+  section.end = text_.data() + end;
+  return true;
+}
+
+// Splits the body into a few chunks per thread, each starting at a
+// statement, to balance the threads.
+void definParallel::splitSection(Section& section) const
+{
+  if (section.begin == nullptr) {
+    return;
+  }
+  const size_t size = section.end - section.begin;
+  const int num_chunks = threads_ * 4;
+  char* begin = section.begin;
+  for (int i = 1; i <= num_chunks; i++) {
+    char* end = section.end;
+    if (i < num_chunks) {
+      end = std::max(section.begin + size * i / num_chunks, begin);
+      end = statementStart(end, section.end);
+    }
+    if (end > begin) {
+      Chunk& chunk = section.chunks.emplace_back();
+      chunk.begin = begin;
+      chunk.end = end;
+    }
+    begin = end;
+  }
+}
+
+// Logs the first line of the section that could not be parsed, if any.
+bool definParallel::checkSection(const char* file, const Section& section) const
+{
+  if (section.begin == nullptr) {
+    return true;
+  }
+  int line = lineOf(section.begin);
+  for (const Chunk& chunk : section.chunks) {
+    if (chunk.error_line >= 0) {
+      logger_->info(utl::ODB,
+                    1114,
+                    "Line {} of {} is not handled by the parallel DEF "
+                    "reader; reading the file with one thread.",
+                    line + chunk.error_line,
+                    file);
+      return false;
+    }
+    line += chunk.lines;
+  }
+  return true;
+}
+
+// Returns the line number of pos, which is outside the section bodies.
+// The bodies are counted by their chunks as their newlines may now be
+// token ends.
+int definParallel::lineOf(const char* pos) const
+{
+  int line = 1;
+  const char* from = text_.data();
+  for (const Section* section : sections()) {
+    if (section->begin >= pos) {
+      break;
+    }
+    line += std::count(from, static_cast<const char*>(section->begin), '\n');
+    for (const Chunk& chunk : section->chunks) {
+      line += chunk.lines;
+    }
+    from = section->end;
+  }
+  return line + std::count(from, pos, '\n');
+}
+
+// The parsed sections in file order
+std::vector<const definParallel::Section*> definParallel::sections() const
+{
+  std::vector<const Section*> sections;
+  for (const Section* section : {&components_, &nets_}) {
+    if (section->begin != nullptr) {
+      sections.push_back(section);
+    }
+  }
+  std::sort(
+      sections.begin(), sections.end(), [](const Section* a, const Section* b) {
+        return a->begin < b->begin;
+      });
+  return sections;
+}
+
+void definParallel::makePieces()
+{
+  const char* from = text_.data();
+  for (const Section* section : sections()) {
+    pieces_.push_back({from, static_cast<size_t>(section->begin - from)});
+    size_t lines = 0;
+    for (const Chunk& chunk : section->chunks) {
+      lines += chunk.lines;
+    }
+    pieces_.push_back({nullptr, lines});
+    from = section->end;
+  }
+  pieces_.push_back(
+      {from, static_cast<size_t>(text_.data() + text_.size() - from)});
+}
+
+// Returns the number of the VERSION statement, 0 if there is none.
+double definParallel::findVersion() const
+{
+  const size_t pos = findLine(0, "VERSION");
+  if (pos == std::string_view::npos) {
+    return 0;
+  }
+  const std::string_view text(text_.data(), text_.size());
+  const std::string line(text.substr(pos, text.find('\n', pos) - pos));
+  return strtod(line.c_str() + strlen("VERSION"), nullptr);
+}
+
+}  // namespace odb
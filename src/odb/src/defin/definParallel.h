@@ -0,0 +1,162 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2019-2025, The OpenROAD Authors
+
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <optional>
+#include <string_view>
+#include <vector>
+
+namespace utl {
+class Logger;
+}
+
+namespace odb {
+
+// Parses the COMPONENTS and NETS sections of a DEF file with several
+// threads.
+//
+// The whole file is read into memory (through zlib, so .gz files work
+// too).  The body of each section is split into chunks at statement
+// boundaries and every chunk is parsed into records on its own thread.
+// The Si2 parser, which is not reentrant, then reads the file from memory
+// through read() with those bodies replaced by blank lines, so its line
+// numbers are unchanged.  definReader creates the db objects from the
+// records in file order when the parser reaches the section headers.
+//
+// Only the statements DefOut writes are handled.  A section using
+// anything else (PROPERTY, SUBNET, quoted names, ...) makes parse() return
+// false and the file is read by the Si2 parser alone.
+class definParallel
+{
+ public:
+  struct Component
+  {
+    const char* id;
+    const char* master;
+    const char* source{nullptr};
+    const char* region{nullptr};
+    std::optional<int> weight;
+    std::optional<std::array<int, 4>> halo;  // left, bottom, right, top
+    int status{0};                           // DEFI_COMPONENT_*, 0 if unset
+    int x{0};
+    int y{0};
+    int orient{0};  // DEF's orient order: N W S E FN FW FS FE
+  };
+
+  struct Connection
+  {
+    const char* inst;  // "*" and "PIN" as in the DEF
+    const char* pin;
+  };
+
+  enum class PathOp : uint8_t
+  {
+    kWire,           // name: ROUTED, FIXED or COVER
+    kPath,           // name: layer
+    kPathTaper,      // name: layer
+    kPathTaperRule,  // name: layer; the next item is the kTaperRule
+    kTaperRule,      // name: rule
+    kPoint,          // values: x y
+    kPointExt,       // values: x y ext
+    kVia,            // name: via
+    kViaRotated,     // name: via; values: orient
+    kRect,           // values: the deltas
+    kColor,          // values: mask
+    kViaColor,       // values: bottom cut top masks
+    kPathEnd,
+    kWireEnd
+  };
+
+  struct PathItem
+  {
+    const char* name;
+    std::array<int, 4> values;
+    PathOp op;
+  };
+
+  struct Net
+  {
+    const char* name;
+    const char* use{nullptr};
+    const char* source{nullptr};
+    const char* non_default_rule{nullptr};
+    std::optional<int> weight;
+    // The net's connections and path items end at these indexes of the
+    // chunk's vectors and start where the previous net's end.
+    size_t connections_end{0};
+    size_t paths_end{0};
+  };
+
+  struct Chunk
+  {
+    char* begin{nullptr};
+    char* end{nullptr};
+    std::vector<Component> components;
+    std::vector<Net> nets;
+    std::vector<Connection> connections;
+    std::vector<PathItem> paths;
+    int lines{0};
+    // Line in the chunk of the first token that can't be parsed, or -1
+    int error_line{-1};
+  };
+
+  definParallel(utl::Logger* logger, int threads);
+
+  // Reads file and parses its COMPONENTS section, and its NETS section if
+  // nets is set.  Returns false if neither section can be parsed.  The
+  // names in the records point into the file text, which lives as long as
+  // this object.
+  bool parse(const char* file, bool nets);
+
+  // The records of each section in file order; empty if the Si2 parser
+  // reads the section.  The records are handed out only once.
+  std::vector<Chunk> takeComponents();
+  std::vector<Chunk> takeNets();
+
+  // A DEFI_READ_FUNCTION serving the text for the Si2 parser; stream is
+  // the definParallel.
+  static size_t read(FILE* stream, char* buffer, size_t size);
+
+ private:
+  struct Section
+  {
+    char* begin{nullptr};  // the line after the header
+    char* end{nullptr};    // the END line
+    std::vector<Chunk> chunks;
+  };
+
+  // A range of the text given to the Si2 parser; data is nullptr for a
+  // run of size newlines.
+  struct Piece
+  {
+    const char* data;
+    size_t size;
+  };
+
+  bool readFile(const char* file);
+  size_t findLine(size_t from, std::string_view words) const;
+  bool findSection(std::string_view name, Section& section);
+  void splitSection(Section& section) const;
+  bool checkSection(const char* file, const Section& section) const;
+  int lineOf(const char* pos) const;
+  std::vector<const Section*> sections() const;
+  void makePieces();
+  double findVersion() const;
+
+  utl::Logger* logger_;
+  int threads_;
+  std::vector<char> text_;
+  double version_{0};
+  Section components_;
+  Section nets_;
+  std::vector<Piece> pieces_;
+  size_t piece_{0};
+  size_t offset_{0};
+};
+
+}  // namespace odb
@@ -248,6 +248,11 @@ void definReader::useBlockName(const char* name)
   _block_name = name;
 }
 
+void definReader::setThreadCount(const int threads)
+{
+  threads_ = threads;
+}
+
 void definReader::init()
 {
   auto make = [this](auto& interface) {
@@ -482,23 +487,9 @@ int definReader::componentsCallback(
   definReader* reader = (definReader*) data;
   CHECKBLOCK
   definComponent* componentR = reader->_componentR.get();
-  std::string id = comp->id();
-  if (reader->_mode != defin::DEFAULT) {
-    if (reader->_block->findInst(id.c_str()) == nullptr) {
-      // Try escaping the hierarchy and see if that matches
-      boost::replace_all(id, "/", "\\/");
-      if (reader->_block->findInst(id.c_str()) == nullptr) {
-        std::string modeStr
-            = reader->_mode == defin::FLOORPLAN ? "FLOORPLAN" : "INCREMENTAL";
-        reader->_logger->warn(
-            utl::ODB,
-            248,
-            "skipping undefined comp {} encountered in {} DEF",
-            comp->id(),
-            modeStr);
-        return PARSE_OK;
-      }
-    }
+  std::string id;
+  if (!reader->findComponent(comp->id(), id)) {
+    return PARSE_OK;
   }
 
   if (comp->hasEEQ()) {
@@ -541,6 +532,73 @@ int definReader::componentsCallback(
   return PARSE_OK;
 }
 
+// Outside of DEFAULT mode the component has to be in the block, possibly
+// with its hierarchy escaped; id is set to the name the block uses.
+bool definReader::findComponent(const char* def_id, std::string& id)
+{
+  id = def_id;
+  if (_mode == defin::DEFAULT || _block->findInst(id.c_str()) != nullptr) {
+    return true;
+  }
+  // Try escaping the hierarchy and see if that matches
+  boost::replace_all(id, "/", "\\/");
+  if (_block->findInst(id.c_str()) != nullptr) {
+    return true;
+  }
+  std::string modeStr = _mode == defin::FLOORPLAN ? "FLOORPLAN" : "INCREMENTAL";
+  _logger->warn(utl::ODB,
+                248,
+                "skipping undefined comp {} encountered in {} DEF",
+                def_id,
+                modeStr);
+  return false;
+}
+
+int definReader::componentsStartCallback(
+    DefParser::defrCallbackType_e /* unused: type */,
+    int /* unused: count */,
+    DefParser::defiUserData data)
+{
+  definReader* reader = (definReader*) data;
+  if (reader->parallel_ == nullptr) {
+    return PARSE_OK;
+  }
+  CHECKBLOCK
+  for (const definParallel::Chunk& chunk :
+       reader->parallel_->takeComponents()) {
+    reader->createComponents(chunk);
+  }
+  return PARSE_OK;
+}
+
+// Same as componentsCallback for the statements definParallel parses
+void definReader::createComponents(const definParallel::Chunk& chunk)
+{
+  definComponent* componentR = _componentR.get();
+  std::string id;
+  for (const definParallel::Component& comp : chunk.components) {
+    if (!findComponent(comp.id, id)) {
+      continue;
+    }
+    componentR->begin(id.c_str(), comp.master);
+    if (comp.source) {
+      componentR->source(dbSourceType(comp.source));
+    }
+    if (comp.weight) {
+      componentR->weight(*comp.weight);
+    }
+    if (comp.region) {
+      componentR->region(comp.region);
+    }
+    if (comp.halo) {
+      const auto& [left, bottom, right, top] = *comp.halo;
+      componentR->halo(left, bottom, right, top);
+    }
+    componentR->placement(comp.status, comp.x, comp.y, comp.orient);
+    componentR->end();
+  }
+}
+
 int definReader::componentMaskShiftCallback(
     DefParser::defrCallbackType_e /* unused: type */,
     DefParser::defiComponentMaskShiftLayer* shiftLayers,
@@ -708,13 +766,7 @@ int definReader::netCallback(DefParser::defrCallbackType_e /* unused: type */,
   definReader* reader = (definReader*) data;
   CHECKBLOCK
   definNet* netR = reader->_netR.get();
-  if (reader->_mode == defin::FLOORPLAN
-      && reader->_block->findNet(net->name()) == nullptr) {
-    reader->_logger->warn(
-        utl::ODB,
-        275,
-        "skipping undefined net {} encountered in FLOORPLAN DEF",
-        net->name());
+  if (!reader->findNet(net->name())) {
     return PARSE_OK;
   }
   if (net->numShieldNets() > 0) {
@@ -887,6 +939,116 @@ int definReader::netCallback(DefParser::defrCallbackType_e /* unused: type */,
   return PARSE_OK;
 }
 
+// In FLOORPLAN mode the net has to be in the block.
+bool definReader::findNet(const char* name)
+{
+  if (_mode == defin::FLOORPLAN && _block->findNet(name) == nullptr) {
+    _logger->warn(utl::ODB,
+                  275,
+                  "skipping undefined net {} encountered in FLOORPLAN DEF",
+                  name);
+    return false;
+  }
+  return true;
+}
+
+int definReader::netsStartCallback(
+    DefParser::defrCallbackType_e /* unused: type */,
+    int /* unused: count */,
+    DefParser::defiUserData data)
+{
+  definReader* reader = (definReader*) data;
+  if (reader->parallel_ == nullptr) {
+    return PARSE_OK;
+  }
+  CHECKBLOCK
+  for (const definParallel::Chunk& chunk : reader->parallel_->takeNets()) {
+    reader->createNets(chunk);
+  }
+  return PARSE_OK;
+}
+
+// Same as netCallback for the statements definParallel parses
+void definReader::createNets(const definParallel::Chunk& chunk)
+{
+  using PathOp = definParallel::PathOp;
+  definNet* netR = _netR.get();
+  size_t connection = 0;
+  size_t item = 0;
+  for (const definParallel::Net& net : chunk.nets) {
+    if (!findNet(net.name)) {
+      connection = net.connections_end;
+      item = net.paths_end;
+      continue;
+    }
+    netR->begin(net.name);
+    if (net.use) {
+      netR->use(net.use);
+    }
+    if (net.source) {
+      netR->source(net.source);
+    }
+    if (net.weight) {
+      netR->weight(*net.weight);
+    }
+    if (net.non_default_rule) {
+      netR->nonDefaultRule(net.non_default_rule);
+    }
+    for (; connection < net.connections_end; ++connection) {
+      const definParallel::Connection& conn = chunk.connections[connection];
+      netR->connection(conn.inst, conn.pin);
+    }
+    for (; item < net.paths_end; ++item) {
+      const definParallel::PathItem& path = chunk.paths[item];
+      const auto& values = path.values;
+      switch (path.op) {
+        case PathOp::kWire:
+          netR->wire(path.name);
+          break;
+        case PathOp::kPath:
+          netR->path(path.name);
+          break;
+        case PathOp::kPathTaper:
+          netR->pathTaper(path.name);
+          break;
+        case PathOp::kPathTaperRule:
+          netR->pathTaperRule(path.name, chunk.paths[++item].name);
+          break;
+        case PathOp::kTaperRule:
+          break;
+        case PathOp::kPoint:
+          netR->pathPoint(values[0], values[1]);
+          break;
+        case PathOp::kPointExt:
+          netR->pathPoint(values[0], values[1], values[2]);
+          break;
+        case PathOp::kVia:
+          netR->pathVia(path.name);
+          break;
+        case PathOp::kViaRotated:
+          netR->pathVia(path.name, translate_orientation(values[0]));
+          break;
+        case PathOp::kRect:
+          netR->pathRect(values[0], values[1], values[2], values[3]);
+          break;
+        case PathOp::kColor:
+          netR->pathColor(values[0]);
+          break;
+        case PathOp::kViaColor:
+          netR->pathViaColor(values[0], values[1], values[2]);
+          break;
+        case PathOp::kPathEnd:
+          netR->pathEnd();
+          break;
+        case PathOp::kWireEnd:
+          netR->wireEnd();
+          break;
+      }
+    }
+    netR->end();
+  }
+}
+
 int definReader::nonDefaultRuleCallback(
     DefParser::defrCallbackType_e /* unused: type */,
     DefParser::defiNonDefault* rule,
@@ -1968,9 +2130,32 @@ bool definReader::createBlock(const char* file)
     defrSetScanchainCbk(scanchainsCallback);
   }
 
+  // The parallel reader falls back to the Si2 parser alone for a file it
+  // can't parse, before the parser has seen any of it.
+  std::unique_ptr<definParallel> parallel;
+  if (threads_ > 1) {
+    parallel = std::make_unique<definParallel>(_logger, threads_);
+    if (!parallel->parse(file, _mode != defin::INCREMENTAL)) {
+      parallel.reset();
+    }
+  }
+
   bool isZipped = hasSuffix(file, ".gz");
   int res;
-  if (!isZipped) {
+  if (parallel) {
+    parallel_ = parallel.get();
+    defrSetComponentStartCbk(componentsStartCallback);
+    if (_mode != defin::INCREMENTAL) {
+      defrSetNetStartCbk(netsStartCallback);
+    }
+    DefParser::defrSetReadFunction(definParallel::read);
+    res = DefParser::defrRead(reinterpret_cast<FILE*>(parallel.get()),
+                              file,
+                              (DefParser::defiUserData) this,
+                              /* case sensitive */ 1);
+    DefParser::defrUnsetReadFunction();
+    parallel_ = nullptr;
+  } else if (!isZipped) {
     FILE* f = fopen(file, "r");
     if (f == nullptr) {
       _logger->warn(utl::ODB, 148, "error: Cannot open DEF file {}", file);
@@ -24,6 +24,7 @@
 #include "defiSite.hpp"
 #include "defiVia.hpp"
 #include "definBase.h"
+#include "definParallel.h"
 #include "defrReader.hpp"
 #include "odb/db.h"
 #include "odb/defin.h"
@@ -68,6 +69,7 @@ class definReader : public definBase
   void skipFillWires();
   void continueOnErrors();
   void useBlockName(const char* name);
+  void setThreadCount(int threads);
   void error(std::string_view msg);
 
   void readChip(std::vector<dbLib*>& search_libs,
@@ -88,6 +90,11 @@ class definReader : public definBase
   bool createBlock(const char* file);
   int errors();
 
+  bool findComponent(const char* def_id, std::string& id);
+  bool findNet(const char* name);
+  void createComponents(const definParallel::Chunk& chunk);
+  void createNets(const definParallel::Chunk& chunk);
+
   // Parser callbacks
   static int blockageCallback(DefParser::defrCallbackType_e type,
                               DefParser::defiBlockage* blockage,
@@ -97,6 +104,10 @@ class definReader : public definBase
                                 DefParser::defiComponent* comp,
                                 DefParser::defiUserData data);
 
+  static int componentsStartCallback(DefParser::defrCallbackType_e type,
+                                     int count,
+                                     DefParser::defiUserData data);
+
   static int componentMaskShiftCallback(
       DefParser::defrCallbackType_e type,
       DefParser::defiComponentMaskShiftLayer* shiftLayers,
@@ -141,6 +152,10 @@ class definReader : public definBase
                          DefParser::defiNet* net,
                          DefParser::defiUserData data);
 
+  static int netsStartCallback(DefParser::defrCallbackType_e type,
+                               int count,
+                               DefParser::defiUserData data);
+
   static int nonDefaultRuleCallback(DefParser::defrCallbackType_e type,
                                     DefParser::defiNonDefault* rule,
                                     DefParser::defiUserData data);
@@ -257,6 +272,9 @@ class definReader : public definBase
   std::unique_ptr<definPinProps> _pin_propsR;
   std::vector<definBase*> _interfaces;
   bool _continue_on_errors{false};
+  int threads_{1};
+  // Records of the sections parsed in parallel while the file is read
+  definParallel* parallel_{nullptr};
   std::string _block_name;
   std::string version_;
   char hier_delimiter_{0};
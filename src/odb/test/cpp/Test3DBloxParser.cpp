@@ -134,6 +134,29 @@ TEST_F(DbvFixture, test_bump_map_parser)
   EXPECT_EQ(bump_inst->getChipRegionInst(), region_inst);
 }
 
+TEST_F(DbvFixture, test_create_bumps)
+{
+  auto region = db_->findChip("SoC")->findChipRegion("r1");
+  ThreeDBlox parser(&logger_, db_.get());
+  parser.createBumps(region,
+                     {"bump3", "bump4"},
+                     {"BUMP", "BUMP"},
+                     {300.0, 400.0},
+                     {500.0, 600.0},
+                     {"-", "-"},
+                     {"-", "-"});
+  EXPECT_EQ(region->getChipBumps().size(), 4);
+  auto block = db_->findChip("SoC")->getBlock();
+  auto inst = block->findInst("bump4");
+  ASSERT_NE(inst, nullptr);
+  const double bump_size2 = 29.0 / 2;
+  EXPECT_EQ(inst->getOrigin().x(),
+            (400.0 - bump_size2) * db_->getDbuPerMicron());
+  EXPECT_EQ(inst->getOrigin().y(),
+            (600.0 - bump_size2) * db_->getDbuPerMicron());
+  EXPECT_EQ(inst->getPlacementStatus(), dbPlacementStatus::FIRM);
+}
+
 TEST_F(SimpleDbFixture, test_bump_map_reader)
 {
   createSimpleDB();
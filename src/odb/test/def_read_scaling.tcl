@@ -0,0 +1,108 @@
+# Runtime and memory of reading a synthetic DEF, plain and gzip compressed,
+# across thread counts.  Every net connects a pin to one instance and has a
+# routed wire with a via.
+# usage: openroad def_read_scaling.tcl [num_insts] [max_threads]
+source helpers.tcl
+
+set num_insts 1000000
+set max_threads [cpu_count]
+if { $argc > 0 } {
+  set num_insts [lindex $argv 0]
+}
+if { $argc > 1 } {
+  set max_threads [lindex $argv 1]
+}
+
+read_lef Nangate45/Nangate45.lef
+
+proc write_def_files { num_insts def_file gz_file } {
+  set def [open $def_file w]
+  set gz [open $gz_file w]
+  zlib push gzip $gz
+  foreach stream [list $def $gz] {
+    puts $stream "VERSION 5.8 ;"
+    puts $stream "DIVIDERCHAR \"/\" ;"
+    puts $stream "BUSBITCHARS \"\[\]\" ;"
+    puts $stream "DESIGN top ;"
+    puts $stream "UNITS DISTANCE MICRONS 2000 ;"
+    puts $stream "DIEAREA ( 0 0 ) ( 4000000 4000000 ) ;"
+    puts $stream "PINS $num_insts ;"
+  }
+  for { set i 0 } { $i < $num_insts } { incr i } {
+    set line "    - in$i + NET n$i + DIRECTION INPUT + USE SIGNAL ;"
+    puts $def $line
+    puts $gz $line
+  }
+  foreach stream [list $def $gz] {
+    puts $stream "END PINS"
+    puts $stream "COMPONENTS $num_insts ;"
+  }
+  for { set i 0 } { $i < $num_insts } { incr i } {
+    set x [expr ($i % 2000) * 1140]
+    set y [expr ($i / 2000) * 2800]
+    set line "    - u$i BUF_X1 + PLACED ( $x $y ) N ;"
+    puts $def $line
+    puts $gz $line
+  }
+  foreach stream [list $def $gz] {
+    puts $stream "END COMPONENTS"
+    puts $stream "NETS $num_insts ;"
+  }
+  for { set i 0 } { $i < $num_insts } { incr i } {
+    set x [expr ($i % 2000) * 1140 + 140]
+    set y [expr ($i / 2000) * 2800 + 1400]
+    set net "    - n$i ( PIN in$i ) ( u$i A ) + USE SIGNAL\n"
+    append net "      + ROUTED metal1 ( $x $y ) ( * [expr $y + 700] ) via1_4\n"
+    append net "      NEW metal2 ( $x [expr $y + 700] ) ( [expr $x + 380] * ) ;"
+    puts $def $net
+    puts $gz $net
+  }
+  foreach stream [list $def $gz] {
+    puts $stream "END NETS"
+    puts $stream "END DESIGN"
+  }
+  close $def
+  close $gz
+}
+
+proc rss_mbytes { } {
+  set status [open /proc/self/status r]
+  set rss 0
+  while { [gets $status line] >= 0 } {
+    if { [scan $line "VmRSS: %d" kbytes] == 1 } {
+      set rss [expr $kbytes / 1024]
+    }
+  }
+  close $status
+  return $rss
+}
+
+set def_file [make_result_file def_read_scaling.def]
+set gz_file [make_result_file def_read_scaling.def.gz]
+write_def_files $num_insts $def_file $gz_file
+set mbytes [expr [file size $def_file] / 1e6]
+
+set db [ord::get_db]
+set tech [$db getTech]
+set results {}
+foreach file [list $def_file $gz_file] {
+  for { set threads 1 } { $threads <= $max_threads } \
+    { set threads [expr $threads * 2] } {
+    set chip [odb::dbChip_create $db $tech "top$threads"]
+    set_thread_count $threads
+    set rss [rss_mbytes]
+    set start [clock milliseconds]
+    read_def -chip "top$threads" $file
+    set ms [expr max([clock milliseconds] - $start, 1)]
+    lappend results [file tail $file] $threads $ms \
+      [expr $mbytes * 1000 / $ms] [expr [rss_mbytes] - $rss]
+    odb::dbChip_destroy $chip
+  }
+}
+
+puts [format "%-24s %8s %12s %10s %10s" "File" "Threads" "Time (ms)" "MB/s" \
+  "RSS (MB)"]
+foreach { file threads ms rate rss } $results {
+  puts [format "%-24s %8d %12d %10.1f %10d" $file $threads $ms $rate $rss]
+}
+exit
@@ -0,0 +1,64 @@
+# read_def on 4 threads of a placed and routed design, plain and gzip
+# compressed, and of a DEF the parallel reader leaves to the serial one
+source "helpers.tcl"
+
+read_lef "Nangate45/Nangate45.lef"
+set def_file "data/gcd/gcd_nangate45_route.def"
+read_def $def_file
+set serial_file [make_result_file read_def_parallel_serial.def]
+write_def $serial_file
+
+# Reads def_file into a new chip on threads and writes it to out_file.
+proc read_and_write_def { def_file out_file threads } {
+  odb::dbChip_destroy [odb::dbDatabase_getChip [ord::get_db]]
+  set_thread_count $threads
+  tee -quiet -variable log "read_def $def_file"
+  set_thread_count 1
+  write_def $out_file
+  return $log
+}
+
+proc report_read { log } {
+  if { [regexp {ODB-1114\] Line ([0-9]+) } $log -> line] } {
+    puts "Read with one thread from line $line."
+  } elseif { [regexp "ODB-1113" $log] } {
+    puts "Read in parallel."
+  }
+}
+
+set gz_file [make_result_file read_def_parallel.def.gz]
+set in [open $def_file r]
+set out [open $gz_file w]
+zlib push gzip $out
+fcopy $in $out
+close $in
+close $out
+
+set plain_file [make_result_file read_def_parallel_plain.def]
+report_read [read_and_write_def $def_file $plain_file 4]
+diff_files $serial_file $plain_file
+
+set parallel_gz_file [make_result_file read_def_parallel_gz.def]
+report_read [read_and_write_def $gz_file $parallel_gz_file 4]
+diff_files $serial_file $parallel_gz_file
+
+# A component PROPERTY is not handled by the parallel reader.
+set in [open $def_file r]
+set text [read $in]
+close $in
+set diearea "DIEAREA ( 0 0 ) ( 200260 201600 ) ;\n"
+set propdefs "PROPERTYDEFINITIONS\n    COMPONENT RE REAL ;\n"
+append propdefs "END PROPERTYDEFINITIONS\n"
+set filler "- FILLER_0_1 FILLCELL_X32 + PLACED ( 20520 22400 ) N"
+set text [string map [list $diearea $diearea$propdefs \
+  "$filler ;" "$filler + PROPERTY RE 1.1 ;"] $text]
+set prop_file [make_result_file read_def_parallel_prop.def]
+set out [open $prop_file w]
+puts -nonewline $out $text
+close $out
+
+set prop_serial_file [make_result_file read_def_parallel_prop_serial.def]
+read_and_write_def $prop_file $prop_serial_file 1
+set prop_parallel_file [make_result_file read_def_parallel_prop_parallel.def]
+report_read [read_and_write_def $prop_file $prop_parallel_file 4]
+diff_files $prop_serial_file $prop_parallel_file
@@ -44,6 +44,16 @@ struct MasterInfo
   bool isMacro = false;
 };
 
+// Metrics of a hypergraph partitioning solution
+struct HypergraphSolutionStats
+{
+  float cut_cost = 0.0;
+  // true if the balance, group and fixed vertices constraints are satisfied
+  bool constraints_satisfied = false;
+  // num_parts x vertex_dimension block balance in row-major order
+  std::vector<float> block_balance;
+};
+
 class Cluster;
 using SharedClusterVector = std::vector<std::shared_ptr<Cluster>>;
 class ModuleMgr;
@@ -137,6 +147,75 @@ class PartitionMgr
                                   const std::vector<float>& e_wt_factors,
                                   const std::vector<float>& v_wt_factors);
 
+  // In-memory variant of tritonPartHypergraph
+  // The hypergraph is given in CSR form: the vertices of hyperedge e are
+  // eind[eptr[e]] ... eind[eptr[e + 1] - 1] (the vertex id starts from 0).
+  // vertex_weights (hyperedge_weights) holds vertex_dimension
+  // (hyperedge_dimension) values per vertex (hyperedge) in row-major order;
+  // empty means every dimension has the weight 1.  fixed is either empty or
+  // holds the block id of each vertex (-1 for free vertices).
+  // Returns the block id of each vertex.
+  std::vector<int> tritonPartHypergraphArrays(
+      unsigned int num_parts,
+      float balance_constraint,
+      const std::vector<float>& base_balance,
+      const std::vector<float>& scale_factor,
+      unsigned int seed,
+      int num_vertices,
+      int vertex_dimension,
+      int hyperedge_dimension,
+      const std::vector<int>& eptr,
+      const std::vector<int>& eind,
+      const std::vector<float>& vertex_weights,
+      const std::vector<float>& hyperedge_weights,
+      const std::vector<int>& fixed,
+      // weight parameters
+      const std::vector<float>& e_wt_factors,
+      const std::vector<float>& v_wt_factors,
+      // coarsening related parameters
+      int thr_coarsen_hyperedge_size_skip,
+      int thr_coarsen_vertices,
+      int thr_coarsen_hyperedges,
+      float coarsening_ratio,
+      int max_coarsen_iters,
+      float adj_diff_ratio,
+      int min_num_vertices_each_part,
+      // initial partitioning related parameters
+      int num_initial_solutions,
+      int num_best_initial_solutions,
+      // refinement related parameters
+      int refiner_iters,
+      int max_moves,
+      float early_stop_ratio,
+      int total_corking_passes,
+      // vcycle related parameters
+      bool v_cycle_flag,
+      int max_num_vcycle,
+      int num_coarsen_solutions,
+      int num_vertices_threshold_ilp,
+      int global_net_threshold);
+
+  // In-memory variant of evaluateHypergraphSolution
+  // The hypergraph is given as in tritonPartHypergraphArrays and
+  // solution holds the block id of each vertex.
+  HypergraphSolutionStats evaluateHypergraphSolutionArrays(
+      unsigned int num_parts,
+      float balance_constraint,
+      const std::vector<float>& base_balance,
+      const std::vector<float>& scale_factor,
+      int num_vertices,
+      int vertex_dimension,
+      int hyperedge_dimension,
+      const std::vector<int>& eptr,
+      const std::vector<int>& eind,
+      const std::vector<float>& vertex_weights,
+      const std::vector<float>& hyperedge_weights,
+      const std::vector<int>& fixed,
+      const std::vector<int>& solution,
+      // weight parameters
+      const std::vector<float>& e_wt_factors,
+      const std::vector<float>& v_wt_factors);
+
   // Top level interface
   // The function for partitioning a hypergraph
   // This is the main API for TritonPart
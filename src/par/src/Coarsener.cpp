@@ -30,6 +30,10 @@ using utl::PAR;
 
 namespace par {
 
+// The number of vertices per thread whose neighbor scores are computed
+// ahead of the vertex matching
+static constexpr int kMatchingBatchSize = 1024;
+
 Coarsener::Coarsener(const int num_parts,
                      const int thr_coarsen_hyperedge_size_skip,
                      const int thr_coarsen_vertices,
@@ -305,213 +309,229 @@ void Coarsener::VertexMatching(
   const int num_early_stop_visited_vertices
       = static_cast<int>(unvisited.size()) / coarsening_ratio_;
   int num_visited_vertices = 0;
-  for (auto v_iter = unvisited.begin(); v_iter != unvisited.end(); v_iter++) {
-    const int v = *v_iter;  // here we should use iterator to enable early-stop
-                            // mechanism
-    if (vertex_cluster_id_vec[v] > -1) {
-      continue;  // this vertex has been mapped
+  // The neighbor scores only depend on hgraph, so they are computed in
+  // parallel for a batch of vertices.  The vertices are still matched one
+  // by one in the order of unvisited, so the matching does not depend on
+  // the number of threads.
+  const int num_unvisited = static_cast<int>(unvisited.size());
+  const int batch_size = kMatchingBatchSize * num_threads_;
+  std::vector<std::vector<std::pair<int, float>>> batch_scores;
+  for (int batch_start = 0; batch_start < num_unvisited;
+       batch_start += batch_size) {
+    const int batch_end = std::min(batch_start + batch_size, num_unvisited);
+    batch_scores.resize(batch_end - batch_start);
+#pragma omp parallel for num_threads(num_threads_) schedule(dynamic, 64)
+    for (int i = batch_start; i < batch_end; i++) {
+      std::vector<std::pair<int, float>>& scores
+          = batch_scores[i - batch_start];
+      scores.clear();
+      if (vertex_cluster_id_vec[unvisited[i]] == -1) {
+        ComputeNeighborScores(hgraph, unvisited[i], scores);
+      }
     }
 
-    // initialize the score for neighbors
-    std::map<int, float> score_map;
-    // traverse all its neighbors
-    for (const int he : hgraph->Edges(v)) {
-      const auto edge_range = hgraph->Vertices(he);
-      const int he_size = edge_range.size();
-      if (he_size <= 1 || he_size > thr_coarsen_hyperedge_size_skip_) {
-        continue;
+    for (int i = batch_start; i < batch_end; i++) {
+      const int v = unvisited[i];
+      if (vertex_cluster_id_vec[v] > -1) {
+        continue;  // this vertex has been mapped
       }
-      // get the normalized score
-      const float he_score = evaluator_->GetNormEdgeScore(he, hgraph);
-      // check the vertices in this hyperedge
-      for (const int nbr_v : edge_range) {
-        if (nbr_v == v) {
-          continue;  // ignore the vertex v itself
+
+      // find the best neighbor vertex
+      // we do not allow the weight of cluster exceed the weight threshold
+      float best_score = -std::numeric_limits<float>::max();
+      int best_vertex = -1;
+      for (const auto& [u, score] : batch_scores[i - batch_start]) {
+        const std::vector<float>& u_weight
+            = vertex_cluster_id_vec[u] > -1
+                  ? vertex_weights_c[vertex_cluster_id_vec[u]]
+                  : hgraph->GetVertexWeights(u);
+        if (hgraph->GetVertexWeights(v) + u_weight > thr_cluster_weight_) {
+          continue;  // cannot satisfy the vertex weight constraint
         }
-        // if the nbr_v has been identified
-        if (score_map.find(nbr_v) != score_map.end()) {
-          score_map[nbr_v] += he_score;
-          continue;
+        if (score > best_score) {
+          best_vertex = u;
+          best_score = score;
+        } else if (score == best_score && vertex_cluster_id_vec[u] == -1) {
+          best_vertex = u;
         }
-        // if the nbr_v is a new neighbor
-        //
-        // check if the merging conditions are satisfied
-        // we do not allow the weight of cluster exceed the weight threshold
-        // we do not allow the merging of non-fixed vertices with fixed-vertices
-        // we do not allow the merging between vertices in different communities
-        if ((hgraph->HasFixedVertices() && hgraph->GetFixedAttr(nbr_v) > -1)
-            || (hgraph->HasCommunity()
-                && hgraph->GetCommunity(v) != hgraph->GetCommunity(nbr_v))) {
-          continue;
+      }
+
+      // if there is no neighbor, map current vertex as a single-vertex
+      // cluster
+      if (best_vertex == -1) {
+        num_visited_vertices += 1;
+        vertex_cluster_id_vec[v] = cluster_id;
+        cluster_id++;
+        vertex_weights_c.push_back(hgraph->GetVertexWeights(v));
+        if (hgraph->HasPlacement()) {
+          placement_attr_c.push_back(hgraph->GetPlacement(v));
         }
-        // check the vertex weight constraint
-        const std::vector<float>& nbr_v_weight
-            = vertex_cluster_id_vec[nbr_v] > -1
-                  ? vertex_weights_c[vertex_cluster_id_vec[nbr_v]]
-                  : hgraph->GetVertexWeights(nbr_v);
-        // This line needs to be updated
-        if (hgraph->GetVertexWeights(v) + nbr_v_weight > thr_cluster_weight_) {
-          continue;  // cannot satisfy the vertex weight constraint
+        if (hgraph->HasCommunity()) {
+          community_attr_c.push_back(hgraph->GetCommunity(v));
+        }
+        if (hgraph->HasFixedVertices()) {
+          fixed_attr_c.push_back(hgraph->GetFixedAttr(v));
         }
-        score_map[nbr_v] = he_score;
+        continue;
       }
-    }  // finish traversing all the neighbors
 
-    // if there is no neighbor, map current vertex as a single-vertex cluster
-    if (score_map.empty()) {
-      num_visited_vertices++;
-      vertex_cluster_id_vec[v] = cluster_id++;
-      vertex_weights_c.push_back(hgraph->GetVertexWeights(v));
-      if (hgraph->HasPlacement()) {
-        placement_attr_c.push_back(hgraph->GetPlacement(v));
-      }
-      if (hgraph->HasCommunity()) {
-        community_attr_c.push_back(hgraph->GetCommunity(v));
-      }
-      if (hgraph->HasFixedVertices()) {
-        fixed_attr_c.push_back(hgraph->GetFixedAttr(v));
+      // cluster best_vertex and v
+      // Case 1 : best_vertex has been clustered with other vertices, add v to
+      // that cluster Case 2 : best_vertex and v both are not clustered
+      if (vertex_cluster_id_vec[best_vertex] > -1) {
+        num_visited_vertices++;
+        const int best_cluster_id = vertex_cluster_id_vec[best_vertex];
+        vertex_cluster_id_vec[v] = best_cluster_id;
+        // you cannot change the order here
+        // update the placement location
+        if (hgraph->HasPlacement()) {
+          placement_attr_c[best_cluster_id] = evaluator_->GetAvgPlacementLoc(
+              vertex_weights_c[best_cluster_id],
+              hgraph->GetVertexWeights(v),
+              placement_attr_c[best_cluster_id],
+              hgraph->GetPlacement(v));
+        }
+        // update the weight of cluster
+        vertex_weights_c[best_cluster_id]
+            = vertex_weights_c[best_cluster_id] + hgraph->GetVertexWeights(v);
+      } else {
+        num_visited_vertices += 2;
+        vertex_cluster_id_vec[best_vertex] = cluster_id;
+        vertex_cluster_id_vec[v] = cluster_id;
+        cluster_id++;
+        vertex_weights_c.push_back(hgraph->GetVertexWeights(best_vertex)
+                                   + hgraph->GetVertexWeights(v));
+        if (hgraph->HasPlacement()) {
+          placement_attr_c.push_back(
+              evaluator_->GetAvgPlacementLoc(v, best_vertex, hgraph));
+        }
+        if (hgraph->HasCommunity()) {
+          community_attr_c.push_back(hgraph->GetCommunity(v));
+        }
+        if (hgraph->HasFixedVertices()) {
+          fixed_attr_c.push_back(hgraph->GetFixedAttr(v));
+        }
       }
-      continue;
-    }
-    // update the score based on critical timing paths
-    // Here we do not need to traverse the entire paths
-    // we just need to check the neighbors of the path
-    // because if there is a path, the most important neighbors
-    // must have been counter when traversing hyperedges before
-    // We just consider the direct neighbors of the vertex
-    // i.e., left neighbor and right neighbor
-    // TODO: 20230409:
-    // Exploration that if we can further improve the results by considering
-    // more neighbors on timing-critical paths
-    // No idea yet.
-    if (hgraph->HasTiming() && hgraph->GetNumTimingPaths() > 0) {
-      for (const int p : hgraph->TimingPathsThrough(v)) {
-        const float path_timing_score
-            = evaluator_->GetPathTimingScore(p, hgraph);
-        // traverse the current path
-        auto path_range = hgraph->PathVertices(p);
-        for (auto iter = path_range.begin(); iter != path_range.end(); ++iter) {
-          const int vertex_id = *iter;
-          if (vertex_id != v) {
-            continue;  // we need to find the neighbors of v, so continue here
+      const int remaining_vertices
+          = hgraph->GetNumVertices() + cluster_id - num_visited_vertices;
+      // check the early-stop condition
+      if (remaining_vertices <= num_early_stop_visited_vertices) {
+        for (int j = i + 1; j < num_unvisited; j++) {
+          const int cur_vertex = unvisited[j];
+          if (vertex_cluster_id_vec[cur_vertex] > -1) {
+            continue;  // this vertex has been visited
           }
-          std::vector<int> neighbors;
-          if (iter != path_range.begin()) {
-            neighbors.push_back(*(iter - 1));  // left neighbor
+          vertex_cluster_id_vec[cur_vertex] = cluster_id++;
+          vertex_weights_c.push_back(hgraph->GetVertexWeights(cur_vertex));
+          if (hgraph->HasPlacement()) {
+            placement_attr_c.push_back(hgraph->GetPlacement(cur_vertex));
           }
-          if (iter + 1 != path_range.end()) {
-            neighbors.push_back(*(iter + 1));  // right neighbor
+          if (hgraph->HasCommunity()) {
+            community_attr_c.push_back(hgraph->GetCommunity(cur_vertex));
           }
-          // add the score.
-          // If the neighbor not found by connectivity, which means the balance
-          // constraint cannot be statisfied
-          for (const auto& nbr_v : neighbors) {
-            if (score_map.find(nbr_v) != score_map.end()) {
-              score_map[nbr_v] += path_timing_score;
-            }
+          if (hgraph->HasFixedVertices()) {
+            fixed_attr_c.push_back(hgraph->GetFixedAttr(cur_vertex));
           }
-        }  // finish traversing current paths
-      }  // finish current nbr_v
-    }
-    // update the score based on physical location information
-    if (hgraph->HasPlacement()) {
-      for (auto& [u, score] : score_map) {  // the score will be updated
-        score += evaluator_->GetPlacementScore(v, u, hgraph);
-      }
-    }
-    // find the best neighbor vertex
-    float best_score = -std::numeric_limits<float>::max();
-    int best_vertex = -1;
-    for (const auto& [u, score] : score_map) {
-      if (score > best_score) {
-        best_vertex = u;
-        best_score = score;
-      } else if (score == best_score && vertex_cluster_id_vec[u] == -1) {
-        best_vertex = u;
-      }
+        }
+        return;  // exit the coarsening process
+      }  // early exit
     }
+  }
+}
 
-    if (best_vertex == -1) {
-      num_visited_vertices += 1;
-      vertex_cluster_id_vec[v] = cluster_id;
-      cluster_id++;
-      vertex_weights_c.push_back(hgraph->GetVertexWeights(v));
-      if (hgraph->HasPlacement()) {
-        placement_attr_c.push_back(hgraph->GetPlacement(v));
-      }
-      if (hgraph->HasCommunity()) {
-        community_attr_c.push_back(hgraph->GetCommunity(v));
-      }
-      if (hgraph->HasFixedVertices()) {
-        fixed_attr_c.push_back(hgraph->GetFixedAttr(v));
-      }
+// compute the score of merging v with each of its neighbors
+// the neighbors are sorted by vertex id
+void Coarsener::ComputeNeighborScores(
+    const HGraphPtr& hgraph,
+    const int v,
+    std::vector<std::pair<int, float>>& scores) const
+{
+  // initialize the score for neighbors
+  std::map<int, float> score_map;
+  // traverse all its neighbors
+  for (const int he : hgraph->Edges(v)) {
+    const auto edge_range = hgraph->Vertices(he);
+    const int he_size = edge_range.size();
+    if (he_size <= 1 || he_size > thr_coarsen_hyperedge_size_skip_) {
       continue;
     }
-
-    // cluster best_vertex and v
-    // Case 1 : best_vertex has been clustered with other vertices, add v to
-    // that cluster Case 2 : best_vertex and v both are not clustered
-    if (vertex_cluster_id_vec[best_vertex] > -1) {
-      num_visited_vertices++;
-      const int best_cluster_id = vertex_cluster_id_vec[best_vertex];
-      vertex_cluster_id_vec[v] = best_cluster_id;
-      // you cannot change the order here
-      // update the placement location
-      if (hgraph->HasPlacement()) {
-        placement_attr_c[best_cluster_id]
-            = evaluator_->GetAvgPlacementLoc(vertex_weights_c[best_cluster_id],
-                                             hgraph->GetVertexWeights(v),
-                                             placement_attr_c[best_cluster_id],
-                                             hgraph->GetPlacement(v));
-      }
-      // update the weight of cluster
-      vertex_weights_c[best_cluster_id]
-          = vertex_weights_c[best_cluster_id] + hgraph->GetVertexWeights(v);
-    } else {
-      num_visited_vertices += 2;
-      vertex_cluster_id_vec[best_vertex] = cluster_id;
-      vertex_cluster_id_vec[v] = cluster_id;
-      cluster_id++;
-      vertex_weights_c.push_back(hgraph->GetVertexWeights(best_vertex)
-                                 + hgraph->GetVertexWeights(v));
-      if (hgraph->HasPlacement()) {
-        placement_attr_c.push_back(
-            evaluator_->GetAvgPlacementLoc(v, best_vertex, hgraph));
+    // get the normalized score
+    const float he_score = evaluator_->GetNormEdgeScore(he, hgraph);
+    // check the vertices in this hyperedge
+    for (const int nbr_v : edge_range) {
+      if (nbr_v == v) {
+        continue;  // ignore the vertex v itself
       }
-      if (hgraph->HasCommunity()) {
-        community_attr_c.push_back(hgraph->GetCommunity(v));
+      // if the nbr_v has been identified
+      auto nbr_iter = score_map.find(nbr_v);
+      if (nbr_iter != score_map.end()) {
+        nbr_iter->second += he_score;
+        continue;
       }
-      if (hgraph->HasFixedVertices()) {
-        fixed_attr_c.push_back(hgraph->GetFixedAttr(v));
+      // if the nbr_v is a new neighbor
+      //
+      // check if the merging conditions are satisfied
+      // we do not allow the merging of non-fixed vertices with fixed-vertices
+      // we do not allow the merging between vertices in different communities
+      if ((hgraph->HasFixedVertices() && hgraph->GetFixedAttr(nbr_v) > -1)
+          || (hgraph->HasCommunity()
+              && hgraph->GetCommunity(v) != hgraph->GetCommunity(nbr_v))) {
+        continue;
       }
+      score_map[nbr_v] = he_score;
     }
-    const int remaining_vertices
-        = hgraph->GetNumVertices() + cluster_id - num_visited_vertices;
-    // check the early-stop condition
-    if (remaining_vertices <= num_early_stop_visited_vertices) {
-      v_iter++;
-      while (v_iter != unvisited.end()) {
-        const int cur_vertex = *v_iter;
-        // increasr the pointer
-        v_iter++;
-        if (vertex_cluster_id_vec[cur_vertex] > -1) {
-          continue;  // this vertex has been visited
+  }  // finish traversing all the neighbors
+
+  if (score_map.empty()) {
+    return;
+  }
+  // update the score based on critical timing paths
+  // Here we do not need to traverse the entire paths
+  // we just need to check the neighbors of the path
+  // because if there is a path, the most important neighbors
+  // must have been counter when traversing hyperedges before
+  // We just consider the direct neighbors of the vertex
+  // i.e., left neighbor and right neighbor
+  // TODO: 20230409:
+  // Exploration that if we can further improve the results by considering
+  // more neighbors on timing-critical paths
+  // No idea yet.
+  if (hgraph->HasTiming() && hgraph->GetNumTimingPaths() > 0) {
+    for (const int p : hgraph->TimingPathsThrough(v)) {
+      const float path_timing_score = evaluator_->GetPathTimingScore(p, hgraph);
+      // traverse the current path
+      auto path_range = hgraph->PathVertices(p);
+      for (auto iter = path_range.begin(); iter != path_range.end(); ++iter) {
+        const int vertex_id = *iter;
+        if (vertex_id != v) {
+          continue;  // we need to find the neighbors of v, so continue here
         }
-        vertex_cluster_id_vec[cur_vertex] = cluster_id++;
-        vertex_weights_c.push_back(hgraph->GetVertexWeights(cur_vertex));
-        if (hgraph->HasPlacement()) {
-          placement_attr_c.push_back(hgraph->GetPlacement(cur_vertex));
+        std::vector<int> neighbors;
+        if (iter != path_range.begin()) {
+          neighbors.push_back(*(iter - 1));  // left neighbor
         }
-        if (hgraph->HasCommunity()) {
-          community_attr_c.push_back(hgraph->GetCommunity(cur_vertex));
+        if (iter + 1 != path_range.end()) {
+          neighbors.push_back(*(iter + 1));  // right neighbor
         }
-        if (hgraph->HasFixedVertices()) {
-          fixed_attr_c.push_back(hgraph->GetFixedAttr(cur_vertex));
+        // add the score.
+        // If the neighbor not found by connectivity, which means the balance
+        // constraint cannot be statisfied
+        for (const auto& nbr_v : neighbors) {
+          auto nbr_iter = score_map.find(nbr_v);
+          if (nbr_iter != score_map.end()) {
+            nbr_iter->second += path_timing_score;
+          }
         }
-      }
-      return;  // exit the coarsening process
-    }  // early exit
+      }  // finish traversing current paths
+    }  // finish current nbr_v
   }
+  // update the score based on physical location information
+  if (hgraph->HasPlacement()) {
+    for (auto& [u, score] : score_map) {  // the score will be updated
+      score += evaluator_->GetPlacementScore(v, u, hgraph);
+    }
+  }
+  scores.assign(score_map.begin(), score_map.end());
 }
 
 // handle group information
@@ -734,23 +754,43 @@ HGraphPtr Coarsener::Contraction(
   std::map<size_t, std::vector<int>>
       parallel_hash_map;  // store the hyperedges_c with the same hash_value
                           // (candidate)
-  for (int e = 0; e < hgraph->GetNumHyperedges(); e++) {
+  // map each hyperedge to the sorted set of its clusters in parallel.
+  // The contracted hyperedges are then merged in the order of the
+  // hyperedges, so the result does not depend on the number of threads.
+  const int num_hyperedges = hgraph->GetNumHyperedges();
+  Matrix<int> contracted_hyperedges(num_hyperedges);
+  std::vector<size_t> hash_values(num_hyperedges, 0);
+#pragma omp parallel for num_threads(num_threads_) schedule(dynamic, 256)
+  for (int e = 0; e < num_hyperedges; e++) {
     const auto range = hgraph->Vertices(e);
     const int he_size = range.size();
     if (he_size <= 1 || he_size > thr_coarsen_hyperedge_size_skip_) {
       continue;  // ignore the single-vertex hyperedge and large hyperedge
     }
-    std::set<int> hyperedge_c;
+    std::vector<int>& hyperedge_c = contracted_hyperedges[e];
+    hyperedge_c.reserve(he_size);
     for (const int vertex_id : range) {
-      hyperedge_c.insert(vertex_cluster_id_vec[vertex_id]);  // get cluster id
+      hyperedge_c.push_back(vertex_cluster_id_vec[vertex_id]);  // cluster id
     }
+    std::sort(hyperedge_c.begin(), hyperedge_c.end());
+    hyperedge_c.erase(std::unique(hyperedge_c.begin(), hyperedge_c.end()),
+                      hyperedge_c.end());
     if (hyperedge_c.size() <= 1) {
-      continue;  // ignore the single-vertex hyperedge
+      hyperedge_c.clear();  // ignore the single-vertex hyperedge
+      continue;
+    }
+    hash_values[e] = std::inner_product(hyperedge_c.begin(),
+                                        hyperedge_c.end(),
+                                        hyperedge_c.begin(),
+                                        static_cast<size_t>(0));
+  }
+
+  for (int e = 0; e < num_hyperedges; e++) {
+    std::vector<int>& hyperedge_vec = contracted_hyperedges[e];
+    if (hyperedge_vec.empty()) {
+      continue;  // ignore the single-vertex hyperedge and large hyperedge
     }
-    size_t hash_value = std::inner_product(hyperedge_c.begin(),
-                                           hyperedge_c.end(),
-                                           hyperedge_c.begin(),
-                                           static_cast<size_t>(0));
+    const size_t hash_value = hash_values[e];
     // check if the hash value has been used
     // for detecting parallel hyperedge
     // hyperedge_slack_c[e] = min_slack(hyperedge_arc_set_c[e])
@@ -758,8 +798,7 @@ HGraphPtr Coarsener::Contraction(
       const int hyperedge_c_id = static_cast<int>(hyperedges_c.size());
       hyperedge_cluster_id_vec[e] = hyperedge_c_id;
       hash_map[hash_value] = hyperedge_c_id;
-      hyperedges_c.push_back(
-          std::vector<int>(hyperedge_c.begin(), hyperedge_c.end()));
+      hyperedges_c.push_back(std::move(hyperedge_vec));
       hyperedges_weights_c.push_back(hgraph->GetHyperedgeWeights(e));
       if (hgraph->HasTiming()) {
         hyperedge_slack_c.push_back(
@@ -773,7 +812,6 @@ HGraphPtr Coarsener::Contraction(
     // there may be parallel hyperedges
     const int hash_hyperedge_c_id
         = hash_map[hash_value];  // the hyperedge_c has been found
-    std::vector<int> hyperedge_vec(hyperedge_c.begin(), hyperedge_c.end());
     // check the representative hyperedge_c
     int parallel_hyperedge_c_id
         = -1;  // the hyperedge_c_id of parallel hyperedge
@@ -796,7 +834,7 @@ HGraphPtr Coarsener::Contraction(
       const int hyperedge_c_id = static_cast<int>(hyperedges_c.size());
       hyperedge_cluster_id_vec[e] = hyperedge_c_id;
       parallel_hash_map[hash_value].push_back(hyperedge_c_id);
-      hyperedges_c.push_back(hyperedge_vec);
+      hyperedges_c.push_back(std::move(hyperedge_vec));
       hyperedges_weights_c.push_back(hgraph->GetHyperedgeWeights(e));
       if (hgraph->HasTiming()) {
         hyperedge_slack_c.push_back(
@@ -11,6 +11,7 @@
 
 #include <memory>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "Evaluator.h"
@@ -98,6 +99,9 @@ class Coarsener
 
   void IncreaseRandomSeed() { random_seed_++; }
 
+  // Set the number of threads used for vertex matching and contraction
+  void SetNumThreads(int num_threads) { num_threads_ = num_threads; }
+
  private:
   // private functions (utilities)
 
@@ -122,6 +126,13 @@ class Coarsener
       std::vector<int>& fixed_attr_c,
       Matrix<float>& placement_attr_c) const;
 
+  // compute the score of merging v with each of its neighbors,
+  // sorted by neighbor id.  The cluster weight constraint is not checked
+  // here because it depends on the clusters found so far.
+  void ComputeNeighborScores(const HGraphPtr& hgraph,
+                             int v,
+                             std::vector<std::pair<int, float>>& scores) const;
+
   // order the vertices based on user-specified parameters
   void OrderVertices(const HGraphPtr& hgraph, std::vector<int>& vertices) const;
 
@@ -186,6 +197,7 @@ class Coarsener
   CoarsenOrder vertex_order_choice_ = CoarsenOrder::kRandom;
   EvaluatorPtr evaluator_ = nullptr;
   utl::Logger* logger_ = nullptr;
+  int num_threads_ = 1;
 };
 
 }  // namespace par
@@ -7,7 +7,6 @@
 #include <functional>
 #include <map>
 #include <memory>
-#include <thread>
 #include <utility>
 #include <vector>
 
@@ -248,23 +247,17 @@ float KWayPMRefine::PerformPairFM(
     const std::vector<int> neighbors = FindNeighbors(
         hgraph, vertex, visited_vertices_flag, solution, partition_pair);
     // update the neighbors of v for all gain buckets in parallel
-    std::vector<std::thread> threads;
-    threads.reserve(blocks.size());
-    for (auto& to_pid : blocks) {
-      threads.emplace_back(&KWayFMRefine::UpdateSingleGainBucket,
-                           this,
-                           to_pid,
-                           std::ref(buckets),
-                           hgraph,
-                           std::ref(neighbors),
-                           std::ref(net_degs),
-                           std::ref(paths_cost),
-                           std::ref(solution));
+    const int num_blocks = blocks.size();
+#pragma omp parallel for num_threads(std::min(num_threads_, num_blocks))
+    for (int i = 0; i < num_blocks; i++) {
+      UpdateSingleGainBucket(blocks[i],
+                             buckets,
+                             hgraph,
+                             neighbors,
+                             net_degs,
+                             paths_cost,
+                             solution);
     }
-    for (auto& t : threads) {
-      t.join();  // wait for all threads to finish
-    }
-    threads.clear();
     if (total_delta_gain >= best_gain) {
       best_gain = total_delta_gain;
       best_vertex_id = vertex;
@@ -309,27 +302,22 @@ void KWayPMRefine::InitializeGainBucketsPM(
     const Partitions& solution,
     const std::pair<int, int>& partition_pair) const
 {
-  std::vector<int> blocks_id{partition_pair.first, partition_pair.second};
-  std::vector<std::thread> threads;  // for parallel updating
-  threads.reserve(blocks_id.size());
+  const std::vector<int> blocks_id{partition_pair.first,
+                                   partition_pair.second};
+  const int num_blocks = blocks_id.size();
 
   // parallel initialize the num_parts gain_buckets
-  for (const auto to_pid : blocks_id) {
-    threads.emplace_back(
-        &KWayFMRefine::InitializeSingleGainBucket,
-        this,
-        std::ref(buckets),
-        to_pid,
+#pragma omp parallel for num_threads(std::min(num_threads_, num_blocks))
+  for (int i = 0; i < num_blocks; i++) {
+    InitializeSingleGainBucket(
+        buckets,
+        blocks_id[i],
         hgraph,
-        std::ref(boundary_vertices),  // we only consider boundary vertices
-        std::ref(net_degs),
-        std::ref(cur_paths_cost),
-        std::ref(solution));
-  }
-  for (auto& t : threads) {
-    t.join();  // wait for all threads to finish
+        boundary_vertices,  // we only consider boundary vertices
+        net_degs,
+        cur_paths_cost,
+        solution);
   }
-  threads.clear();
 }
 
 }  // namespace par
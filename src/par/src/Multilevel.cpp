@@ -9,7 +9,6 @@
 #include <numeric>
 #include <queue>
 #include <random>
-#include <thread>
 #include <utility>
 #include <vector>
 
@@ -132,6 +131,17 @@ std::vector<int> MultilevelPartitioner::Partition(
   return best_solution;
 }
 
+// Set the number of threads shared by coarsening and refinement
+void MultilevelPartitioner::SetNumThreads(const int num_threads)
+{
+  num_threads_ = std::max(num_threads, 1);
+  coarsener_->SetNumThreads(num_threads_);
+  k_way_fm_refiner_->SetNumThreads(num_threads_);
+  k_way_pm_refiner_->SetNumThreads(num_threads_);
+  greedy_refiner_->SetNumThreads(num_threads_);
+  ilp_refiner_->SetNumThreads(num_threads_);
+}
+
 // Private functions (Utilities)
 
 // Run single-level partitioning
@@ -501,20 +511,15 @@ void MultilevelPartitioner::RefinePartition(
     }
 
     // Parallel refine all the solutions
-    std::vector<std::thread> threads;
-    threads.reserve(top_solutions.size());
-    for (auto& top_solution : top_solutions) {
-      threads.emplace_back(&par::MultilevelPartitioner::CallRefiner,
-                           this,
-                           hgraph,
-                           std::ref(upper_block_balance),
-                           std::ref(lower_block_balance),
-                           std::ref(top_solution));
-    }
-    for (auto& th : threads) {
-      th.join();
+    // The refiners run their gain updates serially in this parallel region,
+    // so the number of threads is bounded by num_threads_
+    const int num_solutions = top_solutions.size();
+#pragma omp parallel for num_threads(std::min(num_threads_, num_solutions)) \
+    schedule(dynamic, 1)
+    for (int i = 0; i < num_solutions; i++) {
+      CallRefiner(
+          hgraph, upper_block_balance, lower_block_balance, top_solutions[i]);
     }
-    threads.clear();
 
     // update the best_solution_id
     float best_cost = std::numeric_limits<float>::max();
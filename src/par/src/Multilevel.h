@@ -59,6 +59,9 @@ class MultilevelPartitioner
                         const Matrix<float>& lower_block_balance,
                         std::vector<int>& best_solution) const;
 
+  // Set the number of threads shared by coarsening and refinement
+  void SetNumThreads(int num_threads);
+
  private:
   // Run single-level partitioning
   std::vector<int> SingleLevelPartition(
@@ -129,6 +132,7 @@ class MultilevelPartitioner
   IlpRefinerPtr ilp_refiner_ = nullptr;
   EvaluatorPtr evaluator_ = nullptr;
   utl::Logger* logger_ = nullptr;
+  int num_threads_ = 1;
 };
 
 }  // namespace par
@@ -201,6 +201,138 @@ void PartitionMgr::evaluateHypergraphSolution(
                                           solution_file);
 }
 
+// In-memory variant of tritonPartHypergraph
+std::vector<int> PartitionMgr::tritonPartHypergraphArrays(
+    unsigned int num_parts,
+    float balance_constraint,
+    const std::vector<float>& base_balance,
+    const std::vector<float>& scale_factor,
+    unsigned int seed,
+    int num_vertices,
+    int vertex_dimension,
+    int hyperedge_dimension,
+    const std::vector<int>& eptr,
+    const std::vector<int>& eind,
+    const std::vector<float>& vertex_weights,
+    const std::vector<float>& hyperedge_weights,
+    const std::vector<int>& fixed,
+    // weight parameters
+    const std::vector<float>& e_wt_factors,
+    const std::vector<float>& v_wt_factors,
+    // coarsening related parameters
+    int thr_coarsen_hyperedge_size_skip,
+    int thr_coarsen_vertices,
+    int thr_coarsen_hyperedges,
+    float coarsening_ratio,
+    int max_coarsen_iters,
+    float adj_diff_ratio,
+    int min_num_vertices_each_part,
+    // initial partitioning related parameters
+    int num_initial_solutions,
+    int num_best_initial_solutions,
+    // refinement related parameters
+    int refiner_iters,
+    int max_moves,
+    float early_stop_ratio,
+    int total_corking_passes,
+    // vcycle related parameters
+    bool v_cycle_flag,
+    int max_num_vcycle,
+    int num_coarsen_solutions,
+    int num_vertices_threshold_ilp,
+    int global_net_threshold)
+{
+  auto triton_part
+      = std::make_unique<TritonPart>(db_network_, db_, sta_, logger_);
+  triton_part->SetNetWeight(e_wt_factors);
+  triton_part->SetVertexWeight(v_wt_factors);
+  triton_part->SetPlacementWeight({});
+  triton_part->SetFineTuneParams(  // coarsening related parameters
+      thr_coarsen_hyperedge_size_skip,
+      thr_coarsen_vertices,
+      thr_coarsen_hyperedges,
+      coarsening_ratio,
+      max_coarsen_iters,
+      adj_diff_ratio,
+      min_num_vertices_each_part,
+      // initial partitioning related parameters
+      num_initial_solutions,
+      num_best_initial_solutions,
+      // refinement related parameters
+      refiner_iters,
+      max_moves,
+      early_stop_ratio,
+      total_corking_passes,
+      // vcycle related parameters
+      v_cycle_flag,
+      max_num_vcycle,
+      num_coarsen_solutions,
+      num_vertices_threshold_ilp,
+      global_net_threshold);
+
+  return triton_part->PartitionHypergraph(num_parts,
+                                          balance_constraint,
+                                          base_balance,
+                                          scale_factor,
+                                          seed,
+                                          num_vertices,
+                                          vertex_dimension,
+                                          hyperedge_dimension,
+                                          eptr,
+                                          eind,
+                                          vertex_weights,
+                                          hyperedge_weights,
+                                          fixed);
+}
+
+// In-memory variant of evaluateHypergraphSolution
+HypergraphSolutionStats PartitionMgr::evaluateHypergraphSolutionArrays(
+    unsigned int num_parts,
+    float balance_constraint,
+    const std::vector<float>& base_balance,
+    const std::vector<float>& scale_factor,
+    int num_vertices,
+    int vertex_dimension,
+    int hyperedge_dimension,
+    const std::vector<int>& eptr,
+    const std::vector<int>& eind,
+    const std::vector<float>& vertex_weights,
+    const std::vector<float>& hyperedge_weights,
+    const std::vector<int>& fixed,
+    const std::vector<int>& solution,
+    // weight parameters
+    const std::vector<float>& e_wt_factors,
+    const std::vector<float>& v_wt_factors)
+{
+  auto triton_part
+      = std::make_unique<TritonPart>(db_network_, db_, sta_, logger_);
+  triton_part->SetNetWeight(e_wt_factors);
+  triton_part->SetVertexWeight(v_wt_factors);
+  PartitionToken token;
+  HypergraphSolutionStats stats;
+  stats.constraints_satisfied
+      = triton_part->EvaluateHypergraphSolution(num_parts,
+                                                balance_constraint,
+                                                base_balance,
+                                                scale_factor,
+                                                num_vertices,
+                                                vertex_dimension,
+                                                hyperedge_dimension,
+                                                eptr,
+                                                eind,
+                                                vertex_weights,
+                                                hyperedge_weights,
+                                                fixed,
+                                                solution,
+                                                token);
+  stats.cut_cost = token.cost;
+  for (const auto& balance : token.block_balance) {
+    stats.block_balance.insert(
+        stats.block_balance.end(), balance.begin(), balance.end());
+  }
+  return stats;
+}
+
 // Top level interface
 // The function for partitioning a netlist
 // This is the main API for TritonPart
@@ -80,6 +80,11 @@ void Refiner::SetRefineIters(const int refiner_iters)
   refiner_iters_ = refiner_iters;
 }
 
+void Refiner::SetNumThreads(const int num_threads)
+{
+  num_threads_ = num_threads;
+}
+
 void Refiner::RestoreDefaultParameters()
 {
   max_move_ = max_move_default_;
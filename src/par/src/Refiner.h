@@ -87,6 +87,7 @@ class Refiner
 
   void SetMaxMove(int max_move);
   void SetRefineIters(int refiner_iters);
+  void SetNumThreads(int num_threads);
 
   void RestoreDefaultParameters();
 
@@ -242,6 +243,9 @@ class Refiner
   const int refiner_iters_default_ = 2;
   const int max_move_default_ = 50;
 
+  // the number of threads used to update the gain buckets
+  int num_threads_ = 1;
+
   utl::Logger* logger_ = nullptr;
   EvaluatorPtr evaluator_ = nullptr;
 };
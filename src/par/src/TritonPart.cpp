@@ -65,6 +65,10 @@ TritonPart::TritonPart(sta::dbNetwork* network,
                        utl::Logger* logger)
     : network_(network), db_(db), sta_(sta), logger_(logger)
 {
+  // follow the thread count of OpenROAD, which is also set on the sta
+  if (sta_ != nullptr) {
+    num_threads_ = std::max(sta_->threadCount(), 1);
+  }
 }
 
 void TritonPart::SetTimingParams(float net_timing_factor,
@@ -513,6 +517,14 @@ void TritonPart::EvaluateHypergraphSolution(
   ReadHypergraph(
       hypergraph_file, fixed_file, community_file, group_file, placement_file);
 
+  PartitionToken token;
+  EvaluateSolution(token);
+}
+
+// Evaluate solution_ on original_hypergraph_
+// Returns true if the solution satisfies all the constraints
+bool TritonPart::EvaluateSolution(PartitionToken& token)
+{
   // check the base balance constraint
   if (static_cast<int>(base_balance_.size()) != num_parts_) {
     debugPrint(logger_,
@@ -631,12 +643,13 @@ void TritonPart::EvaluateHypergraphSolution(
                                                      original_hypergraph_,
                                                      logger_);
 
-  evaluator->ConstraintAndCutEvaluator(original_hypergraph_,
-                                       solution_,
-                                       ub_factor_,
-                                       base_balance_,
-                                       group_attr_,
-                                       true);
+  token = evaluator->CutEvaluator(original_hypergraph_, solution_);
+  return evaluator->ConstraintAndCutEvaluator(original_hypergraph_,
+                                              solution_,
+                                              ub_factor_,
+                                              base_balance_,
+                                              group_attr_,
+                                              true);
 }
 
 // Function to evaluate the netlist partitioning solution
@@ -900,6 +913,114 @@ void TritonPart::EvaluatePartDesignSolution(
   }
 }
 
+// In-memory variant of PartitionHypergraph.
+// The hypergraph is given in CSR form and the solution is returned instead
+// of being written to a file.
+std::vector<int> TritonPart::PartitionHypergraph(
+    unsigned int num_parts_arg,
+    float balance_constraint_arg,
+    const std::vector<float>& base_balance_arg,
+    const std::vector<float>& scale_factor_arg,
+    unsigned int seed_arg,
+    int num_vertices,
+    int vertex_dimension_arg,
+    int hyperedge_dimension_arg,
+    const std::vector<int>& eptr,
+    const std::vector<int>& eind,
+    const std::vector<float>& vertex_weights,
+    const std::vector<float>& hyperedge_weights,
+    const std::vector<int>& fixed)
+{
+  logger_->info(PAR, 114, "Partitioning in-memory hypergraph.");
+
+  // Parameters
+  num_parts_ = num_parts_arg;
+  base_balance_ = base_balance_arg;
+  scale_factor_ = scale_factor_arg;
+  ub_factor_ = balance_constraint_arg;
+  seed_ = seed_arg;
+  vertex_dimensions_ = vertex_dimension_arg;
+  hyperedge_dimensions_ = hyperedge_dimension_arg;
+  placement_dimensions_ = 0;
+
+  logger_->report("Partitioning Parameters");
+  logger_->report("\tNumber of partitions = {}", num_parts_);
+  logger_->report("\tUBfactor = {:.1f}", ub_factor_);
+  logger_->report("\tSeed = {}", seed_);
+  logger_->report("\tVertex dimensions = {}", vertex_dimensions_);
+  logger_->report("\tHyperedge dimensions = {}", hyperedge_dimensions_);
+  logger_->report("\tGlobal net threshold = {}", global_net_threshold_);
+
+  // set the random seed
+  srand(seed_);  // set the random seed
+
+  timing_aware_flag_ = false;
+  placement_flag_ = false;
+  fence_flag_ = false;
+
+  BuildHypergraph(
+      num_vertices, eptr, eind, vertex_weights, hyperedge_weights, fixed);
+
+  // call the multilevel partitioner to partition hypergraph_
+  // but the evaluation is the original_hypergraph_
+  MultiLevelPartition();
+
+  return solution_;
+}
+
+// In-memory variant of EvaluateHypergraphSolution.
+bool TritonPart::EvaluateHypergraphSolution(
+    unsigned int num_parts_arg,
+    float balance_constraint_arg,
+    const std::vector<float>& base_balance_arg,
+    const std::vector<float>& scale_factor_arg,
+    int num_vertices,
+    int vertex_dimension_arg,
+    int hyperedge_dimension_arg,
+    const std::vector<int>& eptr,
+    const std::vector<int>& eind,
+    const std::vector<float>& vertex_weights,
+    const std::vector<float>& hyperedge_weights,
+    const std::vector<int>& fixed,
+    const std::vector<int>& solution,
+    PartitionToken& token)
+{
+  logger_->info(
+      PAR, 115, "Evaluating in-memory hypergraph partitioning solution.");
+
+  // Parameters
+  num_parts_ = num_parts_arg;
+  ub_factor_ = balance_constraint_arg;
+  base_balance_ = base_balance_arg;
+  scale_factor_ = scale_factor_arg;
+  seed_ = 0;  // use the default random seed (no meaning in this function)
+  vertex_dimensions_ = vertex_dimension_arg;
+  hyperedge_dimensions_ = hyperedge_dimension_arg;
+  placement_dimensions_ = 0;
+  timing_aware_flag_ = false;
+
+  if (static_cast<int>(solution.size()) != num_vertices) {
+    logger_->error(PAR,
+                   105,
+                   "The solution has {} entries but the hypergraph has {} "
+                   "vertices.",
+                   solution.size(),
+                   num_vertices);
+  }
+  for (const int part_id : solution) {
+    if (part_id < 0 || part_id >= num_parts_) {
+      logger_->error(
+          PAR, 106, "Invalid block id {} in the solution.", part_id);
+    }
+  }
+  solution_ = solution;
+
+  BuildHypergraph(
+      num_vertices, eptr, eind, vertex_weights, hyperedge_weights, fixed);
+
+  return EvaluateSolution(token);
+}
+
 // k-way partitioning used by Hier-RTLMP
 std::vector<int> TritonPart::PartitionKWaySimpleMode(
     unsigned int num_parts_arg,
@@ -1198,6 +1319,132 @@ void TritonPart::ReadHypergraph(const std::string& hypergraph_file,
                 original_hypergraph_->GetNumHyperedges());
 }
 
+// for in-memory hypergraph partitioning
+// Build the hypergraph from CSR arrays
+void TritonPart::BuildHypergraph(int num_vertices,
+                                 const std::vector<int>& eptr,
+                                 const std::vector<int>& eind,
+                                 const std::vector<float>& vertex_weights,
+                                 const std::vector<float>& hyperedge_weights,
+                                 const std::vector<int>& fixed)
+{
+  if (eptr.empty() || eptr.front() != 0
+      || eptr.back() != static_cast<int>(eind.size())) {
+    logger_->error(PAR,
+                   107,
+                   "The hyperedge offsets must start with 0 and end with the "
+                   "number of hyperedge vertices ({}).",
+                   eind.size());
+  }
+  num_vertices_ = num_vertices;
+  num_hyperedges_ = static_cast<int>(eptr.size()) - 1;
+  const size_t num_vertex_weights
+      = static_cast<size_t>(num_vertices_) * vertex_dimensions_;
+  if (!vertex_weights.empty() && vertex_weights.size() != num_vertex_weights) {
+    logger_->error(PAR,
+                   108,
+                   "Expected {} vertex weights but got {}.",
+                   num_vertex_weights,
+                   vertex_weights.size());
+  }
+  const size_t num_hyperedge_weights
+      = static_cast<size_t>(num_hyperedges_) * hyperedge_dimensions_;
+  if (!hyperedge_weights.empty()
+      && hyperedge_weights.size() != num_hyperedge_weights) {
+    logger_->error(PAR,
+                   109,
+                   "Expected {} hyperedge weights but got {}.",
+                   num_hyperedge_weights,
+                   hyperedge_weights.size());
+  }
+  if (!fixed.empty() && static_cast<int>(fixed.size()) != num_vertices_) {
+    logger_->error(PAR,
+                   110,
+                   "Expected {} fixed vertex entries but got {}.",
+                   num_vertices_,
+                   fixed.size());
+  }
+  // Check every offset before reading any hyperedge from eind
+  const int num_pins = static_cast<int>(eind.size());
+  for (int e = 0; e < num_hyperedges_; e++) {
+    if (eptr[e] < 0 || eptr[e + 1] < eptr[e] || eptr[e + 1] > num_pins) {
+      logger_->error(PAR,
+                     111,
+                     "The hyperedge offsets must be non-decreasing and at "
+                     "most {}.",
+                     num_pins);
+    }
+  }
+  for (const int part_id : fixed) {
+    if (part_id < -1 || part_id >= num_parts_) {
+      logger_->error(
+          PAR, 113, "Invalid block id {} for a fixed vertex.", part_id);
+    }
+  }
+
+  // clear the related vectors
+  hyperedges_.clear();
+  hyperedge_weights_.clear();
+  vertex_weights_.clear();
+  fixed_attr_.clear();
+  community_attr_.clear();
+  group_attr_.clear();
+  placement_attr_.clear();
+  hyperedges_.reserve(num_hyperedges_);
+  hyperedge_weights_.reserve(num_hyperedges_);
+  vertex_weights_.reserve(num_vertices_);
+
+  for (int e = 0; e < num_hyperedges_; e++) {
+    std::vector<int> hyperedge(eind.begin() + eptr[e],
+                               eind.begin() + eptr[e + 1]);
+    for (const int v : hyperedge) {
+      if (v < 0 || v >= num_vertices_) {
+        logger_->error(PAR,
+                       112,
+                       "Hyperedge {} has an invalid vertex id {}.",
+                       e,
+                       v);
+      }
+    }
+    hyperedges_.push_back(std::move(hyperedge));
+    if (hyperedge_weights.empty()) {
+      hyperedge_weights_.emplace_back(hyperedge_dimensions_, 1.0);
+    } else {
+      auto hwts = hyperedge_weights.begin() + e * hyperedge_dimensions_;
+      hyperedge_weights_.emplace_back(hwts, hwts + hyperedge_dimensions_);
+    }
+  }
+
+  for (int v = 0; v < num_vertices_; v++) {
+    if (vertex_weights.empty()) {
+      vertex_weights_.emplace_back(vertex_dimensions_, 1.0);
+    } else {
+      auto vwts = vertex_weights.begin() + v * vertex_dimensions_;
+      vertex_weights_.emplace_back(vwts, vwts + vertex_dimensions_);
+    }
+  }
+
+  fixed_attr_ = fixed;
+
+  // Build the original hypergraph first
+  original_hypergraph_ = std::make_shared<Hypergraph>(vertex_dimensions_,
+                                                      hyperedge_dimensions_,
+                                                      placement_dimensions_,
+                                                      hyperedges_,
+                                                      vertex_weights_,
+                                                      hyperedge_weights_,
+                                                      fixed_attr_,
+                                                      community_attr_,
+                                                      placement_attr_,
+                                                      logger_);
+
+  logger_->info(PAR,
+                116,
+                "Built hypergraph has {} vertices and {} hyperedges.",
+                original_hypergraph_->GetNumVertices(),
+                original_hypergraph_->GetNumHyperedges());
+}
+
 // for design partitioning
 // Convert the netlist into hypergraphs
 // read fixed_file, community_file and group_file
@@ -1957,6 +2204,7 @@ void TritonPart::MultiLevelPartition()
                                                 ilp_refiner,
                                                 tritonpart_evaluator,
                                                 logger_);
+  tritonpart_mlevel_partitioner->SetNumThreads(num_threads_);
 
   if (timing_aware_flag_ == true) {
     // Initialize the timing on original_hypergraph_
@@ -6,6 +6,7 @@
 #include <vector>
 
 #include "Coarsener.h"
+#include "Evaluator.h"
 #include "Hypergraph.h"
 #include "Utilities.h"
 #include "db_sta/dbReadVerilog.hh"
@@ -125,6 +126,45 @@ class TritonPart
                                   const char* group_file,
                                   const char* solution_file);
 
+  // In-memory variants of PartitionHypergraph and EvaluateHypergraphSolution.
+  // The hyperedges are given in CSR form: the vertices of hyperedge e are
+  // eind[eptr[e]] ... eind[eptr[e + 1] - 1] (the vertex id starts from 0).
+  // vertex_weights (hyperedge_weights) holds vertex_dimension
+  // (hyperedge_dimension) values per vertex (hyperedge) in row-major order;
+  // empty means every dimension has the weight 1.  fixed is either empty or
+  // holds the block id of each vertex (-1 for free vertices).
+  std::vector<int> PartitionHypergraph(
+      unsigned int num_parts,
+      float balance_constraint,
+      const std::vector<float>& base_balance,
+      const std::vector<float>& scale_factor,
+      unsigned int seed,
+      int num_vertices,
+      int vertex_dimension,
+      int hyperedge_dimension,
+      const std::vector<int>& eptr,
+      const std::vector<int>& eind,
+      const std::vector<float>& vertex_weights,
+      const std::vector<float>& hyperedge_weights,
+      const std::vector<int>& fixed);
+
+  // Returns true if the solution satisfies all the constraints.
+  // The cut cost and the block balance are returned in token.
+  bool EvaluateHypergraphSolution(unsigned int num_parts,
+                                  float balance_constraint,
+                                  const std::vector<float>& base_balance,
+                                  const std::vector<float>& scale_factor,
+                                  int num_vertices,
+                                  int vertex_dimension,
+                                  int hyperedge_dimension,
+                                  const std::vector<int>& eptr,
+                                  const std::vector<int>& eind,
+                                  const std::vector<float>& vertex_weights,
+                                  const std::vector<float>& hyperedge_weights,
+                                  const std::vector<int>& fixed,
+                                  const std::vector<int>& solution,
+                                  PartitionToken& token);
+
   // k-way partitioning used by Hier-RTLMP
   std::vector<int> PartitionKWaySimpleMode(
       unsigned int num_parts_arg,
@@ -211,6 +251,17 @@ class TritonPart
                       const std::string& group_file,
                       const std::string& placement_file);
 
+  // build hypergraph from CSR arrays
+  void BuildHypergraph(int num_vertices,
+                       const std::vector<int>& eptr,
+                       const std::vector<int>& eind,
+                       const std::vector<float>& vertex_weights,
+                       const std::vector<float>& hyperedge_weights,
+                       const std::vector<int>& fixed);
+
+  // evaluate solution_ on original_hypergraph_
+  bool EvaluateSolution(PartitionToken& token);
+
   // read and build netlist
   // placement information is extracted from the OpenDB database
   void ReadNetlist(const std::string& fixed_file,
@@ -233,6 +284,7 @@ class TritonPart
   odb::dbDatabase* db_ = nullptr;
   odb::dbBlock* block_ = nullptr;
   sta::dbSta* sta_ = nullptr;
+  int num_threads_ = 1;  // shared by coarsening and refinement
 
   // user-specified parameters
 
@@ -3,6 +3,109 @@
 
 %{
 #include "par/PartitionMgr.h"
+
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+// Copy a C-contiguous buffer (e.g. a numpy array) or a sequence of numbers
+// into values.  Integer and floating point buffers of any width are
+// accepted.  Returns false with a Python exception set on failure.
+template <typename T>
+static bool par_bufferToVector(PyObject* obj, std::vector<T>& values)
+{
+  values.clear();
+  if (obj == Py_None) {
+    return true;
+  }
+  if (PyObject_CheckBuffer(obj)) {
+    Py_buffer view;
+    if (PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT)
+        != 0) {
+      return false;
+    }
+    const char* format = view.format != nullptr ? view.format : "B";
+    if (*format == '@' || *format == '=' || *format == '<') {
+      format++;
+    }
+    const Py_ssize_t count = view.itemsize > 0 ? view.len / view.itemsize : 0;
+    values.resize(count);
+    const char* data = static_cast<const char*>(view.buf);
+    bool ok = true;
+    for (Py_ssize_t i = 0; ok && i < count; i++) {
+      const char* item = data + i * view.itemsize;
+      switch (*format) {
+        case 'f': {
+          float value;
+          std::memcpy(&value, item, sizeof(value));
+          values[i] = static_cast<T>(value);
+          break;
+        }
+        case 'd': {
+          double value;
+          std::memcpy(&value, item, sizeof(value));
+          values[i] = static_cast<T>(value);
+          break;
+        }
+        case 'b':
+        case 'h':
+        case 'i':
+        case 'l':
+        case 'q': {
+          int64_t value = 0;
+          if (view.itemsize == 1) {
+            value = *reinterpret_cast<const int8_t*>(item);
+          } else if (view.itemsize == 2) {
+            int16_t v;
+            std::memcpy(&v, item, sizeof(v));
+            value = v;
+          } else if (view.itemsize == 4) {
+            int32_t v;
+            std::memcpy(&v, item, sizeof(v));
+            value = v;
+          } else {
+            std::memcpy(&value, item, sizeof(value));
+          }
+          values[i] = static_cast<T>(value);
+          break;
+        }
+        case 'B':
+        case 'H':
+        case 'I':
+        case 'L':
+        case 'Q': {
+          uint64_t value = 0;
+          std::memcpy(&value, item, view.itemsize);
+          values[i] = static_cast<T>(value);
+          break;
+        }
+        default:
+          PyErr_Format(PyExc_TypeError, "unsupported buffer format '%s'",
+                       view.format);
+          ok = false;
+      }
+    }
+    PyBuffer_Release(&view);
+    return ok;
+  }
+  PyObject* seq = PySequence_Fast(obj, "expected a buffer or a sequence");
+  if (seq == nullptr) {
+    return false;
+  }
+  const Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+  values.resize(count);
+  for (Py_ssize_t i = 0; i < count; i++) {
+    const double value
+        = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(seq, i));
+    if (PyErr_Occurred()) {
+      Py_DECREF(seq);
+      return false;
+    }
+    values[i] = static_cast<T>(value);
+  }
+  Py_DECREF(seq);
+  return true;
+}
 %}
 
 %include "../../Exception-py.i"
@@ -18,4 +121,53 @@ namespace std
 }
 #endif
 
+// The hypergraph arrays of the in-memory API accept numpy arrays (or any
+// other buffer or sequence of numbers) without going through a tuple.
+%typemap(in) const std::vector<int>& BUFFER (std::vector<int> temp) {
+  if (!par_bufferToVector($input, temp)) {
+    SWIG_fail;
+  }
+  $1 = &temp;
+}
+%typemap(in) const std::vector<float>& BUFFER (std::vector<float> temp) {
+  if (!par_bufferToVector($input, temp)) {
+    SWIG_fail;
+  }
+  $1 = &temp;
+}
+%typemap(typecheck, precedence=SWIG_TYPECHECK_POINTER)
+    const std::vector<int>& BUFFER, const std::vector<float>& BUFFER {
+  $1 = 1;
+}
+%apply const std::vector<int>& BUFFER {
+  const std::vector<int>& eptr,
+  const std::vector<int>& eind,
+  const std::vector<int>& fixed,
+  const std::vector<int>& solution
+};
+%apply const std::vector<float>& BUFFER {
+  const std::vector<float>& vertex_weights,
+  const std::vector<float>& hyperedge_weights
+};
+
+// The partition is returned as a memoryview of int32 so
+// numpy.asarray() wraps it without a further copy.
+%typemap(out) std::vector<int> tritonPartHypergraphArrays {
+  PyObject* buffer = PyByteArray_FromStringAndSize(
+      reinterpret_cast<const char*>($1.data()), $1.size() * sizeof(int));
+  if (buffer == nullptr) {
+    SWIG_fail;
+  }
+  PyObject* bytes_view = PyMemoryView_FromObject(buffer);
+  Py_DECREF(buffer);
+  if (bytes_view == nullptr) {
+    SWIG_fail;
+  }
+  $result = PyObject_CallMethod(bytes_view, "cast", "s", "i");
+  Py_DECREF(bytes_view);
+  if ($result == nullptr) {
+    SWIG_fail;
+  }
+}
+
 %include "par/PartitionMgr.h"
@@ -103,3 +103,119 @@ def tritonPartDesign(
         num_vertices_threshold_ilp,
         global_net_threshold,
     )
+
+
+def tritonPartHypergraphArrays(
+    design,
+    num_vertices,
+    eptr,
+    eind,
+    *,
+    vertex_weights=[],
+    hyperedge_weights=[],
+    fixed=[],
+    vertex_dimension=1,
+    hyperedge_dimension=1,
+    base_balance=[1.0],
+    scale_factor=[1.0],
+    num_parts=2,
+    balance_constraint=1.0,
+    seed=1,
+    e_wt_factors=[1.0],
+    v_wt_factors=[1.0],
+    thr_coarsen_hyperedge_size_skip=1000,
+    thr_coarsen_vertices=10,
+    thr_coarsen_hyperedges=50,
+    coarsening_ratio=1.5,
+    max_coarsen_iters=30,
+    adj_diff_ratio=0.0001,
+    min_num_vertices_each_part=4,
+    num_initial_solutions=100,
+    num_best_initial_solutions=10,
+    refiner_iters=10,
+    max_moves=100,
+    early_stop_ratio=0.5,
+    total_corking_passes=25,
+    v_cycle_flag=True,
+    max_num_vcycle=1,
+    num_coarsen_solutions=4,
+    num_vertices_threshold_ilp=50,
+    global_net_threshold=1000
+):
+    mgr = design.getPartitionMgr()
+
+    return mgr.tritonPartHypergraphArrays(
+        num_parts,
+        balance_constraint,
+        base_balance,
+        scale_factor,
+        seed,
+        num_vertices,
+        vertex_dimension,
+        hyperedge_dimension,
+        eptr,
+        eind,
+        vertex_weights,
+        hyperedge_weights,
+        fixed,
+        e_wt_factors,
+        v_wt_factors,
+        thr_coarsen_hyperedge_size_skip,
+        thr_coarsen_vertices,
+        thr_coarsen_hyperedges,
+        coarsening_ratio,
+        max_coarsen_iters,
+        adj_diff_ratio,
+        min_num_vertices_each_part,
+        num_initial_solutions,
+        num_best_initial_solutions,
+        refiner_iters,
+        max_moves,
+        early_stop_ratio,
+        total_corking_passes,
+        v_cycle_flag,
+        max_num_vcycle,
+        num_coarsen_solutions,
+        num_vertices_threshold_ilp,
+        global_net_threshold,
+    )
+
+
+def evaluateHypergraphSolutionArrays(
+    design,
+    num_vertices,
+    eptr,
+    eind,
+    solution,
+    *,
+    vertex_weights=[],
+    hyperedge_weights=[],
+    fixed=[],
+    vertex_dimension=1,
+    hyperedge_dimension=1,
+    base_balance=[1.0],
+    scale_factor=[1.0],
+    num_parts=2,
+    balance_constraint=1.0,
+    e_wt_factors=[1.0],
+    v_wt_factors=[1.0]
+):
+    mgr = design.getPartitionMgr()
+
+    return mgr.evaluateHypergraphSolutionArrays(
+        num_parts,
+        balance_constraint,
+        base_balance,
+        scale_factor,
+        num_vertices,
+        vertex_dimension,
+        hyperedge_dimension,
+        eptr,
+        eind,
+        vertex_weights,
+        hyperedge_weights,
+        fixed,
+        solution,
+        e_wt_factors,
+        v_wt_factors,
+    )
@@ -0,0 +1,56 @@
+# Partition an in-memory hypergraph of two cliques joined by one hyperedge
+from openroad import Design, Tech
+import helpers
+import par_aux
+
+tech = Tech()
+design = helpers.make_design(tech)
+logger = design.getLogger()
+
+# vertices 0-3 and 4-7 form two cliques, hyperedge (3, 4) joins them
+hyperedges = [
+    [0, 1, 2, 3],
+    [0, 1],
+    [2, 3],
+    [4, 5, 6, 7],
+    [4, 5],
+    [6, 7],
+    [3, 4],
+]
+eptr = [0]
+eind = []
+for hyperedge in hyperedges:
+    eind.extend(hyperedge)
+    eptr.append(len(eind))
+num_vertices = 8
+
+# The partitioner reports its progress; only check the result
+logger.redirectStringBegin()
+solution = list(par_aux.tritonPartHypergraphArrays(design, num_vertices, eptr, eind))
+logger.redirectStringEnd()
+cut = sum(1 for hyperedge in hyperedges if len({solution[v] for v in hyperedge}) > 1)
+print("Cut", cut)
+print("Cliques kept together", len(set(solution[0:4])) == 1)
+
+logger.redirectStringBegin()
+stats = par_aux.evaluateHypergraphSolutionArrays(
+    design, num_vertices, eptr, eind, solution
+)
+logger.redirectStringEnd()
+print("Evaluated cut", stats.cut_cost)
+
+# hyperedge 0 ends past the last vertex
+try:
+    par_aux.evaluateHypergraphSolutionArrays(
+        design, 3, [0, 10, 3], [0, 1, 2], [0, 1, 0]
+    )
+except Exception as inst:
+    print(inst.args[0])
+
+# fixed vertices use -1 for free and a block id otherwise
+try:
+    par_aux.evaluateHypergraphSolutionArrays(
+        design, 3, [0, 3], [0, 1, 2], [0, 1, 0], fixed=[-1, -2, 0]
+    )
+except Exception as inst:
+    print(inst.args[0])
@@ -0,0 +1,34 @@
+# Wall time of triton_part_hypergraph across thread counts.
+# usage: openroad thread_scaling.tcl [hypergraph_file] [max_threads]
+source helpers.tcl
+
+set hypergraph_file sparcT1_core.hgr
+set max_threads [cpu_count]
+if { $argc > 0 } {
+  set hypergraph_file [lindex $argv 0]
+}
+if { $argc > 1 } {
+  set max_threads [lindex $argv 1]
+}
+
+# The solution is written next to the hypergraph, so partition a copy in the
+# results directory.
+set hypergraph_copy [make_result_file [file tail $hypergraph_file]]
+file copy -force $hypergraph_file $hypergraph_copy
+
+set results {}
+for { set threads 1 } { $threads <= $max_threads } \
+  { set threads [expr $threads * 2] } {
+  set_thread_count $threads
+  set start [clock milliseconds]
+  triton_part_hypergraph -hypergraph_file $hypergraph_copy \
+    -num_parts 2 -balance_constraint 2 -seed 0
+  lappend results $threads [expr [clock milliseconds] - $start]
+}
+
+puts [format "%8s %12s %8s" "Threads" "Time (ms)" "Speedup"]
+set base [lindex $results 1]
+foreach { threads ms } $results {
+  puts [format "%8d %12d %8.2f" $threads $ms [expr double($base) / max($ms, 1)]]
+}
+exit
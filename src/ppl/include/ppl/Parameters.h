@@ -7,6 +7,13 @@
 
 namespace ppl {
 
+// Solver of the assignment problem of each section.
+enum class AssignmentSolver
+{
+  hungarian,
+  jonker_volgenant
+};
+
 class Parameters
 {
  public:
@@ -74,6 +81,15 @@ class Parameters
   }
   std::string getPinPlacementFile() const { return pin_placement_file_; }
 
+  void setAssignmentSolver(AssignmentSolver solver)
+  {
+    assignment_solver_ = solver;
+  }
+  AssignmentSolver getAssignmentSolver() const { return assignment_solver_; }
+
+  void setNumThreads(int num_threads) { num_threads_ = num_threads; }
+  int getNumThreads() const { return num_threads_; }
+
  private:
   bool report_hpwl_ = false;
   int slots_per_section_ = 200;
@@ -88,6 +104,8 @@ class Parameters
   int min_dist_ = 0;
   bool distance_in_tracks_ = false;
   std::string pin_placement_file_;
+  AssignmentSolver assignment_solver_ = AssignmentSolver::hungarian;
+  int num_threads_ = 1;
 };
 
 }  // namespace ppl
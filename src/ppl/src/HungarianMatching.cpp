@@ -11,10 +11,12 @@
 #include <vector>
 
 #include "Core.h"
+#include "JonkerVolgenant.h"
 #include "Netlist.h"
 #include "Slots.h"
 #include "odb/db.h"
 #include "odb/geom.h"
+#include "ppl/Parameters.h"
 #include "utl/Logger.h"
 
 namespace ppl {
@@ -24,8 +26,10 @@ HungarianMatching::HungarianMatching(const Section& section,
                                      Core* core,
                                      std::vector<Slot>& slots,
                                      Logger* logger,
-                                     odb::dbDatabase* db)
-    : netlist_(netlist),
+                                     odb::dbDatabase* db,
+                                     AssignmentSolver solver)
+    : solver_(solver),
+      netlist_(netlist),
       core_(core),
       pin_indices_(section.pin_indices),
       pin_groups_(section.pin_groups),
@@ -46,7 +50,17 @@ HungarianMatching::HungarianMatching(const Section& section,
 void HungarianMatching::findAssignment()
 {
   createMatrix();
-  if (!hungarian_matrix_.empty()) {
+  solve();
+}
+
+void HungarianMatching::solve()
+{
+  if (hungarian_matrix_.empty()) {
+    return;
+  }
+  if (solver_ == AssignmentSolver::jonker_volgenant) {
+    JonkerVolgenant().solve(hungarian_matrix_, assignment_);
+  } else {
     hungarian_solver_.solve(hungarian_matrix_, assignment_);
   }
 }
@@ -184,10 +198,7 @@ void HungarianMatching::assignMirroredPins(IOPin& io_pin,
 void HungarianMatching::findAssignmentForGroups()
 {
   createMatrixForGroups();
-
-  if (!hungarian_matrix_.empty()) {
-    hungarian_solver_.solve(hungarian_matrix_, assignment_);
-  }
+  solve();
 }
 
 void HungarianMatching::createMatrixForGroups()
@@ -10,10 +10,12 @@
 
 #include "Core.h"
 #include "Hungarian.h"
+#include "JonkerVolgenant.h"
 #include "Netlist.h"
 #include "Slots.h"
 #include "odb/geom.h"
 #include "ppl/IOPlacer.h"
+#include "ppl/Parameters.h"
 
 namespace utl {
 class Logger;
@@ -31,7 +33,8 @@ class HungarianMatching
                     Core* core,
                     std::vector<Slot>& slots,
                     Logger* logger,
-                    odb::dbDatabase* db);
+                    odb::dbDatabase* db,
+                    AssignmentSolver solver = AssignmentSolver::hungarian);
   virtual ~HungarianMatching() = default;
   void findAssignment();
   void findAssignmentForGroups();
@@ -44,6 +47,7 @@ class HungarianMatching
   std::vector<int> assignment_;
   std::vector<int> valid_starting_slots_;
   HungarianAlgorithm hungarian_solver_;
+  AssignmentSolver solver_;
   Netlist* netlist_;
   Core* core_;
   const std::vector<int>& pin_indices_;
@@ -61,6 +65,7 @@ class HungarianMatching
   Logger* logger_;
   odb::dbDatabase* db_;
 
+  void solve();
   void createMatrix();
   void createMatrixForGroups();
   void assignMirroredPins(IOPin& io_pin, std::vector<IOPin>& assignment);
@@ -4,9 +4,11 @@
 #include "ppl/IOPlacer.h"
 
 #include <algorithm>
+#include <atomic>
 #include <cmath>
 #include <cstddef>
 #include <cstdint>
+#include <exception>
 #include <fstream>
 #include <limits>
 #include <map>
@@ -2214,9 +2216,40 @@ std::string IOPlacer::getPinSetOrListString(const PinSetOrList& group)
   return pin_names;
 }
 
+// The matchings only read the netlist and the slots, so the assignment
+// problems of the sections are solved in parallel.  The exception of the
+// first failed matching is rethrown, and the remaining matchings are
+// skipped after a failure as the serial loop would.
+template <typename Solve>
+static void forEachMatching(std::vector<HungarianMatching>& matches,
+                            const int num_threads,
+                            const Solve& solve)
+{
+  std::vector<std::exception_ptr> errors(matches.size());
+  std::atomic_bool failed = false;
+#pragma omp parallel for num_threads(num_threads) schedule(dynamic, 1)
+  for (int i = 0; i < matches.size(); i++) {
+    if (failed) {
+      continue;
+    }
+    try {
+      solve(matches[i]);
+    } catch (...) {
+      errors[i] = std::current_exception();
+      failed = true;
+    }
+  }
+  for (const std::exception_ptr& error : errors) {
+    if (error) {
+      std::rethrow_exception(error);
+    }
+  }
+}
+
 void IOPlacer::findPinAssignment(std::vector<Section>& sections,
                                  bool mirrored_groups_only)
 {
+  const AssignmentSolver solver = parms_->getAssignmentSolver();
   std::vector<HungarianMatching> hg_vec;
   for (const auto& section : sections) {
     if (!section.pin_indices.empty()) {
@@ -2226,19 +2259,26 @@ void IOPlacer::findPinAssignment(std::vector<Section>& sections,
                              core_.get(),
                              top_layer_slots_,
                              logger_,
-                             db_);
+                             db_,
+                             solver);
         hg_vec.push_back(hg);
       } else {
-        HungarianMatching hg(
-            section, netlist_.get(), core_.get(), slots_, logger_, db_);
+        HungarianMatching hg(section,
+                             netlist_.get(),
+                             core_.get(),
+                             slots_,
+                             logger_,
+                             db_,
+                             solver);
         hg_vec.push_back(hg);
       }
     }
   }
 
-  for (auto& match : hg_vec) {
+  const int num_threads = parms_->getNumThreads();
+  forEachMatching(hg_vec, num_threads, [](HungarianMatching& match) {
     match.findAssignmentForGroups();
-  }
+  });
 
   for (auto& match : hg_vec) {
     match.getAssignmentForGroups(assignment_, mirrored_groups_only);
@@ -2250,9 +2290,9 @@ void IOPlacer::findPinAssignment(std::vector<Section>& sections,
     updateSection(sec, slots);
   }
 
-  for (auto& match : hg_vec) {
+  forEachMatching(hg_vec, num_threads, [](HungarianMatching& match) {
     match.findAssignment();
-  }
+  });
 
   for (bool mirrored_pins : {true, false}) {
     for (auto& match : hg_vec) {
@@ -156,9 +156,19 @@ add_ver_layer(odb::dbTechLayer* layer)
 void
 run_hungarian_matching()
 {
+  const int num_threads = ord::OpenRoad::openRoad()->getThreadCount();
+  getIOPlacer()->getParameters()->setNumThreads(num_threads);
   getIOPlacer()->runHungarianMatching();
 }
 
+void
+set_assignment_solver(const char* solver)
+{
+  getIOPlacer()->getParameters()->setAssignmentSolver(
+      std::string(solver) == "jv" ? ppl::AssignmentSolver::jonker_volgenant
+                                  : ppl::AssignmentSolver::hungarian);
+}
+
 void
 set_report_hpwl(bool report)
 {
@@ -216,14 +216,15 @@ sta::define_cmd_args "place_pins" {[-hor_layers h_layers]\
                                   [-exclude region]\
                                   [-group_pins pin_list]\
                                   [-annealing] \
-                                  [-write_pin_placement file_name]
+                                  [-write_pin_placement file_name]\
+                                  [-assignment_solver hungarian|jv]
 } ;# checker off
 
 proc place_pins { args } {
   ord::parse_list_args "place_pins" args list {-exclude -group_pins}
   sta::parse_key_args "place_pins" args \
     keys {-hor_layers -ver_layers -random_seed -corner_avoidance \
-          -min_distance -write_pin_placement} \
+          -min_distance -write_pin_placement -assignment_solver} \
     flags {-random -min_distance_in_tracks -annealing} ;# checker off
 
   sta::check_argc_eq0 "place_pins" $args
@@ -361,6 +362,15 @@ proc place_pins { args } {
       ppl::set_pin_placement_file $keys(-write_pin_placement)
     }
 
+    set solver "hungarian"
+    if { [info exists keys(-assignment_solver)] } {
+      set solver $keys(-assignment_solver)
+      if { $solver != "hungarian" && $solver != "jv" } {
+        utl::error PPL 400 "-assignment_solver must be hungarian or jv."
+      }
+    }
+    ppl::set_assignment_solver $solver
+
     if { [info exists flags(-annealing)] } {
       ppl::run_annealing
     } else {
@@ -0,0 +1,110 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#include "JonkerVolgenant.h"
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <vector>
+
+namespace ppl {
+
+int64_t JonkerVolgenant::solve(const std::vector<std::vector<int>>& cost_matrix,
+                               std::vector<int>& assignment)
+{
+  const int rows = cost_matrix.size();
+  const int cols = rows > 0 ? cost_matrix[0].size() : 0;
+  assignment.assign(rows, -1);
+  if (rows == 0 || cols == 0) {
+    return 0;
+  }
+
+  // Every element of the smaller dimension is assigned, so the problem is
+  // solved with n <= m, transposing the matrix if there are more rows than
+  // columns.  The matrix is flattened so the inner loop reads it
+  // contiguously.
+  const bool transposed = rows > cols;
+  const int n = transposed ? cols : rows;
+  const int m = transposed ? rows : cols;
+  std::vector<int> cost(static_cast<size_t>(n) * m);
+  for (int r = 0; r < rows; r++) {
+    for (int c = 0; c < cols; c++) {
+      const size_t idx = transposed ? static_cast<size_t>(c) * m + r
+                                    : static_cast<size_t>(r) * m + c;
+      cost[idx] = cost_matrix[r][c];
+    }
+  }
+
+  // Dual potentials of the n rows (u) and m columns (v), 1-based with
+  // column 0 as the root of the augmenting path.  match[j] is the row
+  // matched to column j, 0 when the column is free.
+  constexpr int64_t inf = std::numeric_limits<int64_t>::max();
+  std::vector<int64_t> u(n + 1, 0);
+  std::vector<int64_t> v(m + 1, 0);
+  std::vector<int> match(m + 1, 0);
+  std::vector<int> way(m + 1, 0);
+  std::vector<int64_t> min_slack(m + 1);
+  std::vector<char> used(m + 1);
+
+  for (int i = 1; i <= n; i++) {
+    // Grow a shortest path tree (Dijkstra on the reduced costs) from row i
+    // until it reaches a free column, then augment along the path.
+    match[0] = i;
+    int j0 = 0;
+    std::fill(min_slack.begin(), min_slack.end(), inf);
+    std::fill(used.begin(), used.end(), 0);
+    do {
+      used[j0] = 1;
+      const int i0 = match[j0];
+      const int* row_cost = &cost[static_cast<size_t>(i0 - 1) * m];
+      int64_t delta = inf;
+      int j1 = 0;
+      for (int j = 1; j <= m; j++) {
+        if (used[j]) {
+          continue;
+        }
+        const int64_t slack = row_cost[j - 1] - u[i0] - v[j];
+        if (slack < min_slack[j]) {
+          min_slack[j] = slack;
+          way[j] = j0;
+        }
+        if (min_slack[j] < delta) {
+          delta = min_slack[j];
+          j1 = j;
+        }
+      }
+      for (int j = 0; j <= m; j++) {
+        if (used[j]) {
+          u[match[j]] += delta;
+          v[j] -= delta;
+        } else {
+          min_slack[j] -= delta;
+        }
+      }
+      j0 = j1;
+    } while (match[j0] != 0);
+
+    do {
+      const int j1 = way[j0];
+      match[j0] = match[j1];
+      j0 = j1;
+    } while (j0 != 0);
+  }
+
+  int64_t total_cost = 0;
+  for (int j = 1; j <= m; j++) {
+    if (match[j] == 0) {
+      continue;
+    }
+    const int row = transposed ? j - 1 : match[j] - 1;
+    const int col = transposed ? match[j] - 1 : j - 1;
+    assignment[row] = col;
+    total_cost += cost_matrix[row][col];
+  }
+
+  return total_cost;
+}
+
+}  // namespace ppl
@@ -0,0 +1,26 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#pragma once
+
+#include <cstdint>
+#include <vector>
+
+namespace ppl {
+
+// Solves the rectangular linear assignment problem with the shortest
+// augmenting path method of Jonker and Volgenant.  It returns the same
+// minimum cost as HungarianAlgorithm, in O(n^2 * m) time for an n x m
+// problem (n <= m), but is much faster on the section sizes used by the
+// pin placer.
+class JonkerVolgenant
+{
+ public:
+  // assignment[row] is set to the column assigned to each row of
+  // cost_matrix, or -1 when the row is not assigned.  Returns the total
+  // cost of the assignment.
+  int64_t solve(const std::vector<std::vector<int>>& cost_matrix,
+                std::vector<int>& assignment);
+};
+
+}  // namespace ppl
@@ -0,0 +1,9 @@
+# place_pins with an unknown assignment solver
+source "helpers.tcl"
+read_lef Nangate45/Nangate45.lef
+read_def gcd.def
+
+catch {
+  place_pins -hor_layers metal3 -ver_layers metal2 -assignment_solver munkres
+} error
+puts $error
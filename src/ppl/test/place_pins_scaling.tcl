@@ -0,0 +1,66 @@
+# Runtime of place_pins on a synthetic design across thread counts and
+# assignment solvers.  Each IO pin drives one randomly placed buffer.
+# usage: openroad place_pins_scaling.tcl [num_pins] [max_threads]
+source "helpers.tcl"
+
+set num_pins 100000
+set max_threads [cpu_count]
+if { $argc > 0 } {
+  set num_pins [lindex $argv 0]
+}
+if { $argc > 1 } {
+  set max_threads [lindex $argv 1]
+}
+
+read_lef Nangate45/Nangate45.lef
+
+proc make_design { num_pins } {
+  set db [ord::get_db]
+  set tech [$db getTech]
+  set chip [odb::dbChip_create $db $tech]
+  set block [odb::dbBlock_create $chip "top"]
+  set dbu [$tech getDbUnitsPerMicron]
+  $block setDefUnits $dbu
+
+  # Enough boundary for the pins at the default min distance.
+  set size [expr int(sqrt($num_pins) * 40 * $dbu)]
+  set rect [odb::Rect]
+  $rect init 0 0 $size $size
+  $block setDieArea $rect
+
+  set master [$db findMaster "BUF_X1"]
+  expr { srand(42) }
+  for { set i 0 } { $i < $num_pins } { incr i } {
+    set net [odb::dbNet_create $block "net$i"]
+    set bterm [odb::dbBTerm_create $net "pin$i"]
+    $bterm setIoType INPUT
+    set inst [odb::dbInst_create $block $master "buf$i"]
+    $inst setLocation [expr int(rand() * $size * 0.9)] \
+      [expr int(rand() * $size * 0.9)]
+    $inst setPlacementStatus PLACED
+    [$inst findITerm "A"] connect $net
+  }
+
+  source Nangate45/Nangate45.tracks
+}
+
+make_design $num_pins
+
+set results {}
+foreach solver { hungarian jv } {
+  for { set threads 1 } { $threads <= $max_threads } \
+    { set threads [expr $threads * 2] } {
+    set_thread_count $threads
+    set start [clock milliseconds]
+    place_pins -hor_layers metal3 -ver_layers metal2 -corner_avoidance 0 \
+      -assignment_solver $solver
+    set ms [expr [clock milliseconds] - $start]
+    lappend results $solver $threads $ms [ppl::compute_io_nets_hpwl]
+  }
+}
+
+puts [format "%-10s %8s %12s %16s" "Solver" "Threads" "Time (ms)" "HPWL"]
+foreach { solver threads ms hpwl } $results {
+  puts [format "%-10s %8d %12d %16d" $solver $threads $ms $hpwl]
+}
+exit
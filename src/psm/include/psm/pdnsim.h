@@ -7,6 +7,7 @@
 #include <memory>
 #include <optional>
 #include <string>
+#include <vector>
 
 #include "odb/db.h"
 #include "odb/dbBlockCallBackObj.h"
@@ -43,6 +44,18 @@ enum class GeneratedSourceType
   kBumps
 };
 
+enum class SolverType
+{
+  kDirect,
+  kIterative
+};
+
+enum class Preconditioner
+{
+  kIncompleteCholesky,
+  kJacobi
+};
+
 class PDNSim : public odb::dbBlockCallBackObj
 {
  public:
@@ -58,9 +71,43 @@ class PDNSim : public odb::dbBlockCallBackObj
     int strap_track_pitch = 10;
   };
 
+  struct SolverSettings
+  {
+    // Direct uses a sparse LU factorization, iterative uses a conjugate
+    // gradient solver which needs far less memory on large grids.
+    SolverType type = SolverType::kDirect;
+
+    // Iterative solver
+    Preconditioner preconditioner = Preconditioner::kIncompleteCholesky;
+    double tolerance = 1e-10;  // relative residual
+    int max_iterations = 0;    // 0 uses twice the number of nodes
+    int threads = 1;
+  };
+
   using IRDropByPoint = std::map<odb::Point, double>;
   using IRDropByLayer = std::map<odb::dbTechLayer*, IRDropByPoint>;
 
+  // Values binned on a regular grid over the die area.  The values are
+  // stored row-major, bin (row, col) covers the square of size pitch at
+  // origin + (col * pitch, row * pitch).
+  struct GriddedMap
+  {
+    odb::Point origin;
+    int pitch = 0;
+    int rows = 0;
+    int cols = 0;
+    std::vector<double> values;
+  };
+
+  // Worst voltage and IR drop seen by the terminals of each instance,
+  // aligned by index.
+  struct InstanceVoltages
+  {
+    std::vector<odb::dbInst*> insts;
+    std::vector<double> worst_voltage;
+    std::vector<double> worst_ir_drop;
+  };
+
   PDNSim(utl::Logger* logger,
          odb::dbDatabase* db,
          sta::dbSta* sta,
@@ -79,6 +126,16 @@ class PDNSim : public odb::dbBlockCallBackObj
                         const std::string& em_file,
                         const std::string& error_file,
                         const std::string& voltage_source_file);
+  // Analyze every net in every corner and report the results in one table.
+  // The grid of each net is built once and its corners are solved in
+  // parallel.  voltage_source_files is either empty or has one file per net.
+  void analyzePowerGrid(const std::vector<odb::dbNet*>& nets,
+                        const std::vector<sta::Corner*>& corners,
+                        GeneratedSourceType source_type,
+                        bool use_prev_solution,
+                        bool enable_em,
+                        const std::string& error_file,
+                        const std::vector<std::string>& voltage_source_files);
   void writeSpiceNetwork(odb::dbNet* net,
                          sta::Corner* corner,
                          GeneratedSourceType source_type,
@@ -88,6 +145,18 @@ class PDNSim : public odb::dbBlockCallBackObj
                          sta::Corner* corner,
                          odb::dbTechLayer* layer,
                          IRDropByPoint& ir_drop) const;
+  // Worst IR drop of the layer's nodes (NaN for bins without nodes) and
+  // largest current (A) through one of the layer's resistors in each bin.
+  // Errors out if the net hasn't been analyzed for the corner.
+  void getIRDropMap(odb::dbNet* net,
+                    sta::Corner* corner,
+                    odb::dbTechLayer* layer,
+                    int bin_size,
+                    GriddedMap& ir_drop_map,
+                    GriddedMap& max_current_map) const;
+  void getInstanceVoltages(odb::dbNet* net,
+                           sta::Corner* corner,
+                           InstanceVoltages& inst_voltages) const;
   bool checkConnectivity(odb::dbNet* net,
                          bool floorplanning,
                          const std::string& error_file,
@@ -97,6 +166,7 @@ class PDNSim : public odb::dbBlockCallBackObj
   void clearSolvers();
 
   void setGeneratedSourceSettings(const GeneratedSourceSettings& settings);
+  void setSolverSettings(const SolverSettings& settings);
 
   // from dbBlockCallBackObj
   void inDbPostMoveInst(odb::dbInst*) override;
@@ -122,6 +192,8 @@ class PDNSim : public odb::dbBlockCallBackObj
   odb::dbNet* findPowerNet(const char* net_name);
 
   IRSolver* getIRSolver(odb::dbNet* net, bool floorplanning);
+  // The solver of net with a solution for corner, errors out otherwise
+  IRSolver* getAnalyzedSolver(odb::dbNet* net, sta::Corner* corner) const;
 
   odb::dbDatabase* db_ = nullptr;
   sta::dbSta* sta_ = nullptr;
@@ -134,6 +206,7 @@ class PDNSim : public odb::dbBlockCallBackObj
   bool debug_gui_enabled_ = false;
 
   GeneratedSourceSettings generated_source_settings_;
+  SolverSettings solver_settings_;
 
   std::map<odb::dbNet*, std::unique_ptr<IRSolver>> solvers_;
   std::map<odb::dbNet*, std::map<sta::Corner*, double>> user_voltages_;
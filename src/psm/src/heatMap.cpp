@@ -7,6 +7,7 @@
 #include <limits>
 #include <map>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "odb/dbTypes.h"
@@ -152,9 +153,12 @@ bool IRDropDataSource::populateMap()
   setMaxValue(max);
 
   auto& ir_drop = ir_drops[layer_];
+  std::vector<std::pair<odb::Rect, double>> regions;
+  regions.reserve(ir_drop.size());
   for (const auto& [point, drop] : ir_drop) {
-    addToMap({point, point}, drop);
+    regions.emplace_back(odb::Rect(point, point), drop);
   }
+  addToMap(regions);
 
   return true;
 }
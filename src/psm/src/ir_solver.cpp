@@ -6,8 +6,10 @@
 #include <algorithm>
 #include <cmath>
 #include <cstddef>
+#include <exception>
 #include <fstream>
 #include <iterator>
+#include <limits>
 #include <map>
 #include <memory>
 #include <optional>
@@ -19,6 +21,7 @@
 #include <vector>
 
 #include "boost/geometry/geometry.hpp"
+#include "omp.h"
 #include "connection.h"
 #include "db_sta/dbNetwork.hh"
 #include "est/EstimateParasitics.h"
@@ -49,7 +52,8 @@ IRSolver::IRSolver(
     utl::Logger* logger,
     const std::map<odb::dbNet*, std::map<sta::Corner*, Voltage>>& user_voltages,
     const std::map<odb::dbInst*, std::map<sta::Corner*, Power>>& user_powers,
-    const PDNSim::GeneratedSourceSettings& generated_source_settings)
+    const PDNSim::GeneratedSourceSettings& generated_source_settings,
+    const PDNSim::SolverSettings& solver_settings)
     : net_(net),
       logger_(logger),
       estimate_parasitics_(estimate_parasitics),
@@ -58,7 +62,8 @@ IRSolver::IRSolver(
       gui_(nullptr),
       user_voltages_(user_voltages),
       user_powers_(user_powers),
-      generated_source_settings_(generated_source_settings)
+      generated_source_settings_(generated_source_settings),
+      solver_settings_(solver_settings)
 {
 }
 
@@ -117,6 +122,104 @@ PDNSim::IRDropByPoint IRSolver::getIRDrop(odb::dbTechLayer* layer,
   return ir_drop;
 }
 
+static void initGriddedMap(const odb::Rect& area,
+                           const int bin_size,
+                           const double value,
+                           PDNSim::GriddedMap& map)
+{
+  map.origin = area.ll();
+  map.pitch = bin_size;
+  map.cols = std::max(1, (area.dx() + bin_size - 1) / bin_size);
+  map.rows = std::max(1, (area.dy() + bin_size - 1) / bin_size);
+  map.values.assign(static_cast<std::size_t>(map.rows) * map.cols, value);
+}
+
+static double& griddedMapBin(PDNSim::GriddedMap& map, const odb::Point& pt)
+{
+  const int col = std::clamp(
+      (pt.getX() - map.origin.getX()) / map.pitch, 0, map.cols - 1);
+  const int row = std::clamp(
+      (pt.getY() - map.origin.getY()) / map.pitch, 0, map.rows - 1);
+  return map.values[static_cast<std::size_t>(row) * map.cols + col];
+}
+
+void IRSolver::getIRDropMap(odb::dbTechLayer* layer,
+                            sta::Corner* corner,
+                            const int bin_size,
+                            PDNSim::GriddedMap& ir_drop_map,
+                            PDNSim::GriddedMap& max_current_map) const
+{
+  const odb::Rect die = getBlock()->getDieArea();
+  initGriddedMap(
+      die, bin_size, std::numeric_limits<double>::quiet_NaN(), ir_drop_map);
+  initGriddedMap(die, bin_size, 0.0, max_current_map);
+
+  if (!hasSolution(corner)) {
+    return;
+  }
+
+  for (const auto& [pt, ir_drop] : getIRDrop(layer, corner)) {
+    double& bin = griddedMapBin(ir_drop_map, pt);
+    if (std::isnan(bin) || ir_drop > bin) {
+      bin = ir_drop;
+    }
+  }
+
+  // Resistors, including vias, are binned at their center
+  for (const auto& [connection, current] : generateCurrentMap(corner)) {
+    const Node* node0 = connection->getNode0();
+    const Node* node1 = connection->getNode1();
+    if (node0->getLayer() != layer && node1->getLayer() != layer) {
+      continue;
+    }
+    const odb::Point center
+        = odb::Rect(node0->getPoint(), node1->getPoint()).center();
+    double& bin = griddedMapBin(max_current_map, center);
+    bin = std::max(bin, current);
+  }
+}
+
+PDNSim::InstanceVoltages IRSolver::getInstanceVoltages(
+    sta::Corner* corner) const
+{
+  PDNSim::InstanceVoltages inst_voltages;
+  if (!hasSolution(corner)) {
+    return inst_voltages;
+  }
+
+  const Voltage net_voltage = solution_voltages_.at(corner);
+  const bool is_ground = net_voltage == 0.0;
+  const auto& voltages = voltages_.at(corner);
+
+  std::map<odb::dbInst*, std::size_t> inst_index;
+  for (const auto& node : network_->getITermNodes()) {
+    odb::dbInst* inst = node->getITerm()->getInst();
+    const Voltage voltage = voltages.at(node.get());
+
+    auto [itr, inserted]
+        = inst_index.emplace(inst, inst_voltages.insts.size());
+    if (inserted) {
+      inst_voltages.insts.push_back(inst);
+      inst_voltages.worst_voltage.push_back(voltage);
+      continue;
+    }
+    Voltage& worst = inst_voltages.worst_voltage[itr->second];
+    if (is_ground) {
+      worst = std::max(worst, voltage);
+    } else {
+      worst = std::min(worst, voltage);
+    }
+  }
+
+  inst_voltages.worst_ir_drop.reserve(inst_voltages.worst_voltage.size());
+  for (const Voltage worst : inst_voltages.worst_voltage) {
+    inst_voltages.worst_ir_drop.push_back(is_ground ? worst
+                                                    : net_voltage - worst);
+  }
+
+  return inst_voltages;
+}
+
 bool IRSolver::check(bool check_bterms)
 {
   const utl::DebugScopedTimer timer(logger_, utl::PSM, "timer", 1, "Check: {}");
@@ -831,22 +934,26 @@ void IRSolver::buildNodeCurrentMap(sta::Corner* corner,
   }
 }
 
-std::map<Node*, Connection::ConnectionSet> IRSolver::getNodeConnectionMap(
-    const Connection::ConnectionMap<Connection::Conductance>& conductance) const
+const std::map<Node*, Connection::ConnectionSet>&
+IRSolver::getNodeConnectionMap()
 {
+  // The topology does not depend on the corner, so it is built once
+  if (!node_connections_.empty()) {
+    return node_connections_;
+  }
+
   const utl::DebugScopedTimer timer(
       logger_, utl::PSM, "timer", 1, "Build node/connection mapping: {}");
 
-  std::map<Node*, Connection::ConnectionSet> node_connections;
-  for (const auto& [connection, cond] : conductance) {
+  for (const auto& connection : network_->getConnections()) {
     Node* node0 = connection->getNode0();
     Node* node1 = connection->getNode1();
 
-    node_connections[node0].insert(connection);
-    node_connections[node1].insert(connection);
+    node_connections_[node0].insert(connection.get());
+    node_connections_[node1].insert(connection.get());
   }
 
-  return node_connections;
+  return node_connections_;
 }
 
 std::map<Node*, std::size_t> IRSolver::assignNodeIDs(const Node::NodeSet& nodes,
@@ -871,17 +978,14 @@ std::map<Node*, std::size_t> IRSolver::assignNodeIDs(
   return assignNodeIDs(node_set, start);
 }
 
-void IRSolver::buildCondMatrixAndVoltages(
-    bool is_ground,
+void IRSolver::buildCondMatrix(
     const std::map<Node*, Connection::ConnectionSet>& node_connections,
-    const ValueNodeMap<Current>& currents,
     const Connection::ConnectionMap<Connection::Conductance>& conductance,
     const std::map<Node*, std::size_t>& node_index,
-    Eigen::SparseMatrix<Connection::Conductance>& g_matrix,
-    Eigen::VectorXd& j_vector) const
+    Eigen::SparseMatrix<Connection::Conductance>& g_matrix) const
 {
   const utl::DebugScopedTimer timer(
-      logger_, utl::PSM, "timer", 1, "Build G and J: {}");
+      logger_, utl::PSM, "timer", 1, "Build G: {}");
 
   const bool print_progress = logger_->debugCheck(utl::PSM, "progress", 1);
   std::size_t count = 0;
@@ -889,13 +993,6 @@ void IRSolver::buildCondMatrixAndVoltages(
   for (const auto& [node, connections] : node_connections) {
     const std::size_t node_idx = node_index.at(node);
 
-    auto find_node = currents.find(node);
-    if (find_node == currents.end()) {
-      j_vector[node_idx] = 0;
-    } else {
-      j_vector[node_idx] = find_node->second;
-    }
-
     Connection::Conductance node_cond = 0.0;
     for (auto* conn : connections) {
       Node* other = conn->getOtherNode(node);
@@ -914,30 +1011,20 @@ void IRSolver::buildCondMatrixAndVoltages(
     count++;
   }
   g_matrix.setFromTriplets(cond_values.begin(), cond_values.end());
-  if (!is_ground) {
-    for (auto& j : j_vector) {
-      j = -j;
-    }
-  }
   cond_values.clear();
 }
 
-void IRSolver::addSourcesToMatrixAndVoltages(
-    Voltage src_voltage,
+void IRSolver::addSourcesToMatrix(
     const std::vector<std::unique_ptr<psm::SourceNode>>& sources,
     const std::map<Node*, std::size_t>& node_index,
-    Eigen::SparseMatrix<Connection::Conductance>& g_matrix,
-    Eigen::VectorXd& j_vector) const
+    Eigen::SparseMatrix<Connection::Conductance>& g_matrix) const
 {
   // Attach sources as current sources through a 1 ohm resistor
-  const Connection::Resistance src_res = 1.0;
-  const Connection::Conductance src_cond = 1.0 / src_res;
+  const Connection::Conductance src_cond = 1.0 / kSourceResistance;
 
   for (const auto& src_node : sources) {
     const std::size_t idx = node_index.at(src_node.get());
 
-    j_vector[idx] = src_voltage / src_res;
-
     Node* real_node = src_node->getSource();
 
     const std::size_t real_node_idx = node_index.at(real_node);
@@ -955,25 +1042,68 @@ void IRSolver::addSourcesToMatrixAndVoltages(
   }
 }
 
-void IRSolver::solve(sta::Corner* corner,
-                     GeneratedSourceType source_type,
-                     const std::string& source_file)
+Eigen::VectorXd IRSolver::buildCurrentVector(
+    Voltage src_voltage,
+    const ValueNodeMap<Current>& currents,
+    const Factorization& factorization) const
 {
-  const utl::DebugScopedTimer timer(logger_, utl::PSM, "timer", 1, "Solve: {}");
+  const utl::DebugScopedTimer timer(
+      logger_, utl::PSM, "timer", 1, "Build J: {}");
 
-  if (network_->isFloorplanningOnly()) {
-    network_->setFloorplanning(false);
-    network_->construct();
+  Eigen::VectorXd j_vector = Eigen::VectorXd::Zero(factorization.num_nodes);
+  for (const auto& [node, node_idx] : factorization.real_node_index) {
+    auto find_node = currents.find(node);
+    if (find_node != currents.end()) {
+      j_vector[node_idx] = find_node->second;
+    }
+  }
+  if (src_voltage != 0.0) {
+    j_vector = -j_vector;
   }
 
-  assertResistanceMap(corner);
+  if (factorization.type == SolverType::kIterative) {
+    j_vector += factorization.source_conductance * src_voltage;
+  } else {
+    for (const auto& src_node : factorization.sources) {
+      const std::size_t idx = factorization.node_index.at(src_node.get());
+      j_vector[idx] = src_voltage / kSourceResistance;
+    }
+  }
+
+  return j_vector;
+}
+
+IRSolver::Factorization* IRSolver::prepareFactorization(
+    sta::Corner* corner,
+    GeneratedSourceType source_type,
+    const std::string& source_file)
+{
+  const Connection::ResistanceMap resistance = getResistanceMap(corner);
 
-  // Reset
-  auto& voltages = voltages_[corner];
-  auto& currents = currents_[corner];
+  auto& factorization = factorizations_[corner];
+  if (factorization != nullptr
+      && factorization->type == solver_settings_.type
+      && factorization->preconditioner == solver_settings_.preconditioner
+      && factorization->source_type == source_type
+      && factorization->source_file == source_file
+      && factorization->resistance == resistance) {
+    debugPrint(logger_,
+               utl::PSM,
+               "solve",
+               1,
+               "Reusing factorization of the G matrix");
+    if (gui_) {
+      gui_->setSources(factorization->sources);
+    }
+    return factorization.get();
+  }
 
-  voltages.clear();
-  currents.clear();
+  factorization = std::make_unique<Factorization>();
+  factorization->type = solver_settings_.type;
+  factorization->preconditioner = solver_settings_.preconditioner;
+  factorization->source_type = source_type;
+  factorization->source_file = source_file;
+  factorization->resistance = resistance;
 
   const auto conductance = generateConductanceMap(corner);
   debugPrint(logger_,
@@ -987,28 +1117,32 @@ void IRSolver::solve(sta::Corner* corner,
     dumpConductance(conductance, "cond");
   }
 
-  const auto node_connections = getNodeConnectionMap(conductance);
+  const auto& node_connections = getNodeConnectionMap();
+
+  // Build source map
+  factorization->src_voltage = generateSourceNodes(
+      source_type, source_file, corner, factorization->sources);
+
+  if (factorization->type == SolverType::kIterative) {
+    buildIterativeMatrix(*factorization, node_connections, conductance);
+    return factorization.get();
+  }
+
   Node::NodeSet all_nodes;
   for (const auto& [node, conns] : node_connections) {
     all_nodes.insert(node);
   }
 
-  buildNodeCurrentMap(corner, currents);
-
-  // Build source map
-  std::vector<std::unique_ptr<SourceNode>> src_nodes;
-  Voltage src_voltage
-      = generateSourceNodes(source_type, source_file, corner, src_nodes);
-
-  // Solve
   // create vector of nodes
-  std::map<Node*, std::size_t> node_index = assignNodeIDs(all_nodes);
-  const std::map<Node*, std::size_t> real_node_index = node_index;
-  for (const auto& [node, id] : assignNodeIDs(src_nodes, node_index.size())) {
-    node_index[node] = id;
+  factorization->real_node_index = assignNodeIDs(all_nodes);
+  factorization->node_index = factorization->real_node_index;
+  for (const auto& [node, id] : assignNodeIDs(
+           factorization->sources, factorization->real_node_index.size())) {
+    factorization->node_index[node] = id;
   }
 
-  const std::size_t num_nodes = node_index.size();
+  const std::size_t num_nodes = factorization->node_index.size();
+  factorization->num_nodes = num_nodes;
 
   debugPrint(logger_,
              utl::PSM,
@@ -1018,29 +1152,46 @@ void IRSolver::solve(sta::Corner* corner,
              all_nodes.size());
   debugPrint(logger_, utl::PSM, "stats", 1, "Nodes in matrix: {}", num_nodes);
 
-  // create sparse matrix and vector
-  Eigen::SparseMatrix<Connection::Conductance> g_matrix(num_nodes, num_nodes);
-  Eigen::VectorXd j_vector(num_nodes);
+  // create sparse matrix
+  ConductanceMatrix& g_matrix = factorization->g_matrix;
+  g_matrix.resize(num_nodes, num_nodes);
+
+  // Build G
+  buildCondMatrix(
+      node_connections, conductance, factorization->node_index, g_matrix);
+  addSourcesToMatrix(
+      factorization->sources, factorization->node_index, g_matrix);
+
+  return factorization.get();
+}
+
+void IRSolver::factorize(Factorization& factorization) const
+{
+  if (factorization.factorized) {
+    return;
+  }
+  if (factorization.type == SolverType::kIterative) {
+    factorizeIterative(factorization);
+  } else {
+    factorizeDirect(factorization);
+  }
+  factorization.factorized = true;
+}
 
-  // Build G and J
-  buildCondMatrixAndVoltages(src_voltage == 0.0,
-                             node_connections,
-                             currents,
-                             conductance,
-                             node_index,
-                             g_matrix,
-                             j_vector);
-  addSourcesToMatrixAndVoltages(
-      src_voltage, src_nodes, node_index, g_matrix, j_vector);
+void IRSolver::factorizeDirect(Factorization& factorization) const
+{
+  const utl::DebugScopedTimer timer(
+      logger_, utl::PSM, "timer", 1, "Factorize G: {}");
 
-  Eigen::SparseLU<Eigen::SparseMatrix<Connection::Conductance>> eigen_solver;
+  ConductanceMatrix& g_matrix = factorization.g_matrix;
 
   debugPrint(logger_, utl::PSM, "solve", 1, "Factorizing the G matrix");
+  auto& eigen_solver = factorization.solver;
   eigen_solver.compute(g_matrix);
   if (eigen_solver.info() != Eigen::ComputationInfo::Success) {
     // decomposition failed
     if (logger_->debugCheck(utl::PSM, "dump", 1)) {
-      network_->dumpNodes(node_index);
+      network_->dumpNodes(factorization.node_index);
       dumpMatrix(g_matrix, "G");
     }
     logger_->error(
@@ -1050,16 +1201,287 @@ void IRSolver::solve(sta::Corner* corner,
         eigen_solver.lastErrorMessage());
   }
 
-  debugPrint(logger_, utl::PSM, "solve", 1, "Solving system of equations GV=J");
-  const Eigen::VectorXd v_vector = eigen_solver.solve(j_vector);
-  if (eigen_solver.info() != Eigen::ComputationInfo::Success) {
-    // solving failed
+  if (logger_->debugCheck(utl::PSM, "dump", 2)) {
+    dumpMatrix(g_matrix, "G");
+  }
+
+  // The LU factors hold everything needed to solve
+  g_matrix = ConductanceMatrix();
+}
+
+void IRSolver::buildIterativeMatrix(
+    Factorization& factorization,
+    const std::map<Node*, Connection::ConnectionSet>& node_connections,
+    const Connection::ConnectionMap<Connection::Conductance>& conductance) const
+{
+
+  for (const auto& src_node : factorization.sources) {
+    factorization.source_nodes.insert(src_node->getSource());
+  }
+
+  Node::NodeSet free_nodes;
+  for (const auto& [node, conns] : node_connections) {
+    if (factorization.source_nodes.find(node)
+        == factorization.source_nodes.end()) {
+      free_nodes.insert(node);
+    }
+  }
+  factorization.real_node_index = assignNodeIDs(free_nodes);
+  factorization.node_index = factorization.real_node_index;
+
+  const std::size_t num_nodes = free_nodes.size();
+  factorization.num_nodes = num_nodes;
+  debugPrint(logger_, utl::PSM, "stats", 1, "Nodes in matrix: {}", num_nodes);
+
+  // Connections to fixed nodes move to the right hand side
+  factorization.source_conductance = Eigen::VectorXd::Zero(num_nodes);
+  std::vector<Eigen::Triplet<Connection::Conductance>> cond_values;
+  for (const auto& [node, node_idx] : factorization.real_node_index) {
+    Connection::Conductance node_cond = 0.0;
+    for (auto* conn : node_connections.at(node)) {
+      const Connection::Conductance cond = conductance.at(conn);
+      node_cond += cond;
+
+      auto find_other
+          = factorization.real_node_index.find(conn->getOtherNode(node));
+      if (find_other == factorization.real_node_index.end()) {
+        factorization.source_conductance[node_idx] += cond;
+      } else {
+        cond_values.emplace_back(node_idx, find_other->second, -cond);
+      }
+    }
+    cond_values.emplace_back(node_idx, node_idx, node_cond);
+  }
+  factorization.g_matrix.resize(num_nodes, num_nodes);
+  factorization.g_matrix.setFromTriplets(cond_values.begin(),
+                                         cond_values.end());
+  cond_values.clear();
+
+  if (logger_->debugCheck(utl::PSM, "dump", 2)) {
+    dumpMatrix(factorization.g_matrix, "G");
+  }
+}
+
+void IRSolver::factorizeIterative(Factorization& factorization) const
+{
+  const utl::DebugScopedTimer timer(
+      logger_, utl::PSM, "timer", 1, "Build preconditioner: {}");
+
+  debugPrint(logger_, utl::PSM, "solve", 1, "Building the preconditioner");
+  setEigenThreads();
+  Eigen::ComputationInfo info;
+  if (factorization.preconditioner == Preconditioner::kIncompleteCholesky) {
+    factorization.ichol_solver = std::make_unique<IncompleteCholeskySolver>();
+    factorization.ichol_solver->compute(factorization.g_matrix);
+    info = factorization.ichol_solver->info();
+  } else {
+    factorization.jacobi_solver = std::make_unique<JacobiSolver>();
+    factorization.jacobi_solver->compute(factorization.g_matrix);
+    info = factorization.jacobi_solver->info();
+  }
+  if (info != Eigen::ComputationInfo::Success) {
     if (logger_->debugCheck(utl::PSM, "dump", 1)) {
-      network_->dumpNodes(node_index);
-      dumpMatrix(g_matrix, "G");
-      dumpVector(j_vector, "J");
+      network_->dumpNodes(factorization.node_index);
+      dumpMatrix(factorization.g_matrix, "G");
+    }
+    logger_->error(
+        utl::PSM, 183, "Preconditioner construction of the G matrix failed.");
+  }
+}
+
+template <typename Solver>
+static Eigen::VectorXd solveWithSettings(
+    Solver& solver,
+    const PDNSim::SolverSettings& settings,
+    const Eigen::VectorXd& j_vector,
+    const Eigen::VectorXd& guess,
+    int& iterations,
+    double& error,
+    bool& converged)
+{
+  solver.setTolerance(settings.tolerance);
+  if (settings.max_iterations > 0) {
+    solver.setMaxIterations(settings.max_iterations);
+  }
+  Eigen::VectorXd v_vector;
+  if (guess.size() == j_vector.size()) {
+    v_vector = solver.solveWithGuess(j_vector, guess);
+  } else {
+    v_vector = solver.solve(j_vector);
+  }
+  iterations = solver.iterations();
+  error = solver.error();
+  converged = solver.info() == Eigen::ComputationInfo::Success;
+  return v_vector;
+}
+
+void IRSolver::setEigenThreads() const
+{
+  // Corners solved in parallel leave the threads to the corners
+  if (!omp_in_parallel()) {
+    Eigen::setNbThreads(solver_settings_.threads);
+  }
+}
+
+Eigen::VectorXd IRSolver::solveIterative(Factorization& factorization,
+                                         const Eigen::VectorXd& j_vector) const
+{
+  setEigenThreads();
+
+  int iterations = 0;
+  double error = 0.0;
+  bool converged = false;
+  std::size_t preconditioner_nnz = 0;
+  Eigen::VectorXd v_vector;
+  if (factorization.ichol_solver) {
+    v_vector = solveWithSettings(*factorization.ichol_solver,
+                                 solver_settings_,
+                                 j_vector,
+                                 factorization.guess,
+                                 iterations,
+                                 error,
+                                 converged);
+    preconditioner_nnz
+        = factorization.ichol_solver->preconditioner().matrixL().nonZeros();
+  } else {
+    v_vector = solveWithSettings(*factorization.jacobi_solver,
+                                 solver_settings_,
+                                 j_vector,
+                                 factorization.guess,
+                                 iterations,
+                                 error,
+                                 converged);
+    preconditioner_nnz = factorization.num_nodes;
+  }
+
+  // Matrix and preconditioner values and indices, and the solver vectors
+  const std::size_t memory
+      = (factorization.g_matrix.nonZeros() + preconditioner_nnz)
+            * (sizeof(Connection::Conductance) + sizeof(int))
+        + 6 * factorization.num_nodes * sizeof(double);
+
+  logger_->info(utl::PSM,
+                184,
+                "Iterative solver: {} iterations, relative residual {:.3e}, "
+                "memory {:.1f} MB.",
+                iterations,
+                error,
+                memory / (1024.0 * 1024.0));
+  if (!converged) {
+    logger_->warn(utl::PSM,
+                  185,
+                  "Iterative solver did not converge to a relative residual "
+                  "of {:.3e}.",
+                  solver_settings_.tolerance);
+  }
+
+  // Start the next solve, e.g. with updated currents, from this solution
+  factorization.guess = v_vector;
+
+  return v_vector;
+}
+
+void IRSolver::clearFactorizations()
+{
+  factorizations_.clear();
+}
+
+void IRSolver::solve(sta::Corner* corner,
+                     GeneratedSourceType source_type,
+                     const std::string& source_file)
+{
+  solve(std::vector<sta::Corner*>{corner}, source_type, source_file, 1);
+}
+
+void IRSolver::solve(const std::vector<sta::Corner*>& corners,
+                     GeneratedSourceType source_type,
+                     const std::string& source_file,
+                     const int threads)
+{
+  const utl::DebugScopedTimer timer(logger_, utl::PSM, "timer", 1, "Solve: {}");
+
+  if (network_->isFloorplanningOnly()) {
+    network_->setFloorplanning(false);
+    network_->construct();
+    node_connections_.clear();
+    clearFactorizations();
+  }
+
+  // Power, parasitics and voltages come from STA, which is not thread safe,
+  // so the inputs of all corners are collected first.
+  std::vector<Factorization*> factorizations;
+  std::vector<Voltage> src_voltages;
+  for (sta::Corner* corner : corners) {
+    assertResistanceMap(corner);
+
+    // Reset
+    voltages_[corner].clear();
+    auto& currents = currents_[corner];
+    currents.clear();
+
+    // The factorization only depends on the grid, so it is reused as long as
+    // the grid is unchanged and only the currents differ.
+    Factorization* factorization
+        = prepareFactorization(corner, source_type, source_file);
+    factorizations.push_back(factorization);
+
+    buildNodeCurrentMap(corner, currents);
+
+    // A voltage source file defines the voltage together with the sources.
+    src_voltages.push_back(source_file.empty() ? getNetVoltage(corner)
+                                               : factorization->src_voltage);
+  }
+
+  // Each corner has its own factorization and results, so the corners can
+  // be factorized and solved in parallel.
+  std::vector<std::exception_ptr> errors(corners.size());
+#pragma omp parallel for num_threads(threads) schedule(dynamic, 1) \
+    if (corners.size() > 1)
+  for (std::size_t i = 0; i < corners.size(); i++) {
+    try {
+      factorize(*factorizations[i]);
+      solveCorner(corners[i], *factorizations[i], src_voltages[i]);
+    } catch (...) {
+      errors[i] = std::current_exception();
+    }
+  }
+  for (const std::exception_ptr& error : errors) {
+    if (error) {
+      std::rethrow_exception(error);
+    }
+  }
+
+  for (std::size_t i = 0; i < corners.size(); i++) {
+    solution_voltages_[corners[i]] = src_voltages[i];
+  }
+}
+
+void IRSolver::solveCorner(sta::Corner* corner,
+                           Factorization& factorization,
+                           const Voltage src_voltage)
+{
+  auto& voltages = voltages_.at(corner);
+
+  // Build J
+  const Eigen::VectorXd j_vector
+      = buildCurrentVector(src_voltage, currents_.at(corner), factorization);
+
+  // Solve
+  debugPrint(logger_, utl::PSM, "solve", 1, "Solving system of equations GV=J");
+  Eigen::VectorXd v_vector;
+  if (factorization.type == SolverType::kIterative) {
+    v_vector = solveIterative(factorization, j_vector);
+  } else {
+    const auto& eigen_solver = factorization.solver;
+    v_vector = eigen_solver.solve(j_vector);
+    if (eigen_solver.info() != Eigen::ComputationInfo::Success) {
+      // solving failed
+      if (logger_->debugCheck(utl::PSM, "dump", 1)) {
+        network_->dumpNodes(factorization.node_index);
+        dumpVector(j_vector, "J");
+      }
+      logger_->error(utl::PSM, 12, "Solving V = inv(G)*J failed.");
     }
-    logger_->error(utl::PSM, 12, "Solving V = inv(G)*J failed.");
   }
   debugPrint(logger_,
              utl::PSM,
@@ -1068,15 +1490,16 @@ void IRSolver::solve(sta::Corner* corner,
              "Solving system of equations GV=J complete");
 
   if (logger_->debugCheck(utl::PSM, "dump", 2)) {
-    network_->dumpNodes(node_index);
-    dumpMatrix(g_matrix, "G");
+    network_->dumpNodes(factorization.node_index);
     dumpVector(j_vector, "J");
     dumpVector(v_vector, "V");
   }
-  for (const auto& [node, node_idx] : real_node_index) {
+  for (const auto& [node, node_idx] : factorization.real_node_index) {
     voltages[node] = v_vector[node_idx];
   }
-  solution_voltages_[corner] = src_voltage;
+  for (Node* node : factorization.source_nodes) {
+    voltages[node] = src_voltage;
+  }
 }
 
 std::map<odb::dbInst*, IRSolver::Power> IRSolver::getInstancePower(
@@ -1365,6 +1788,11 @@ void IRSolver::report(sta::Corner* corner) const
   logger_->report("Percentage drop  : {:3.2f} %", results.max_percent);
   logger_->report("######################################");
 
+  writeMetrics(corner, results);
+}
+
+void IRSolver::writeMetrics(sta::Corner* corner, const Results& results) const
+{
   logger_->metric(getMetricKey("design_powergrid__voltage__worst", corner),
                   results.worst_voltage);
   logger_->metric(getMetricKey("design_powergrid__drop__average", corner),
@@ -1385,6 +1813,12 @@ void IRSolver::reportEM(sta::Corner* corner) const
   logger_->report("Number of resistors: {}", results.resistors);
   logger_->report("######################################");
 
+  writeEMMetrics(corner, results);
+}
+
+void IRSolver::writeEMMetrics(sta::Corner* corner,
+                              const EMResults& results) const
+{
   logger_->metric(getMetricKey("design_powergrid__current__max", corner),
                   results.max_current);
   logger_->metric(getMetricKey("design_powergrid__current__average", corner),
@@ -72,7 +72,8 @@ class IRSolver
       const std::map<odb::dbNet*, std::map<sta::Corner*, Voltage>>&
           user_voltages,
       const std::map<odb::dbInst*, std::map<sta::Corner*, Power>>& user_powers,
-      const PDNSim::GeneratedSourceSettings& generated_source_settings);
+      const PDNSim::GeneratedSourceSettings& generated_source_settings,
+      const PDNSim::SolverSettings& solver_settings);
 
   odb::dbNet* getNet() const { return net_; };
 
@@ -81,18 +82,35 @@ class IRSolver
   void solve(sta::Corner* corner,
              GeneratedSourceType source_type,
              const std::string& source_file);
+  // Solve several corners.  The grid topology is shared between the corners
+  // and the corners are factorized and solved in parallel.
+  void solve(const std::vector<sta::Corner*>& corners,
+             GeneratedSourceType source_type,
+             const std::string& source_file,
+             int threads);
 
   void report(sta::Corner* corner) const;
   void reportEM(sta::Corner* corner) const;
+  void writeMetrics(sta::Corner* corner, const Results& results) const;
+  void writeEMMetrics(sta::Corner* corner, const EMResults& results) const;
 
   Results getSolution(sta::Corner* corner) const;
   EMResults getEMSolution(sta::Corner* corner) const;
   PDNSim::IRDropByPoint getIRDrop(odb::dbTechLayer* layer,
                                   sta::Corner* corner) const;
+  void getIRDropMap(odb::dbTechLayer* layer,
+                    sta::Corner* corner,
+                    int bin_size,
+                    PDNSim::GriddedMap& ir_drop_map,
+                    PDNSim::GriddedMap& max_current_map) const;
+  PDNSim::InstanceVoltages getInstanceVoltages(sta::Corner* corner) const;
   ConnectivityResults getConnectivityResults() const;
 
   void enableGui(bool enable);
 
+  // Drop the cached factorizations, e.g. when the source settings change.
+  void clearFactorizations();
+
   void writeErrorFile(const std::string& error_file) const;
   void writeInstanceVoltageFile(const std::string& voltage_file,
                                 sta::Corner* corner) const;
@@ -128,6 +146,48 @@ class IRSolver
   template <typename T>
   using ValueNodeMap = std::map<const Node*, T>;
 
+  using ConductanceMatrix = Eigen::SparseMatrix<Connection::Conductance>;
+  using IncompleteCholeskySolver
+      = Eigen::ConjugateGradient<ConductanceMatrix,
+                                 Eigen::Lower | Eigen::Upper,
+                                 Eigen::IncompleteCholesky<double>>;
+  using JacobiSolver
+      = Eigen::ConjugateGradient<ConductanceMatrix,
+                                 Eigen::Lower | Eigen::Upper,
+                                 Eigen::DiagonalPreconditioner<double>>;
+
+  // Factorized G matrix of a corner along with the source nodes and node
+  // numbering it was built with.  It only depends on the grid and the layer
+  // resistances, so solves with different currents can reuse it.
+  struct Factorization
+  {
+    SolverType type;
+    Preconditioner preconditioner;
+    GeneratedSourceType source_type;
+    std::string source_file;
+    Connection::ResistanceMap resistance;
+    Voltage src_voltage = 0.0;
+    std::vector<std::unique_ptr<SourceNode>> sources;
+    std::map<Node*, std::size_t> real_node_index;
+    std::map<Node*, std::size_t> node_index;
+    std::size_t num_nodes = 0;
+    // G is released by the direct solver once factorized
+    ConductanceMatrix g_matrix;
+    bool factorized = false;
+
+    // Direct solver
+    Eigen::SparseLU<ConductanceMatrix> solver;
+
+    // Iterative solver.  The nodes tied to sources are fixed at the source
+    // voltage and eliminated, which leaves a symmetric positive definite
+    // G matrix over the remaining nodes.
+    Eigen::VectorXd source_conductance;
+    std::set<Node*, Node::Compare> source_nodes;
+    std::unique_ptr<IncompleteCholeskySolver> ichol_solver;
+    std::unique_ptr<JacobiSolver> jacobi_solver;
+    Eigen::VectorXd guess;
+  };
+
   odb::dbBlock* getBlock() const;
   odb::dbTech* getTech() const;
 
@@ -169,9 +229,7 @@ class IRSolver
   bool wasNodeVisited(const std::unique_ptr<Node>& node) const;
   bool wasNodeVisited(const Node* node) const;
 
-  std::map<Node*, Connection::ConnectionSet> getNodeConnectionMap(
-      const Connection::ConnectionMap<Connection::Conductance>& conductance)
-      const;
+  const std::map<Node*, Connection::ConnectionSet>& getNodeConnectionMap();
   void buildNodeCurrentMap(sta::Corner* corner,
                            ValueNodeMap<Current>& currents) const;
   std::map<Node*, std::size_t> assignNodeIDs(const Node::NodeSet& nodes,
@@ -179,20 +237,37 @@ class IRSolver
   std::map<Node*, std::size_t> assignNodeIDs(
       const std::vector<std::unique_ptr<SourceNode>>& nodes,
       std::size_t start = 0) const;
-  void buildCondMatrixAndVoltages(
-      bool is_ground,
+  void buildCondMatrix(
       const std::map<Node*, Connection::ConnectionSet>& node_connections,
-      const ValueNodeMap<Current>& currents,
       const Connection::ConnectionMap<Connection::Conductance>& conductance,
       const std::map<Node*, std::size_t>& node_index,
-      Eigen::SparseMatrix<Connection::Conductance>& g_matrix,
-      Eigen::VectorXd& j_vector) const;
-  void addSourcesToMatrixAndVoltages(
-      Voltage src_voltage,
+      Eigen::SparseMatrix<Connection::Conductance>& g_matrix) const;
+  void addSourcesToMatrix(
       const std::vector<std::unique_ptr<psm::SourceNode>>& sources,
       const std::map<Node*, std::size_t>& node_index,
-      Eigen::SparseMatrix<Connection::Conductance>& g_matrix,
-      Eigen::VectorXd& j_vector) const;
+      Eigen::SparseMatrix<Connection::Conductance>& g_matrix) const;
+  Eigen::VectorXd buildCurrentVector(Voltage src_voltage,
+                                     const ValueNodeMap<Current>& currents,
+                                     const Factorization& factorization) const;
+  // Returns the cached factorization of the corner or a new one with G
+  // built but not yet factorized.
+  Factorization* prepareFactorization(sta::Corner* corner,
+                                      GeneratedSourceType source_type,
+                                      const std::string& source_file);
+  void buildIterativeMatrix(
+      Factorization& factorization,
+      const std::map<Node*, Connection::ConnectionSet>& node_connections,
+      const Connection::ConnectionMap<Connection::Conductance>& conductance)
+      const;
+  void factorize(Factorization& factorization) const;
+  void factorizeDirect(Factorization& factorization) const;
+  void factorizeIterative(Factorization& factorization) const;
+  void setEigenThreads() const;
+  Eigen::VectorXd solveIterative(Factorization& factorization,
+                                 const Eigen::VectorXd& j_vector) const;
+  void solveCorner(sta::Corner* corner,
+                   Factorization& factorization,
+                   Voltage src_voltage);
 
   std::string getMetricKey(const std::string& key, sta::Corner* corner) const;
 
@@ -218,6 +293,7 @@ class IRSolver
   std::map<sta::Corner*, Voltage> solution_voltages_;
 
   const PDNSim::GeneratedSourceSettings& generated_source_settings_;
+  const PDNSim::SolverSettings& solver_settings_;
 
   // Holds nodes that were visited during the open net check
   std::set<const Node*> visited_;
@@ -226,7 +302,11 @@ class IRSolver
   std::map<sta::Corner*, ValueNodeMap<Voltage>> voltages_;
   std::map<sta::Corner*, ValueNodeMap<Current>> currents_;
 
+  std::map<Node*, Connection::ConnectionSet> node_connections_;
+  std::map<sta::Corner*, std::unique_ptr<Factorization>> factorizations_;
+
   static constexpr Current kSpiceFileMinCurrent = 1e-18;
+  static constexpr Connection::Resistance kSourceResistance = 1.0;
 };
 
 }  // namespace psm
@@ -8,17 +8,98 @@
 #include "psm/pdnsim.h"
 #include "odb/db.h"
 
+#include <vector>
+
+// Copy values into a memoryview of doubles with the given shape.
+// numpy.asarray() wraps the memoryview without a further copy.
+static PyObject* psm_valuesToView(const std::vector<double>& values,
+                                  const int rows,
+                                  const int cols)
+{
+  PyObject* buffer = PyByteArray_FromStringAndSize(
+      reinterpret_cast<const char*>(values.data()),
+      values.size() * sizeof(double));
+  if (buffer == nullptr) {
+    return nullptr;
+  }
+  PyObject* bytes_view = PyMemoryView_FromObject(buffer);
+  Py_DECREF(buffer);
+  if (bytes_view == nullptr) {
+    return nullptr;
+  }
+  PyObject* view = nullptr;
+  if (rows < 0) {
+    view = PyObject_CallMethod(bytes_view, "cast", "s", "d");
+  } else {
+    view = PyObject_CallMethod(
+        bytes_view, "cast", "s(ii)", "d", rows, cols);
+  }
+  Py_DECREF(bytes_view);
+  return view;
+}
+
 %}
 
 %include <std_string.i>
 %include <std_map.i>
+%include <std_vector.i>
 
 %import "odb.i"
 %include "../../Exception-py.i"
 
 %template(IRDropByPoint) std::map<odb::Point, double>;
+#ifndef BAZEL
+// Already instantiated by OpenRoad-py.i when the modules are combined
+%template(Corners) std::vector<sta::Corner*>;
+#endif
 
 // For getIRDropForLayer
 WRAP_OBJECT_RETURN_REF(psm::PDNSim::IRDropByPoint, ir_drop);
 
+// For getIRDropMap, each map is returned as (values, [x, y], pitch) where
+// values is a rows x cols memoryview of doubles, i.e.
+// numpy.asarray(values)[row, col].
+%typemap(in, numinputs=0) psm::PDNSim::GriddedMap& (psm::PDNSim::GriddedMap temp) {
+  $1 = &temp;
+}
+
+%typemap(argout) psm::PDNSim::GriddedMap& {
+  PyObject* values = psm_valuesToView($1->values, $1->rows, $1->cols);
+  if (values == nullptr) {
+    SWIG_fail;
+  }
+  PyObject* map = Py_BuildValue("(N[ii]i)",
+                                values,
+                                $1->origin.getX(),
+                                $1->origin.getY(),
+                                $1->pitch);
+  $result = SWIG_Python_AppendOutput($result, map);
+}
+
+// For getInstanceVoltages, returned as (insts, worst_voltage, worst_ir_drop)
+// where the voltages are 1-D memoryviews of doubles aligned with insts.
+%typemap(in, numinputs=0) psm::PDNSim::InstanceVoltages& (psm::PDNSim::InstanceVoltages temp) {
+  $1 = &temp;
+}
+
+%typemap(argout) psm::PDNSim::InstanceVoltages& {
+  PyObject* insts = PyList_New($1->insts.size());
+  for (std::size_t i = 0; i < $1->insts.size(); i++) {
+    PyList_SetItem(insts,
+                   i,
+                   SWIG_NewInstanceObj($1->insts[i], $descriptor(odb::dbInst*), 0));
+  }
+  PyObject* worst_voltage = psm_valuesToView($1->worst_voltage, -1, 0);
+  PyObject* worst_ir_drop = psm_valuesToView($1->worst_ir_drop, -1, 0);
+  if (worst_voltage == nullptr || worst_ir_drop == nullptr) {
+    Py_DECREF(insts);
+    Py_XDECREF(worst_voltage);
+    Py_XDECREF(worst_ir_drop);
+    SWIG_fail;
+  }
+  PyObject* voltages
+      = Py_BuildValue("(NNN)", insts, worst_voltage, worst_ir_drop);
+  $result = SWIG_Python_AppendOutput($result, voltages);
+}
+
 %include "psm/pdnsim.h"
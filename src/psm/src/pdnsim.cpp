@@ -4,6 +4,7 @@
 #include "psm/pdnsim.h"
 
 #include <algorithm>
+#include <cstddef>
 #include <limits>
 #include <memory>
 #include <string>
@@ -110,6 +111,98 @@ void PDNSim::analyzePowerGrid(odb::dbNet* net,
   solver->writeInstanceVoltageFile(voltage_file, corner);
 }
 
+void PDNSim::analyzePowerGrid(
+    const std::vector<odb::dbNet*>& nets,
+    const std::vector<sta::Corner*>& corners,
+    GeneratedSourceType source_type,
+    bool use_prev_solution,
+    bool enable_em,
+    const std::string& error_file,
+    const std::vector<std::string>& voltage_source_files)
+{
+  if (nets.empty() || corners.empty()) {
+    return;
+  }
+  if (!voltage_source_files.empty()
+      && voltage_source_files.size() != nets.size()) {
+    logger_->error(utl::PSM,
+                   189,
+                   "Expected {} voltage source files, one per net, got {}.",
+                   nets.size(),
+                   voltage_source_files.size());
+  }
+
+  for (std::size_t i = 0; i < nets.size(); i++) {
+    odb::dbNet* net = nets[i];
+    if (!checkConnectivity(net, false, error_file, false)) {
+      logger_->error(utl::PSM,
+                     196,
+                     "Unable to analyze {} as its check connectivity failed.",
+                     net->getName());
+    }
+
+    // The network of the net is built once and shared by all the corners
+    auto* solver = getIRSolver(net, false);
+    std::vector<sta::Corner*> solve_corners;
+    for (sta::Corner* corner : corners) {
+      if (!use_prev_solution || !solver->hasSolution(corner)) {
+        solve_corners.push_back(corner);
+      }
+    }
+    if (solve_corners.size() != corners.size()) {
+      logger_->info(utl::PSM, 195, "Reusing previous solution");
+    }
+    const std::string voltage_source_file
+        = voltage_source_files.empty() ? "" : voltage_source_files[i];
+    solver->solve(solve_corners,
+                  source_type,
+                  voltage_source_file,
+                  solver_settings_.threads);
+  }
+
+  logger_->report("########## IR report #################");
+  logger_->report("{:<16} {:<16} {:>10} {:>10} {:>10} {:>10} {:>8}{}",
+                  "Net",
+                  "Corner",
+                  "Supply",
+                  "Worst V",
+                  "Avg drop",
+                  "Worst drop",
+                  "Drop %",
+                  enable_em ? fmt::format(" {:>10}", "Max I") : "");
+  for (odb::dbNet* net : nets) {
+    const IRSolver* solver = solvers_.at(net).get();
+    for (sta::Corner* corner : corners) {
+      const IRSolver::Results results = solver->getSolution(corner);
+      solver->writeMetrics(corner, results);
+
+      std::string em;
+      if (enable_em) {
+        const IRSolver::EMResults em_results = solver->getEMSolution(corner);
+        solver->writeEMMetrics(corner, em_results);
+        em = fmt::format(" {:>10.3e}", em_results.max_current);
+      }
+
+      logger_->report(
+          "{:<16} {:<16} {:>10.3e} {:>10.3e} {:>10.3e} {:>10.3e} {:>8.2f}{}",
+          net->getName(),
+          corner->name(),
+          results.net_voltage,
+          results.worst_voltage,
+          results.avg_ir_drop,
+          results.worst_ir_drop,
+          results.max_percent,
+          em);
+    }
+  }
+  logger_->report("######################################");
+
+  last_corner_ = corners.front();
+  heatmap_->setNet(nets.front());
+  heatmap_->setCorner(last_corner_);
+  heatmap_->update();
+}
+
 bool PDNSim::checkConnectivity(odb::dbNet* net,
                                bool floorplanning,
                                const std::string& error_file,
@@ -158,7 +251,8 @@ psm::IRSolver* PDNSim::getIRSolver(odb::dbNet* net, bool floorplanning)
                                         logger_,
                                         user_voltages_,
                                         user_powers_,
-                                        generated_source_settings_);
+                                        generated_source_settings_,
+                                        solver_settings_);
     addOwner(net->getBlock());
   }
 
@@ -188,6 +282,42 @@ void PDNSim::getIRDropForLayer(odb::dbNet* net,
   ir_drop = find_solver->second->getIRDrop(layer, corner);
 }
 
+void PDNSim::getIRDropMap(odb::dbNet* net,
+                          sta::Corner* corner,
+                          odb::dbTechLayer* layer,
+                          const int bin_size,
+                          GriddedMap& ir_drop_map,
+                          GriddedMap& max_current_map) const
+{
+  if (bin_size <= 0) {
+    logger_->error(utl::PSM, 188, "Bin size must be positive.");
+  }
+  getAnalyzedSolver(net, corner)
+      ->getIRDropMap(layer, corner, bin_size, ir_drop_map, max_current_map);
+}
+
+void PDNSim::getInstanceVoltages(odb::dbNet* net,
+                                 sta::Corner* corner,
+                                 InstanceVoltages& inst_voltages) const
+{
+  inst_voltages = getAnalyzedSolver(net, corner)->getInstanceVoltages(corner);
+}
+
+IRSolver* PDNSim::getAnalyzedSolver(odb::dbNet* net, sta::Corner* corner) const
+{
+  auto find_solver = solvers_.find(net);
+  if (find_solver == solvers_.end()
+      || !find_solver->second->hasSolution(corner)) {
+    logger_->error(utl::PSM,
+                   194,
+                   "{} has not been analyzed for corner {}, run "
+                   "analyze_power_grid first.",
+                   net->getName(),
+                   corner->name());
+  }
+  return find_solver->second.get();
+}
+
 void PDNSim::setGeneratedSourceSettings(const GeneratedSourceSettings& settings)
 {
   if (settings.bump_dx > 0) {
@@ -205,6 +335,20 @@ void PDNSim::setGeneratedSourceSettings(const GeneratedSourceSettings& settings)
   if (settings.strap_track_pitch > 0) {
     generated_source_settings_.strap_track_pitch = settings.strap_track_pitch;
   }
+
+  // Generated sources are part of the factorized grid
+  for (const auto& [net, solver] : solvers_) {
+    solver->clearFactorizations();
+  }
+}
+
+void PDNSim::setSolverSettings(const SolverSettings& settings)
+{
+  if (settings.tolerance <= 0.0) {
+    logger_->error(utl::PSM, 182, "Solver tolerance must be positive.");
+  }
+  solver_settings_ = settings;
+  solver_settings_.threads = std::max(settings.threads, 1);
 }
 
 void PDNSim::clearSolvers()
@@ -37,6 +37,53 @@ using sta::Corner;
   }
 }
 
+%typemap(in) const std::vector<odb::dbNet*>& (std::vector<odb::dbNet*> nets) {
+  int argc;
+  Tcl_Obj **argv;
+  if (Tcl_ListObjGetElements(interp, $input, &argc, &argv) != TCL_OK) {
+    return TCL_ERROR;
+  }
+  for (int i = 0; i < argc; i++) {
+    void *obj;
+    if (!SWIG_IsOK(SWIG_ConvertPtr(argv[i], &obj, $descriptor(odb::dbNet*), 0))) {
+      Tcl_SetResult(interp, const_cast<char*>("list of nets expected"), TCL_STATIC);
+      return TCL_ERROR;
+    }
+    nets.push_back(reinterpret_cast<odb::dbNet*>(obj));
+  }
+  $1 = &nets;
+}
+
+%typemap(in) const std::vector<Corner*>& (std::vector<Corner*> corners) {
+  int argc;
+  Tcl_Obj **argv;
+  if (Tcl_ListObjGetElements(interp, $input, &argc, &argv) != TCL_OK) {
+    return TCL_ERROR;
+  }
+  for (int i = 0; i < argc; i++) {
+    void *obj;
+    if (!SWIG_IsOK(SWIG_ConvertPtr(argv[i], &obj, $descriptor(Corner*), 0))) {
+      Tcl_SetResult(interp, const_cast<char*>("list of corners expected"), TCL_STATIC);
+      return TCL_ERROR;
+    }
+    corners.push_back(reinterpret_cast<Corner*>(obj));
+  }
+  $1 = &corners;
+}
+
+%typemap(in) const std::vector<std::string>& (std::vector<std::string> strings) {
+  int argc;
+  Tcl_Obj **argv;
+  if (Tcl_ListObjGetElements(interp, $input, &argc, &argv) != TCL_OK) {
+    return TCL_ERROR;
+  }
+  for (int i = 0; i < argc; i++) {
+    int length;
+    strings.emplace_back(Tcl_GetStringFromObj(argv[i], &length));
+  }
+  $1 = &strings;
+}
+
 %inline %{
 
 
@@ -54,6 +101,19 @@ analyze_power_grid_cmd(odb::dbNet* net, Corner* corner, psm::GeneratedSourceType
   pdnsim->analyzePowerGrid(net, corner, type, voltage_file, reuse_solution, enable_em, em_file, error_file, voltage_source_file);
 }
 
+void
+analyze_power_grid_multi_cmd(const std::vector<odb::dbNet*>& nets,
+                             const std::vector<Corner*>& corners,
+                             psm::GeneratedSourceType type,
+                             const char* error_file,
+                             bool reuse_solution,
+                             bool enable_em,
+                             const std::vector<std::string>& voltage_source_files)
+{
+  PDNSim* pdnsim = getPDNSim();
+  pdnsim->analyzePowerGrid(nets, corners, type, reuse_solution, enable_em, error_file, voltage_source_files);
+}
+
 void
 add_decap_master(odb::dbMaster *master, float cap)
 {
@@ -107,6 +167,31 @@ void set_source_settings(int bump_dx, int bump_dy, int bump_size, int bump_inter
   pdnsim->setGeneratedSourceSettings(settings);
 }
 
+void set_solver_settings(const char* type,
+                         const char* preconditioner,
+                         double tolerance,
+                         int max_iterations,
+                         int threads)
+{
+  PDNSim::SolverSettings settings;
+  if (strcmp(type, "ITERATIVE") == 0) {
+    settings.type = psm::SolverType::kIterative;
+  } else {
+    settings.type = psm::SolverType::kDirect;
+  }
+  if (strcmp(preconditioner, "JACOBI") == 0) {
+    settings.preconditioner = psm::Preconditioner::kJacobi;
+  } else {
+    settings.preconditioner = psm::Preconditioner::kIncompleteCholesky;
+  }
+  settings.tolerance = tolerance;
+  settings.max_iterations = max_iterations;
+  settings.threads = threads;
+
+  PDNSim* pdnsim = getPDNSim();
+  pdnsim->setSolverSettings(settings);
+}
+
 void
 set_inst_power(odb::dbInst* inst, Corner* corner, float power)
 {
@@ -33,8 +33,8 @@ proc check_power_grid { args } {
 }
 
 sta::define_cmd_args "analyze_power_grid" {
-  -net net_name
-  [-corner corner]
+  -net net_names
+  [-corner corner | -corners corners]
   [-error_file error_file]
   [-voltage_file voltage_file]
   [-enable_em]
@@ -42,12 +42,16 @@ sta::define_cmd_args "analyze_power_grid" {
   [-vsrc voltage_source_file]
   [-source_type FULL|BUMPS|STRAPS]
   [-allow_reuse]
+  [-solver DIRECT|ITERATIVE]
+  [-preconditioner ICHOL|JACOBI]
+  [-tolerance tolerance]
+  [-max_iterations max_iterations]
 }
 
 proc analyze_power_grid { args } {
   sta::parse_key_args "analyze_power_grid" args \
-    keys {-net -corner -voltage_file -error_file -em_outfile -vsrc \
-      -source_type} \
+    keys {-net -corner -corners -voltage_file -error_file -em_outfile -vsrc \
+      -source_type -solver -preconditioner -tolerance -max_iterations} \
     flags {-enable_em -allow_reuse}
   if { ![info exists keys(-net)] } {
     utl::error PSM 58 "Argument -net not specified."
@@ -82,6 +86,78 @@ proc analyze_power_grid { args } {
     }
   }
 
+  set solver "DIRECT"
+  if { [info exists keys(-solver)] } {
+    set solver $keys(-solver)
+    if { [lsearch -exact {DIRECT ITERATIVE} $solver] == -1 } {
+      utl::error PSM 186 "-solver must be DIRECT or ITERATIVE."
+    }
+  }
+
+  set preconditioner "ICHOL"
+  if { [info exists keys(-preconditioner)] } {
+    set preconditioner $keys(-preconditioner)
+    if { [lsearch -exact {ICHOL JACOBI} $preconditioner] == -1 } {
+      utl::error PSM 187 "-preconditioner must be ICHOL or JACOBI."
+    }
+  }
+
+  set tolerance 1e-10
+  if { [info exists keys(-tolerance)] } {
+    set tolerance $keys(-tolerance)
+    sta::check_positive_float "-tolerance" $tolerance
+  }
+
+  set max_iterations 0
+  if { [info exists keys(-max_iterations)] } {
+    set max_iterations $keys(-max_iterations)
+    sta::check_positive_integer "-max_iterations" $max_iterations
+  }
+
+  psm::set_solver_settings $solver $preconditioner $tolerance $max_iterations \
+    [ord::thread_count]
+
+  if { [llength $keys(-net)] > 1 || [info exists keys(-corners)] } {
+    if { [info exists keys(-corner)] && [info exists keys(-corners)] } {
+      utl::error PSM 190 "-corner and -corners cannot be used together."
+    }
+    if { $voltage_file != "" || $em_file != "" } {
+      utl::error PSM 191 \
+        "-voltage_file and -em_outfile require a single net and corner."
+    }
+    if { $voltage_source_file != "" \
+        && [llength $voltage_source_file] != [llength $keys(-net)] } {
+      utl::error PSM 192 "-vsrc requires one voltage source file per net."
+    }
+
+    set nets {}
+    foreach net_name $keys(-net) {
+      lappend nets [psm::find_net $net_name]
+    }
+    set corners {}
+    if { [info exists keys(-corners)] } {
+      foreach corner_name $keys(-corners) {
+        set corner [sta::find_corner $corner_name]
+        if { $corner == "NULL" } {
+          utl::error PSM 193 "Unable to find corner: $corner_name"
+        }
+        lappend corners $corner
+      }
+    } else {
+      lappend corners [sta::parse_corner_or_default keys]
+    }
+
+    psm::analyze_power_grid_multi_cmd \
+      $nets \
+      $corners \
+      $source_type \
+      $error_file \
+      [info exists flags(-allow_reuse)] \
+      $enable_em \
+      $voltage_source_file
+    return
+  }
+
   psm::analyze_power_grid_cmd \
     [psm::find_net $keys(-net)] \
     [sta::parse_corner_or_default keys] \
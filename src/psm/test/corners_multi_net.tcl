@@ -0,0 +1,33 @@
+# analyze_power_grid of two nets on two corners in one run matches the
+# single net and corner runs
+source helpers.tcl
+
+read_lef Nangate45/Nangate45.lef
+read_def Nangate45_data/gcd.def
+define_corners "min" "max"
+read_liberty -corner max Nangate45/Nangate45_slow.lib
+read_liberty -corner min Nangate45/Nangate45_fast.lib
+read_sdc Nangate45_data/gcd.sdc
+
+source Nangate45_data/Nangate45_corners.rc
+
+tee -quiet -variable multi_log {
+  analyze_power_grid -net {VDD VSS} -corners {min max} \
+    -vsrc {Vsrc_gcd_vdd.loc Vsrc_gcd_vss.loc}
+}
+puts "Reported [regexp -all -line {^(VDD|VSS) +(min|max) } $multi_log] rows."
+
+foreach { net vsrc } { VDD Vsrc_gcd_vdd.loc VSS Vsrc_gcd_vss.loc } {
+  foreach corner { min max } {
+    tee -quiet -variable single_log \
+      "analyze_power_grid -net $net -corner $corner -vsrc $vsrc"
+    regexp {Worstcase IR drop: (\S+) V} $single_log -> single_drop
+    regexp -line "^$net +$corner +\\S+ +\\S+ +\\S+ +(\\S+)" $multi_log \
+      -> multi_drop
+    if { abs($multi_drop - $single_drop) <= 0.01 * abs($single_drop) } {
+      puts "$net $corner: same worst IR drop as a single run."
+    } else {
+      puts "$net $corner: worst IR drop $multi_drop instead of $single_drop."
+    }
+  }
+}
@@ -0,0 +1,25 @@
+# The iterative solver finds the worst IR drop of the direct solver
+source helpers.tcl
+
+read_lef Nangate45/Nangate45.lef
+read_def Nangate45_data/gcd.def
+read_liberty Nangate45/Nangate45_typ.lib
+read_sdc Nangate45_data/gcd.sdc
+
+proc worst_ir_drop { solver preconditioner } {
+  tee -quiet -variable log \
+    "analyze_power_grid -net VDD -vsrc Vsrc_gcd_vdd.loc -solver $solver \
+      -preconditioner $preconditioner"
+  regexp {Worstcase IR drop: (\S+) V} $log -> drop
+  return $drop
+}
+
+set direct_drop [worst_ir_drop DIRECT ICHOL]
+foreach preconditioner { ICHOL JACOBI } {
+  set drop [worst_ir_drop ITERATIVE $preconditioner]
+  if { abs($drop - $direct_drop) <= 0.01 * $direct_drop } {
+    puts "$preconditioner: worst IR drop within 1% of the direct solver."
+  } else {
+    puts "$preconditioner: worst IR drop $drop instead of $direct_drop."
+  }
+}
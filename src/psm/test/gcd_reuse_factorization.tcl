@@ -0,0 +1,31 @@
+# A second solve of the same grid reuses the factorization of the G matrix
+# and reports the same IR drop
+source helpers.tcl
+
+read_lef Nangate45/Nangate45.lef
+read_def Nangate45_data/gcd.def
+read_liberty Nangate45/Nangate45_typ.lib
+read_sdc Nangate45_data/gcd.sdc
+
+proc analyze { } {
+  tee -quiet -variable log {
+    analyze_power_grid -net VDD -vsrc Vsrc_gcd_vdd.loc
+  }
+  set reused [regexp "Reusing factorization of the G matrix" $log]
+  regexp {########## IR report #+\n.*?\n#+\n} $log report
+  return [list $reused $report]
+}
+
+set_debug_level PSM solve 1
+lassign [analyze] reused1 report1
+lassign [analyze] reused2 report2
+set_debug_level PSM solve 0
+
+puts "First solve reused the factorization: $reused1"
+puts "Second solve reused the factorization: $reused2"
+if { $report1 == $report2 } {
+  puts "Same IR report."
+} else {
+  puts $report1
+  puts $report2
+}
@@ -0,0 +1,40 @@
+from openroad import Design, Tech, Timing
+import helpers
+import pdnsim_aux
+
+tech = Tech()
+tech.readLef("Nangate45/Nangate45.lef")
+tech.readLiberty("Nangate45/Nangate45_typ.lib")
+
+design = helpers.make_design(tech)
+design.readDef("Nangate45_data/gcd.def")
+design.evalTclString("read_sdc Nangate45_data/gcd.sdc")
+
+pdnsim_aux.check_power_grid(design, net="VDD", require_bterm=False)
+pdnsim_aux.analyze_power_grid(design, vsrc="Vsrc_gcd_vdd.loc", net="VDD")
+
+pdnsim = design.getPDNSim()
+block = design.getBlock()
+corner = Timing(design).cmdCorner()
+layer = tech.getTech().findLayer("metal1")
+bin_size = 10 * block.getDbUnitsPerMicron()
+
+vdd = block.findNet("VDD")
+(ir_drop, origin, pitch), (max_current, _, _) = pdnsim.getIRDropMap(
+    vdd, corner, layer, bin_size
+)
+print("IR drop map", ir_drop.shape, origin, pitch)
+print("Max current map", max_current.shape)
+insts, worst_voltage, worst_ir_drop = pdnsim.getInstanceVoltages(vdd, corner)
+print("Instances", len(insts) == len(worst_voltage) == len(worst_ir_drop))
+
+# VSS has not been analyzed
+vss = block.findNet("VSS")
+try:
+    pdnsim.getIRDropMap(vss, corner, layer, bin_size)
+except Exception as inst:
+    print(inst.args[0])
+try:
+    pdnsim.getInstanceVoltages(vss, corner)
+except Exception as inst:
+    print(inst.args[0])
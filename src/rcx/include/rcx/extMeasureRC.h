@@ -5,6 +5,7 @@
 
 #include <cstdio>
 #include <string>
+#include <vector>
 
 #include "odb/array1.h"
 #include "odb/db.h"
@@ -80,6 +81,11 @@ struct CouplingConfig
       = 7000;        // Threshold for length-based calculations
   bool length_flag;  // Whether to use length-based calculations
 
+  // Diagonal coupling search settings
+  static constexpr int DIAG_LEVEL_LIMIT = 3;  // Levels searched on each side
+  static constexpr int DIAG_TRACK_LIMIT = 4;  // Tracks searched on each side
+  static constexpr int DIAG_MAX_DIST = 500;   // Maximum diagonal distance
+
   // Calculation modes
   bool new_calc_flow;   // Use new calculation flow
   bool vertical_cap;    // Enable vertical capacitance calculation
@@ -222,6 +228,26 @@ struct CouplingDimensionParams
   }
 };
 
+// Markers of the tracks [tr_lo, tr_lo + wires.size()) of a level
+struct FirstWireSeed
+{
+  uint level;
+  uint tr_lo;
+  std::vector<Wire*> wires;
+};
+
+// Tracks [tr_lo, tr_hi) of a level extracted as one parallel task. The
+// markers of the levels below are not reset between tracks, so the band
+// starts from the lower level markers the serial flow has when it reaches
+// tr_lo.
+struct CouplingBand
+{
+  uint level;
+  uint tr_lo;
+  uint tr_hi;
+  std::vector<FirstWireSeed> seeds;
+};
+
 struct BoundaryData;
 
 class SegmentTables
@@ -349,6 +375,16 @@ class extMeasureRC : public extMeasure
                                   int max_level,
                                   CouplingDimensionParams& opts,
                                   odb::Ath__array1D<Wire*>** firstWireTable);
+  // Move the markers like GetCouplingSegments does on the wire level and on
+  // diagonal level jj, without making segments
+  void FindCoupleWires(int tr,
+                       Wire* w,
+                       CouplingDimensionParams& opts,
+                       odb::Ath__array1D<Wire*>** firstWireTable);
+  void FindDiagonalCoupleWires(Wire* w,
+                               uint dir,
+                               int jj,
+                               odb::Ath__array1D<Wire*>** firstWireTable);
   bool VerticalDiagonalCouplingAndCrossOverlap(Wire* w,
                                                extSegment* s,
                                                int overMet,
@@ -854,6 +890,29 @@ class extMeasureRC : public extMeasure
                    int totWireCnt,
                    uint& totalWiresExtracted,
                    float& previous_percent_extracted);
+  // Extract the wires on tracks [trLo, trHi) of a level
+  void CouplingFlowTracks(uint dir,
+                          uint level,
+                          uint trLo,
+                          uint trHi,
+                          uint couplingDist,
+                          CouplingConfig& config,
+                          CouplingState& counts,
+                          SegmentTables& segments,
+                          odb::Ath__array1D<Wire*>** firstWireTable,
+                          int totWireCnt,
+                          uint& totalWiresExtracted,
+                          float& previous_percent_extracted);
+  // Replay the marker moves of the serial flow to seed the bands
+  void SeedCouplingBands(uint dir,
+                         uint couplingDist,
+                         std::vector<CouplingBand>& bands);
+  // CouplingFlow on bands of tracks with the extMain thread count
+  void CouplingFlowParallel(uint dir,
+                            uint couplingDist,
+                            int totWireCnt,
+                            uint& totalWiresExtracted,
+                            float& previous_percent_extracted);
   // dkf 10172023
   // dkf 061824 int CouplingFlow(uint dir, uint couplingDist, uint
   // diag_met_limit);
@@ -111,6 +111,12 @@ class extDistRC
   void interpolate(uint d, extDistRC* rc1, extDistRC* rc2);
   double interpolate_res(uint d, extDistRC* rc2);
 
+  // Scratch result of an interpolated lookup in table for the calling
+  // thread, or nullptr on the main thread which uses the scratch entry of
+  // the table itself.  This lets the coupling flow read the models from
+  // several threads.
+  static extDistRC* threadScratch(const void* table);
+
  private:
   int sep_;
   double coupling_;
@@ -152,7 +158,7 @@ class extDistRCTable
   extDistRC* getComputeRC(uint dist);
   extDistRC* getRC(uint s, bool compute);
   extDistRC* getComputeRC_res(uint dist1, uint dist2);
-  extDistRC* findIndexed_res(uint dist1, uint dist2);
+  extDistRC* findIndexed_res(uint index, uint dist1, uint dist2);
   int getComputeRC_maxDist();
   uint writeRules(FILE* fp,
                   odb::Ath__array1D<extDistRC*>* table,
@@ -197,6 +203,7 @@ class extDistRCTable
  private:
   void makeCapTableOver();
   void makeCapTableUnder();
+  extDistRC* resResult(extDistRC* rc, double diag);
 
   odb::Ath__array1D<extDistRC*>* measureTable_;
   odb::Ath__array1D<extDistRC*>* computeTable_;
@@ -1270,8 +1277,8 @@ class extMeasure
                    uint trackn,
                    odb::Ath__array1D<SEQ*>* residueSeq);
 
-  odb::dbCCSeg* makeCcap(odb::dbRSeg* rseg1, odb::dbRSeg* rseg2, double ccCap);
-  void addCCcap(odb::dbCCSeg* ccap, double v, uint model);
+  bool isCouplingCap(odb::dbRSeg* rseg1, odb::dbRSeg* rseg2, double ccCap);
+  void addCCcap(odb::dbRSeg* rseg1, odb::dbRSeg* rseg2, double v, uint model);
   void addFringe(odb::dbRSeg* rseg1,
                  odb::dbRSeg* rseg2,
                  double frCap,
@@ -1638,6 +1645,41 @@ class extCorner
   float _gndFactor;
   extCorner* _extCornerPtr;
 };
+// Updates of the extracted values of dbRSeg and dbCCSeg objects recorded
+// while a band of tracks is extracted by the parallel coupling flow.  They
+// are applied to the database after all bands are extracted, in band order,
+// so the result does not depend on the thread schedule.
+class extRCJournal
+{
+ public:
+  void addCapacitance(odb::dbRSeg* rseg, double cap, int dbIndex);
+  void addResistance(odb::dbRSeg* rseg, double res, int dbIndex);
+  void addCoupling(odb::dbCapNode* node1,
+                   odb::dbCapNode* node2,
+                   double cap,
+                   int dbIndex);
+  void apply() const;
+
+ private:
+  enum UpdateType
+  {
+    CAPACITANCE,
+    RESISTANCE,
+    COUPLING
+  };
+  struct Update
+  {
+    UpdateType type;
+    odb::dbRSeg* rseg;
+    odb::dbCapNode* node1;
+    odb::dbCapNode* node2;
+    int dbIndex;
+    double value;
+  };
+
+  std::vector<Update> updates_;
+};
+
 // CLEANUP dkf 10302024
 struct LayerDimensionData
 {
@@ -1870,6 +1912,9 @@ class extMain
 
   bool _v2;  // new flow dkf: 10302023
 
+  // Threads used by the coupling flow of the v2 flow
+  int _threads = 1;
+
   void skip_via_wires(bool v) { _skip_via_wires = v; };
   void printUpdateCoup(uint netId1,
                        uint netId2,
@@ -2089,6 +2134,18 @@ class extMain
   bool updateCoupCap(odb::dbRSeg* rseg1, odb::dbRSeg* rseg2, int jj, double v);
   double updateRes(odb::dbRSeg* rseg, double res, uint model);
 
+  // Add to the extracted values of the database, or record the update in the
+  // journal of the calling thread when it has one.  The returned value is
+  // the total without the updates pending in the journal.
+  static void setThreadJournal(extRCJournal* journal);
+  double addCapacitance(odb::dbRSeg* rseg, double cap, int dbIndex);
+  double addResistance(odb::dbRSeg* rseg, double res, int dbIndex);
+  // Returns nullptr when the update is recorded in a journal.
+  odb::dbCCSeg* addCoupling(odb::dbCapNode* node1,
+                            odb::dbCapNode* node2,
+                            double cap,
+                            int dbIndex);
+
   uint getExtBbox(int* x1, int* y1, int* x2, int* y2);
 
   void setupMapping(uint itermCnt = 0);
@@ -2206,7 +2263,8 @@ class extMain
                 bool moreToRead = false,
                 bool diff = false,
                 bool calib = false,
-                int app_print_limit = 0);
+                int app_print_limit = 0,
+                int threads = 1);
   uint readSPEFincr(char* filename);
   void writeSPEF(bool stop);
   uint writeSPEF(uint netId,
@@ -2236,7 +2294,8 @@ class extMain
                  int corner,
                  const char* corner_name,
                  const char* spef_version,
-                 bool parallel);
+                 bool parallel,
+                 int threads = 1);
   uint writeNetSPEF(odb::dbNet* net, double resBound, uint debug);
   uint makeITermCapNode(uint id, odb::dbNet* net);
   uint makeBTermCapNode(uint id, odb::dbNet* net);
@@ -3,8 +3,10 @@
 
 #pragma once
 
+#include <cstddef>
 #include <cstdio>
 #include <map>
+#include <memory>
 #include <vector>
 
 #include "odb/array1.h"
@@ -16,6 +18,7 @@
 
 namespace utl {
 class Logger;
+class OutStreamHandler;
 }
 
 namespace rcx {
@@ -124,6 +127,13 @@ class extSpef
   void writeCNodeNumber();
 
   bool closeOutFile();
+  void flushOutBuffer();
+  extSpef* makeWriteWorker();
+  void writeNets(const std::vector<odb::dbNet*>& nets, uint repChunk);
+  void writeNetsParallel(const std::vector<odb::dbNet*>& nets,
+                         uint start,
+                         uint end,
+                         std::vector<extSpef*>& workers);
   bool isCapNodeExcluded(odb::dbCapNode* node);
   void writeBlock(char* nodeCoord,
                   const char* capUnit,
@@ -315,6 +325,11 @@ class extSpef
 
   char _outFile[1024];
   FILE* _outFP = nullptr;
+  // Compressed output: the text is written to the memory stream _outFP and
+  // flushed into _gzStream.
+  std::unique_ptr<utl::OutStreamHandler> _gzStream;
+  char* _outBuf = nullptr;
+  size_t _outBufSize = 0;
 
   Ath__parser* _parser = nullptr;
 
@@ -503,6 +518,9 @@ class extSpef
   bool _moreToRead;
   bool _termJxy = false;
   bool _incrPlusCcNets = false;
+  // Threads formatting the *D_NET sections when writing, and breaking the
+  // lines into words when reading
+  int _threads = 1;
   odb::dbBTerm* _ccbterm1;
   odb::dbBTerm* _ccbterm2;
   odb::dbITerm* _cciterm1;
@@ -60,6 +60,7 @@ struct ExtractOptions
   bool _v2 = false;
   float _version = 2.2;
   int _wire_extracted_progress_count = 50000;
+  int thread_count = 1;
 
   int _dbg = 0;
 };
@@ -73,6 +74,7 @@ struct SpefOptions
   int corner = -1;
   const int debug = 0;
   const bool parallel = false;
+  int thread_count = 1;
   const bool init = false;
   const bool end = false;
   const bool use_ids = false;
@@ -123,6 +125,7 @@ struct ReadSpefOpts
   bool no_cap_num_collapse = false;
   const char* cap_node_map_file = nullptr;
   bool log = false;
+  int thread_count = 1;
 };
 
 struct DiffOptions
@@ -145,6 +148,7 @@ struct DiffOptions
   float upper_guard = -1;
   bool m_map = false;
   bool log = false;
+  int thread_count = 1;
 };
 struct PatternOptions
 {
@@ -176,6 +176,9 @@ class Track
   Grid* getGrid();
   Wire* getWire_Linear(uint markerCnt, uint id);
   Wire* getNextWire(Wire* wire);
+  // First wire in the search markers; unlike getNextWire(nullptr) it does
+  // not move the search marker so it can be called from several threads.
+  Wire* getFirstWire();
   uint search(int xy1,
               int xy2,
               uint markIndex1,
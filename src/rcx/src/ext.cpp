@@ -292,7 +292,8 @@ void Ext::write_spef(const SpefOptions& options)
                   options.corner,
                   name,
                   spef_version_,
-                  options.parallel);
+                  options.parallel,
+                  options.thread_count);
 }
 
 void Ext::read_spef(ReadSpefOpts& opt)
@@ -341,7 +342,8 @@ void Ext::read_spef(ReadSpefOpts& opt)
                  opt.more_to_read,
                  false /*diff*/,
                  false /*calibrate*/,
-                 opt.app_print_limit);
+                 opt.app_print_limit,
+                 opt.thread_count);
 
   for (int ii = 1; ii < parser.getWordCnt(); ii++) {
     _ext->readSPEFincr(parser.get(ii));
@@ -392,7 +394,8 @@ void Ext::diff_spef(const DiffOptions& opt)
                  false /*moreToRead*/,
                  true /*diff*/,
                  false /*calibrate*/,
-                 0);
+                 0,
+                 opt.thread_count);
 }
 
 void Ext::calibrate(const std::string& spef_file,
@@ -72,6 +72,7 @@ extract(const char* ext_model_file,
   opts._version= version;
 
   opts._dbg= dbg;
+  opts.thread_count = ord::OpenRoad::openRoad()->getThreadCount();
   
   ext->extract(opts);
 }
@@ -91,6 +92,7 @@ write_spef(const char* file,
   opts.nets = nets;
   opts.net_id = net_id;
   opts.coordinates= coordinates;
+  opts.thread_count = ord::OpenRoad::openRoad()->getThreadCount();
   
   ext->write_spef(opts);
 }
@@ -124,6 +126,7 @@ diff_spef(const char* file,
   opts.r_conn = r_conn;
   opts.spef_corner = spef_corner;
   opts.ext_corner = ext_corner;
+  opts.thread_count = ord::OpenRoad::openRoad()->getThreadCount();
   
   ext->diff_spef(opts);
 }
@@ -220,6 +223,7 @@ read_spef(const char* file)
   
   ReadSpefOpts opts;
   opts.file = file;
+  opts.thread_count = ord::OpenRoad::openRoad()->getThreadCount();
   
   ext->read_spef(opts);
 }
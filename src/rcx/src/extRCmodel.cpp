@@ -10,10 +10,12 @@
 #include <cstring>
 #include <filesystem>
 #include <limits>
+#include <unordered_map>
 
 #include "odb/array1.h"
 #include "odb/db.h"
 #include "odb/util.h"
+#include "omp.h"
 #include "parse.h"
 #include "rcx/extRCap.h"
 #include "rcx/extprocess.h"
@@ -62,6 +64,15 @@ double extDistRC::interpolate_res(uint d, extDistRC* rc2)
   return lineSegment(d, coupling_, rc2->coupling_, res_, rc2->res_);
 }
 
+extDistRC* extDistRC::threadScratch(const void* table)
+{
+  if (omp_get_thread_num() == 0) {
+    return nullptr;
+  }
+  thread_local std::unordered_map<const void*, extDistRC> scratch;
+  return &scratch[table];
+}
+
 void extDistRC::set(uint d, double cc, double fr, double a, double r)
 {
   sep_ = d;
@@ -679,7 +690,10 @@ extDistRC* extDistRCTable::getComputeRC(uint dist)
       if (dist <= 2 * lastDist) {  // send Inf dist
 
         uint cnt = measureTable_->getCnt();
-        extDistRC* rc31 = measureTable_->geti(31);
+        extDistRC* rc31 = extDistRC::threadScratch(this);
+        if (rc31 == nullptr) {
+          rc31 = measureTable_->geti(31);
+        }
         extDistRC* rc2 = measureTable_->get(cnt - 2);
         extDistRC* rc3 = measureTable_->get(cnt - 3);
 
@@ -1793,13 +1807,17 @@ extDistRC* extDistWidthRCTable::getRC_99(uint mou, uint w, uint dw, uint ds)
     return rc2;
   }
 
-  _rc31->sep_ = ds;
+  extDistRC* rc31 = extDistRC::threadScratch(this);
+  if (rc31 == nullptr) {
+    rc31 = _rc31;
+  }
+  rc31->sep_ = ds;
 
   uint lastDist = _lastDiagDist->geti(mou);
   if (ds > lastDist) {  // extrapolate
-    _rc31->fringe_ = (rc2->fringe_ / ds) * lastDist;
+    rc31->fringe_ = (rc2->fringe_ / ds) * lastDist;
 
-    return _rc31;
+    return rc31;
   }
   // interpolate;
   uint s1 = _diagDistTable[mou]->get(dsIndex - 1);
@@ -1811,9 +1829,9 @@ extDistRC* extDistWidthRCTable::getRC_99(uint mou, uint w, uint dw, uint ds)
   extDistRC* rc1
       = _rcDiagDistTable[mou][wIndex][dwIndex][dsIndex - 1]->getRC_99();
 
-  _rc31->fringe_ = lineSegment(ds, s1, s2, rc1->fringe_, rc2->fringe_);
+  rc31->fringe_ = lineSegment(ds, s1, s2, rc1->fringe_, rc2->fringe_);
 
-  return _rc31;
+  return rc31;
 }
 
 double extRCModel::getFringeOver(uint met, uint mUnder, uint w, uint s)
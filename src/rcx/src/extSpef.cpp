@@ -3,15 +3,19 @@
 
 #include "rcx/extSpef.h"
 
-#include <stdio.h>  // NOLINT(modernize-deprecated-headers): for popen()
+#include <stdio.h>  // NOLINT(modernize-deprecated-headers): open_memstream
 
 #include <algorithm>
+#include <atomic>
 #include <cctype>
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
 #include <ctime>
+#include <exception>
 #include <limits>
+#include <memory>
+#include <string>
 #include <vector>
 
 #include "name.h"
@@ -21,9 +25,11 @@
 #include "odb/dbSet.h"
 #include "odb/dbTypes.h"
 #include "odb/geom.h"
+#include "omp.h"
 #include "parse.h"
 #include "rcx/extRCap.h"
 #include "utl/Logger.h"
+#include "utl/ScopedTemporaryFile.h"
 
 using odb::Ath__array1D;
 using odb::dbBlock;
@@ -1226,6 +1232,7 @@ bool extSpef::setInSpef(const char* filename, const bool onlyOpen)
     _nodeParser = new Ath__parser(logger_);
     _parser = new Ath__parser(logger_);
   }
+  _parser->setBlockMode(_threads);
   _parser->openFile(filename);
 
   return true;
@@ -1240,9 +1247,16 @@ bool extSpef::setOutSpef(const char* filename)
   strcpy(_outFile, filename);
 
   if (_gzipFlag) {
-    char cmd[2048];
-    sprintf(cmd, "gzip -1 > %s.gz", filename);
-    _outFP = popen(cmd, "w");
+    std::string gzName = filename;
+    if (gzName.size() < 3 || gzName.compare(gzName.size() - 3, 3, ".gz")) {
+      gzName += ".gz";
+    }
+    try {
+      _gzStream = std::make_unique<utl::OutStreamHandler>(gzName.c_str(), true);
+    } catch (const std::exception&) {
+      return false;
+    }
+    _outFP = open_memstream(&_outBuf, &_outBufSize);
   } else {
     _outFP = fopen(filename, "w");
   }
@@ -1260,15 +1274,155 @@ bool extSpef::closeOutFile()
     return false;
   }
 
-  if (_gzipFlag) {
-    pclose(_outFP);
+  if (_gzStream) {
+    flushOutBuffer();
+    fclose(_outFP);
+    free(_outBuf);
+    _outBuf = nullptr;
+    _outBufSize = 0;
+    // Finishes the compressed stream and renames it to the output file.
+    _gzStream = nullptr;
   } else {
     fclose(_outFP);
   }
+  _outFP = nullptr;
 
   return true;
 }
 
+void extSpef::flushOutBuffer()
+{
+  if (!_gzStream) {
+    return;
+  }
+  fflush(_outFP);
+  _gzStream->getStream().write(_outBuf, _outBufSize);
+  rewind(_outFP);
+}
+
+extSpef* extSpef::makeWriteWorker()
+{
+  extSpef* worker = new extSpef(_tech, _block, logger_, _version, _ext);
+  worker->_cornerBlock = _cornerBlock;
+  worker->_cornerCnt = _cornerCnt;
+  worker->_cornersPerBlock = _cornersPerBlock;
+  worker->_active_corner_cnt = _active_corner_cnt;
+  std::copy(std::begin(_active_corner_number),
+            std::end(_active_corner_number),
+            std::begin(worker->_active_corner_number));
+  strcpy(worker->_delimiter, _delimiter);
+  worker->_cap_unit = _cap_unit;
+  worker->_res_unit = _res_unit;
+  worker->_preserveCapValues = _preserveCapValues;
+  worker->_symmetricCCcaps = _symmetricCCcaps;
+  worker->_singleP = _singleP;
+  worker->_wConn = _wConn;
+  worker->_wCap = _wCap;
+  worker->_wOnlyCCcap = _wOnlyCCcap;
+  worker->_wRes = _wRes;
+  worker->_noCnum = _noCnum;
+  worker->_noBackSlash = _noBackSlash;
+  worker->_foreign = _foreign;
+  worker->_writingNodeCoords = _writingNodeCoords;
+  worker->_writeNameMap = _writeNameMap;
+  worker->_termJxy = _termJxy;
+  worker->_childBlockInstBaseMap = _childBlockInstBaseMap;
+  worker->_childBlockNetBaseMap = _childBlockNetBaseMap;
+  if (!_preserveCapValues) {
+    worker->setupMappingForWrite();
+  }
+  return worker;
+}
+
+void extSpef::writeNets(const std::vector<dbNet*>& nets, const uint repChunk)
+{
+  std::vector<extSpef*> workers;
+  if (_threads > 1) {
+    for (int ii = 0; ii < _threads; ii++) {
+      workers.push_back(makeWriteWorker());
+    }
+  }
+
+  constexpr uint netChunk = 10000;
+  uint cnt = 0;
+  for (uint start = 0; start < nets.size(); start += netChunk) {
+    const uint end = std::min<uint>(start + netChunk, nets.size());
+    if (workers.empty()) {
+      for (uint ii = start; ii < end; ii++) {
+        writeNet(nets[ii], 0.0, 0);
+      }
+    } else {
+      writeNetsParallel(nets, start, end, workers);
+    }
+    flushOutBuffer();
+
+    for (; cnt < end; cnt++) {
+      if ((cnt + 1) % repChunk == 0) {
+        logger_->info(RCX, 42, "{} nets finished", cnt + 1);
+      }
+    }
+  }
+
+  for (extSpef* worker : workers) {
+    delete worker;
+  }
+}
+
+void extSpef::writeNetsParallel(const std::vector<dbNet*>& nets,
+                                const uint start,
+                                const uint end,
+                                std::vector<extSpef*>& workers)
+{
+  // The instance map ids depend on the largest net id written so far, so
+  // they are computed in net order before the nets are split.
+  std::vector<uint> baseNameMaps(end - start);
+  for (uint ii = start; ii < end; ii++) {
+    baseNameMaps[ii - start] = _baseNameMap;
+    if (!nets[ii]->getCapNodes().empty()) {
+      getNetMapId(nets[ii]->getId());
+    }
+  }
+
+  // Every thread writes a contiguous range of the nets into its own buffer;
+  // the buffers are appended to the output in thread order.
+  const int threads = workers.size();
+  const uint netsPerThread = (end - start + threads - 1) / threads;
+  std::vector<char*> buffers(threads, nullptr);
+  std::vector<size_t> sizes(threads, 0);
+  std::vector<std::exception_ptr> errors(threads);
+  std::atomic_bool failed = false;
+#pragma omp parallel for num_threads(threads) schedule(static, 1)
+  for (int t = 0; t < threads; t++) {
+    extSpef* worker = workers[t];
+    worker->_outFP = open_memstream(&buffers[t], &sizes[t]);
+    const uint lo = std::min(end, start + t * netsPerThread);
+    const uint hi = std::min(end, lo + netsPerThread);
+    try {
+      for (uint ii = lo; ii < hi && !failed; ii++) {
+        worker->_baseNameMap = baseNameMaps[ii - start];
+        worker->writeNet(nets[ii], 0.0, 0);
+      }
+    } catch (...) {
+      errors[t] = std::current_exception();
+      failed = true;
+    }
+    fclose(worker->_outFP);
+    worker->_outFP = nullptr;
+  }
+
+  for (int t = 0; t < threads; t++) {
+    if (!failed) {
+      fwrite(buffers[t], 1, sizes[t], _outFP);
+    }
+    free(buffers[t]);
+  }
+  for (const std::exception_ptr& error : errors) {
+    if (error) {
+      std::rethrow_exception(error);
+    }
+  }
+}
+
 void extSpef::writeBlockPorts()
 {
   if (_partial && !_btermFound) {
@@ -1561,8 +1715,7 @@ void extSpef::writeBlock(const char* nodeCoord,
   _cornersPerBlock = _cornerCnt;
   _cornerBlock = _block;
 
-  uint cnt = 0;
-
+  std::vector<dbNet*> nets;
   for (dbNet* net : _block->getNets()) {
     if (!tnets.empty() && !net->isMarked()) {
       if (!_incrPlusCcNets || net->getCcCount() == 0) {
@@ -1576,18 +1729,15 @@ void extSpef::writeBlock(const char* nodeCoord,
     if (_wOnlyClock && type != dbSigType::CLOCK) {
       continue;
     }
-    writeNet(net, 0.0, 0);
-    ++cnt;
-
-    constexpr uint repChunk = 100000;
-    if (cnt % repChunk == 0) {
-      logger_->info(RCX, 42, "{} nets finished", cnt);
-    }
+    nets.push_back(net);
   }
+  constexpr uint repChunk = 100000;
+  writeNets(nets, repChunk);
+
   for (dbNet* net : tnets) {
     net->setMark(false);
   }
-  logger_->info(RCX, 443, "{} nets finished", cnt);
+  logger_->info(RCX, 443, "{} nets finished", nets.size());
 
   closeOutFile();
 }
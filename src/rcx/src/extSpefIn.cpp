@@ -2,6 +2,7 @@
 // Copyright (c) 2019-2025, The OpenROAD Authors
 
 #include <algorithm>
+#include <chrono>
 #include <cmath>
 #include <cstdio>
 #include <cstring>
@@ -2286,6 +2287,7 @@ uint extSpef::readBlock(const uint debug,
                         const int fixLoop,
                         bool& rsegCoord)
 {
+  const auto start = std::chrono::steady_clock::now();
   _stampWire = stampWire;
   _rConn = rConn;
   _rCap = rCap;
@@ -2610,6 +2612,18 @@ uint extSpef::readBlock(const uint debug,
       _gndCapCnt,
       _ccCapCnt);
 
+  const std::chrono::duration<double> elapsed
+      = std::chrono::steady_clock::now() - start;
+  const double mbytes = _parser->getBytesRead() / 1e6;
+  debugPrint(logger_,
+             RCX,
+             "spef",
+             1,
+             "Read {:.1f} MB of SPEF in {:.2f} seconds ({:.1f} MB/s).",
+             mbytes,
+             elapsed.count(),
+             mbytes / std::max(elapsed.count(), 1e-6));
+
   if (_cc_merge_cnt) {
     logger_->info(RCX, 60, "     merged {} coupling caps", _cc_merge_cnt);
   }
@@ -437,6 +437,96 @@ double extMain::getFringe(const uint met,
   return rc->getFringe();
 }
 
+static thread_local extRCJournal* thread_journal = nullptr;
+
+void extRCJournal::addCapacitance(dbRSeg* rseg, double cap, int dbIndex)
+{
+  updates_.push_back({CAPACITANCE, rseg, nullptr, nullptr, dbIndex, cap});
+}
+
+void extRCJournal::addResistance(dbRSeg* rseg, double res, int dbIndex)
+{
+  updates_.push_back({RESISTANCE, rseg, nullptr, nullptr, dbIndex, res});
+}
+
+void extRCJournal::addCoupling(dbCapNode* node1,
+                               dbCapNode* node2,
+                               double cap,
+                               int dbIndex)
+{
+  updates_.push_back({COUPLING, nullptr, node1, node2, dbIndex, cap});
+}
+
+void extRCJournal::apply() const
+{
+  for (const Update& update : updates_) {
+    switch (update.type) {
+      case CAPACITANCE: {
+        double tot = update.rseg->getCapacitance(update.dbIndex);
+        tot += update.value;
+        update.rseg->setCapacitance(tot, update.dbIndex);
+        break;
+      }
+      case RESISTANCE: {
+        double tot = update.rseg->getResistance(update.dbIndex);
+        tot += update.value;
+        update.rseg->setResistance(tot, update.dbIndex);
+        break;
+      }
+      case COUPLING: {
+        dbCCSeg* ccap = dbCCSeg::create(update.node1, update.node2, true);
+        ccap->addCapacitance(update.value, update.dbIndex);
+        break;
+      }
+    }
+  }
+}
+
+void extMain::setThreadJournal(extRCJournal* journal)
+{
+  thread_journal = journal;
+}
+
+double extMain::addCapacitance(dbRSeg* rseg, double cap, int dbIndex)
+{
+  double tot = rseg->getCapacitance(dbIndex);
+  tot += cap;
+
+  if (thread_journal != nullptr) {
+    thread_journal->addCapacitance(rseg, cap, dbIndex);
+  } else {
+    rseg->setCapacitance(tot, dbIndex);
+  }
+  return tot;
+}
+
+double extMain::addResistance(dbRSeg* rseg, double res, int dbIndex)
+{
+  double tot = rseg->getResistance(dbIndex);
+  tot += res;
+
+  if (thread_journal != nullptr) {
+    thread_journal->addResistance(rseg, res, dbIndex);
+  } else {
+    rseg->setResistance(tot, dbIndex);
+  }
+  return tot;
+}
+
+dbCCSeg* extMain::addCoupling(dbCapNode* node1,
+                              dbCapNode* node2,
+                              double cap,
+                              int dbIndex)
+{
+  if (thread_journal != nullptr) {
+    thread_journal->addCoupling(node1, node2, cap, dbIndex);
+    return nullptr;
+  }
+  dbCCSeg* ccap = dbCCSeg::create(node1, node2, true);
+  ccap->addCapacitance(cap, dbIndex);
+  return ccap;
+}
+
 void extMain::updateTotalCap(dbRSeg* rseg,
                              double frCap,
                              double ccCap,
@@ -445,10 +535,7 @@ void extMain::updateTotalCap(dbRSeg* rseg,
 {
   double cap = frCap + ccCap - deltaFr;
 
-  double tot = rseg->getCapacitance(modelIndex);
-  tot += cap;
-
-  rseg->setCapacitance(tot, modelIndex);
+  addCapacitance(rseg, cap, modelIndex);
 }
 
 void extMain::updateTotalRes(dbRSeg* rseg1,
@@ -466,16 +553,10 @@ void extMain::updateTotalRes(dbRSeg* rseg1,
     }
 
     if (rseg1 != nullptr) {
-      double tot = rseg1->getResistance(modelIndex);
-      tot += res;
-
-      rseg1->setResistance(tot, modelIndex);
+      addResistance(rseg1, res, modelIndex);
     }
     if (rseg2 != nullptr) {
-      double tot = rseg2->getResistance(modelIndex);
-      tot += res;
-
-      rseg2->setResistance(tot, modelIndex);
+      addResistance(rseg2, res, modelIndex);
     }
   }
 }
@@ -510,18 +591,14 @@ void extMain::updateTotalCap(dbRSeg* rseg,
     }
 
     extDbIndex = getProcessCornerDbIndex(modelIndex);
-    tot = rseg->getCapacitance(extDbIndex);
-    tot += cap;
+    addCapacitance(rseg, cap, extDbIndex);
 
-    rseg->setCapacitance(tot, extDbIndex);
     getScaledCornerDbIndex(modelIndex, sci, scDbIdx);
     if (sci == -1) {
       continue;
     }
     getScaledGndC(sci, cap);
-    tot = rseg->getCapacitance(scDbIdx);
-    tot += cap;
-    rseg->setCapacitance(tot, scDbIdx);
+    addCapacitance(rseg, cap, scDbIdx);
   }
 }
 
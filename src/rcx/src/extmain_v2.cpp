@@ -257,6 +257,7 @@ void extMain::setExtractionOptions_v2(ExtractOptions options)
     _v2 = true;
   }
   _dbgOption = options._dbg;
+  _threads = options.thread_count;
   _overCell = _v2 && options.over_cell;  // Use inside cell context for coupling
                                          // cap extraction
 
@@ -21,7 +21,6 @@
 using odb::Ath__array1D;
 using odb::dbBTerm;
 using odb::dbCapNode;
-using odb::dbCCSeg;
 using odb::dbNet;
 using odb::dbRSeg;
 using odb::dbSet;
@@ -1815,11 +1814,10 @@ void extMeasure::printNet(dbRSeg* rseg, uint netId)
 bool extMain::updateCoupCap(dbRSeg* rseg1, dbRSeg* rseg2, int jj, double v)
 {
   if (rseg1 != nullptr && rseg2 != nullptr) {
-    dbCCSeg* ccap
-        = dbCCSeg::create(dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
-                          dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
-                          true);
-    ccap->addCapacitance(v, jj);
+    addCoupling(dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
+                dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
+                v,
+                jj);
     return true;
   }
   if (rseg1 != nullptr) {
@@ -1856,19 +1854,14 @@ double extMain::updateTotalCap(dbRSeg* rseg, double cap, uint modelIndex)
 
   int extDbIndex, sci, scDbIndex;
   extDbIndex = getProcessCornerDbIndex(modelIndex);
-  double tot = rseg->getCapacitance(extDbIndex);
-  tot += cap;
+  double tot = addCapacitance(rseg, cap, extDbIndex);
 
-  rseg->setCapacitance(tot, extDbIndex);
-  // return rseg->getCapacitance(extDbIndex);
   getScaledCornerDbIndex(modelIndex, sci, scDbIndex);
   if (sci == -1) {
     return tot;
   }
   getScaledGndC(sci, cap);
-  double tots = rseg->getCapacitance(scDbIndex);
-  tots += cap;
-  rseg->setCapacitance(tots, scDbIndex);
+  addCapacitance(rseg, cap, scDbIndex);
   return tot;
 }
 
@@ -1895,11 +1888,7 @@ double extMain::updateRes(dbRSeg* rseg, double res, uint model)
     res *= _resFactor;
   }
 
-  double tot = rseg->getResistance(model);
-  tot += res;
-
-  rseg->setResistance(tot, model);
-  return rseg->getResistance(model);
+  return addResistance(rseg, res, model);
 }
 
 bool extMeasure::isConnectedToBterm(dbRSeg* rseg1)
@@ -1920,7 +1909,7 @@ bool extMeasure::isConnectedToBterm(dbRSeg* rseg1)
   return false;
 }
 
-dbCCSeg* extMeasure::makeCcap(dbRSeg* rseg1, dbRSeg* rseg2, double ccCap)
+bool extMeasure::isCouplingCap(dbRSeg* rseg1, dbRSeg* rseg2, double ccCap)
 {
   if ((rseg1 != nullptr) && (rseg2 != nullptr)
       && rseg1->getNet() != rseg2->getNet()) {  // signal nets
@@ -1929,22 +1918,19 @@ dbCCSeg* extMeasure::makeCcap(dbRSeg* rseg1, dbRSeg* rseg2, double ccCap)
 
     if (ccCap >= _extMain->_coupleThreshold) {
       _totBigCCcnt++;
-
-      dbCapNode* node1 = rseg1->getTargetCapNode();
-      dbCapNode* node2 = rseg2->getTargetCapNode();
-
-      return dbCCSeg::create(node1, node2, true);
+      return true;
     }
     _totSmallCCcnt++;
-    return nullptr;
+    return false;
   }
-  return nullptr;
+  return false;
 }
 
-void extMeasure::addCCcap(dbCCSeg* ccap, double v, uint model)
+void extMeasure::addCCcap(dbRSeg* rseg1, dbRSeg* rseg2, double v, uint model)
 {
   double coupling = _ccModify ? v * _ccFactor : v;
-  ccap->addCapacitance(coupling, model);
+  _extMain->addCoupling(
+      rseg1->getTargetCapNode(), rseg2->getTargetCapNode(), coupling, model);
 }
 
 void extMeasure::addFringe(dbRSeg* rseg1,
@@ -2002,11 +1988,11 @@ void extMeasure::calcDiagRC(int rsegId1,
     rseg2 = dbRSeg::getRSeg(_block, rsegId2);
   }
 
-  dbCCSeg* ccCap = makeCcap(rseg1, rseg2, capTable[_minModelIndex]);
+  const bool coupled = isCouplingCap(rseg1, rseg2, capTable[_minModelIndex]);
 
   for (uint model = 0; model < modelCnt; model++) {
-    if (ccCap != nullptr) {
-      addCCcap(ccCap, capTable[model], model);
+    if (coupled) {
+      addCCcap(rseg1, rseg2, capTable[model], model);
     } else {
       addFringe(nullptr, rseg2, capTable[model], model);
     }
@@ -2018,12 +2004,12 @@ void extMeasure::createCap(int rsegId1, uint rsegId2, double* capTable)
   dbRSeg* rseg1 = rsegId1 > 0 ? dbRSeg::getRSeg(_block, rsegId1) : nullptr;
   dbRSeg* rseg2 = rsegId2 > 0 ? dbRSeg::getRSeg(_block, rsegId2) : nullptr;
 
-  dbCCSeg* ccCap = makeCcap(rseg1, rseg2, capTable[_minModelIndex]);
+  const bool coupled = isCouplingCap(rseg1, rseg2, capTable[_minModelIndex]);
 
   uint modelCnt = _metRCTable.getCnt();
   for (uint model = 0; model < modelCnt; model++) {
-    if (ccCap != nullptr) {
-      addCCcap(ccCap, capTable[model], model);
+    if (coupled) {
+      addCCcap(rseg1, rseg2, capTable[model], model);
     } else {
       _rc[model]->diag_ += capTable[model];
       addFringe(nullptr, rseg2, capTable[model], model);
@@ -2217,17 +2203,14 @@ void extMeasure::calcRC(dbRSeg* rseg1, dbRSeg* rseg2, uint totLenCovered)
         _extMain->updateRes(rseg2, res, model);
       }
 
-      dbCCSeg* ccap = nullptr;
+      bool coupled = false;
       bool includeCoupling = true;
       if ((rseg1 != nullptr) && (rseg2 != nullptr)) {  // signal nets
 
         _totCCcnt++;
 
         if (_rc[_minModelIndex]->coupling_ >= _extMain->_coupleThreshold) {
-          ccap = dbCCSeg::create(
-              dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
-              dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
-              true);
+          coupled = true;
 
           includeCoupling = false;
           _totBigCCcnt++;
@@ -2236,10 +2219,14 @@ void extMeasure::calcRC(dbRSeg* rseg1, dbRSeg* rseg2, uint totLenCovered)
         }
       }
       extDistRC* finalRC = _rc[model];
-      if (ccap != nullptr) {
+      if (coupled) {
         double coupling
             = _ccModify ? finalRC->coupling_ * _ccFactor : finalRC->coupling_;
-        ccap->addCapacitance(coupling, model);
+        _extMain->addCoupling(
+            dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
+            dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
+            coupling,
+            model);
       }
 
       double frCap = _extMain->calcFringe(finalRC, deltaFr, includeCoupling);
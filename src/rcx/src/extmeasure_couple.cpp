@@ -1,13 +1,19 @@
 // SPDX-License-Identifier: BSD-3-Clause
 // Copyright (c) 2024-2025, The OpenROAD Authors
 
+#include <algorithm>
+#include <atomic>
 #include <cmath>
 #include <cstdio>
+#include <exception>
+#include <utility>
+#include <vector>
 
 #include "gseq.h"
 #include "odb/array1.h"
 #include "odb/db.h"
 #include "odb/dbSet.h"
+#include "omp.h"
 #include "rcx/dbUtil.h"
 #include "rcx/extMeasureRC.h"
 #include "rcx/extRCap.h"
@@ -240,9 +246,9 @@ bool extMeasureRC::FindDiagonalCoupleSegments(
     CouplingDimensionParams& opts,
     Ath__array1D<Wire*>** firstWireTable)
 {
-  int diagLimit = 3;
-  int diagLimitTrackNum = 4;
-  int diagMaxDist = 500;
+  int diagLimit = CouplingConfig::DIAG_LEVEL_LIMIT;
+  int diagLimitTrackNum = CouplingConfig::DIAG_TRACK_LIMIT;
+  int diagMaxDist = CouplingConfig::DIAG_MAX_DIST;
   uint dir = opts.direction;
   FILE* fp = opts.dbgFP;
 
@@ -308,6 +314,40 @@ bool extMeasureRC::FindDiagonalCoupleSegments(
   // look up -- M1 is required as width not wide
   return true;
 }
+void extMeasureRC::FindCoupleWires(int tr,
+                                   Wire* w,
+                                   CouplingDimensionParams& opts,
+                                   Ath__array1D<Wire*>** firstWireTable)
+{
+  Ath__array1D<Wire*> wireTable;
+  FindCoupleWiresOnTracks_up(w, tr + 1, opts, firstWireTable, &wireTable);
+  FindCoupleWiresOnTracks_down(w, tr - 1, opts, firstWireTable, &wireTable);
+}
+void extMeasureRC::FindDiagonalCoupleWires(Wire* w,
+                                           uint dir,
+                                           int jj,
+                                           Ath__array1D<Wire*>** firstWireTable)
+{
+  Ath__array1D<Wire*> wireTable;
+  Grid* upgrid = _search->getGrid(dir, jj);
+  int diag_track_num = upgrid->getTrackNum1(w->getBase());
+  FindAllNeigbors_up(w,
+                     diag_track_num + 1,
+                     dir,
+                     jj,
+                     CouplingConfig::DIAG_MAX_DIST,
+                     CouplingConfig::DIAG_TRACK_LIMIT,
+                     firstWireTable,
+                     &wireTable);
+  FindAllNeigbors_down(w,
+                       diag_track_num - 1,
+                       dir,
+                       jj,
+                       CouplingConfig::DIAG_MAX_DIST,
+                       CouplingConfig::DIAG_TRACK_LIMIT,
+                       firstWireTable,
+                       &wireTable);
+}
 bool extMeasureRC::VerticalDiagonalCouplingAndCrossOverlap(
     Wire* w,
     extSegment* s,
@@ -315,8 +355,7 @@ bool extMeasureRC::VerticalDiagonalCouplingAndCrossOverlap(
     SegmentTables& segments,
     CouplingConfig& config)
 {
-  int diagMaxDist
-      = 500;  // same as in FindDiagonalCoupleSegments; TODO create opts
+  int diagMaxDist = CouplingConfig::DIAG_MAX_DIST;
 
   bool dbgOverlaps = config.debug_overlaps;  // CHECK
   FILE* fp = config.debug_fp;
@@ -503,6 +542,15 @@ int extMeasureRC::CouplingFlow(uint dir,
   uint metalLevelCnt = _search->getColCnt();
 
   CouplingConfig config(_extMain, metalLevelCnt);
+  if (_extMain->_threads > 1 && !config.debug_enabled
+      && _extMain->_debug_net_id == 0) {
+    CouplingFlowParallel(dir,
+                         couplingDist,
+                         totWireCnt,
+                         totalWiresExtracted,
+                         previous_percent_extracted);
+    return 0;
+  }
   _segFP = nullptr;
   if (config.debug_enabled) {
     config.debug_fp = OpenPrintFile(dir, "Segments");
@@ -516,136 +564,376 @@ int extMeasureRC::CouplingFlow(uint dir,
   Ath__array1D<Wire*>** firstWireTable = allocMarkTable(metalLevelCnt);
   allocateTables(metalLevelCnt);
 
-  _dir = dir;
-
   for (int level = 1; level < metalLevelCnt; level++) {
-    _met = level;
     Grid* netGrid = _search->getGrid(dir, level);
     segments.resetAll();
     // DBG _extMain->getPeakMemory("CouplingFlow Level:", level);
 
     config.reset_calc_flow_flag(level);
 
-    uint maxDist = 10 * netGrid->getPitch();
-    for (uint tr = 0; tr < netGrid->getTrackCnt(); tr++) {
-      Track* track = netGrid->getTrackPtr(tr);
-      if (track == nullptr) {
+    CouplingFlowTracks(dir,
+                       level,
+                       0,
+                       netGrid->getTrackCnt(),
+                       couplingDist,
+                       config,
+                       counts,
+                       segments,
+                       firstWireTable,
+                       totWireCnt,
+                       totalWiresExtracted,
+                       previous_percent_extracted);
+    // fprintf(stdout, "\nDir=%d  wireCnt=%d  NotOrderedCnt=%d  oneEmptyTable=%d
+    // oneCntTable=%d\n",
+    //        dir, wireCnt, notOrderCnt, oneEmptyTable, oneCntTable);
+  }
+  if (_segFP != nullptr) {
+    fclose(_segFP);
+  }
+
+  de_allocateTables(metalLevelCnt);
+
+  return 0;
+}
+void extMeasureRC::CouplingFlowTracks(uint dir,
+                                      uint level,
+                                      uint trLo,
+                                      uint trHi,
+                                      uint couplingDist,
+                                      CouplingConfig& config,
+                                      CouplingState& counts,
+                                      SegmentTables& segments,
+                                      Ath__array1D<Wire*>** firstWireTable,
+                                      int totWireCnt,
+                                      uint& totalWiresExtracted,
+                                      float& previous_percent_extracted)
+{
+  uint metalLevelCnt = config.metal_level_count;
+  Grid* netGrid = _search->getGrid(dir, level);
+
+  _dir = dir;
+  _met = level;
+
+  uint maxDist = 10 * netGrid->getPitch();
+  for (uint tr = trLo; tr < trHi; tr++) {
+    Track* track = netGrid->getTrackPtr(tr);
+    if (track == nullptr) {
+      continue;
+    }
+
+    ResetFirstWires(level, metalLevelCnt, dir, firstWireTable);
+    for (Wire* w = track->getFirstWire(); w != nullptr; w = w->getNext()) {
+      counts.wire_count++;
+      if (w->isPower() || w->getRsegId() == 0) {
         continue;
       }
 
-      ResetFirstWires(level, metalLevelCnt, dir, firstWireTable);
-      for (Wire* w = track->getNextWire(nullptr); w != nullptr;
-           w = w->getNext()) {
-        counts.wire_count++;
-        if (w->isPower() || w->getRsegId() == 0) {
-          continue;
-        }
-
-        if (config.debug_enabled) {
-          Print5wires(_segFP, w, w->getLevel());
-        }
-        // DebugWire(w, 0, 0, 17091); --- Placeholder for stopping during
+      if (config.debug_enabled) {
+        Print5wires(_segFP, w, w->getLevel());
+      }
+      // DebugWire(w, 0, 0, 17091); --- Placeholder for stopping during
 
-        totalWiresExtracted++;
-        // TODO: use progress object _progressTracker->updateProgress();
+      totalWiresExtracted++;
+      // TODO: use progress object _progressTracker->updateProgress();
 
-        if (counts.wire_count % _extMain->_wire_extracted_progress_count == 0) {
-          printProgress(
-              totalWiresExtracted, totWireCnt, previous_percent_extracted);
-        }
-        CouplingDimensionParams coupleOptions(dir,
-                                              level,
-                                              maxDist,
-                                              couplingDist,
-                                              config.limit_track_num,
-                                              config.debug_fp);
-
-        // Find all detailed Coupling neighbors in both directions and levels to
-        // calculate Lateral and Diagonal Coupling
-        GetCouplingSegments(
-            tr, w, config, coupleOptions, segments, firstWireTable);
-
-        // Distance based Resistance Calculation based on coupling segments of
-        // the wire
+      if (counts.wire_count % _extMain->_wire_extracted_progress_count == 0) {
+        printProgress(
+            totalWiresExtracted, totWireCnt, previous_percent_extracted);
+      }
+      CouplingDimensionParams coupleOptions(dir,
+                                            level,
+                                            maxDist,
+                                            couplingDist,
+                                            config.limit_track_num,
+                                            config.debug_fp);
+
+      // Find all detailed Coupling neighbors in both directions and levels to
+      // calculate Lateral and Diagonal Coupling
+      GetCouplingSegments(
+          tr, w, config, coupleOptions, segments, firstWireTable);
+
+      // Distance based Resistance Calculation based on coupling segments of
+      // the wire
+      for (uint ii = 0; ii < segments.wireSegmentTable.getCnt(); ii++) {
+        extSegment* s = segments.wireSegmentTable.get(ii);
+        CalcRes(s);
+      }
+      // Context -- Overlap -- Coupling Extraction
+      if (config.new_calc_flow || config.length_flag) {
+        _met = w->getLevel();
+        _len = w->getLen();
         for (uint ii = 0; ii < segments.wireSegmentTable.getCnt(); ii++) {
           extSegment* s = segments.wireSegmentTable.get(ii);
-          CalcRes(s);
-        }
-        // Context -- Overlap -- Coupling Extraction
-        if (config.new_calc_flow || config.length_flag) {
-          _met = w->getLevel();
-          _len = w->getLen();
-          for (uint ii = 0; ii < segments.wireSegmentTable.getCnt(); ii++) {
-            extSegment* s = segments.wireSegmentTable.get(ii);
-
-            if (config.length_flag && s->_len < CouplingConfig::LENGTH_BOUND) {
-              continue;
-            }
 
-            Release(_whiteSegTable[_met]);
+          if (config.length_flag && s->_len < CouplingConfig::LENGTH_BOUND) {
+            continue;
+          }
 
-            extSegment* white = _seqmentPool->alloc();
-            white->set(dir, w, s->_xy, s->_len, nullptr, nullptr);
+          Release(_whiteSegTable[_met]);
 
-            _whiteSegTable[_met]->add(white);
-            PrintOverlapSeg(_segFP, s, _met, "\nNEW --");
+          extSegment* white = _seqmentPool->alloc();
+          white->set(dir, w, s->_xy, s->_len, nullptr, nullptr);
 
-            Ath__array1D<extSegment*> crossOvelapTable(8);
-            uint overMet = _met + 1;
-            for (; overMet < metalLevelCnt; overMet++) {
-              Release(_ovSegTable[overMet]);
-              Release(_whiteSegTable[overMet]);
+          _whiteSegTable[_met]->add(white);
+          PrintOverlapSeg(_segFP, s, _met, "\nNEW --");
 
-              // Coupling Caps
-              VerticalDiagonalCouplingAndCrossOverlap(
-                  w, s, overMet, segments, config);
+          Ath__array1D<extSegment*> crossOvelapTable(8);
+          uint overMet = _met + 1;
+          for (; overMet < metalLevelCnt; overMet++) {
+            Release(_ovSegTable[overMet]);
+            Release(_whiteSegTable[overMet]);
 
-              // Over Sub Under met -- Create Coupling Capacitors
-              if (CreateCouplingCaps_overUnder(s, overMet)) {
-                continue;
-              }
+            // Coupling Caps
+            VerticalDiagonalCouplingAndCrossOverlap(
+                w, s, overMet, segments, config);
 
-              // Looking up metal levels, all overlaps are blocked
-              if (_whiteSegTable[overMet]->getCnt() == 0) {
-                break;
-              }
+            // Over Sub Under met -- Create Coupling Capacitors
+            if (CreateCouplingCaps_overUnder(s, overMet)) {
+              continue;
             }
-            if (overMet >= metalLevelCnt - 1) {
-              CreateCouplingCaps_over(s, metalLevelCnt);
+
+            // Looking up metal levels, all overlaps are blocked
+            if (_whiteSegTable[overMet]->getCnt() == 0) {
+              break;
             }
           }
+          if (overMet >= metalLevelCnt - 1) {
+            CreateCouplingCaps_over(s, metalLevelCnt);
+          }
+        }
+      }
+      // DELETE for (uint ii = 0; ii < !new_calc_flow && segTable.getCnt();
+      // ii++)
+      for (uint ii = 0; (!config.new_calc_flow || config.length_flag)
+                        && ii < segments.wireSegmentTable.getCnt();
+           ii++) {
+        extSegment* s = segments.wireSegmentTable.get(ii);
+
+        if (config.length_flag && s->_len >= CouplingConfig::LENGTH_BOUND) {
+          continue;
         }
-        // DELETE for (uint ii = 0; ii < !new_calc_flow && segTable.getCnt();
-        // ii++)
-        for (uint ii = 0; (!config.new_calc_flow || config.length_flag)
-                          && ii < segments.wireSegmentTable.getCnt();
-             ii++) {
-          extSegment* s = segments.wireSegmentTable.get(ii);
 
-          if (config.length_flag && s->_len >= CouplingConfig::LENGTH_BOUND) {
+        PrintOverlapSeg(
+            _segFP, s, _met, "\nmeasure_RC_new .........................\n");
+
+        measure_RC_new(s, true);
+      }
+      ReleaseSegTables(metalLevelCnt);
+      releaseAll(segments);
+    }
+  }
+}
+void extMeasureRC::SeedCouplingBands(uint dir,
+                                     uint couplingDist,
+                                     std::vector<CouplingBand>& bands)
+{
+  const uint metalLevelCnt = _search->getColCnt();
+  CouplingConfig config(_extMain, metalLevelCnt);
+  Ath__array1D<Wire*>** firstWireTable = allocMarkTable(metalLevelCnt);
+
+  uint ii = 0;
+  for (uint level = 1; level < metalLevelCnt; level++) {
+    Grid* netGrid = _search->getGrid(dir, level);
+    const int loLevel
+        = std::max<int>(1, (int) level - CouplingConfig::DIAG_LEVEL_LIMIT + 1);
+    Track* lastTrack = nullptr;
+    uint lastTr = 0;
+    for (; ii < bands.size() && bands[ii].level == level; ii++) {
+      CouplingBand& band = bands[ii];
+
+      // The lower level tracks the diagonal searches of the band can read
+      for (int jj = (int) level - 1; jj >= loLevel; jj--) {
+        Grid* grid = _search->getGrid(dir, jj);
+        const int trackCnt = grid->getTrackCnt();
+        int lo = trackCnt;
+        int hi = -1;
+        for (uint tr = band.tr_lo; tr < band.tr_hi; tr++) {
+          Track* track = netGrid->getTrackPtr(tr);
+          if (track == nullptr) {
             continue;
           }
+          for (Wire* w = track->getFirstWire(); w != nullptr;
+               w = w->getNext()) {
+            if (w->isPower() || w->getRsegId() == 0) {
+              continue;
+            }
+            const int diag_track_num = grid->getTrackNum1(w->getBase());
+            lo = std::min(
+                lo, diag_track_num - CouplingConfig::DIAG_TRACK_LIMIT - 1);
+            hi = std::max(
+                hi, diag_track_num + CouplingConfig::DIAG_TRACK_LIMIT + 1);
+          }
+        }
+        lo = std::max(lo, 0);
+        hi = std::min(hi, trackCnt - 1);
+        if (lo > hi) {
+          continue;
+        }
+        FirstWireSeed seed{(uint) jj, (uint) lo, {}};
+        for (int tr = lo; tr <= hi; tr++) {
+          seed.wires.push_back(tr < firstWireTable[jj]->getSize()
+                                   ? firstWireTable[jj]->geti(tr)
+                                   : nullptr);
+        }
+        band.seeds.push_back(std::move(seed));
+      }
 
-          PrintOverlapSeg(
-              _segFP, s, _met, "\nmeasure_RC_new .........................\n");
-
-          measure_RC_new(s, true);
+      for (uint tr = band.tr_lo; tr < band.tr_hi; tr++) {
+        Track* track = netGrid->getTrackPtr(tr);
+        if (track == nullptr) {
+          continue;
+        }
+        lastTrack = track;
+        lastTr = tr;
+        for (Wire* w = track->getFirstWire(); w != nullptr; w = w->getNext()) {
+          if (w->isPower() || w->getRsegId() == 0) {
+            continue;
+          }
+          for (int jj = (int) level - 1; jj >= loLevel; jj--) {
+            FindDiagonalCoupleWires(w, dir, jj, firstWireTable);
+          }
         }
-        ReleaseSegTables(metalLevelCnt);
-        releaseAll(segments);
       }
     }
-    // fprintf(stdout, "\nDir=%d  wireCnt=%d  NotOrderedCnt=%d  oneEmptyTable=%d
-    // oneCntTable=%d\n",
-    //        dir, wireCnt, notOrderCnt, oneEmptyTable, oneCntTable);
+    if (lastTrack == nullptr) {
+      continue;
+    }
+    // The levels from this one up keep the markers of its last track: the
+    // reset before it and the searches of its wires on these levels.
+    CouplingDimensionParams coupleOptions(dir,
+                                          level,
+                                          10 * netGrid->getPitch(),
+                                          couplingDist,
+                                          config.limit_track_num,
+                                          nullptr);
+    ResetFirstWires(level, metalLevelCnt, dir, firstWireTable);
+    for (Wire* w = lastTrack->getFirstWire(); w != nullptr; w = w->getNext()) {
+      if (w->isPower() || w->getRsegId() == 0) {
+        continue;
+      }
+      FindCoupleWires(lastTr, w, coupleOptions, firstWireTable);
+      for (int jj = level + 1;
+           jj < (int) metalLevelCnt
+           && jj < (int) level + CouplingConfig::DIAG_LEVEL_LIMIT;
+           jj++) {
+        FindDiagonalCoupleWires(w, dir, jj, firstWireTable);
+      }
+    }
   }
-  if (_segFP != nullptr) {
-    fclose(_segFP);
+  DeleteMarkTable(firstWireTable, metalLevelCnt);
+}
+void extMeasureRC::CouplingFlowParallel(uint dir,
+                                        uint couplingDist,
+                                        int totWireCnt,
+                                        uint& totalWiresExtracted,
+                                        float& previous_percent_extracted)
+{
+  const uint metalLevelCnt = _search->getColCnt();
+
+  // Bands of tracks in the serial level/track order
+  constexpr uint kTracksPerBand = 64;
+  std::vector<CouplingBand> bands;
+  for (uint level = 1; level < metalLevelCnt; level++) {
+    const uint trackCnt = _search->getGrid(dir, level)->getTrackCnt();
+    for (uint tr = 0; tr < trackCnt; tr += kTracksPerBand) {
+      bands.push_back({level, tr, std::min(tr + kTracksPerBand, trackCnt), {}});
+    }
+  }
+  const int threads = std::min<int>(_extMain->_threads, bands.size());
+  if (threads == 0) {
+    return;
+  }
+  SeedCouplingBands(dir, couplingDist, bands);
+
+  // One measure object per thread, sharing the search grids and the
+  // geometry of the main one
+  std::vector<extMeasureRC*> workers(threads);
+  std::vector<Ath__array1D<Wire*>**> firstWireTables(threads);
+  for (int t = 0; t < threads; t++) {
+    extMeasureRC* m = new extMeasureRC(_extMain->getLogger());
+    _extMain->initRunEnv(*m);
+    m->_search = _search;
+    m->_pixelTable = _pixelTable;
+    m->_rotatedGs = _rotatedGs;
+    m->_seqmentPool = new odb::AthPool<extSegment>(1024);
+    m->allocateTables(metalLevelCnt);
+    workers[t] = m;
+    firstWireTables[t] = m->allocMarkTable(metalLevelCnt);
+  }
+
+  // The database updates of every band are journaled and applied below in
+  // band order so the result does not depend on the thread schedule.
+  std::vector<extRCJournal> journals(bands.size());
+  std::vector<uint> wireCounts(bands.size(), 0);
+  std::vector<std::exception_ptr> errors(bands.size());
+  std::atomic_bool failed = false;
+#pragma omp parallel for num_threads(threads) schedule(dynamic, 1)
+  for (int ii = 0; ii < (int) bands.size(); ii++) {
+    if (failed) {
+      continue;
+    }
+    const int t = omp_get_thread_num();
+    extMeasureRC* m = workers[t];
+    extMain::setThreadJournal(&journals[ii]);
+    gs::setThreadPool(m->_seqPool);
+    try {
+      const CouplingBand& band = bands[ii];
+      CouplingConfig config(_extMain, metalLevelCnt);
+      config.reset_calc_flow_flag(band.level);
+      CouplingState counts;
+      SegmentTables segments;
+      float percent = 0.0;
+
+      // The levels from band.level up are reset on every track
+      for (const FirstWireSeed& seed : band.seeds) {
+        for (uint jj = 0; jj < seed.wires.size(); jj++) {
+          firstWireTables[t][seed.level]->set(seed.tr_lo + jj, seed.wires[jj]);
+        }
+      }
+      m->CouplingFlowTracks(dir,
+                            band.level,
+                            band.tr_lo,
+                            band.tr_hi,
+                            couplingDist,
+                            config,
+                            counts,
+                            segments,
+                            firstWireTables[t],
+                            0,
+                            wireCounts[ii],
+                            percent);
+    } catch (...) {
+      errors[ii] = std::current_exception();
+      failed = true;
+    }
+    extMain::setThreadJournal(nullptr);
+    gs::setThreadPool(nullptr);
+  }
+
+  for (int t = 0; t < threads; t++) {
+    extMeasureRC* m = workers[t];
+    _totCCcnt += m->_totCCcnt;
+    _totSmallCCcnt += m->_totSmallCCcnt;
+    _totBigCCcnt += m->_totBigCCcnt;
+    _totSignalSegCnt += m->_totSignalSegCnt;
+    _totSegCnt += m->_totSegCnt;
+    m->DeleteMarkTable(firstWireTables[t], metalLevelCnt);
+    m->de_allocateTables(metalLevelCnt);
+    delete m->_seqmentPool;
+    delete m;
+  }
+
+  for (const std::exception_ptr& error : errors) {
+    if (error) {
+      std::rethrow_exception(error);
+    }
   }
 
-  de_allocateTables(metalLevelCnt);
-
-  return 0;
+  for (uint ii = 0; ii < bands.size(); ii++) {
+    journals[ii].apply();
+    totalWiresExtracted += wireCounts[ii];
+    printProgress(totalWiresExtracted, totWireCnt, previous_percent_extracted);
+  }
 }
 void extMeasureRC::ReleaseSegTables(uint metalLevelCnt)
 {
@@ -1500,7 +1788,7 @@ void extMeasureRC::OpenEnded1(extSegment* cc,
   dbRSeg* rseg2 = cc->_down != nullptr ? GetRSeg(cc->_down->getRsegId())
                                        : GetRSeg(cc->_up->getRsegId());
 
-  dbCCSeg* ccCap = nullptr;
+  bool coupled = false;
   for (uint ii = 0; ii < _metRCTable.getCnt(); ii++) {
     extMetRCTable* rcModel = _metRCTable.get(ii);
     extDistRC* rc = OverUnderRC(rcModel,
@@ -1523,12 +1811,12 @@ void extMeasureRC::OpenEnded1(extSegment* cc,
 
     if (CHECK_COUPLING_THRESHOLD) {
       if (ii == 0) {
-        // check if the cap value is over the couplingThreshold, then create
-        // coupling cap object dbCCSeg
-        ccCap = makeCcap(rseg, rseg2, cc);
+        // check if the cap value is over the couplingThreshold, then add it
+        // to a coupling cap object dbCCSeg
+        coupled = isCouplingCap(rseg, rseg2, cc);
       }
-      if (ccCap != nullptr) {
-        addCCcap(ccCap, cc / 2, ii);
+      if (coupled) {
+        addCCcap(rseg, rseg2, cc / 2, ii);
       } else {
         addFringe(rseg, rseg2, cc / 2, ii);
       }
@@ -1551,8 +1839,8 @@ void extMeasureRC::OverUnder(extSegment* cc,
   dbRSeg* rseg_down = GetRSeg(cc->_down->getRsegId());
   dbRSeg* rseg_up = GetRSeg(cc->_up->getRsegId());
 
-  dbCCSeg* ccCap_up = nullptr;
-  dbCCSeg* ccCap_down = nullptr;
+  bool coupled_up = false;
+  bool coupled_down = false;
   for (uint ii = 0; ii < _metRCTable.getCnt(); ii++) {
     extMetRCTable* rcModel = _metRCTable.get(ii);
     extDistRC* rc_up = OverUnderRC(rcModel,
@@ -1582,19 +1870,19 @@ void extMeasureRC::OverUnder(extSegment* cc,
 
     if (CHECK_COUPLING_THRESHOLD) {
       if (ii == 0) {
-        // check if the cap value is over the couplingThreshold, then create
-        // coupling cap object dbCCSeg
-        ccCap_up = makeCcap(rseg, rseg_up, cc_up);
-        ccCap_down = makeCcap(rseg, rseg_down, cc_down);
+        // check if the cap value is over the couplingThreshold, then add it
+        // to a coupling cap object dbCCSeg
+        coupled_up = isCouplingCap(rseg, rseg_up, cc_up);
+        coupled_down = isCouplingCap(rseg, rseg_down, cc_down);
       }
-      if (ccCap_up != nullptr) {
-        addCCcap(ccCap_up, cc_up / 2, ii);
+      if (coupled_up) {
+        addCCcap(rseg, rseg_up, cc_up / 2, ii);
       } else {
         addFringe(rseg, rseg_up, cc_up / 2, ii);
       }
 
-      if (ccCap_down != nullptr) {
-        addCCcap(ccCap_down, cc_down / 2, ii);
+      if (coupled_down) {
+        addCCcap(rseg, rseg_down, cc_down / 2, ii);
       } else {
         addFringe(rseg, rseg_down, cc_down / 2, ii);
       }
@@ -1622,8 +1910,8 @@ void extMeasureRC::Model1(extSegment* cc,
     dist = cc->_dist_down;
   }
 
-  dbCCSeg* ccCap_up = nullptr;
-  dbCCSeg* ccCap_down = nullptr;
+  bool coupled_up = false;
+  bool coupled_down = false;
   for (uint ii = 0; ii < _metRCTable.getCnt(); ii++) {
     extMetRCTable* rcModel = _metRCTable.get(ii);
     extDistRC* rc_up = OverUnderRC(rcModel,
@@ -1664,19 +1952,19 @@ void extMeasureRC::Model1(extSegment* cc,
 
     if (CHECK_COUPLING_THRESHOLD) {
       if (ii == 0) {
-        // check if the cap value is over the couplingThreshold, then create
-        // coupling cap object dbCCSeg
-        ccCap_up = makeCcap(rseg1, rseg_up, cc_up);
-        ccCap_down = makeCcap(rseg1, rseg_down, cc_down);
+        // check if the cap value is over the couplingThreshold, then add it
+        // to a coupling cap object dbCCSeg
+        coupled_up = isCouplingCap(rseg1, rseg_up, cc_up);
+        coupled_down = isCouplingCap(rseg1, rseg_down, cc_down);
       }
-      if (ccCap_up != nullptr) {
-        addCCcap(ccCap_up, cc_up / 2, ii);
+      if (coupled_up) {
+        addCCcap(rseg1, rseg_up, cc_up / 2, ii);
       } else {
         addFringe(rseg1, rseg_up, cc_up / 2, ii);
       }
 
-      if (ccCap_down != nullptr) {
-        addCCcap(ccCap_down, cc_down / 2, ii);
+      if (coupled_down) {
+        addCCcap(rseg1, rseg_down, cc_down / 2, ii);
       } else {
         addFringe(rseg1, rseg_down, cc_down / 2, ii);
       }
@@ -1695,15 +1983,15 @@ double extMeasureRC::updateCoupCap(dbRSeg* rseg1,
     double tot = _extMain->updateTotalCap(rseg1, v, jj);
     return tot;
   }
-  dbCCSeg* ccap
-      = dbCCSeg::create(dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
-                        dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
-                        true);
-
   v /= 2;
-  ccap->addCapacitance(v, jj);
-
-  double cc = ccap->getCapacitance(jj);
+  dbCCSeg* ccap = _extMain->addCoupling(
+      dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
+      dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
+      v,
+      jj);
+
+  // The total is not known until a journaled coupling cap is applied.
+  double cc = ccap != nullptr ? ccap->getCapacitance(jj) : v;
 
   _extMain->printUpdateCoup(
       rseg1->getNet()->getId(), rseg2->getNet()->getId(), v, 2 * v, cc);
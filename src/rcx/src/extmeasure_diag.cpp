@@ -45,8 +45,7 @@ int extMeasureRC::FindCouplingNeighbors(uint dir,
       ResetFirstWires(
           netGrid, &firstWireTable, tr, netGrid->getTrackCnt(), limitTrackNum);
 
-      for (Wire* w = track->getNextWire(nullptr); w != nullptr;
-           w = w->getNext()) {
+      for (Wire* w = track->getFirstWire(); w != nullptr; w = w->getNext()) {
         bool found = false;
         uint start_next_track
             = tr;  // in case that track holds wires with different base
@@ -147,7 +146,7 @@ int extMeasureRC::FindCouplingNeighbors_down(uint dir,
       ResetFirstWires(
           netGrid, &firstWireTable, start_track_index, tr, limitTrackNum);
 
-      Wire* first_wire1 = track->getNextWire(nullptr);
+      Wire* first_wire1 = track->getFirstWire();
       for (Wire* w = first_wire1; w != nullptr; w = w->getNext()) {
         bool found = false;
         for (int next_tr = tr - 1;
@@ -186,7 +185,7 @@ void extMeasureRC::ResetFirstWires(Grid* netGrid,
       firstWireTable->set(ii, nullptr);
       continue;
     }
-    Wire* w1 = track->getNextWire(nullptr);
+    Wire* w1 = track->getFirstWire();
     firstWireTable->set(ii, w1);
   }
 }
@@ -510,7 +509,7 @@ Wire* extMeasureRC::GetNextWire(Grid* netGrid,
     first_wire = firstWireTable->geti(tr);
   }
   if (first_wire == nullptr) {
-    first_wire = next_track->getNextWire(nullptr);
+    first_wire = next_track->getFirstWire();
   }
 
   return first_wire;
@@ -616,8 +615,7 @@ int extMeasureRC::PrintAllGrids(uint dir, FILE* fp, uint mode)
       }
 
       fprintf(fp, "Track %d M%d %s %d \n", tr, jj, vert, track->getBase());
-      for (Wire* w = track->getNextWire(nullptr); w != nullptr;
-           w = w->getNext()) {
+      for (Wire* w = track->getFirstWire(); w != nullptr; w = w->getNext()) {
         if (mode == 0) {
           PrintWire(fp, w, jj);
         } else if (mode == 1) {  // coupling neighbors
@@ -654,7 +652,7 @@ int extMeasureRC::ConnectWires(uint dir)
       /* DEBUG
     if (ConnectAllWires(track)) {
       if (_extMain->_dbgOption > 1) {
-        for (Wire* w = track->getNextWire(nullptr); w != nullptr;
+        for (Wire* w = track->getFirstWire(); w != nullptr;
              w = w->getNext())
           PrintWire(stdout, w, jj);
       }
@@ -751,7 +749,7 @@ int extMeasureRC::FindDiagonalNeighbors(uint dir,
       ResetFirstWires(m1, m2, dir, firstWireTable);
 
       Wire* prev = nullptr;
-      Wire* first_wire1 = track->getNextWire(nullptr);
+      Wire* first_wire1 = track->getFirstWire();
       for (Wire* w = first_wire1; w != nullptr;
            w = w->getNext())  // for all wires in the track
       {
@@ -826,7 +824,7 @@ int extMeasureRC::FindDiagonalNeighbors_vertical_power(
       if (next_track == nullptr) {
         continue;
       }
-      Wire* first = next_track->getNextWire(nullptr);
+      Wire* first = next_track->getFirstWire();
       if (first == nullptr) {
         continue;
       }
@@ -920,7 +918,7 @@ int extMeasureRC::FindDiagonalNeighbors_vertical_up(uint dir,
       ResetFirstWires(m1, m2, dir, firstWireTable);
 
       Wire* prev = nullptr;
-      Wire* first_wire1 = track->getNextWire(nullptr);
+      Wire* first_wire1 = track->getFirstWire();
       for (Wire* w = first_wire1; w != nullptr;
            w = w->getNext())  // for all wires in the track
       {
@@ -987,7 +985,7 @@ int extMeasureRC::FindDiagonalNeighbors_vertical_down(uint dir,
       ResetFirstWires(m2, m1, dir, firstWireTable);
 
       Wire* prev = nullptr;
-      Wire* first_wire1 = track->getNextWire(nullptr);
+      Wire* first_wire1 = track->getFirstWire();
       for (Wire* w = first_wire1; w != nullptr;
            w = w->getNext())  // for all wires in the track
       {
@@ -1057,7 +1055,7 @@ int extMeasureRC::FindDiagonalNeighbors_down(uint dir,
       ResetFirstWires(m2, jj, dir, firstWireTable);
 
       Wire* prev = nullptr;
-      Wire* first_wire1 = track->getNextWire(nullptr);
+      Wire* first_wire1 = track->getFirstWire();
       for (Wire* w = first_wire1; w != nullptr;
            w = w->getNext())  // for all wires in the track
       {
@@ -85,12 +85,12 @@ bool extMeasureRC::updateCoupCap(dbRSeg* rseg1,
                                  const char* dbg_msg)
 {
   if (rseg1 != nullptr && rseg2 != nullptr) {
-    dbCCSeg* ccap
-        = dbCCSeg::create(dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
-                          dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
-                          true);
-    ccap->addCapacitance(v, jj);
-    if (IsDebugNet()) {
+    dbCCSeg* ccap = _extMain->addCoupling(
+        dbCapNode::getCapNode(_block, rseg1->getTargetNode()),
+        dbCapNode::getCapNode(_block, rseg2->getTargetNode()),
+        v,
+        jj);
+    if (ccap != nullptr && IsDebugNet()) {
       DebugUpdateCC(stdout,
                     dbg_msg,
                     rseg1->getId(),
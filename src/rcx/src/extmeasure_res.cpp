@@ -221,6 +221,25 @@ void extMain::calcRes0(double* deltaRes,
   }
 }
 
+// The interpolated resistance of a lookup is returned in diag_ of the
+// table entry.  Outside the main thread it is returned in a scratch copy of
+// the entry instead, so the tables are not written by several threads.
+extDistRC* extDistRCTable::resResult(extDistRC* rc, double diag)
+{
+  extDistRC* scratch = extDistRC::threadScratch(rc);
+  if (scratch == nullptr) {
+    rc->diag_ = diag;
+    return rc;
+  }
+  scratch->set(rc->sep_, rc->coupling_, rc->fringe_, diag, rc->res_);
+  return scratch;
+}
+
+// The resistance tables of the distance ranges are passed to
+// findIndexed_res by index.  They used to be swapped into
+// measureTable_/computeTable_ for that call only: no other lookup of a
+// resistance table reads those members, so the lookups do not change and
+// the tables stay read-only for parallel extraction.
 extDistRC* extDistRCTable::getComputeRC_res(uint dist1, uint dist2)
 {
   int min_dist = 0;
@@ -238,13 +257,12 @@ extDistRC* extDistRCTable::getComputeRC_res(uint dist1, uint dist2)
   }
 
   extDistRC* rc1 = measureTableR_[0]->geti(0);
-  rc1->diag_ = 0.0;
   if (rc1 == nullptr) {
     return nullptr;
   }
 
   if (dist1 + dist2 == 0) {  // ASSUMPTION: 0 dist exists as first
-    return rc1;
+    return resResult(rc1, 0.0);
   }
   if (dist1 >= maxDist_ && dist2 >= maxDist_) {
     return nullptr;
@@ -258,7 +276,7 @@ extDistRC* extDistRCTable::getComputeRC_res(uint dist1, uint dist2)
   bool found = false;
   extDistRC* rc2 = measureTableR_[1]->geti(0);
   if (rc2 == nullptr) {
-    return rc1;
+    return resResult(rc1, 0.0);
   }
 
   if (dist1 <= rc1->sep_) {
@@ -297,44 +315,35 @@ extDistRC* extDistRCTable::getComputeRC_res(uint dist1, uint dist2)
     }
   }
   if (found) {
-    if (!measureInR_) {
-      delete measureTable_;
-    }
-    measureInR_ = true;
-    measureTable_ = measureTableR_[index_dist];
-    computeTable_ = computeTableR_[index_dist];
-    extDistRC* res = findIndexed_res(dist1, dist2);
-    res->diag_ = 0;
+    extDistRC* res = findIndexed_res(index_dist, dist1, dist2);
     if (rc != nullptr && dist1 < rc->sep_) {
-      measureTable_ = measureTableR_[index_dist - 1];
-      computeTable_ = computeTableR_[index_dist - 1];
-      extDistRC* res1 = findIndexed_res(dist1, dist2);
+      extDistRC* res1 = findIndexed_res(index_dist - 1, dist1, dist2);
       double R1 = res->interpolate_res(dist1, res1);
-      res1->diag_ = R1;
-      return res1;
+      return resResult(res1, R1);
     }
-    return res;
+    return resResult(res, 0.0);
   }
   return nullptr;
 }
 
-extDistRC* extDistRCTable::findIndexed_res(uint dist1, uint dist2)
+extDistRC* extDistRCTable::findIndexed_res(uint index, uint dist1, uint dist2)
 {
-  extDistRC* firstRC = measureTable_->get(0);
+  Ath__array1D<extDistRC*>* measureTable = measureTableR_[index];
+  extDistRC* firstRC = measureTable->get(0);
   uint firstDist = firstRC->sep_;
   if (dist2 <= firstDist) {
     return firstRC;
   }
-  if (measureTable_->getCnt() == 1) {
+  if (measureTable->getCnt() == 1) {
     return firstRC;
   }
-  extDistRC* resLast = measureTable_->getLast();
+  extDistRC* resLast = measureTable->getLast();
   if (dist2 >= resLast->sep_) {
     return resLast;
   }
 
   uint n = dist2 / unit_;
-  extDistRC* res = computeTable_->geti(n);
+  extDistRC* res = computeTableR_[index]->geti(n);
   return res;
 }
 
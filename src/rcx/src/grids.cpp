@@ -1100,6 +1100,20 @@ Wire* Track::getNextWire(Wire* wire)
   return nullptr;
 }
 
+Wire* Track::getFirstWire()
+{
+  uint ii = _grid->searchLowMarker();
+  if (_marker[ii]) {
+    return _marker[ii];
+  }
+  for (ii++; ii <= _grid->searchHiMarker(); ii++) {
+    if (_marker[ii]) {
+      return _marker[ii];
+    }
+  }
+  return nullptr;
+}
+
 Wire* Track::getWire_Linear(uint markerCnt, uint id)
 {
   for (uint ii = 0; ii < markerCnt; ii++) {
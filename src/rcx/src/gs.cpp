@@ -33,6 +33,8 @@ static constexpr int GS_NONE = 3;
 static constexpr int GS_ROW = 1;
 static constexpr int GS_COLUMN = 0;
 
+static thread_local odb::AthPool<SEQ>* thread_seq_pool = nullptr;
+
 gs::gs(odb::AthPool<SEQ>* pool)
 {
   init_ = INIT;
@@ -277,15 +279,25 @@ bool gs::checkPlane(const int plane)
   return 0 <= plane && plane < nplanes_;
 }
 
+void gs::setThreadPool(odb::AthPool<SEQ>* pool)
+{
+  thread_seq_pool = pool;
+}
+
+odb::AthPool<SEQ>* gs::seqPool()
+{
+  return thread_seq_pool != nullptr ? thread_seq_pool : seqPool_;
+}
+
 SEQ* gs::salloc()
 {
-  SEQ* s = seqPool_->alloc();
+  SEQ* s = seqPool()->alloc();
   return s;
 }
 
 void gs::release(SEQ* s)
 {
-  seqPool_->free(s);
+  seqPool()->free(s);
 }
 
 uint gs::getSeq(int* ll,
@@ -381,7 +393,7 @@ uint gs::getSeq(int* ll,
           s = salloc();
         }
         if (flag) {
-          seqPool_->free(s);
+          seqPool()->free(s);
           return blacksum;
         }
         start = end + 1;
@@ -432,7 +444,7 @@ uint gs::getSeq(int* ll,
           s = salloc();
         }
         if (flag) {
-          seqPool_->free(s);
+          seqPool()->free(s);
           return blacksum;
         }
         start = end + 1;
@@ -444,7 +456,7 @@ uint gs::getSeq(int* ll,
       ce += plc.x_resolution;
     }
   }
-  seqPool_->free(s);
+  seqPool()->free(s);
   return blacksum;
 }
 
@@ -59,6 +59,11 @@ class gs
   // Deallocate a SEQ
   void release(SEQ* s);
 
+  // Use pool instead of the pool given at construction for the SEQs
+  // allocated and released by the calling thread, so the bitmaps can be
+  // searched from several threads.  A null pool restores the default.
+  static void setThreadPool(odb::AthPool<SEQ>* pool);
+
  private:
   using pixint = std::uint64_t;
 
@@ -92,6 +97,8 @@ class gs
   bool getSeqRow(int y, int plane, int stpix, int& epix, int& seqcol);
   bool getSeqCol(int x, int plane, int stpix, int& epix, int& seqcol);
 
+  odb::AthPool<SEQ>* seqPool();
+
   int nplanes_;   // max number of planes
   int maxplane_;  // maximum used plane
 
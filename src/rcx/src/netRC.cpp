@@ -11,6 +11,7 @@
 #include <cstring>
 #include <list>
 #include <string>
+#include <string_view>
 #include <vector>
 
 #include "find_some_net.h"
@@ -2232,7 +2233,8 @@ void extMain::writeSPEF(char* filename,
                         int corner,
                         const char* corner_name,
                         const char* spef_version,
-                        bool parallel)
+                        bool parallel,
+                        int threads)
 {
   if (_block == nullptr) {
     logger_->info(
@@ -2244,6 +2246,7 @@ void extMain::writeSPEF(char* filename,
     _spef = new extSpef(_tech, _block, logger_, spef_version, this);
   }
   _spef->_termJxy = termJxy;
+  _spef->_threads = threads;
 
   _writeNameMap = noNameMap ? false : true;
   _spef->_writeNameMap = _writeNameMap;
@@ -2263,8 +2266,9 @@ void extMain::writeSPEF(char* filename,
   }
   _spef->preserveFlag(_foreign);
 
-  if (gzFlag) {
-    _spef->setGzipFlag(gzFlag);
+  const std::string_view name = filename != nullptr ? filename : "";
+  if (gzFlag || name.ends_with(".gz")) {
+    _spef->setGzipFlag(true);
   }
 
   _spef->setDesign((char*) _block->getName().c_str());
@@ -2334,12 +2338,14 @@ uint extMain::readSPEF(char* filename,
                        bool moreToRead,
                        bool diff,
                        bool calib,
-                       int app_print_limit)
+                       int app_print_limit,
+                       int threads)
 {
   if (!_spef || _spef->getBlock() != _block) {
     delete _spef;
     _spef = new extSpef(_tech, _block, logger_, "", this);
   }
+  _spef->_threads = threads;
   _spef->_moreToRead = moreToRead;
   _spef->incr_rRun();
 
@@ -5,14 +5,21 @@
 
 #include <stdio.h>  // NOLINT(modernize-deprecated-headers): for popen()
 
+#include <algorithm>
+#include <cstdint>
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
+#include <exception>
 #include <filesystem>
+#include <istream>
+#include <memory>
+#include <string_view>
 
 #include "odb/array1.h"
 #include "odb/odb.h"
 #include "utl/Logger.h"
+#include "utl/ScopedTemporaryFile.h"
 
 namespace rcx {
 
@@ -94,9 +101,12 @@ void Ath__parser::init()
     _wordArray[ii] = ATH__allocCharWord(512, _logger);
   }
 
+  _words = _wordArray;
+
   _wordSeparators = ATH__allocCharWord(24, _logger);
 
   strcpy(_wordSeparators, " \n\t");
+  updateSeparators();
 
   _commentChar = '#';
 
@@ -121,7 +131,7 @@ void Ath__parser::resetLineNum(int v)
 
 bool Ath__parser::isDigit(int ii, int jj)
 {
-  const char C = _wordArray[ii][jj];
+  const char C = _words[ii][jj];
 
   return (C >= '0') && (C <= '9');
 }
@@ -129,15 +139,29 @@ bool Ath__parser::isDigit(int ii, int jj)
 void Ath__parser::resetSeparator(const char* s)
 {
   strcpy(_wordSeparators, s);
+  updateSeparators();
 }
 
 void Ath__parser::addSeparator(const char* s)
 {
   strcat(_wordSeparators, s);
+  updateSeparators();
+}
+
+void Ath__parser::updateSeparators()
+{
+  std::fill(std::begin(_separators), std::end(_separators), false);
+  for (const char* s = _wordSeparators; *s != '\0'; s++) {
+    _separators[(unsigned char) *s] = true;
+  }
 }
 
 void Ath__parser::openFile(const char* name)
 {
+  if (_blockThreads > 0) {
+    openBlockFile(name);
+    return;
+  }
   if (name != nullptr && strlen(name) > 4
       && !strcmp(name + strlen(name) - 3, ".gz")) {
     char cmd[256];
@@ -172,13 +196,163 @@ void Ath__parser::setInputFP(FILE* fp)
   _inFP = fp;
 }
 
+void Ath__parser::setBlockMode(const int threads)
+{
+  _blockThreads = std::max(threads, 1);
+}
+
+uint64_t Ath__parser::getBytesRead()
+{
+  return _bytesRead;
+}
+
+void Ath__parser::openBlockFile(const char* name)
+{
+  if (name != nullptr) {
+    strcpy(_inputFile, name);
+  }
+  _inStream = nullptr;
+  try {
+    _inStream = std::make_unique<utl::InStreamHandler>(_inputFile, true);
+  } catch (const std::exception&) {
+    _logger->error(utl::RCX, 6, "Cannot open file {} for reading", _inputFile);
+  }
+  // The last block is shorter than requested, which is not an error.
+  _inStream->getStream().exceptions(std::ios::badbit);
+
+  _blockTextSize = 0;
+  _blockLinesEnd = 0;
+  _blockRanges.clear();
+  _blockRange = 0;
+  _blockLine = 0;
+}
+
+bool Ath__parser::readBlock()
+{
+  constexpr size_t blockSize = 64 << 20;
+
+  // Move the unfinished last line of the previous block to the front.
+  size_t size = _blockTextSize - _blockLinesEnd;
+  if (size > 0) {
+    memmove(_blockText.data(), _blockText.data() + _blockLinesEnd, size);
+  }
+
+  std::istream& in = _inStream->getStream();
+  size_t end = 0;
+  while (end == 0) {
+    _blockText.resize(size + blockSize + 1);
+    in.read(_blockText.data() + size, blockSize);
+    const size_t n = in.gcount();
+    _bytesRead += n;
+    size += n;
+    if (n < blockSize) {
+      if (size == 0) {
+        return false;
+      }
+      if (_blockText[size - 1] != '\n') {
+        _blockText[size++] = '\n';
+      }
+      end = size;
+    } else {
+      const std::string_view text(_blockText.data() + size - n, n);
+      const size_t pos = text.rfind('\n');
+      if (pos != std::string_view::npos) {
+        end = size - n + pos + 1;
+      }
+    }
+  }
+  _blockTextSize = size;
+  _blockLinesEnd = end;
+
+  // Split the lines into one range per thread.
+  const int threads = _blockThreads;
+  std::vector<char*> bounds(threads + 1);
+  char* text = _blockText.data();
+  bounds[0] = text;
+  for (int t = 1; t < threads; t++) {
+    char* bound = std::max(text + end * t / threads, bounds[t - 1]);
+    if (bound > text && bound < text + end && bound[-1] != '\n') {
+      bound = (char*) memchr(bound, '\n', text + end - bound) + 1;
+    }
+    bounds[t] = bound;
+  }
+  bounds[threads] = text + end;
+
+  _blockRanges.resize(threads);
+#pragma omp parallel for num_threads(threads) schedule(static, 1)
+  for (int t = 0; t < threads; t++) {
+    breakBlockRange(bounds[t], bounds[t + 1], _blockRanges[t]);
+  }
+  _blockRange = 0;
+  _blockLine = 0;
+
+  return true;
+}
+
+// Same word breaking as mkWords(), in place: the separator after each word
+// is replaced by '\0'.
+void Ath__parser::breakBlockRange(char* begin, char* end, BlockRange& range)
+{
+  range.words.clear();
+  range.lines.clear();
+  char* p = begin;
+  while (p < end) {
+    range.lines.push_back(range.words.size());
+    char* eol = (char*) memchr(p, '\n', end - p);
+    while (p < eol) {
+      while (p < eol && isSeparator(*p)) {
+        p++;
+      }
+      if (p == eol || *p == _commentChar) {
+        break;
+      }
+      char* word = p;
+      while (p < eol && !isSeparator(*p) && *p != _commentChar) {
+        p++;
+      }
+      if (*p == _commentChar) {
+        break;
+      }
+      range.words.push_back(word);
+      *p++ = '\0';
+    }
+    p = eol + 1;
+  }
+  range.lines.push_back(range.words.size());
+}
+
+int Ath__parser::parseNextBlockLine()
+{
+  while (true) {
+    for (; _blockRange < _blockRanges.size(); _blockRange++, _blockLine = 0) {
+      BlockRange& range = _blockRanges[_blockRange];
+      while (_blockLine + 1 < range.lines.size()) {
+        const int first = range.lines[_blockLine];
+        const int last = range.lines[_blockLine + 1];
+        _blockLine++;
+        _lineNum++;
+        reportProgress();
+        if (last > first) {
+          _words = range.words.data() + first;
+          _currentWordCnt = last - first;
+          return _currentWordCnt;
+        }
+      }
+    }
+    if (!readBlock()) {
+      _currentWordCnt = -1;
+      return _currentWordCnt;
+    }
+  }
+}
+
 void Ath__parser::printWords(FILE* fp)
 {
   if (fp == nullptr) {
     return;
   }
   for (int ii = 0; ii < _currentWordCnt; ii++) {
-    fprintf(fp, "%s ", _wordArray[ii]);
+    fprintf(fp, "%s ", _words[ii]);
   }
   fprintf(fp, "\n");
 }
@@ -198,7 +372,7 @@ char* Ath__parser::get(int ii)
   if ((ii < 0) || (ii >= _currentWordCnt)) {
     return nullptr;
   }
-  return _wordArray[ii];
+  return _words[ii];
 }
 
 int Ath__parser::getInt(int ii)
@@ -268,14 +442,14 @@ int Ath__parser::mkWords(const char* word, const char* sep)
   char buf1[100];
   if (sep != nullptr) {
     strcpy(buf1, _wordSeparators);
-    strcpy(_wordSeparators, sep);
+    resetSeparator(sep);
   }
 
   strcpy(_line, word);
   _currentWordCnt = mkWords(0);
 
   if (sep != nullptr) {
-    strcpy(_wordSeparators, buf1);
+    resetSeparator(buf1);
   }
 
   return _currentWordCnt;
@@ -296,17 +470,12 @@ int Ath__parser::mkDirTree(const char* word, const char* sep)
 
 bool Ath__parser::isSeparator(char a)
 {
-  int len = strlen(_wordSeparators);
-  for (int k = 0; k < len; k++) {
-    if (a == _wordSeparators[k]) {
-      return true;
-    }
-  }
-  return false;
+  return _separators[(unsigned char) a];
 }
 
 int Ath__parser::mkWords(int jj)
 {
+  _words = _wordArray;
   if (_line[0] == _commentChar) {
     return jj;
   }
@@ -380,6 +549,9 @@ void Ath__parser::syntaxError(const char* msg)
 
 int Ath__parser::parseNextLine()
 {
+  if (_inStream) {
+    return parseNextBlockLine();
+  }
   while (readLineAndBreak() == 0) {
     ;
   }
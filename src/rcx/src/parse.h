@@ -3,13 +3,20 @@
 
 #pragma once
 
+#include <cstdint>
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
+#include <memory>
+#include <vector>
 
 #include "odb/array1.h"
 #include "utl/Logger.h"
 
+namespace utl {
+class InStreamHandler;
+}
+
 namespace rcx {
 
 class Ath__parser
@@ -19,6 +26,11 @@ class Ath__parser
   ~Ath__parser();
   void openFile(const char* name = nullptr);
   void setInputFP(FILE* fp);
+  // Read the files opened later in large blocks (gzip files are
+  // decompressed in-process) and break the lines of each block into words
+  // with the given number of threads ahead of parseNextLine().
+  void setBlockMode(int threads);
+  uint64_t getBytesRead();
   int mkWords(const char* word, const char* sep = nullptr);
   int readLineAndBreak(int prevWordCnt = -1);
   int parseNextLine();
@@ -47,15 +59,31 @@ class Ath__parser
   bool isDigit(int ii, int jj);
 
  private:
+  // The words of the lines in a part of a block
+  struct BlockRange
+  {
+    std::vector<char*> words;
+    // Index in words of the first word of each line, and of the end
+    std::vector<int> lines;
+  };
+
   void init();
   void reportProgress();
   int mkWords(int jj);
   bool isSeparator(char a);
+  void updateSeparators();
+  void openBlockFile(const char* name);
+  bool readBlock();
+  void breakBlockRange(char* begin, char* end, BlockRange& range);
+  int parseNextBlockLine();
 
   char* _line;
   char* _tmpLine;
   char* _wordSeparators;
   char** _wordArray;
+  // The words of the current line: _wordArray or a line of a block
+  char** _words;
+  bool _separators[256];
   char _commentChar;
   int _maxWordCnt;
 
@@ -67,6 +95,18 @@ class Ath__parser
 
   int _progressLineChunk;
   utl::Logger* _logger;
+
+  int _blockThreads = 0;
+  std::unique_ptr<utl::InStreamHandler> _inStream;
+  std::vector<char> _blockText;
+  // Bytes of _blockText holding text; the lines end at _blockLinesEnd and
+  // the rest is the start of a line continued in the next block.
+  size_t _blockTextSize = 0;
+  size_t _blockLinesEnd = 0;
+  std::vector<BlockRange> _blockRanges;
+  size_t _blockRange = 0;
+  size_t _blockLine = 0;
+  uint64_t _bytesRead = 0;
 };
 
 }  // namespace rcx
@@ -0,0 +1,40 @@
+# v2 extraction with multiple threads matches the single thread SPEF
+source helpers.tcl
+
+read_lef sky130hs/sky130hs.tlef
+read_lef sky130hs/sky130hs_std_cell.lef
+read_liberty sky130hs/sky130hs_tt.lib
+
+read_def gcd.def
+
+# Load via resistance info
+source sky130hs/sky130hs.rc
+
+define_process_corner -ext_model_index 0 X
+
+proc extract_spef { threads spef_file } {
+  set_thread_count $threads
+  extract_parasitics -ext_model_file ext_pattern.rules -max_res 0 \
+    -coupling_threshold 0.1 -version 2.0 -skip_over_cell
+  # Write both files on one thread so only the extraction differs
+  set_thread_count 1
+  write_spef $spef_file
+}
+
+proc remove_parasitics { } {
+  foreach net [[ord::get_db_block] getNets] {
+    $net destroyParasitics
+  }
+}
+
+set serial_file [make_result_file gcd_parallel_serial.spef]
+extract_spef 1 $serial_file
+remove_parasitics
+set parallel_file [make_result_file gcd_parallel.spef]
+extract_spef 4 $parallel_file
+
+if { [diff_files $serial_file $parallel_file "^\\*DATE"] == 0 } {
+  puts "pass"
+} else {
+  puts "fail"
+}
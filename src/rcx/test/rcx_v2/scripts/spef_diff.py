@@ -0,0 +1,184 @@
+"""Load diff_spef.out into a pandas DataFrame and compute error statistics.
+
+diff_spef writes one line per net and total R or C value; the columns are
+described in src/rcx/doc/diff_spef.README.  read_diff_spef() parses the
+whole file at once into typed columns, and the functions below compute
+buckets, histograms, outliers and percentiles on the frame with vectorized
+group-bys, so correlating millions of nets takes seconds.
+
+    import spef_diff
+    df = spef_diff.read_diff_spef("diff_spef.out", cache="diff_spef.parquet")
+    caps = df[(df["type"] == "netCap") & (df["corner"] == 0)]
+    print(spef_diff.error_summary(caps, ["pattern", "wire"], 3.0))
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Pattern net names of the calibration flow, e.g. O6_..._3 or V2-...-W3
+PATTERNS = ["O6", "U6", "OU6", "R6", "DU6", "V2"]
+
+# Upper bounds (inclusive) of the wire length buckets; 0 is its own bucket
+# and longer wires go to the last one.
+LENGTH_BOUNDS = [0, 5000, 10000, 20000, 50000, 100000]
+
+# Token index of the columns that differ between the netRes lines and the
+# lines of the cap types
+_RES_COLUMNS = {"via_res": 14, "via_cnt": 16, "wire_len": 18, "wire_cnt": 20}
+_CAP_COLUMNS = {"wire_len": 14, "wire_cnt": 16, "via_cnt": 18}
+
+
+def read_diff_spef(path, cache=None):
+    """Returns the frame of the diff_spef.out file at path.
+
+    When cache is a file name, the frame is read from that Parquet file if
+    it is newer than path, and written to it otherwise.
+    """
+    if (
+        cache is not None
+        and os.path.exists(cache)
+        and os.path.getmtime(cache) >= os.path.getmtime(path)
+    ):
+        return pd.read_parquet(cache)
+
+    df = parse_diff_spef(path)
+    if cache is not None:
+        try:
+            df.to_parquet(cache)
+        except ImportError as e:
+            print("Not caching", path, ":", e, file=sys.stderr)
+    return df
+
+
+def parse_diff_spef(path):
+    """Parses the total R and C lines of a diff_spef.out file.
+
+    The ccCap lines, which compare single coupling caps, are skipped.  The
+    original line is kept in the "line" column for the reports.
+    """
+    with open(path, "r") as f:
+        lines = pd.Series(f.read().splitlines(), dtype=object)
+    tokens = lines.str.split()
+    keep = (tokens.str.len() >= 24) & (tokens.str[2] != "ccCap")
+    lines = lines[keep].reset_index(drop=True)
+    tokens = tokens[keep].reset_index(drop=True)
+
+    cols = pd.DataFrame(tokens.tolist())
+    is_res = cols[21] == "netRes"
+
+    def column(res_index, cap_index):
+        return cols[res_index].where(is_res, cols[cap_index])
+
+    df = pd.DataFrame(
+        {
+            "error": pd.to_numeric(cols[0]),
+            "value": pd.to_numeric(cols[1]),
+            "ref": pd.to_numeric(cols[6]),
+            "min_bound": pd.to_numeric(cols[11]),
+            "max_bound": pd.to_numeric(cols[12]),
+        }
+    )
+    for name in _CAP_COLUMNS:
+        df[name] = pd.to_numeric(column(_RES_COLUMNS[name], _CAP_COLUMNS[name]))
+    df["via_res"] = pd.to_numeric(cols[14].where(is_res))
+    df["type"] = column(21, 19).astype("category")
+    df["corner"] = pd.to_numeric(column(23, 21)).astype(np.int16)
+    df["net_id"] = pd.to_numeric(tokens.str[-2], errors="coerce")
+    df["net"] = tokens.str[-1]
+    df["pattern"], df["wire"] = net_patterns(df["net"])
+    df["pattern"] = df["pattern"].astype("category")
+    df["line"] = lines
+    return df
+
+
+def net_patterns(names):
+    """Returns the pattern name and wire number of the pattern net names.
+
+    The wire number is <NA> for names that don't end in one.
+    """
+    # Via patterns can have . or - as separators
+    is_via = names.str.startswith("V") & names.str.contains("V2", regex=False)
+    dash = names.str.split("-")
+    segments = dash.where(dash.str[0] == "V2", names.str.split("."))
+    segments = segments.where(is_via, names.str.split("_"))
+
+    last = segments.str[-1]
+    wire = last.where(~is_via, last.str.split("W").str[1])
+    wire = pd.to_numeric(wire, errors="coerce").astype("Int64")
+    return segments.str[0], wire
+
+
+def bucket_index(values, edges):
+    """Returns the bucket [edges[i], edges[i + 1]) of each value.
+
+    Values below the first edge are in the first bucket and values at or
+    above the last edge in the last one.
+    """
+    index = np.searchsorted(edges, values, side="right") - 1
+    return np.clip(index, 0, len(edges) - 1)
+
+
+def histogram(values, edges):
+    """Returns the count of the values in each bucket of bucket_index()."""
+    return np.bincount(bucket_index(values, edges), minlength=len(edges))
+
+
+def length_bucket(wire_len):
+    """Returns the LENGTH_BOUNDS bucket label of each wire length."""
+    labels = ["0"] + ["<=" + str(b) for b in LENGTH_BOUNDS[1:]]
+    labels.append(">" + str(LENGTH_BOUNDS[-1]))
+    index = np.searchsorted(LENGTH_BOUNDS, wire_len, side="left")
+    return pd.Categorical.from_codes(index, labels)
+
+
+def outliers(df, threshold):
+    """Returns the rows with an error percentage beyond +/-threshold."""
+    return df[df["error"].abs() > threshold]
+
+
+def error_summary(df, by, threshold, percentiles=(50, 90, 99)):
+    """Returns the count, outliers and |error| percentiles of each group."""
+    keys = [df[c] for c in by]
+    abs_error = df["error"].abs()
+    groups = abs_error.groupby(keys, observed=True)
+    summary = pd.DataFrame(
+        {
+            "count": groups.size(),
+            "outliers": (abs_error > threshold).groupby(keys, observed=True).sum(),
+        }
+    )
+    summary["outlier_percent"] = (100.0 * summary["outliers"] / summary["count"]).round(
+        1
+    )
+    for p in percentiles:
+        summary["p" + str(p)] = groups.quantile(p / 100.0)
+    summary["max"] = groups.max()
+    return summary
+
+
+def sort_rows(df):
+    """Sorts the rows by error, then by the rest of the line."""
+    rest = df["line"].str.split().str[1:].str.join(" ")
+    order = np.lexsort((rest.to_numpy(), df["error"].to_numpy()))
+    return df.iloc[order]
+
+
+def format_lines(df, replace=None):
+    """Returns the report lines of the rows.
+
+    The tokens are joined by single spaces and the error token is replaced
+    by the "error" column; replace maps other token indexes to columns.
+    """
+    replace = {0: "error", **(replace or {})}
+    tokens = df["line"].str.split()
+    for index, column in replace.items():
+        values = df[column].map(str)
+        tokens = pd.Series(
+            [t[:index] + [v] + t[index + 1 :] for t, v in zip(tokens, values)],
+            index=df.index,
+            dtype=object,
+        )
+    return tokens.str.join(" ")
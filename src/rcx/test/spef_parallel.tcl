@@ -0,0 +1,53 @@
+# SPEF written with multiple threads or compressed matches the serial output
+source helpers.tcl
+
+read_lef sky130hs/sky130hs.tlef
+read_lef sky130hs/sky130hs_std_cell.lef
+read_liberty sky130hs/sky130hs_tt.lib
+
+read_def gcd.def
+
+# Load via resistance info
+source sky130hs/sky130hs.rc
+
+define_process_corner -ext_model_index 0 X
+extract_parasitics -ext_model_file ext_pattern.rules -max_res 0 \
+  -coupling_threshold 0.1
+
+proc read_spef_lines { filename } {
+  set stream [open $filename r]
+  fconfigure $stream -translation binary
+  set data [read $stream]
+  close $stream
+  if { [file extension $filename] == ".gz" } {
+    set data [zlib gunzip $data]
+  }
+  # The *DATE line records when the file was written.
+  return [lsearch -all -inline -not -regexp [split $data "\n"] {^\*DATE}]
+}
+
+set_thread_count 1
+set serial_file [make_result_file spef_parallel_serial.spef]
+write_spef $serial_file
+
+set_thread_count 4
+set parallel_file [make_result_file spef_parallel.spef]
+write_spef $parallel_file
+
+set gz_file [make_result_file spef_parallel.spef.gz]
+write_spef $gz_file
+
+set serial [read_spef_lines $serial_file]
+set pass 1
+foreach filename [list $parallel_file $gz_file] {
+  if { [read_spef_lines $filename] != $serial } {
+    puts "[file tail $filename] differs from the serial SPEF"
+    set pass 0
+  }
+}
+
+if { $pass } {
+  puts "pass"
+} else {
+  puts "fail"
+}
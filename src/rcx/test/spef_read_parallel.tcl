@@ -0,0 +1,50 @@
+# SPEF read with rcx on multiple threads from a gzip file matches the
+# serial read of the plain file
+source helpers.tcl
+
+read_lef sky130hs/sky130hs.tlef
+read_lef sky130hs/sky130hs_std_cell.lef
+read_liberty sky130hs/sky130hs_tt.lib
+
+read_def gcd.def
+
+# Load via resistance info
+source sky130hs/sky130hs.rc
+
+define_process_corner -ext_model_index 0 X
+extract_parasitics -ext_model_file ext_pattern.rules -max_res 0 \
+  -coupling_threshold 0.1
+
+set_thread_count 1
+set spef_file [make_result_file spef_read_parallel.spef]
+write_spef $spef_file
+
+set gz_file [make_result_file spef_read_parallel.spef.gz]
+set in [open $spef_file r]
+set out [open $gz_file w]
+zlib push gzip $out
+fcopy $in $out
+close $in
+close $out
+
+proc read_and_write_spef { in_file out_file threads } {
+  foreach net [[ord::get_db_block] getNets] {
+    $net destroyParasitics
+  }
+  set_thread_count $threads
+  bench_read_spef $in_file
+  set_thread_count 1
+  write_spef $out_file
+}
+
+set serial_file [make_result_file spef_read_parallel_serial.spef]
+read_and_write_spef $spef_file $serial_file 1
+
+set parallel_file [make_result_file spef_read_parallel_gz.spef]
+read_and_write_spef $gz_file $parallel_file 4
+
+if { [diff_files $serial_file $parallel_file "^\\*DATE"] } {
+  puts "fail"
+} else {
+  puts "pass"
+}
@@ -0,0 +1,92 @@
+# Runtime of reading a synthetic SPEF, plain and gzip compressed, across
+# thread counts.  Every net has two internal nodes, one resistor and a
+# coupling cap to the next net.
+# usage: openroad spef_read_scaling.tcl [num_nets] [max_threads]
+source helpers.tcl
+
+set num_nets 10000000
+set max_threads [cpu_count]
+if { $argc > 0 } {
+  set num_nets [lindex $argv 0]
+}
+if { $argc > 1 } {
+  set max_threads [lindex $argv 1]
+}
+
+read_lef sky130hs/sky130hs.tlef
+
+proc make_design { num_nets } {
+  set db [ord::get_db]
+  set tech [$db getTech]
+  set chip [odb::dbChip_create $db $tech]
+  set block [odb::dbBlock_create $chip "top"]
+  for { set i 1 } { $i <= $num_nets } { incr i } {
+    odb::dbNet_create $block "net$i"
+  }
+}
+
+proc write_spef_files { num_nets spef_file gz_file } {
+  set spef [open $spef_file w]
+  set gz [open $gz_file w]
+  zlib push gzip $gz
+  foreach stream [list $spef $gz] {
+    puts $stream "*SPEF \"ieee 1481-1999\""
+    puts $stream "*DESIGN \"top\""
+    puts $stream "*DIVIDER /"
+    puts $stream "*DELIMITER :"
+    puts $stream "*BUS_DELIMITER \[ \]"
+    puts $stream "*T_UNIT 1 NS"
+    puts $stream "*C_UNIT 1 FF"
+    puts $stream "*R_UNIT 1 OHM"
+    puts $stream "*L_UNIT 1 HENRY"
+    puts $stream ""
+    puts $stream "*NAME_MAP"
+  }
+  for { set i 1 } { $i <= $num_nets } { incr i } {
+    set line "*$i net$i"
+    puts $spef $line
+    puts $gz $line
+  }
+  for { set i 1 } { $i <= $num_nets } { incr i } {
+    set cc ""
+    if { $i < $num_nets } {
+      set cc "3 *$i:1 *[expr $i + 1]:1 0.1\n"
+    }
+    set net "\n*D_NET *$i 1.1\n*CONN\n*CAP\n1 *$i:1 0.5\n2 *$i:2 0.5\n"
+    append net $cc "*RES\n1 *$i:1 *$i:2 10.0\n*END"
+    puts $spef $net
+    puts $gz $net
+  }
+  close $spef
+  close $gz
+}
+
+make_design $num_nets
+set spef_file [make_result_file spef_read_scaling.spef]
+set gz_file [make_result_file spef_read_scaling.spef.gz]
+write_spef_files $num_nets $spef_file $gz_file
+set mbytes [expr [file size $spef_file] / 1e6]
+
+define_process_corner -ext_model_index 0 X
+
+set results {}
+foreach file [list $spef_file $gz_file] {
+  for { set threads 1 } { $threads <= $max_threads } \
+    { set threads [expr $threads * 2] } {
+    foreach net [[ord::get_db_block] getNets] {
+      $net destroyParasitics
+    }
+    set_thread_count $threads
+    set start [clock milliseconds]
+    bench_read_spef $file
+    set ms [expr max([clock milliseconds] - $start, 1)]
+    lappend results [file tail $file] $threads $ms \
+      [expr $mbytes * 1000 / $ms]
+  }
+}
+
+puts [format "%-28s %8s %12s %10s" "File" "Threads" "Time (ms)" "MB/s"]
+foreach { file threads ms rate } $results {
+  puts [format "%-28s %8d %12d %10.1f" $file $threads $ms $rate]
+}
+exit
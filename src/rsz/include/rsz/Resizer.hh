@@ -412,6 +412,28 @@ class Resizer : public dbStaState, public dbNetworkObserver
   PinSet findFaninFanouts(PinSet& end_pins);
   PinSet findFanins(PinSet& end_pins);
 
+  ////////////////////////////////////////////////////////////////
+  // API for scripted what-if exploration.
+  // Moves made between whatIfBegin() and whatIfCommit()/whatIfRollback()
+  // are journaled in odb so they can be backed out without reloading the
+  // design.  Parasitics of the nets touched by the moves are re-estimated
+  // incrementally before timing and power are queried.
+  void whatIfBegin();
+  // Swap the master of inst for an equivalent cell.
+  // Returns false if the master is not swappable with the current one.
+  bool whatIfSwapCell(dbInst* inst, dbMaster* master);
+  // Insert a buffer after the driver of net that drives all of its
+  // instance loads.  Top level ports stay on the original net.
+  dbInst* whatIfInsertBuffer(dbNet* net, dbMaster* buffer_master);
+  // Worst setup slack (seconds).
+  float whatIfWorstSlack();
+  // Total power of the design for the command corner (watts).
+  float whatIfTotalPower();
+  int whatIfMoveCount() const { return what_if_move_count_; }
+  bool inWhatIf() const { return what_if_parasitics_ != nullptr; }
+  void whatIfCommit();
+  void whatIfRollback();
+
   ////////////////////////////////////////////////////////////////
   dbNetwork* getDbNetwork() { return db_network_; }
   dbBlock* getDbBlock() { return block_; };
@@ -698,6 +720,7 @@ class Resizer : public dbStaState, public dbNetworkObserver
   void journalEnd();
   void journalRestore();
   void journalMakeBuffer(Instance* buffer);
+  void checkWhatIf() const;
 
   ////////////////////////////////////////////////////////////////
   // API for logic resynthesis
@@ -791,6 +814,10 @@ class Resizer : public dbStaState, public dbNetworkObserver
 
   std::unique_ptr<OdbCallBack> db_cbk_;
 
+  // What-if session state.
+  std::unique_ptr<est::IncrementalParasiticsGuard> what_if_parasitics_;
+  int what_if_move_count_ = 0;
+
   // Restrict default sizing such that one sizing move cannot increase area or
   // leakage by more than 4X.  Subsequent sizing moves can exceed the 4X limit.
   std::optional<double> sizing_area_limit_ = 4.0;
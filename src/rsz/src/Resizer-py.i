@@ -0,0 +1,42 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+%module rsz_py
+
+%{
+#include "odb/db.h"
+#include "ord/OpenRoad.hh"
+#include "rsz/Resizer.hh"
+
+using namespace rsz;
+%}
+
+%include "../../Exception-py.i"
+
+%import "odb.i"
+
+// Only the what-if API is wrapped; the full header pulls in most of
+// OpenSTA.
+namespace rsz {
+
+%nodefaultctor Resizer;
+%nodefaultdtor Resizer;
+
+class Resizer
+{
+ public:
+  double designArea();
+
+  void whatIfBegin();
+  bool whatIfSwapCell(odb::dbInst* inst, odb::dbMaster* master);
+  odb::dbInst* whatIfInsertBuffer(odb::dbNet* net,
+                                  odb::dbMaster* buffer_master);
+  float whatIfWorstSlack();
+  float whatIfTotalPower();
+  int whatIfMoveCount() const;
+  bool inWhatIf() const;
+  void whatIfCommit();
+  void whatIfRollback();
+};
+
+}  // namespace rsz
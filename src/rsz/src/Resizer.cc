@@ -64,6 +64,7 @@
 #include "sta/NetworkClass.hh"
 #include "sta/Parasitics.hh"
 #include "sta/PortDirection.hh"
+#include "sta/PowerClass.hh"
 #include "sta/Sdc.hh"
 #include "sta/Search.hh"
 #include "sta/SearchPred.hh"
@@ -75,6 +76,7 @@
 #include "sta/Vector.hh"
 #include "utl/Logger.h"
 #include "utl/scope.h"
+#include "utl/stage_metrics.h"
 
 // http://vlsicad.eecs.umich.edu/BK/Slots/cache/dropzone.tamu.edu/~zhuoli/GSRC/fast_buffer_insertion.html
 
@@ -4230,6 +4232,7 @@ void Resizer::repairDesign(double max_wire_length,
                            bool match_cell_footprint,
                            bool verbose)
 {
+  utl::ScopedStageMetrics metrics(logger_, "repair_design");
   utl::SetAndRestore set_match_footprint(match_cell_footprint_,
                                          match_cell_footprint);
   resizePreamble();
@@ -4241,6 +4244,8 @@ void Resizer::repairDesign(double max_wire_length,
   }
   repair_design_->repairDesign(
       max_wire_length, slew_margin, cap_margin, buffer_gain, verbose);
+  metrics.setQuality("inserted_buffers",
+                     repair_design_->insertedBufferCount());
 }
 
 int Resizer::repairDesignBufferCount() const
@@ -4395,6 +4400,7 @@ bool Resizer::repairSetup(double setup_margin,
                           bool skip_vt_swap,
                           bool skip_crit_vt_swap)
 {
+  utl::ScopedStageMetrics metrics(logger_, "repair_timing_setup");
   utl::SetAndRestore set_match_footprint(match_cell_footprint_,
                                          match_cell_footprint);
   resizePreamble();
@@ -4404,21 +4410,26 @@ bool Resizer::repairSetup(double setup_margin,
              == est::ParasiticsSrc::detailed_routing) {
     opendp_->initMacrosAndGrid();
   }
-  return repair_setup_->repairSetup(setup_margin,
-                                    repair_tns_end_percent,
-                                    max_passes,
-                                    max_iterations,
-                                    max_repairs_per_pass,
-                                    verbose,
-                                    sequence,
-                                    skip_pin_swap,
-                                    skip_gate_cloning,
-                                    skip_size_down,
-                                    skip_buffering,
-                                    skip_buffer_removal,
-                                    skip_last_gasp,
-                                    skip_vt_swap,
-                                    skip_crit_vt_swap);
+  const bool repaired = repair_setup_->repairSetup(setup_margin,
+                                                   repair_tns_end_percent,
+                                                   max_passes,
+                                                   max_iterations,
+                                                   max_repairs_per_pass,
+                                                   verbose,
+                                                   sequence,
+                                                   skip_pin_swap,
+                                                   skip_gate_cloning,
+                                                   skip_size_down,
+                                                   skip_buffering,
+                                                   skip_buffer_removal,
+                                                   skip_last_gasp,
+                                                   skip_vt_swap,
+                                                   skip_crit_vt_swap);
+  Slack worst_slack;
+  Vertex* worst_vertex;
+  sta_->worstSlack(max_, worst_slack, worst_vertex);
+  metrics.setQuality("worst_slack", worst_slack);
+  return repaired;
 }
 
 void Resizer::reportSwappablePins()
@@ -4452,6 +4463,7 @@ bool Resizer::repairHold(
     bool match_cell_footprint,
     bool verbose)
 {
+  utl::ScopedStageMetrics metrics(logger_, "repair_timing_hold");
   utl::SetAndRestore set_match_footprint(match_cell_footprint_,
                                          match_cell_footprint);
   // Some technologies such as nangate45 don't have delay cells. Hence,
@@ -4470,13 +4482,15 @@ bool Resizer::repairHold(
              == est::ParasiticsSrc::detailed_routing) {
     opendp_->initMacrosAndGrid();
   }
-  return repair_hold_->repairHold(setup_margin,
-                                  hold_margin,
-                                  allow_setup_violations,
-                                  max_buffer_percent,
-                                  max_passes,
-                                  max_iterations,
-                                  verbose);
+  const bool repaired = repair_hold_->repairHold(setup_margin,
+                                                 hold_margin,
+                                                 allow_setup_violations,
+                                                 max_buffer_percent,
+                                                 max_passes,
+                                                 max_iterations,
+                                                 verbose);
+  metrics.setQuality("inserted_buffers", repair_hold_->holdBufferCount());
+  return repaired;
 }
 
 void Resizer::repairHold(const Pin* end_pin,
@@ -4742,6 +4756,171 @@ void Resizer::journalRestoreTest()
       removed_buffer_count_old - unbuffer_move_->numMoves());
 }
 
+////////////////////////////////////////////////////////////////
+
+// API for scripted what-if exploration.
+
+void Resizer::whatIfBegin()
+{
+  if (inWhatIf()) {
+    logger_->error(RSZ, 169, "A what-if session is already active.");
+  }
+  resizePreamble();
+  what_if_parasitics_
+      = std::make_unique<est::IncrementalParasiticsGuard>(estimate_parasitics_);
+  what_if_move_count_ = 0;
+  journalBegin();
+}
+
+void Resizer::checkWhatIf() const
+{
+  if (!inWhatIf()) {
+    logger_->error(RSZ, 170, "No what-if session is active.");
+  }
+}
+
+bool Resizer::whatIfSwapCell(dbInst* inst, dbMaster* master)
+{
+  checkWhatIf();
+  Instance* sta_inst = db_network_->dbToSta(inst);
+  LibertyCell* cell = network_->libertyCell(sta_inst);
+  LibertyCell* replacement = network_->libertyCell(db_network_->dbToSta(master));
+  if (cell == nullptr || replacement == nullptr) {
+    return false;
+  }
+  if (dontTouch(sta_inst)) {
+    logger_->warn(RSZ,
+                  171,
+                  "Instance {} is dont touch and cannot be swapped.",
+                  inst->getName());
+    return false;
+  }
+  if (cell == replacement) {
+    return true;
+  }
+  const LibertyCellSeq swappable_cells = getSwappableCells(cell);
+  if (std::find(swappable_cells.begin(), swappable_cells.end(), replacement)
+      == swappable_cells.end()) {
+    return false;
+  }
+  if (!replaceCell(sta_inst, replacement, true)) {
+    return false;
+  }
+  what_if_move_count_++;
+  return true;
+}
+
+dbInst* Resizer::whatIfInsertBuffer(dbNet* db_net, dbMaster* buffer_master)
+{
+  checkWhatIf();
+  LibertyCell* buffer_cell
+      = network_->libertyCell(db_network_->dbToSta(buffer_master));
+  if (buffer_cell == nullptr || !buffer_cell->isBuffer()) {
+    logger_->error(RSZ, 172, "{} is not a buffer.", buffer_master->getName());
+  }
+  Net* net = db_network_->dbToSta(db_net);
+  if (dontTouch(net)) {
+    logger_->warn(RSZ,
+                  173,
+                  "Net {} is dont touch and cannot be buffered.",
+                  db_net->getName());
+    return nullptr;
+  }
+  PinSet* drivers = network_->drivers(net);
+  if (drivers == nullptr || drivers->size() != 1) {
+    logger_->warn(RSZ,
+                  174,
+                  "Net {} does not have a single driver and cannot be "
+                  "buffered.",
+                  db_net->getName());
+    return nullptr;
+  }
+  const Pin* drvr_pin = *drivers->begin();
+
+  std::vector<const Pin*> loads;
+  std::unique_ptr<NetConnectedPinIterator> pin_iter(
+      network_->pinIterator(net));
+  while (pin_iter->hasNext()) {
+    const Pin* pin = pin_iter->next();
+    if (pin != drvr_pin && !network_->isTopLevelPort(pin)
+        && network_->isLoad(pin)) {
+      loads.push_back(pin);
+    }
+  }
+  if (loads.empty()) {
+    return nullptr;
+  }
+
+  LibertyPort *input, *output;
+  buffer_cell->bufferPorts(input, output);
+  // Make the buffer in the driver pin's parent hierarchy, as repair_hold
+  // does, so the move matches a real insertion in hierarchical designs.
+  Instance* parent
+      = db_network_->getOwningInstanceParent(const_cast<Pin*>(drvr_pin));
+  odb::dbModNet* mod_drvr_net = db_network_->hierNet(drvr_pin);
+  Instance* buffer = makeBuffer(
+      buffer_cell, "what_if", parent, db_network_->location(drvr_pin));
+  Net* buffer_out = db_network_->makeNet(parent);
+  db_network_->staToDb(buffer_out)->setSigType(db_net->getSigType());
+
+  sta_->connectPin(buffer, input, net);
+  sta_->connectPin(buffer, output, buffer_out);
+  if (mod_drvr_net) {
+    // The input of the buffer is a new load on the hierarchical net
+    db_network_->connectPin(network_->findPin(buffer, input),
+                            (Net*) mod_drvr_net);
+  }
+
+  Pin* buffer_out_pin = network_->findPin(buffer, output);
+  for (const Pin* load_pin : loads) {
+    db_network_->disconnectPin(const_cast<Pin*>(load_pin));
+    db_network_->hierarchicalConnect(db_network_->flatPin(buffer_out_pin),
+                                     db_network_->flatPin(load_pin));
+  }
+  level_drvr_vertices_valid_ = false;
+
+  what_if_move_count_++;
+  return db_network_->staToDb(buffer);
+}
+
+float Resizer::whatIfWorstSlack()
+{
+  checkWhatIf();
+  what_if_parasitics_->update();
+  return sta_->worstSlack(max_);
+}
+
+float Resizer::whatIfTotalPower()
+{
+  checkWhatIf();
+  what_if_parasitics_->update();
+  sta::PowerResult total, sequential, combinational, clock, macro, pad;
+  sta_->power(
+      sta_->cmdCorner(), total, sequential, combinational, clock, macro, pad);
+  return total.total();
+}
+
+void Resizer::whatIfCommit()
+{
+  checkWhatIf();
+  journalEnd();
+  what_if_parasitics_.reset();
+  logger_->info(RSZ, 175, "Committed {} what-if moves.", what_if_move_count_);
+  what_if_move_count_ = 0;
+}
+
+void Resizer::whatIfRollback()
+{
+  checkWhatIf();
+  db_cbk_->addOwner(block_);
+  journalRestore();
+  db_cbk_->removeOwner();
+  level_drvr_vertices_valid_ = false;
+  what_if_parasitics_.reset();
+  logger_->info(RSZ, 176, "Rolled back {} what-if moves.", what_if_move_count_);
+  what_if_move_count_ = 0;
+}
+
 void Resizer::getBufferPins(Instance* buffer, Pin*& ip, Pin*& op)
 {
   ip = nullptr;
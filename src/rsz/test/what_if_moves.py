@@ -0,0 +1,80 @@
+# what-if cell swaps and buffer insertions are kept on commit and undone on
+# rollback
+import math
+from openroad import Tech
+import helpers
+import utl
+
+tech = Tech()
+tech.readLef("Nangate45/Nangate45.lef")
+tech.readLiberty("Nangate45/Nangate45_typ.lib")
+
+design = helpers.make_design(tech)
+design.readDef("repair_setup1.def")
+design.evalTclString("create_clock -period 0.3 clk")
+design.evalTclString("source Nangate45/Nangate45.rc")
+design.evalTclString("set_wire_rc -layer metal3")
+design.evalTclString("estimate_parasitics -placement")
+
+db = tech.getDB()
+block = design.getBlock()
+resizer = design.getResizer()
+
+
+def snapshot():
+    masters = {inst.getName(): inst.getMaster().getName() for inst in block.getInsts()}
+    connections = {}
+    for net in block.getNets():
+        pins = [
+            iterm.getInst().getName() + "/" + iterm.getMTerm().getName()
+            for iterm in net.getITerms()
+        ]
+        pins += [bterm.getName() for bterm in net.getBTerms()]
+        connections[net.getName()] = sorted(pins)
+    return masters, connections
+
+
+utl.report(f"Initial: area {resizer.designArea() * 1e12:.3f} um^2")
+
+# upsize the driver of the long wire to r2 and keep it
+resizer.whatIfBegin()
+slack0 = resizer.whatIfWorstSlack()
+power0 = resizer.whatIfTotalPower()
+swapped = resizer.whatIfSwapCell(block.findInst("u5"), db.findMaster("BUF_X2"))
+utl.report(f"Swapped u5: {swapped}")
+slack1 = resizer.whatIfWorstSlack()
+power1 = resizer.whatIfTotalPower()
+utl.report(f"Moves: {resizer.whatIfMoveCount()}")
+resizer.whatIfCommit()
+utl.report(f"Worst slack improved: {slack1 > slack0}")
+utl.report(f"Total power increased: {power1 > power0}")
+
+masters1, connections1 = snapshot()
+utl.report(f"Committed: area {resizer.designArea() * 1e12:.3f} um^2")
+
+# upsize u1 and buffer r1q, then undo both
+resizer.whatIfBegin()
+swapped = resizer.whatIfSwapCell(block.findInst("u1"), db.findMaster("BUF_X4"))
+utl.report(f"Swapped u1: {swapped}")
+buffer = resizer.whatIfInsertBuffer(block.findNet("r1q"), db.findMaster("BUF_X4"))
+utl.report(f"Inserted buffer: {buffer.getMaster().getName()}")
+slack2 = resizer.whatIfWorstSlack()
+power2 = resizer.whatIfTotalPower()
+utl.report(f"Moves: {resizer.whatIfMoveCount()}")
+utl.report(f"Trial: area {resizer.designArea() * 1e12:.3f} um^2")
+utl.report(f"Trial worst slack differs: {slack2 != slack1}")
+utl.report(f"Trial total power increased: {power2 > power1}")
+resizer.whatIfRollback()
+
+masters2, connections2 = snapshot()
+utl.report(f"Rolled back: area {resizer.designArea() * 1e12:.3f} um^2")
+utl.report(f"Same instance count: {len(masters2) == len(masters1)}")
+utl.report(f"Same masters: {masters2 == masters1}")
+utl.report(f"Same connectivity: {connections2 == connections1}")
+
+resizer.whatIfBegin()
+slack3 = resizer.whatIfWorstSlack()
+power3 = resizer.whatIfTotalPower()
+resizer.whatIfCommit()
+utl.report(f"Same worst slack: {math.isclose(slack3, slack1, rel_tol=1e-6)}")
+utl.report(f"Same total power: {math.isclose(power3, power1, rel_tol=1e-6)}")
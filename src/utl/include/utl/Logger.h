@@ -39,6 +39,7 @@ namespace utl {
 
 class PrometheusMetricsServer;
 class PrometheusRegistry;
+class Profiler;
 
 class Progress;
 
@@ -227,6 +228,9 @@ class Logger
   bool isPrometheusServerReadyToServe();
   uint16_t getPrometheusPort();
 
+  // Hierarchical profiling spans, see utl/profiler.h.
+  Profiler* getProfiler() { return profiler_.get(); }
+
   void suppressMessage(ToolId tool, int id);
   void unsuppressMessage(ToolId tool, int id);
 
@@ -359,6 +363,8 @@ class Logger
   std::shared_ptr<PrometheusRegistry> prometheus_registry_;
   std::unique_ptr<PrometheusMetricsServer> prometheus_metrics_;
 
+  std::unique_ptr<Profiler> profiler_;
+
   // This matrix is pre-allocated so it can be safely updated
   // from multiple threads without locks.
   using MessageCounter = std::array<std::atomic_int16_t, max_message_id + 1>;
@@ -0,0 +1,111 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#include "utl/Logger.h"
+#include "utl/timer.h"
+
+namespace utl {
+
+// Aggregated statistics of one profiling span.  Spans are identified by
+// their path in the span hierarchy, e.g. "global_route/maze_route".
+struct ProfileStat
+{
+  std::string name;
+  int depth = 0;
+  int64_t calls = 0;
+  double inclusive_seconds = 0.0;
+  double exclusive_seconds = 0.0;
+  int64_t rss_delta_bytes = 0;
+};
+
+// Collects named, nestable profiling spans.  Spans are kept on a per-thread
+// stack so the time spent in child spans can be subtracted from the
+// exclusive time of the parent.  Profiling is off by default; spans that
+// are opened while profiling is off are not recorded, even if it is on when
+// they end.
+//
+// Spans can be opened from C++ with ProfileScope and from scripts with
+// begin()/end().
+class Profiler
+{
+ public:
+  explicit Profiler(Logger* logger);
+
+  // When trace is set, every span is also recorded as a Chrome trace event.
+  void start(bool trace = false);
+  void stop();
+  void reset();
+  bool isEnabled() const { return enabled_; }
+
+  void begin(const std::string& name);
+  void end();
+
+  std::vector<ProfileStat> getStats() const;
+  // The stats as a JSON object keyed by span path.
+  std::string getStatsJSON() const;
+  void report() const;
+  // Write the recorded trace events in the Chrome trace-event format
+  // (viewable in chrome://tracing or Perfetto).
+  void writeChromeTrace(const std::string& filename) const;
+
+  // Add the stats to the metrics of the logger.
+  void addMetrics();
+
+ private:
+  struct Frame
+  {
+    std::string path;
+    Timer timer;
+    double child_seconds = 0.0;
+    size_t start_rss = 0;
+    double start_us = 0.0;
+    // False for a span opened while profiling was off
+    bool recorded = true;
+  };
+
+  struct TraceEvent
+  {
+    std::string name;
+    uint64_t thread = 0;
+    double start_us = 0.0;
+    double duration_us = 0.0;
+  };
+
+  std::vector<Frame>& stack();
+  void record(const Frame& frame, double elapsed);
+
+  // Trace events past this limit are dropped to bound memory.
+  static constexpr size_t max_trace_events = 1000000;
+
+  Logger* logger_;
+  std::atomic_bool enabled_{false};
+  std::atomic_bool trace_{false};
+  Timer epoch_;
+  mutable std::mutex mutex_;
+  std::map<std::string, ProfileStat> stats_;
+  std::vector<TraceEvent> trace_events_;
+};
+
+// Profiles the enclosing scope as a span of the logger's profiler.  The
+// elapsed time is also reported like a DebugScopedTimer when the tool's
+// "profile" debug group is at level 1 or above.
+class ProfileScope : public DebugScopedTimer
+{
+ public:
+  ProfileScope(Logger* logger, ToolId tool, const std::string& name);
+  ~ProfileScope() override;
+
+ private:
+  Profiler* profiler_;
+};
+
+}  // namespace utl
@@ -0,0 +1,54 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#pragma once
+
+#include <cstddef>
+#include <string>
+
+#include "utl/profiler.h"
+#include "utl/prometheus/gauge.h"
+#include "utl/timer.h"
+
+namespace utl {
+
+class Logger;
+
+// Publishes telemetry of a major command (a stage such as global_placement)
+// on the logger's Prometheus registry.  Construct it at the start of the
+// command; the end of the stage is recorded when it goes out of scope.
+//
+// All metrics carry a "stage" label:
+//   ord_stage_running            1 while the stage runs, 0 otherwise
+//   ord_stage_start_time_seconds unix time of the last start
+//   ord_stage_end_time_seconds   unix time of the last end
+//   ord_stage_runs               number of completed runs
+//   ord_stage_wall_seconds       wall time of the last run
+//   ord_stage_cpu_seconds        process CPU time of the last run
+//   ord_stage_rss_bytes          current RSS at the end of the last run
+//   ord_stage_peak_rss_bytes     peak RSS at the end of the last run
+//   ord_stage_rss_delta_bytes    RSS change over the last run
+//   ord_stage_quality            quality counters, with a "metric" label
+//
+// The stage is also profiled as a top-level span of the logger's profiler.
+class ScopedStageMetrics
+{
+ public:
+  ScopedStageMetrics(Logger* logger, const std::string& stage);
+  ~ScopedStageMetrics();
+
+  // Publish a key quality counter (e.g. hpwl, overflow, drvs) of the stage.
+  void setQuality(const std::string& metric, double value);
+
+ private:
+  Gauge<double>& gauge(const std::string& name, const std::string& help);
+
+  Logger* logger_;
+  std::string stage_;
+  Timer timer_;
+  double start_cpu_;
+  size_t start_rss_;
+  ProfileScope profile_;
+};
+
+}  // namespace utl
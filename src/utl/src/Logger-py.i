@@ -10,6 +10,7 @@
 #ifdef BAZEL
 %{
 #include "utl/Logger.h"
+#include "utl/profiler.h"
 
 namespace ord {
 // Defined in OpenRoad.i
@@ -26,6 +27,7 @@ using namespace utl;
 #else
 %{
 #include "utl/Logger.h"
+#include "utl/profiler.h"
 #include "LoggerCommon.h"
 
 namespace ord {
@@ -51,11 +53,18 @@ using namespace utl;
 
 %include "../../Exception-py.i"
 %include "stdint.i"
+%include <std_string.i>
+%include <std_vector.i>
 
 %ignore utl::Logger::progress;
 %ignore utl::Logger::swapProgress;
 
+%ignore utl::ProfileScope;
+
 %include "utl/Logger.h"
+%include "utl/profiler.h"
+
+%template(ProfileStats) std::vector<utl::ProfileStat>;
 #ifndef BAZEL
 %include "LoggerCommon.h"
 #endif
\ No newline at end of file
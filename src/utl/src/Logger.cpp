@@ -28,6 +28,7 @@
 #include "spdlog/sinks/stdout_color_sinks.h"
 #include "spdlog/spdlog.h"
 #include "utl/Progress.h"
+#include "utl/profiler.h"
 #include "utl/prometheus/metrics_server.h"
 #include "utl/prometheus/registry.h"
 
@@ -67,6 +68,7 @@ Logger::Logger(const char* log_filename, const char* metrics_filename)
   }
 
   prometheus_registry_ = std::make_shared<PrometheusRegistry>();
+  profiler_ = std::make_unique<Profiler>(this);
 }
 
 Logger::~Logger()
@@ -213,6 +215,7 @@ void Logger::finalizeMetrics()
   log_metric("flow__errors__count", std::to_string(error_count_));
 
   addWarningMetrics();
+  profiler_->addMetrics();
 
   for (MetricsPolicy policy : metrics_policies_) {
     policy.applyPolicy(metrics_entries_);
@@ -7,6 +7,7 @@
 #include <string>
 
 #include "utl/Logger.h"
+#include "utl/profiler.h"
 
 namespace ord {
 // Defined in OpenRoad.i
@@ -119,4 +120,52 @@ void unsuppress_message(utl::ToolId tool, int id)
   logger->unsuppressMessage(tool, id);
 }
 
+void start_profiling(bool trace)
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->start(trace);
+}
+
+void stop_profiling()
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->stop();
+}
+
+void reset_profiling()
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->reset();
+}
+
+void profile_begin(const char* name)
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->begin(name);
+}
+
+void profile_end()
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->end();
+}
+
+std::string profile_stats_json()
+{
+  Logger* logger = getLogger();
+  return logger->getProfiler()->getStatsJSON();
+}
+
+void report_profile()
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->report();
+}
+
+void write_profile_trace(const char* filename)
+{
+  Logger* logger = getLogger();
+  logger->getProfiler()->writeChromeTrace(filename);
+}
+
 }  // namespace utl
@@ -25,5 +25,13 @@ void push_metrics_stage(const char* fmt);
 std::string pop_metrics_stage();
 void suppress_message(utl::ToolId tool, int id);
 void unsuppress_message(utl::ToolId tool, int id);
+void start_profiling(bool trace);
+void stop_profiling();
+void reset_profiling();
+void profile_begin(const char* name);
+void profile_end();
+std::string profile_stats_json();
+void report_profile();
+void write_profile_trace(const char* filename);
 
 }  // namespace utl
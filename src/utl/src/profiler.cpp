@@ -0,0 +1,256 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#include "utl/profiler.h"
+
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <fstream>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#include "utl/Logger.h"
+#include "utl/mem_stats.h"
+#include "utl/timer.h"
+
+namespace utl {
+
+static uint64_t threadIndex()
+{
+  static std::atomic<uint64_t> next_index{0};
+  thread_local const uint64_t index = next_index++;
+  return index;
+}
+
+static std::string escapeJSON(const std::string& str)
+{
+  std::string escaped;
+  escaped.reserve(str.size());
+  for (const char c : str) {
+    if (c == '"' || c == '\\') {
+      escaped += '\\';
+    }
+    escaped += c;
+  }
+  return escaped;
+}
+
+Profiler::Profiler(Logger* logger) : logger_(logger)
+{
+}
+
+void Profiler::start(bool trace)
+{
+  enabled_ = true;
+  trace_ = trace;
+}
+
+void Profiler::stop()
+{
+  enabled_ = false;
+}
+
+void Profiler::reset()
+{
+  std::lock_guard<std::mutex> lock(mutex_);
+  stats_.clear();
+  trace_events_.clear();
+  epoch_.reset();
+}
+
+std::vector<Profiler::Frame>& Profiler::stack()
+{
+  thread_local std::vector<Frame> frames;
+  return frames;
+}
+
+void Profiler::begin(const std::string& name)
+{
+  std::vector<Frame>& frames = stack();
+  Frame frame;
+  if (!enabled_) {
+    // Pairs with the end() of the span, which is not recorded.
+    frame.recorded = false;
+    if (!frames.empty()) {
+      frame.path = frames.back().path;
+    }
+    frames.push_back(std::move(frame));
+    return;
+  }
+  frame.path = (frames.empty() || frames.back().path.empty())
+                   ? name
+                   : frames.back().path + "/" + name;
+  frame.start_rss = getCurrentRSS();
+  frame.start_us = epoch_.elapsed() * 1e6;
+  frames.push_back(std::move(frame));
+}
+
+void Profiler::end()
+{
+  std::vector<Frame>& frames = stack();
+  if (frames.empty()) {
+    if (!enabled_) {
+      return;
+    }
+    logger_->warn(UTL, 15, "Profiling span ended without a matching begin.");
+    return;
+  }
+  const Frame frame = std::move(frames.back());
+  frames.pop_back();
+  if (!frame.recorded) {
+    return;
+  }
+  const double elapsed = frame.timer.elapsed();
+  for (auto parent = frames.rbegin(); parent != frames.rend(); parent++) {
+    if (parent->recorded) {
+      parent->child_seconds += elapsed;
+      break;
+    }
+  }
+  record(frame, elapsed);
+}
+
+void Profiler::record(const Frame& frame, const double elapsed)
+{
+  const int64_t rss_delta = static_cast<int64_t>(getCurrentRSS())
+                            - static_cast<int64_t>(frame.start_rss);
+
+  std::lock_guard<std::mutex> lock(mutex_);
+  ProfileStat& stat = stats_[frame.path];
+  if (stat.calls == 0) {
+    stat.name = frame.path;
+    stat.depth = std::count(frame.path.begin(), frame.path.end(), '/');
+  }
+  stat.calls++;
+  stat.inclusive_seconds += elapsed;
+  stat.exclusive_seconds += std::max(elapsed - frame.child_seconds, 0.0);
+  stat.rss_delta_bytes += rss_delta;
+
+  if (trace_ && trace_events_.size() < max_trace_events) {
+    trace_events_.push_back(
+        {frame.path, threadIndex(), frame.start_us, elapsed * 1e6});
+  }
+}
+
+std::vector<ProfileStat> Profiler::getStats() const
+{
+  std::lock_guard<std::mutex> lock(mutex_);
+  std::vector<ProfileStat> stats;
+  stats.reserve(stats_.size());
+  for (const auto& [path, stat] : stats_) {
+    stats.push_back(stat);
+  }
+  return stats;
+}
+
+std::string Profiler::getStatsJSON() const
+{
+  std::string json = "{";
+  std::string separator;
+  for (const ProfileStat& stat : getStats()) {
+    json += fmt::format(
+        "{}\n\t\"{}\": {{\"depth\": {}, \"calls\": {}, "
+        "\"inclusive_seconds\": {}, \"exclusive_seconds\": {}, "
+        "\"rss_delta_bytes\": {}}}",
+        separator,
+        escapeJSON(stat.name),
+        stat.depth,
+        stat.calls,
+        stat.inclusive_seconds,
+        stat.exclusive_seconds,
+        stat.rss_delta_bytes);
+    separator = ",";
+  }
+  return json + "\n}";
+}
+
+void Profiler::report() const
+{
+  logger_->report("{:<40} {:>10} {:>12} {:>12} {:>12}",
+                  "Span",
+                  "Calls",
+                  "Incl (s)",
+                  "Excl (s)",
+                  "RSS (MB)");
+  logger_->report("{:-<90}", "");
+  for (const ProfileStat& stat : getStats()) {
+    const std::string name = stat.name.substr(stat.name.rfind('/') + 1);
+    logger_->report("{:<40} {:>10} {:>12.3f} {:>12.3f} {:>12.1f}",
+                    std::string(2 * stat.depth, ' ') + name,
+                    stat.calls,
+                    stat.inclusive_seconds,
+                    stat.exclusive_seconds,
+                    stat.rss_delta_bytes / (1024.0 * 1024.0));
+  }
+}
+
+void Profiler::writeChromeTrace(const std::string& filename) const
+{
+  std::ofstream out(filename);
+  if (!out) {
+    logger_->error(UTL, 16, "Unable to open {} to write the trace.", filename);
+  }
+
+  std::lock_guard<std::mutex> lock(mutex_);
+  out << "{\"traceEvents\": [";
+  std::string separator;
+  for (const TraceEvent& event : trace_events_) {
+    const std::string name = event.name.substr(event.name.rfind('/') + 1);
+    out << separator
+        << fmt::format(
+               "\n{{\"name\": \"{}\", \"cat\": \"{}\", \"ph\": \"X\", "
+               "\"pid\": 0, \"tid\": {}, \"ts\": {:.3f}, \"dur\": {:.3f}}}",
+               escapeJSON(name),
+               escapeJSON(event.name),
+               event.thread,
+               event.start_us,
+               event.duration_us);
+    separator = ",";
+  }
+  out << "\n], \"displayTimeUnit\": \"ms\"}\n";
+  if (trace_events_.size() >= max_trace_events) {
+    logger_->warn(UTL,
+                  17,
+                  "Trace limited to the first {} events.",
+                  max_trace_events);
+  }
+}
+
+void Profiler::addMetrics()
+{
+  for (const ProfileStat& stat : getStats()) {
+    logger_->metric("profile__calls:" + stat.name, stat.calls);
+    logger_->metric("profile__runtime__inclusive:" + stat.name,
+                    stat.inclusive_seconds);
+    logger_->metric("profile__runtime__exclusive:" + stat.name,
+                    stat.exclusive_seconds);
+    logger_->metric("profile__mem__rss_delta:" + stat.name,
+                    stat.rss_delta_bytes);
+  }
+}
+
+//////////////////////////
+
+ProfileScope::ProfileScope(Logger* logger,
+                           ToolId tool,
+                           const std::string& name)
+    : DebugScopedTimer(logger, tool, "profile", 1, name + ": {}"),
+      profiler_(logger->getProfiler())
+{
+  if (profiler_->isEnabled()) {
+    profiler_->begin(name);
+  } else {
+    profiler_ = nullptr;
+  }
+}
+
+ProfileScope::~ProfileScope()
+{
+  if (profiler_) {
+    profiler_->end();
+  }
+}
+
+}  // namespace utl
@@ -0,0 +1,77 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#include "utl/stage_metrics.h"
+
+#include <ctime>
+#include <memory>
+#include <string>
+
+#include "utl/Logger.h"
+#include "utl/mem_stats.h"
+#include "utl/prometheus/gauge.h"
+#include "utl/prometheus/registry.h"
+
+namespace utl {
+
+static double cpuSeconds()
+{
+  return static_cast<double>(std::clock()) / CLOCKS_PER_SEC;
+}
+
+ScopedStageMetrics::ScopedStageMetrics(Logger* logger, const std::string& stage)
+    : logger_(logger),
+      stage_(stage),
+      start_cpu_(cpuSeconds()),
+      start_rss_(getCurrentRSS()),
+      profile_(logger, UTL, stage)
+{
+  gauge("ord_stage_running", "1 while the stage is running").Set(1);
+  gauge("ord_stage_start_time_seconds", "Unix time of the last stage start")
+      .SetToCurrentTime();
+}
+
+ScopedStageMetrics::~ScopedStageMetrics()
+{
+  const size_t rss = getCurrentRSS();
+  gauge("ord_stage_wall_seconds", "Wall time of the last stage run")
+      .Set(timer_.elapsed());
+  gauge("ord_stage_cpu_seconds", "Process CPU time of the last stage run")
+      .Set(cpuSeconds() - start_cpu_);
+  gauge("ord_stage_rss_bytes", "Resident set size at the end of the stage")
+      .Set(rss);
+  gauge("ord_stage_peak_rss_bytes",
+        "Peak resident set size at the end of the stage")
+      .Set(getPeakRSS());
+  gauge("ord_stage_rss_delta_bytes",
+        "Change of the resident set size over the stage")
+      .Set(static_cast<double>(rss) - static_cast<double>(start_rss_));
+  gauge("ord_stage_runs", "Number of completed stage runs").Increment();
+  gauge("ord_stage_end_time_seconds", "Unix time of the last stage end")
+      .SetToCurrentTime();
+  gauge("ord_stage_running", "1 while the stage is running").Set(0);
+}
+
+void ScopedStageMetrics::setQuality(const std::string& metric, double value)
+{
+  std::shared_ptr<PrometheusRegistry> registry = logger_->getRegistry();
+  BuildGauge()
+      .Name("ord_stage_quality")
+      .Help("Key quality counters of the stage")
+      .Register(*registry)
+      .Add({{"stage", stage_}, {"metric", metric}})
+      .Set(value);
+}
+
+Gauge<double>& ScopedStageMetrics::gauge(const std::string& name,
+                                         const std::string& help)
+{
+  std::shared_ptr<PrometheusRegistry> registry = logger_->getRegistry();
+  return BuildGauge()
+      .Name(name)
+      .Help(help)
+      .Register(*registry)
+      .Add({{"stage", stage_}});
+}
+
+}  // namespace utl
@@ -0,0 +1,118 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#include <chrono>
+#include <cstdio>
+#include <fstream>
+#include <sstream>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "gtest/gtest.h"
+#include "utl/Logger.h"
+#include "utl/profiler.h"
+
+namespace utl {
+
+static void sleepMs(int ms)
+{
+  std::this_thread::sleep_for(std::chrono::milliseconds(ms));
+}
+
+TEST(Utl, ProfilerDisabled)
+{
+  Logger logger;
+  {
+    ProfileScope scope(&logger, UTL, "outer");
+  }
+  EXPECT_TRUE(logger.getProfiler()->getStats().empty());
+}
+
+TEST(Utl, ProfilerEnabledInSpan)
+{
+  Logger logger;
+  Profiler* profiler = logger.getProfiler();
+  profiler->start();
+  profiler->begin("outer");
+  profiler->stop();
+  profiler->begin("skipped");
+  profiler->start();
+  profiler->end();
+  profiler->begin("inner");
+  profiler->end();
+  profiler->end();
+  profiler->stop();
+
+  const std::vector<ProfileStat> stats = profiler->getStats();
+  ASSERT_EQ(stats.size(), 2);
+  EXPECT_EQ(stats[0].name, "outer");
+  EXPECT_EQ(stats[0].calls, 1);
+  EXPECT_EQ(stats[1].name, "outer/inner");
+  EXPECT_EQ(stats[1].calls, 1);
+}
+
+TEST(Utl, ProfilerNested)
+{
+  Logger logger;
+  Profiler* profiler = logger.getProfiler();
+  profiler->start();
+  for (int i = 0; i < 2; i++) {
+    ProfileScope outer(&logger, UTL, "outer");
+    sleepMs(5);
+    {
+      ProfileScope inner(&logger, UTL, "inner");
+      sleepMs(10);
+    }
+  }
+  profiler->begin("script");
+  profiler->end();
+  profiler->stop();
+
+  const std::vector<ProfileStat> stats = profiler->getStats();
+  ASSERT_EQ(stats.size(), 3);
+  const ProfileStat& outer = stats[0];
+  const ProfileStat& inner = stats[1];
+  EXPECT_EQ(outer.name, "outer");
+  EXPECT_EQ(outer.depth, 0);
+  EXPECT_EQ(outer.calls, 2);
+  EXPECT_EQ(inner.name, "outer/inner");
+  EXPECT_EQ(inner.depth, 1);
+  EXPECT_EQ(inner.calls, 2);
+  EXPECT_GE(inner.inclusive_seconds, 0.02);
+  EXPECT_DOUBLE_EQ(inner.inclusive_seconds, inner.exclusive_seconds);
+  EXPECT_NEAR(outer.exclusive_seconds,
+              outer.inclusive_seconds - inner.inclusive_seconds,
+              1e-3);
+  EXPECT_EQ(stats[2].name, "script");
+
+  EXPECT_NE(profiler->getStatsJSON().find("\"outer/inner\": {\"depth\": 1, "
+                                          "\"calls\": 2"),
+            std::string::npos);
+}
+
+TEST(Utl, ProfilerChromeTrace)
+{
+  Logger logger;
+  Profiler* profiler = logger.getProfiler();
+  profiler->start(true);
+  {
+    ProfileScope outer(&logger, UTL, "outer");
+    ProfileScope inner(&logger, UTL, "inner");
+  }
+  profiler->stop();
+
+  const std::string filename = "profiler_trace.json";
+  profiler->writeChromeTrace(filename);
+  std::ifstream in(filename);
+  std::stringstream content;
+  content << in.rdbuf();
+  std::remove(filename.c_str());
+
+  EXPECT_EQ(content.str().rfind("{\"traceEvents\": [", 0), 0);
+  EXPECT_NE(content.str().find("\"name\": \"inner\", \"cat\": \"outer/inner\", "
+                               "\"ph\": \"X\""),
+            std::string::npos);
+}
+
+}  // namespace utl
@@ -0,0 +1,49 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright (c) 2025, The OpenROAD Authors
+
+#include <memory>
+#include <sstream>
+#include <string>
+
+#include "gtest/gtest.h"
+#include "utl/Logger.h"
+#include "utl/prometheus/registry.h"
+#include "utl/prometheus/text_serializer.h"
+#include "utl/stage_metrics.h"
+
+namespace utl {
+
+static std::string serialize(Logger& logger)
+{
+  std::ostringstream out;
+  TextSerializer::Serialize(out, logger.getRegistry()->Collect());
+  return out.str();
+}
+
+TEST(Utl, StageMetrics)
+{
+  Logger logger;
+  {
+    ScopedStageMetrics metrics(&logger, "global_route");
+    EXPECT_NE(
+        serialize(logger).find("ord_stage_running{stage=\"global_route\"} 1"),
+        std::string::npos);
+    metrics.setQuality("overflow", 42);
+  }
+
+  const std::string content = serialize(logger);
+  EXPECT_NE(content.find("ord_stage_running{stage=\"global_route\"} 0"),
+            std::string::npos);
+  EXPECT_NE(content.find("ord_stage_runs{stage=\"global_route\"} 1"),
+            std::string::npos);
+  EXPECT_NE(content.find("ord_stage_wall_seconds{stage=\"global_route\"}"),
+            std::string::npos);
+  EXPECT_NE(content.find("ord_stage_peak_rss_bytes{stage=\"global_route\"}"),
+            std::string::npos);
+  EXPECT_NE(content.find(
+                "ord_stage_quality{metric=\"overflow\",stage=\"global_route\"} "
+                "42"),
+            std::string::npos);
+}
+
+}  // namespace utl